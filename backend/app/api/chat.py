@@ -5,7 +5,7 @@ from typing import List, Dict
 
 from app.schemas.chat import ChatMessageResponse, ChatMessageUpdate, ChatMessageInput
 from app.services.chat_service import ChatService
-from app.core.database import get_db_session
+from app.core.database import get_db_session, get_read_db_session
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 
@@ -13,7 +13,7 @@ router = APIRouter()
 
 @router.get("", response_model=Dict[UUID, List[ChatMessageResponse]])
 async def get_all_chats(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -72,8 +72,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db_session
-from app.services.document_service import DocumentService
+from app.core.database import get_db_session, get_read_db_session
+from app.services.document_service import DocumentService, InvalidSearchCursorError
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 from app.schemas.document import (
@@ -133,7 +133,7 @@ async def list_collections(
     limit: int = Query(default=50, le=1000, description="Maximum number of collections to return"),
     offset: int = Query(default=0, ge=0, description="Number of collections to skip"),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_read_db_session)
 ):
     """
     List user's document collections.
@@ -182,7 +182,7 @@ async def list_collections(
 async def get_collection_analytics(
     collection_id: UUID = Path(..., description="Collection ID"),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_read_db_session)
 ):
     """
     Get comprehensive analytics for a document collection.
@@ -210,7 +210,7 @@ async def get_collection_analytics(
 async def search_documents(
     search_request: DocumentSearchRequest,
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_read_db_session)
 ):
     """
     Advanced document search with full-text search and filtering.
@@ -256,12 +256,16 @@ async def search_documents(
         return DocumentSearchResponse(
             documents=document_responses,
             total_count=search_metadata["total_count"],
+            count_is_estimate=search_metadata["count_is_estimate"],
             returned_count=search_metadata["returned_count"],
             limit=search_metadata["limit"],
             offset=search_metadata["offset"],
+            next_cursor=search_metadata["next_cursor"],
             search_params=search_metadata["search_params"]
         )
         
+    except InvalidSearchCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Document search failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Document search failed: {str(e)}")
@@ -433,7 +437,7 @@ async def store_document_chunks(
 @router.get("/stats/overview")
 async def get_document_stats(
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db_session)
+    session: AsyncSession = Depends(get_read_db_session)
 ):
     """
     Get comprehensive document statistics for the user.
@@ -1,21 +1,42 @@
 """Workflow Executions API endpoints"""
 
+import logging
 import uuid
+from datetime import datetime
 from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_current_user
-from app.core.database import get_db_session
+from app.core.blob_store import (
+    BlobNotFoundError,
+    collect_blob_refs,
+    get_blob_store,
+    normalize_digest,
+)
+from app.core.checkpointer import orphaned_execution_clause
+from app.core import database
+from app.core.database import get_db_session, get_read_db_session
+from app.models.execution import ExecutionCheckpoint, WorkflowExecution
 from app.models.user import User
+from app.models.workflow import Workflow
 from app.schemas.execution import (
     WorkflowExecutionCreate,
     WorkflowExecutionResponse,
 )
 from app.services.execution_service import ExecutionService
+from app.services.workflow_executor import get_workflow_executor
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Only executions that stopped without completing may be resumed, plus
+# "running" ones whose worker is gone (see orphaned_execution_clause)
+RESUMABLE_STATUSES = ("failed", "interrupted")
+
 
 @router.post(
     "",
@@ -45,7 +66,7 @@ async def create_workflow_execution(
 @router.get("", response_model=List[WorkflowExecutionResponse])
 async def list_executions(
     workflow_id: uuid.UUID = None,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
     execution_service: ExecutionService = Depends(),
     skip: int = 0,
@@ -86,6 +107,144 @@ async def get_workflow_execution(
     return execution
 
 
+@router.get("/{execution_id}/blobs/{digest}")
+async def get_execution_output_blob(
+    execution_id: uuid.UUID,
+    digest: str,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+    execution_service: ExecutionService = Depends(),
+):
+    """
+    Stream a spilled execution output back from the blob store.
+
+    Only digests referenced by the execution's stored outputs can be fetched.
+    """
+    execution = await execution_service.get_execution(
+        db, execution_id=execution_id, user_id=current_user.id
+    )
+    if not execution:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Execution not found"
+        )
+
+    try:
+        digest = normalize_digest(digest)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if digest not in collect_blob_refs(execution.outputs or {}):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Blob not found for execution"
+        )
+
+    try:
+        chunks = get_blob_store().iter_chunks(digest)
+    except BlobNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Blob content is missing from store"
+        )
+
+    return StreamingResponse(
+        chunks,
+        media_type="application/json",
+        headers={"ETag": f'"{digest}"', "Cache-Control": "private, max-age=31536000, immutable"},
+    )
+
+
+async def _resume_in_background(execution_id: uuid.UUID, workflow_id: uuid.UUID, user: User) -> None:
+    """Run a claimed resume on its own session; failures are recorded on the execution."""
+    executor = get_workflow_executor()
+    async with database.AsyncSessionLocal() as db:
+        execution = await db.get(WorkflowExecution, execution_id)
+        workflow = await db.get(Workflow, workflow_id)
+        try:
+            ctx = await executor.prepare_execution_context(
+                db,
+                workflow,
+                execution_inputs=execution.inputs or {},
+                user=user,
+                owner_id=workflow.user_id,
+            )
+            ctx.execution_id = execution_id
+            await executor.execute_workflow(ctx, db, stream=False, resume=True)
+        except ValueError as e:
+            # Raised before the run started, so the executor has not recorded it
+            await executor.update_execution_status(
+                db, execution_id, status="failed", error_message=str(e), completed_at=datetime.utcnow()
+            )
+        except Exception as e:
+            # The executor has already recorded the failure on the execution
+            logger.warning(f"Resumed execution {execution_id} failed: {e}")
+
+
+@router.post(
+    "/{execution_id}/resume",
+    response_model=WorkflowExecutionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_workflow_execution(
+    execution_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user),
+    execution_service: ExecutionService = Depends(),
+):
+    """
+    Resume a failed or interrupted execution from its last persisted checkpoint.
+
+    An execution still marked running is resumable once its checkpoint has gone
+    stale for EXECUTION_ORPHAN_TIMEOUT_SECONDS (its worker was lost, e.g. the pod
+    restarted mid-run).
+
+    Only executions of workflows with checkpointing enabled have one; nodes
+    that completed before the interruption are not run again. The execution is
+    claimed atomically (so concurrent resumes cannot both run it), marked
+    running, and continues in the background; poll the execution for its result.
+    """
+    execution = await execution_service.get_execution(
+        db, execution_id=execution_id, user_id=current_user.id
+    )
+    if not execution:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Execution not found"
+        )
+    if await db.get(ExecutionCheckpoint, execution_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Execution has no checkpoint to resume from"
+        )
+    workflow = await db.get(Workflow, execution.workflow_id)
+    if not workflow:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Workflow not found"
+        )
+
+    claimed = await db.execute(
+        update(WorkflowExecution)
+        .where(
+            WorkflowExecution.id == execution_id,
+            WorkflowExecution.user_id == current_user.id,
+            or_(WorkflowExecution.status.in_(RESUMABLE_STATUSES), orphaned_execution_clause()),
+        )
+        .values(status="running", error_message=None, completed_at=None, started_at=datetime.utcnow())
+        .returning(WorkflowExecution.id)
+    )
+    if claimed.scalar_one_or_none() is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Execution is {execution.status}; only {' or '.join(RESUMABLE_STATUSES)} executions, "
+                "or running ones whose checkpoint has gone stale, can be resumed"
+            ),
+        )
+    await db.commit()
+
+    background_tasks.add_task(_resume_in_background, execution.id, workflow.id, current_user)
+    await db.refresh(execution)
+    return execution
+
+
 @router.delete("/{execution_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_workflow_execution(
     execution_id: uuid.UUID,
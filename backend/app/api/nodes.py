@@ -21,19 +21,14 @@ async def get_all_nodes():
         node_registry.discover_nodes()
     
     nodes_list = []
-    for name, node_class in node_registry.nodes.items():
+    for name in list(node_registry.nodes):
         # Skip hidden aliases (like ReactAgent)
         if name in node_registry.hidden_aliases:
             continue
             
         try:
-            instance = node_class()
-            # Use model_dump instead of deprecated dict() and drop None fields
-            metadata = (
-                instance.metadata.model_dump(exclude_none=True)
-                if hasattr(instance.metadata, "model_dump")
-                else instance.metadata.dict(exclude_none=True)
-            )
+            # Served from the manifest when available; the node module is not imported
+            metadata = node_registry.get_node_metadata(name).model_dump(exclude_none=True)
             # Add the node name to the metadata and ensure each node has an ID
             metadata["name"] = name
             metadata['id'] = name
@@ -50,20 +45,13 @@ async def get_node_categories():
     Retrieve all available node categories.
     """
     categories = set()
-    for name, node_class in node_registry.nodes.items():
+    for name, metadata in node_registry.node_configs.items():
         # Skip hidden aliases (like ReactAgent)
         if name in node_registry.hidden_aliases:
             continue
             
         try:
-            instance = node_class()
-            # Use model_dump instead of deprecated dict() and drop None fields
-            metadata_dict = (
-                instance.metadata.model_dump(exclude_none=True)
-                if hasattr(instance.metadata, "model_dump")
-                else instance.metadata.dict(exclude_none=True)
-            )
-            category = metadata_dict.get("category", "Other")
+            category = metadata.category or "Other"
             categories.add(category)
         except Exception as e:
             logger.error(f"Failed to get category for node {name}: {e}", exc_info=True)
@@ -86,18 +74,11 @@ async def get_node_details(node_type: str):
     Get detailed information about a specific node type including
     configuration schema, examples, and usage instructions.
     """
-    node_class = node_registry.get_node(node_type)
-    if not node_class:
+    if node_type not in node_registry.nodes:
         raise HTTPException(status_code=404, detail=f"Node type '{node_type}' not found")
     
     try:
-        instance = node_class()
-        # Use model_dump instead of deprecated dict() and drop None fields
-        metadata = (
-            instance.metadata.model_dump(exclude_none=True)
-            if hasattr(instance.metadata, "model_dump")
-            else instance.metadata.dict(exclude_none=True)
-        )
+        metadata = node_registry.get_node_metadata(node_type).model_dump(exclude_none=True)
         
         # Add detailed configuration schema
         detailed_info = {
@@ -205,14 +186,13 @@ async def get_registry_statistics():
     nodes_by_category = {}
     total_nodes = len(node_registry.nodes)
     
-    for name, node_class in node_registry.nodes.items():
+    for name, metadata in node_registry.node_configs.items():
         # Skip hidden aliases (like ReactAgent)
         if name in node_registry.hidden_aliases:
             continue
             
         try:
-            instance = node_class()
-            category = instance.metadata.category
+            category = metadata.category
             if category not in nodes_by_category:
                 nodes_by_category[category] = 0
             nodes_by_category[category] += 1
@@ -234,14 +214,13 @@ async def search_nodes(query: str):
     results = []
     query_lower = query.lower()
     
-    for name, node_class in node_registry.nodes.items():
+    for name, node_metadata in node_registry.node_configs.items():
         # Skip hidden aliases (like ReactAgent)
         if name in node_registry.hidden_aliases:
             continue
             
         try:
-            instance = node_class()
-            metadata = instance.metadata.dict()
+            metadata = node_metadata.model_dump()
             
             # Search in name, description, category
             searchable_text = f"{metadata.get('name', '')} {metadata.get('description', '')} {metadata.get('category', '')}".lower()
@@ -243,6 +243,15 @@ class VectorDocumentsResponse(BaseModel):
     total_created: int = Field(description="Total number of documents created")
     failed_count: int = Field(description="Number of documents that failed to create")
 
+class VectorBulkIngestResponse(BaseModel):
+    collection_id: uuid.UUID = Field(description="Collection the documents were loaded into")
+    total_received: int = Field(description="Number of non-empty NDJSON lines read")
+    total_created: int = Field(description="Number of documents written")
+    failed_count: int = Field(description="Number of lines rejected during validation")
+    batches: int = Field(description="Number of COPY batches executed")
+    elapsed_ms: float = Field(description="Server-side ingest time in milliseconds")
+    errors: List[Dict[str, Any]] = Field(default_factory=list, description="First rejected lines with reasons")
+
 class VectorDocumentsDeleteResponse(BaseModel):
     deleted_ids: List[uuid.UUID] = Field(description="IDs of deleted documents")
     deleted_contents: List[str] = Field(description="Contents of deleted documents")
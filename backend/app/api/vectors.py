@@ -1,7 +1,7 @@
 import uuid
 import time
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from sqlalchemy.orm import selectinload
@@ -16,8 +16,10 @@ from app.api.schemas import (
     VectorCollectionCreate, VectorCollectionUpdate, VectorCollectionResponse,
     VectorCollectionStats, VectorDocumentCreate, VectorDocumentResponse,
     VectorSearchRequest, VectorSearchResponse, VectorSearchResult,
-    VectorDocumentsCreate, VectorDocumentsResponse, VectorDocumentsDeleteResponse
+    VectorDocumentsCreate, VectorDocumentsResponse, VectorDocumentsDeleteResponse,
+    VectorBulkIngestResponse
 )
+from app.services.vector_ingest_service import IngestLineTooLargeError, VectorIngestService
 
 router = APIRouter()
 
@@ -267,35 +269,30 @@ async def create_vector_documents(
                 detail="Access denied to this collection"
             )
         
-        created_ids = []
+        new_documents = []
         failed_count = 0
         
         for doc_data in documents_data.documents:
-            try:
-                # Validate embedding dimension if provided
-                if doc_data.embedding and len(doc_data.embedding) != collection.embedding_dimension:
-                    failed_count += 1
-                    continue
-                
-                # Create document
-                new_document = VectorDocument(
-                    collection_id=collection_id,
-                    content=doc_data.content,
-                    document_metadata=doc_data.document_metadata or {},
-                    embedding=str(doc_data.embedding) if doc_data.embedding else None,
-                    source_url=doc_data.source_url,
-                    source_type=doc_data.source_type,
-                    chunk_index=doc_data.chunk_index
-                )
-                
-                db.add(new_document)
-                # Flush to get the ID
-                await db.flush()
-                created_ids.append(new_document.id)
-                
-            except Exception as e:
+            # Validate embedding dimension if provided
+            if doc_data.embedding and len(doc_data.embedding) != collection.embedding_dimension:
                 failed_count += 1
-                print(f"Error creating document: {e}")
+                continue
+            
+            # IDs are assigned client-side so the whole batch needs a single flush
+            new_documents.append(VectorDocument(
+                id=uuid.uuid4(),
+                collection_id=collection_id,
+                content=doc_data.content,
+                document_metadata=doc_data.document_metadata or {},
+                embedding_vector=doc_data.embedding or None,
+                source_url=doc_data.source_url,
+                source_type=doc_data.source_type,
+                chunk_index=doc_data.chunk_index
+            ))
+        
+        db.add_all(new_documents)
+        await db.flush()
+        created_ids = [doc.id for doc in new_documents]
         
         # Update collection document count
         collection.document_count += len(created_ids)
@@ -316,6 +313,67 @@ async def create_vector_documents(
             detail=f"Failed to create vector documents: {str(e)}"
         )
 
+@router.post("/collections/{collection_id}/documents/bulk", response_model=VectorBulkIngestResponse)
+async def bulk_ingest_vector_documents(
+    collection_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bulk-load vector documents from an NDJSON request body.
+
+    Each line is a JSON object with ``content`` and either ``embedding`` (list of
+    floats) or ``embedding_b64`` (base64 little-endian float32). Rows are written
+    with PostgreSQL COPY in batches; only counts are returned.
+    """
+    collection_query = select(VectorCollection).options(
+        selectinload(VectorCollection.workflow)
+    ).where(VectorCollection.id == collection_id)
+    
+    collection_result = await db.execute(collection_query)
+    collection = collection_result.scalar_one_or_none()
+    
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Vector collection not found"
+        )
+    
+    # Check if user owns the workflow
+    if collection.workflow.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this collection"
+        )
+    
+    embedding_dimension = collection.embedding_dimension
+    # Release the pooled connection; the COPY runs on its own connection
+    await db.close()
+    
+    try:
+        result = await VectorIngestService().ingest(collection_id, embedding_dimension, request.stream())
+    except IngestLineTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to bulk ingest vector documents: {str(e)}"
+        )
+    
+    return VectorBulkIngestResponse(
+        collection_id=collection_id,
+        total_received=result.total_received,
+        total_created=result.total_created,
+        failed_count=result.failed_count,
+        batches=result.batches,
+        elapsed_ms=result.elapsed_ms,
+        errors=result.errors
+    )
+
 @router.post("/collections/{collection_id}/search", response_model=VectorSearchResponse)
 async def search_vector_documents(
     collection_id: uuid.UUID,
@@ -442,7 +500,7 @@ async def get_vector_documents(
                 collection_id=doc.collection_id,
                 content=doc.content,
                 document_metadata=doc.document_metadata,
-                embedding=doc.embedding,
+                embedding=doc.embedding if doc.embedding_vector is None else str(doc.embedding_vector.tolist()),
                 source_url=doc.source_url,
                 source_type=doc.source_type,
                 chunk_index=doc.chunk_index,
@@ -544,7 +544,7 @@ async def trigger_webhook(
             )
         
         # Check rate limiting
-        if await webhook_service.check_rate_limit(db=db, webhook_id=webhook_id):
+        if await webhook_service.check_rate_limit(db=db, webhook_id=webhook_id, endpoint=endpoint):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded"
@@ -687,9 +687,8 @@ async def trigger_webhook(
             execution_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
             error_message = str(e)
         
-        # Log the event
-        await webhook_service.log_event(
-            db=db,
+        # Log the event (buffered; written by the webhook stats writer)
+        webhook_service.record_event(
             webhook_id=webhook_id,
             event_type="webhook.received",
             payload=payload,
@@ -712,8 +711,7 @@ async def trigger_webhook(
     except Exception as e:
         # Log error event
         try:
-            await webhook_service.log_event(
-                db=db,
+            webhook_service.record_event(
                 webhook_id=webhook_id,
                 event_type="webhook.error",
                 payload={},
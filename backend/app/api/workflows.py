@@ -292,14 +292,13 @@ from typing import Any, Dict, Optional, AsyncGenerator, List
 from datetime import datetime, timedelta
 from sqlalchemy import and_
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc
 from app.models.execution import WorkflowExecution
 from app.core.engine import get_engine
-from app.core.database import get_db_session
+from app.core.database import get_db_session, get_read_db_session
 from app.auth.dependencies import get_current_user, get_optional_user, get_current_user_or_master_api_key
 from app.models.user import User
 from app.models.workflow import WorkflowTemplate
@@ -307,11 +306,16 @@ from app.schemas.workflow import (
     WorkflowCreate, 
     WorkflowUpdate, 
     WorkflowResponse,
+    WorkflowSummaryResponse,
     WorkflowTemplateCreate,
     WorkflowTemplateResponse,
     WorkflowVisibilityUpdate
 )
-from app.services.workflow_service import WorkflowService, WorkflowTemplateService
+from app.services.workflow_service import (
+    InvalidWorkflowCursorError,
+    WorkflowService,
+    WorkflowTemplateService,
+)
 from app.services.dependencies import get_workflow_service_dep, get_workflow_template_service_dep, get_execution_service_dep
 from app.services.execution_service import ExecutionService
 from app.services.chat_service import ChatService
@@ -320,38 +324,45 @@ from app.schemas.execution import WorkflowExecutionCreate, WorkflowExecutionUpda
 from app.core.execution_queue import execution_queue
 from app.models.workflow import Workflow
 from app.services.workflow_executor import get_workflow_executor
-from app.core.json_utils import make_json_serializable
+from app.core.json_utils import encode_sse
 from sqlalchemy.future import select
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("", response_model=List[WorkflowResponse])
+def _set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the keyset cursor of the next page (absent on the last page)."""
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+
+@router.get("", response_model=List[WorkflowSummaryResponse])
 async def get_workflows(
-    db: AsyncSession = Depends(get_db_session),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(get_workflow_service_dep),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
     """
-    Get list of workflows for the current user.
+    Get list of workflows for the current user, newest first.
+
+    Returns summary fields only (no flow_data); fetch /workflows/{id} for the
+    full definition. Pass the X-Next-Cursor response header back as ``cursor``
+    to get the next page (``skip`` is only used without a cursor).
     """
     try:
         user_id = current_user.id  # Cache user ID
-        # Get user's workflows, ordered by updated_at descending
-        query = (
-            select(Workflow)
-            .filter_by(user_id=user_id)
-            .order_by(desc(Workflow.updated_at))
-            .offset(skip)
-            .limit(limit)
+        workflows, next_cursor = await workflow_service.get_user_workflows(
+            db, user_id, skip=skip, limit=limit, cursor=cursor
         )
-        result = await db.execute(query)
-        workflows = result.scalars().all()
-        
-        return [WorkflowResponse.model_validate(workflow) for workflow in workflows]
+        _set_next_cursor(response, next_cursor)
+        return [WorkflowSummaryResponse.model_validate(workflow) for workflow in workflows]
+    except InvalidWorkflowCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching workflows: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch workflows")
@@ -535,17 +546,19 @@ async def validate_workflow(
         }
 
 
-@router.get("/public/", response_model=List[WorkflowResponse])
+@router.get("/public/", response_model=List[WorkflowSummaryResponse])
 async def get_public_workflows(
-    db: AsyncSession = Depends(get_db_session),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db_session),
     workflow_service: WorkflowService = Depends(get_workflow_service_dep),
     current_user: Optional[User] = Depends(get_optional_user),
     skip: int = 0,
     limit: int = 100,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    cursor: Optional[str] = None
 ):
     """
-    Get list of public workflows.
+    Get list of public workflows (summary fields, keyset-paginated via X-Next-Cursor).
     """
     try:
         sanitized_search = None
@@ -560,28 +573,33 @@ async def get_public_workflows(
                 import re
                 sanitized_search = re.sub(r'[^\w\s\-_]', '', search.strip())
         
-        workflows = await workflow_service.get_public_workflows(
-            db, skip=skip, limit=limit, search=sanitized_search
+        workflows, next_cursor = await workflow_service.get_public_workflows(
+            db, skip=skip, limit=limit, search=sanitized_search, cursor=cursor
         )
-        return [WorkflowResponse.model_validate(workflow) for workflow in workflows]
+        _set_next_cursor(response, next_cursor)
+        return [WorkflowSummaryResponse.model_validate(workflow) for workflow in workflows]
     except HTTPException:
         raise
+    except InvalidWorkflowCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching public workflows: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to fetch public workflows")
 
 
-@router.get("/search/", response_model=List[WorkflowResponse])
+@router.get("/search/", response_model=List[WorkflowSummaryResponse])
 async def search_workflows(
     q: str,
-    db: AsyncSession = Depends(get_db_session),
+    response: Response,
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(get_workflow_service_dep),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
     """
-    Search user's workflows by name or description.
+    Search user's workflows by name or description (summary fields, keyset-paginated via X-Next-Cursor).
     """
     try:
         # Sanitize search parameter to prevent injection attacks
@@ -595,12 +613,15 @@ async def search_workflows(
         sanitized_q = re.sub(r'[^\w\s\-_]', '', q.strip())
         
         user_id = current_user.id  # Cache user ID
-        workflows = await workflow_service.get_user_workflows(
-            db, user_id, skip=skip, limit=limit, search=sanitized_q
+        workflows, next_cursor = await workflow_service.get_user_workflows(
+            db, user_id, skip=skip, limit=limit, search=sanitized_q, cursor=cursor
         )
-        return [WorkflowResponse.model_validate(workflow) for workflow in workflows]
+        _set_next_cursor(response, next_cursor)
+        return [WorkflowSummaryResponse.model_validate(workflow) for workflow in workflows]
     except HTTPException:
         raise
+    except InvalidWorkflowCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error searching workflows: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to search workflows")
@@ -669,7 +690,7 @@ async def update_workflow_visibility(
 
 @router.get("/stats/")
 async def get_workflow_stats(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
     workflow_service: WorkflowService = Depends(get_workflow_service_dep)
 ):
@@ -691,7 +712,7 @@ async def get_workflow_stats(
 # Template endpoints
 @router.get("/templates/", response_model=List[WorkflowTemplateResponse])
 async def get_workflow_templates(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     template_service: WorkflowTemplateService = Depends(get_workflow_template_service_dep),
     current_user: Optional[User] = Depends(get_optional_user),
     skip: int = 0,
@@ -748,7 +769,7 @@ async def get_workflow_templates(
 
 @router.get("/templates/categories/")
 async def get_template_categories(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     template_service: WorkflowTemplateService = Depends(get_workflow_template_service_dep),
     current_user: Optional[User] = Depends(get_optional_user)
 ):
@@ -828,11 +849,9 @@ class AdhocExecuteRequest(BaseModel):
     workflow_id: Optional[str] = None  # Execution kaydı için workflow_id
 
 
-# Use centralized JSON serialization utility
-_make_chunk_serializable = make_json_serializable
 @router.get("/dashboard/stats/")
 async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db_session),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -1039,10 +1058,9 @@ async def execute_adhoc_workflow(
                                 llm_output += result["output"]
                             final_outputs.update(result)
                 
-                # Make chunk serializable before JSON conversion
+                # Encode the chunk straight to an SSE frame in one pass
                 try:
-                    serialized_chunk = _make_chunk_serializable(chunk)
-                    yield f"data: {json.dumps(serialized_chunk, ensure_ascii=False)}\n\n"
+                    yield encode_sse(chunk)
                 except (TypeError, ValueError) as e:
                     logger.warning(f"Non-serializable chunk: {e}")
                     safe_chunk = {"type": "error", "error": f"Serialization error: {str(e)}", "original_type": type(chunk).__name__}
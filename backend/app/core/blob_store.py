@@ -0,0 +1,307 @@
+"""
+Content-Addressed Blob Store
+============================
+
+Keeps large execution payloads out of the ``workflow_executions.outputs`` JSONB
+column. Values above a size threshold are written to a blob store keyed by the
+SHA-256 of their encoded bytes and replaced inline by a small reference object
+that carries the digest, the byte size and a short preview.
+
+Backends:
+• ``local`` - files under ``BLOB_STORE_DIR``, sharded by digest prefix
+• ``s3``    - any S3-compatible bucket (requires ``boto3``)
+
+Because blobs are content-addressed, repeated ingests that produce identical
+chunk lists are stored exactly once.
+
+Usage:
+    from app.core.blob_store import spill_large_outputs, get_blob_store
+
+    outputs = spill_large_outputs(make_json_serializable(result))
+    for chunk in get_blob_store().iter_chunks(digest):
+        ...
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.constants import (
+    BLOB_STORE_BACKEND,
+    BLOB_STORE_DIR,
+    BLOB_STORE_S3_BUCKET,
+    BLOB_STORE_S3_ENDPOINT_URL,
+    BLOB_STORE_S3_PREFIX,
+    EXECUTION_OUTPUT_PREVIEW_CHARS,
+    EXECUTION_OUTPUT_SPILL_THRESHOLD_KB,
+)
+from app.core.json_utils import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_KEY = "__blob_ref__"
+DIGEST_PREFIX = "sha256:"
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobNotFoundError(KeyError):
+    """Raised when a digest is not present in the blob store."""
+
+
+def compute_digest(data: bytes) -> str:
+    """Return the hex SHA-256 digest used as the blob address."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def normalize_digest(digest: str) -> str:
+    """Strip the optional ``sha256:`` prefix and validate the hex digest."""
+    if digest.startswith(DIGEST_PREFIX):
+        digest = digest[len(DIGEST_PREFIX):]
+    digest = digest.lower()
+    if not _DIGEST_RE.match(digest):
+        raise ValueError(f"Invalid blob digest: {digest!r}")
+    return digest
+
+
+class BlobStore(ABC):
+    """Abstract content-addressed blob store."""
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its hex digest. Idempotent."""
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is present."""
+
+    @abstractmethod
+    def iter_chunks(self, digest: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Stream a blob back in chunks. Raises BlobNotFoundError if missing."""
+
+    def get(self, digest: str) -> bytes:
+        """Read a whole blob into memory."""
+        return b"".join(self.iter_chunks(digest))
+
+
+class LocalBlobStore(BlobStore):
+    """Filesystem blob store, laid out as ``<root>/ab/cd/<digest>``."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def _path(self, digest: str) -> str:
+        digest = normalize_digest(digest)
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def put(self, data: bytes) -> str:
+        digest = compute_digest(data)
+        path = self._path(digest)
+        if os.path.exists(path):
+            return digest
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp file and rename so readers never observe partial blobs
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return digest
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self._path(digest))
+
+    def iter_chunks(self, digest: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        path = self._path(digest)
+        if not os.path.exists(path):
+            raise BlobNotFoundError(digest)
+
+        def _reader() -> Iterator[bytes]:
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+
+        return _reader()
+
+
+class S3BlobStore(BlobStore):
+    """S3-compatible blob store (AWS S3, MinIO, Ceph RGW, ...)."""
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: Optional[str] = None):
+        try:
+            import boto3
+        except ImportError as e:
+            raise RuntimeError("S3 blob store requires boto3. Install with: pip install boto3") from e
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def _key(self, digest: str) -> str:
+        return f"{self.prefix}{normalize_digest(digest)}"
+
+    def put(self, data: bytes) -> str:
+        digest = compute_digest(data)
+        if not self.exists(digest):
+            self._client.put_object(
+                Bucket=self.bucket,
+                Key=self._key(digest),
+                Body=data,
+                ContentType="application/json",
+            )
+        return digest
+
+    def exists(self, digest: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=self._key(digest))
+            return True
+        except ClientError:
+            return False
+
+    def iter_chunks(self, digest: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self._client.get_object(Bucket=self.bucket, Key=self._key(digest))
+        except ClientError as e:
+            raise BlobNotFoundError(digest) from e
+        return response["Body"].iter_chunks(chunk_size=chunk_size)
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Get the process-wide blob store configured via constants."""
+    global _blob_store
+    if _blob_store is None:
+        if BLOB_STORE_BACKEND == "s3":
+            if not BLOB_STORE_S3_BUCKET:
+                raise RuntimeError("BLOB_STORE_S3_BUCKET must be set when BLOB_STORE_BACKEND=s3")
+            _blob_store = S3BlobStore(
+                bucket=BLOB_STORE_S3_BUCKET,
+                prefix=BLOB_STORE_S3_PREFIX,
+                endpoint_url=BLOB_STORE_S3_ENDPOINT_URL,
+            )
+        else:
+            _blob_store = LocalBlobStore(BLOB_STORE_DIR)
+        logger.info(f"Blob store initialized: {_blob_store.__class__.__name__}")
+    return _blob_store
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Check whether ``value`` is a spilled-output reference."""
+    return isinstance(value, dict) and BLOB_REF_KEY in value
+
+
+def make_blob_ref(digest: str, encoded: bytes, preview_chars: int) -> Dict[str, Any]:
+    """Build the inline reference that replaces a spilled value."""
+    return {
+        BLOB_REF_KEY: f"{DIGEST_PREFIX}{digest}",
+        "size": len(encoded),
+        "content_type": "application/json",
+        "preview": encoded[:preview_chars].decode("utf-8", errors="ignore"),
+    }
+
+
+def collect_blob_refs(value: Any) -> Set[str]:
+    """Return the normalized digests of every blob reference inside ``value``."""
+    refs: Set[str] = set()
+    stack: List[Any] = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if BLOB_REF_KEY in item:
+                refs.add(normalize_digest(item[BLOB_REF_KEY]))
+            else:
+                stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return refs
+
+
+def _spill_value(
+    value: Any, store: BlobStore, threshold: int, preview_chars: int, depth: int
+) -> Tuple[Any, bytes]:
+    """
+    Spill ``value`` if its encoding exceeds ``threshold``.
+
+    Returns the value (or its reference) with its JSON encoding. Dicts are
+    assembled from their children's encodings, bottom-up, so every value is
+    encoded once however deep it sits.
+    """
+    # Spill children first so that a large container keeps its small siblings inline
+    if (isinstance(value, dict) and depth > 0 and not is_blob_ref(value)
+            and all(isinstance(key, str) for key in value)):
+        children, parts = {}, []
+        for key, child in value.items():
+            children[key], encoded_child = _spill_value(child, store, threshold, preview_chars, depth - 1)
+            parts.append(dumps_bytes(key) + b":" + encoded_child)
+        value, encoded = children, b"{" + b",".join(parts) + b"}"
+    else:
+        encoded = dumps_bytes(value)
+
+    if len(encoded) <= threshold or value is None or isinstance(value, (bool, int, float)):
+        return value, encoded
+
+    digest = store.put(encoded)
+    logger.debug(f"Spilled {len(encoded)} bytes to blob store as {digest[:12]}")
+    ref = make_blob_ref(digest, encoded, preview_chars)
+    return ref, dumps_bytes(ref)
+
+
+def spill_large_outputs(
+    outputs: Dict[str, Any],
+    threshold_bytes: Optional[int] = None,
+    store: Optional[BlobStore] = None,
+    preview_chars: Optional[int] = None,
+    max_depth: int = 2,
+) -> Dict[str, Any]:
+    """
+    Replace oversized values in an execution output dict with blob references.
+
+    The top-level dict itself is never spilled. Its values, and the values of
+    nested dicts down to ``max_depth`` (e.g. ``node_outputs[<node_id>]``), are
+    encoded and written to the blob store when they exceed the threshold.
+
+    Args:
+        outputs: JSON-serializable execution outputs
+        threshold_bytes: Spill threshold; defaults to EXECUTION_OUTPUT_SPILL_THRESHOLD_KB
+        store: Blob store to write to; defaults to get_blob_store()
+        preview_chars: Size of the inline preview kept in each reference
+        max_depth: How many dict levels below the top to consider individually
+
+    Returns:
+        A new dict with large values replaced by references
+    """
+    if not isinstance(outputs, dict):
+        return outputs
+
+    if threshold_bytes is None:
+        threshold_bytes = EXECUTION_OUTPUT_SPILL_THRESHOLD_KB * 1024
+    if threshold_bytes <= 0:
+        return outputs
+    if preview_chars is None:
+        preview_chars = EXECUTION_OUTPUT_PREVIEW_CHARS
+    store = store or get_blob_store()
+
+    return {
+        key: _spill_value(value, store, threshold_bytes, preview_chars, max_depth - 1)[0]
+        for key, value in outputs.items()
+    }
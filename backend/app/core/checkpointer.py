@@ -290,32 +290,259 @@ IMPLEMENTATION DETAILS:
 ──────────────────────────────────────────────────────────────
 """
 
+import base64
 import os
 import time
 import logging
-from .constants import DISABLE_DATABASE, DATABASE_URL
-import warnings
-from typing import Optional
+import uuid
+from datetime import timedelta
+from .constants import (
+    DISABLE_DATABASE,
+    DATABASE_URL,
+    EXECUTION_CHECKPOINTS_DEFAULT,
+    EXECUTION_CHECKPOINT_MAX_KB,
+    EXECUTION_ORPHAN_TIMEOUT_SECONDS,
+)
+from typing import Any, Callable, Dict, Optional, Tuple
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.base import BaseCheckpointSaver
+from sqlalchemy import and_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import func
+from . import database
 from .logging_config import log_performance
+from app.models.execution import ExecutionCheckpoint, WorkflowExecution
 
 logger = logging.getLogger(__name__)
 
-try:
-    from langgraph.checkpoint.postgres import PostgresSaver  # type: ignore[import-untyped]
-    _POSTGRES_AVAILABLE = True
-    logger.info("PostgresSaver import successful")
-except ImportError as e:
-    _POSTGRES_AVAILABLE = False
-    PostgresSaver = None  # type: ignore[assignment]
-    logger.warning(f"PostgresSaver import failed: {e}")
-    logger.info("Will use in-memory checkpointer instead")
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+class ExecutionCheckpointSaver(MemorySaver):
+    """
+    Durable checkpointer backed by the ``execution_checkpoints`` table.
+
+    Checkpoints live in memory for the running graph exactly as with
+    ``MemorySaver``. When the run config carries an ``execution_id``, the latest
+    top-level checkpoint (taken by LangGraph after every superstep, i.e. at node
+    boundaries) is also upserted into that execution's row, channel values
+    included. A later process resumes by looking up a thread it has never seen:
+    the row is loaded and seeded back into memory.
+
+    Checkpoints larger than ``max_bytes`` are not persisted (the previous one
+    stays), and database errors are logged rather than failing the run.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = EXECUTION_CHECKPOINT_MAX_KB * 1024,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._session_factory = session_factory
+        self._restored = set()
+        self.persisted = 0
+        self.skipped_oversize = 0
+        self.write_errors = 0
+
+    # ------------------------------------------------------------------
+    # LangGraph checkpointer API
+    # ------------------------------------------------------------------
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        next_config = self.put(config, checkpoint, metadata, new_versions)
+        execution_id = _execution_id(config)
+        if execution_id and not config["configurable"].get("checkpoint_ns"):
+            await self._persist(execution_id, config, checkpoint, metadata)
+        return next_config
+
+    async def aget_tuple(self, config):
+        found = self.get_tuple(config)
+        execution_id = _execution_id(config)
+        if found is None and execution_id and not config["configurable"].get("checkpoint_ns"):
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id not in self._restored:
+                self._restored.add(thread_id)
+                if await self.restore(thread_id, execution_id):
+                    found = self.get_tuple(config)
+        return found
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def encode(self, config, checkpoint, metadata) -> Dict[str, Any]:
+        """Serialize a full checkpoint (with channel values) into the JSON row payload."""
+        checkpoint_type, checkpoint_bytes = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_bytes = self.serde.dumps_typed(metadata)
+        return {
+            "version": CHECKPOINT_FORMAT_VERSION,
+            "checkpoint_id": checkpoint["id"],
+            "parent_checkpoint_id": config["configurable"].get("checkpoint_id"),
+            "checkpoint_type": checkpoint_type,
+            "checkpoint": base64.b64encode(checkpoint_bytes).decode("ascii"),
+            "metadata_type": metadata_type,
+            "metadata": base64.b64encode(metadata_bytes).decode("ascii"),
+            "size_bytes": len(checkpoint_bytes) + len(metadata_bytes),
+        }
+
+    def decode(self, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        checkpoint = self.serde.loads_typed(
+            (payload["checkpoint_type"], base64.b64decode(payload["checkpoint"]))
+        )
+        metadata = self.serde.loads_typed(
+            (payload["metadata_type"], base64.b64decode(payload["metadata"]))
+        )
+        return checkpoint, metadata
+
+    async def restore(self, thread_id: str, execution_id: str) -> bool:
+        """Seed ``thread_id`` with the checkpoint stored for ``execution_id``. False if there is none."""
+        try:
+            payload = await self._read_checkpoint(execution_id)
+        except Exception as e:
+            logger.error(f"Failed to load checkpoint for execution {execution_id}: {e}")
+            return False
+        if not payload:
+            return False
+
+        checkpoint, metadata = self.decode(payload)
+        configurable = {"thread_id": thread_id, "checkpoint_ns": ""}
+        if payload.get("parent_checkpoint_id"):
+            configurable["checkpoint_id"] = payload["parent_checkpoint_id"]
+        self.put({"configurable": configurable}, checkpoint, metadata, checkpoint["channel_versions"])
+        logger.info(f"Restored checkpoint {checkpoint['id']} for execution {execution_id}")
+        return True
+
+    async def _persist(self, execution_id: str, config, checkpoint, metadata) -> None:
+        try:
+            payload = self.encode(config, checkpoint, metadata)
+        except Exception as e:
+            self.write_errors += 1
+            logger.warning(f"Checkpoint for execution {execution_id} is not serializable, not persisted: {e}")
+            return
+        if payload["size_bytes"] > self.max_bytes:
+            self.skipped_oversize += 1
+            logger.warning(
+                f"Checkpoint for execution {execution_id} is {payload['size_bytes']} bytes "
+                f"(limit {self.max_bytes}), keeping the previous one"
+            )
+            return
+        try:
+            await self._write_checkpoint(execution_id, payload)
+            self.persisted += 1
+        except Exception as e:
+            self.write_errors += 1
+            logger.error(f"Failed to persist checkpoint for execution {execution_id}: {e}")
+
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        if not database.AsyncSessionLocal:
+            raise RuntimeError("Database is not enabled. Set DATABASE_URL to enable database functionality.")
+        return database.AsyncSessionLocal()
+
+    async def _write_checkpoint(self, execution_id: str, payload: Dict[str, Any]) -> None:
+        parent_id = payload["parent_checkpoint_id"]
+        values = {
+            "checkpoint_data": payload,
+            "parent_checkpoint_id": uuid.UUID(parent_id) if parent_id else None,
+            "updated_at": func.now(),
+        }
+        statement = pg_insert(ExecutionCheckpoint).values(
+            execution_id=uuid.UUID(execution_id), **values
+        ).on_conflict_do_update(index_elements=[ExecutionCheckpoint.execution_id], set_=values)
+        async with self._session() as db:
+            await db.execute(statement)
+            await db.commit()
+
+    async def _read_checkpoint(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        async with self._session() as db:
+            result = await db.execute(
+                select(ExecutionCheckpoint.checkpoint_data).where(
+                    ExecutionCheckpoint.execution_id == uuid.UUID(execution_id)
+                )
+            )
+            return result.scalar_one_or_none()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "persisted": self.persisted,
+            "skipped_oversize": self.skipped_oversize,
+            "write_errors": self.write_errors,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def _execution_id(config) -> Optional[str]:
+    execution_id = (config or {}).get("configurable", {}).get("execution_id")
+    return str(execution_id) if execution_id else None
+
+
+def checkpoint_settings(flow_data: Optional[Dict[str, Any]]) -> Tuple[bool, int]:
+    """
+    Per-workflow checkpointing settings as ``(enabled, max_bytes)``.
+
+    Read from ``flow_data["settings"]["checkpointing"]``, which is either a bool
+    or ``{"enabled": bool, "max_kb": int}``; unset values fall back to
+    EXECUTION_CHECKPOINTS_DEFAULT and EXECUTION_CHECKPOINT_MAX_KB.
+    """
+    settings = ((flow_data or {}).get("settings") or {}).get("checkpointing")
+    if isinstance(settings, bool):
+        settings = {"enabled": settings}
+    elif not isinstance(settings, dict):
+        settings = {}
+    enabled = bool(settings.get("enabled", EXECUTION_CHECKPOINTS_DEFAULT))
+    max_kb = settings.get("max_kb") or EXECUTION_CHECKPOINT_MAX_KB
+    return enabled, int(max_kb) * 1024
+
+
+def orphaned_execution_clause(timeout_seconds: int = EXECUTION_ORPHAN_TIMEOUT_SECONDS):
+    """
+    Filter for executions whose worker died mid-run.
+
+    The execution is still "running", has a persisted checkpoint, and neither
+    the run (re)started nor a superstep was checkpointed within
+    ``timeout_seconds``. Runs without checkpointing never match: they have
+    nothing to resume from.
+    """
+    cutoff = func.now() - timedelta(seconds=timeout_seconds)
+    stale_checkpoint = select(ExecutionCheckpoint.execution_id).where(
+        ExecutionCheckpoint.execution_id == WorkflowExecution.id,
+        ExecutionCheckpoint.updated_at < cutoff,
+    )
+    return and_(
+        WorkflowExecution.status == "running",
+        func.coalesce(WorkflowExecution.started_at, WorkflowExecution.created_at) < cutoff,
+        stale_checkpoint.exists(),
+    )
+
+
+async def interrupt_orphaned_executions(
+    session_factory: Optional[Callable[[], Any]] = None,
+    timeout_seconds: int = EXECUTION_ORPHAN_TIMEOUT_SECONDS,
+) -> int:
+    """
+    Mark checkpointed executions left "running" by a lost worker as "interrupted",
+    so they can be resumed. Returns the number of executions marked.
+    """
+    session_factory = session_factory or database.AsyncSessionLocal
+    if not session_factory:
+        return 0
+    statement = (
+        update(WorkflowExecution)
+        .where(orphaned_execution_clause(timeout_seconds))
+        .values(status="interrupted", error_message="Execution was interrupted before it completed")
+        .execution_options(synchronize_session=False)
+    )
+    async with session_factory() as db:
+        result = await db.execute(statement)
+        await db.commit()
+    return result.rowcount or 0
 
 
 def create_checkpointer(
     database_url: Optional[str] = None,
-    use_memory: bool = False
+    use_memory: bool = False,
+    max_bytes: int = EXECUTION_CHECKPOINT_MAX_KB * 1024,
 ) -> BaseCheckpointSaver:
     """
     Create an appropriate checkpointer based on configuration.
@@ -323,9 +550,11 @@ def create_checkpointer(
     Args:
         database_url: PostgreSQL connection URL (optional)
         use_memory: Force use of in-memory checkpointer
+        max_bytes: Largest checkpoint the durable checkpointer persists
     
     Returns:
-        BaseCheckpointSaver: Configured checkpointer instance
+        BaseCheckpointSaver: ExecutionCheckpointSaver when a database is
+        configured, MemorySaver otherwise
     """
     start_time = time.time()
     
@@ -336,10 +565,9 @@ def create_checkpointer(
         "database_url_provided": bool(database_url),
         "use_memory_forced": use_memory,
         "database_disabled": database_disabled,
-        "postgres_available": _POSTGRES_AVAILABLE
     })
     
-    if use_memory or database_disabled or not database_url or not _POSTGRES_AVAILABLE:
+    if use_memory or database_disabled or not database_url:
         reason = []
         if use_memory:
             reason.append("memory forced")
@@ -347,8 +575,6 @@ def create_checkpointer(
             reason.append("database disabled")
         if not database_url:
             reason.append("no database URL")
-        if not _POSTGRES_AVAILABLE:
-            reason.append("PostgresSaver not available")
         
         duration = time.time() - start_time
         logger.info("Using in-memory checkpointer", extra={
@@ -359,72 +585,33 @@ def create_checkpointer(
         
         return MemorySaver()
     
-    try:
-        logger.info("Attempting to create PostgreSQL checkpointer", extra={
-            "database_url_length": len(database_url) if database_url else 0
-        })
-        
-        if PostgresSaver is None:
-            raise ImportError("PostgresSaver not available")
-        
-        # Time the connection setup
-        setup_start = time.time()
-        checkpointer = PostgresSaver.from_conn_string(database_url)
-        connection_duration = time.time() - setup_start
-        
-        logger.info("PostgreSQL checkpointer created", extra={
-            "connection_duration_ms": round(connection_duration * 1000, 2)
-        })
-        
-        # Test connection setup - PostgresSaver uses async context manager pattern
-        test_start = time.time()
-        try:
-            # Try to setup if the method exists
-            if hasattr(checkpointer, 'setup') and callable(checkpointer.setup):
-                checkpointer.setup()
-            else:
-                logger.info("PostgreSQL checkpointer doesn't require explicit setup")
-        except Exception as setup_error:
-            logger.warning(f"PostgreSQL checkpointer setup failed, but continuing: {setup_error}")
-        test_duration = time.time() - test_start
-        
-        total_duration = time.time() - start_time
-        
-        logger.info("PostgreSQL checkpointer initialized successfully", extra={
-            "test_duration_ms": round(test_duration * 1000, 2),
-            "total_duration_ms": round(total_duration * 1000, 2)
-        })
-        
-        log_performance("create_postgres_checkpointer", total_duration, 
-                       checkpointer_type="postgres",
-                       connection_duration_ms=round(connection_duration * 1000, 2),
-                       test_duration_ms=round(test_duration * 1000, 2))
-        
-        return checkpointer
-                
-    except Exception as e:
-        duration = time.time() - start_time
-        
-        logger.error("Failed to create PostgreSQL checkpointer", extra={
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "duration_ms": round(duration * 1000, 2),
-            "database_disabled": database_disabled
-        })
-        
-        if not database_disabled:  # Only warn if database was expected to work
-            warnings.warn(f"Could not create PostgreSQL checkpointer: {e}")
-        
-        logger.info("Falling back to in-memory checkpointer", extra={
-            "fallback_reason": "postgres_failed",
-            "postgres_error": str(e)
-        })
-        
-        log_performance("create_checkpointer_fallback", duration, 
-                       checkpointer_type="memory_fallback",
-                       original_error=str(e))
-        
-        return MemorySaver()
+    # Checkpoints go through the application's async engine into execution_checkpoints;
+    # langgraph's PostgresSaver is synchronous and would need a second connection pool.
+    checkpointer = ExecutionCheckpointSaver(max_bytes=max_bytes)
+    duration = time.time() - start_time
+    logger.info("Using execution checkpoint saver", extra={
+        "max_bytes": max_bytes,
+        "setup_duration_ms": round(duration * 1000, 2)
+    })
+    log_performance("create_postgres_checkpointer", duration, checkpointer_type="postgres")
+    
+    return checkpointer
+
+
+def create_execution_checkpointer(
+    flow_data: Optional[Dict[str, Any]],
+    force: bool = False,
+) -> Optional[BaseCheckpointSaver]:
+    """
+    Durable checkpointer for one workflow run, or None when the workflow has
+    checkpointing off (the engine then keeps its in-memory default, so fast
+    flows pay nothing). ``force`` ignores the workflow setting, for resumes.
+    """
+    enabled, max_bytes = checkpoint_settings(flow_data)
+    if not (enabled or force):
+        return None
+    checkpointer = create_checkpointer(DATABASE_URL, max_bytes=max_bytes)
+    return checkpointer if isinstance(checkpointer, ExecutionCheckpointSaver) else None
 
 
 def get_default_checkpointer() -> BaseCheckpointSaver:
@@ -444,7 +631,7 @@ def get_default_checkpointer() -> BaseCheckpointSaver:
     checkpointer = create_checkpointer(database_url)
     
     duration = time.time() - start_time
-    checkpointer_type = "postgres" if hasattr(checkpointer, 'conn') else "memory"
+    checkpointer_type = "postgres" if isinstance(checkpointer, ExecutionCheckpointSaver) else "memory"
     
     logger.info("Default checkpointer created", extra={
         "checkpointer_type": checkpointer_type,
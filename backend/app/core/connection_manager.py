@@ -13,6 +13,7 @@ from collections import defaultdict
 import time
 
 from .connection_pool import ConnectionPool, PooledConnection
+from .flow_topology import is_cycle, strongly_connected_components
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +68,8 @@ class ConnectionManager:
         self._connection_graph: Dict[str, Set[str]] = defaultdict(set)
         self._reverse_graph: Dict[str, Set[str]] = defaultdict(set)
         self._validation_cache: Dict[str, Tuple[bool, List[str]]] = {}
+        # Cyclic strongly connected component of each node in the current build
+        self._cyclic_component: Dict[str, int] = {}
         self._cache_hits = 0
         self._cache_misses = 0
         
@@ -106,6 +109,8 @@ class ConnectionManager:
         for node_id in nodes.keys():
             self._connection_cache[node_id] = NodeConnectionMap(node_id=node_id)
         
+        self._cyclic_component = self._find_cyclic_components(connections, nodes)
+        
         # Process connections
         valid_connections = 0
         invalid_connections = 0
@@ -160,13 +165,28 @@ class ConnectionManager:
         """
         errors = []
         
-        # Check cache first
+        # Check cache first (node and handle checks only; cycles depend on the current graph)
         cache_key = f"{conn_info.source_node_id}:{conn_info.source_handle}->{conn_info.target_node_id}:{conn_info.target_handle}"
         if cache_key in self._validation_cache:
             self._cache_hits += 1
-            return self._validation_cache[cache_key]
+            is_valid, errors = self._validation_cache[cache_key]
+        else:
+            self._cache_misses += 1
+            is_valid, errors = self._validation_cache[cache_key] = self._check_nodes_and_handles(conn_info, nodes)
+        
+        # 4. Check for circular dependencies
+        if conn_info.source_node_id in nodes and conn_info.target_node_id in nodes:
+            if self._creates_circular_dependency(conn_info.source_node_id, conn_info.target_node_id):
+                errors = errors + [f"Circular dependency detected: {conn_info.source_node_id} -> {conn_info.target_node_id}"]
         
-        self._cache_misses += 1
+        return len(errors) == 0, errors
+    
+    def _check_nodes_and_handles(
+        self,
+        conn_info: ConnectionInfo,
+        nodes: Dict[str, Any]
+    ) -> Tuple[bool, List[str]]:
+        errors = []
         
         # 1. Check if nodes exist
         if conn_info.source_node_id not in nodes:
@@ -176,9 +196,7 @@ class ConnectionManager:
             errors.append(f"Target node '{conn_info.target_node_id}' not found")
         
         if errors:
-            result = (False, errors)
-            self._validation_cache[cache_key] = result
-            return result
+            return False, errors
         
         # 2. Validate node handles
         source_node = nodes[conn_info.source_node_id]
@@ -196,13 +214,7 @@ class ConnectionManager:
         if not self._validate_type_compatibility(source_node, target_node, conn_info):
             errors.append(f"Type incompatibility: {conn_info.source_handle} -> {conn_info.target_handle}")
         
-        # 4. Check for circular dependencies
-        if self._creates_circular_dependency(conn_info.source_node_id, conn_info.target_node_id):
-            errors.append(f"Circular dependency detected: {conn_info.source_node_id} -> {conn_info.target_node_id}")
-        
-        result = (len(errors) == 0, errors)
-        self._validation_cache[cache_key] = result
-        return result
+        return len(errors) == 0, errors
     
     def _validate_output_handle(self, node: Any, handle: str) -> bool:
         """Validate if node has the specified output handle."""
@@ -238,39 +250,43 @@ class ConnectionManager:
         except Exception:
             return True
     
+    def _find_cyclic_components(self, connections: List[Any], nodes: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Map each node on a cycle of the full connection graph to its strongly
+        connected component. Computed once per build, O(V + E).
+        """
+        successors: Dict[str, List[str]] = defaultdict(list)
+        for conn in connections:
+            if conn.source_node_id in nodes and conn.target_node_id in nodes:
+                successors[conn.source_node_id].append(conn.target_node_id)
+        
+        component_of: Dict[str, int] = {}
+        for number, component in enumerate(strongly_connected_components(list(successors), successors)):
+            if is_cycle(component, successors):
+                for node_id in component:
+                    component_of[node_id] = number
+        return component_of
+    
     def _creates_circular_dependency(self, source_id: str, target_id: str) -> bool:
         """Check if adding this connection would create a circular dependency."""
-        # Use DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-        
-        def has_cycle(node_id: str) -> bool:
-            if node_id in rec_stack:
-                return True
-            if node_id in visited:
-                return False
-            
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            
-            # Check all outgoing connections
-            for neighbor in self._connection_graph.get(node_id, set()):
-                if has_cycle(neighbor):
-                    return True
-            
-            rec_stack.remove(node_id)
+        # An edge between different components (or outside any cycle) can never close one
+        component = self._cyclic_component.get(source_id)
+        if component is None or self._cyclic_component.get(target_id) != component:
             return False
         
-        # Temporarily add the new connection
-        self._connection_graph[source_id].add(target_id)
-        
-        # Check for cycles
-        cycle_detected = has_cycle(source_id)
-        
-        # Remove the temporary connection
-        self._connection_graph[source_id].discard(target_id)
-        
-        return cycle_detected
+        # Accepted connections are kept acyclic, so the new edge closes a cycle exactly
+        # when its source is already reachable from its target
+        seen = {target_id}
+        pending = [target_id]
+        while pending:
+            node_id = pending.pop()
+            if node_id == source_id:
+                return True
+            for neighbor in self._connection_graph.get(node_id, ()):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    pending.append(neighbor)
+        return False
     
     def _add_connection_to_mappings(self, conn_info: ConnectionInfo):
         """Add validated connection to mappings."""
@@ -140,6 +140,16 @@ DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
 DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
+# Read Replica - optional; read-only endpoints use it while its lag is within bounds
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", "5"))
+
+# Node Data Access - nodes reach the database through a per-execution async repository
+NODE_DB_CALL_TIMEOUT = float(os.getenv("NODE_DB_CALL_TIMEOUT", "30"))
+# Synchronous sessions opened on the event loop thread: "warn", "raise" or "off"
+DB_EVENT_LOOP_GUARD = os.getenv("DB_EVENT_LOOP_GUARD", "warn").lower()
+
 # Credential encryption key - MUST be set via environment variable in production
 _default_credential_key = "dev-only-insecure-key-change-me"
 CREDENTIAL_MASTER_KEY = os.getenv("CREDENTIAL_MASTER_KEY", _default_credential_key)
@@ -175,6 +185,10 @@ RATE_LIMIT_WINDOW = "60"
 # Engine Settings
 AF_USE_STUB_ENGINE = "false"
 
+# Node Registry Manifest
+# Register nodes from app/nodes/manifest.json at startup and import node modules on first use.
+NODE_MANIFEST_ENABLED = os.getenv("NODE_MANIFEST_ENABLED", "true").lower() == "true"
+
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
@@ -187,4 +201,110 @@ KEYCLOAK_CLIENT_ID = os.getenv("KEYCLOAK_CLIENT_ID")
 KEYCLOAK_VERIFY_SSL = os.getenv("KEYCLOAK_VERIFY_SSL", "true").lower() == "true"
 
 # Master API Key for bypassing authorization on execution endpoints
-MASTER_API_KEY = os.getenv("MASTER_API_KEY")
\ No newline at end of file
+MASTER_API_KEY = os.getenv("MASTER_API_KEY")
+
+# Execution Output Blob Store
+# Node outputs larger than the threshold are spilled out of workflow_executions.outputs
+# into a content-addressed store and referenced by digest.
+EXECUTION_OUTPUT_SPILL_THRESHOLD_KB = int(os.getenv("EXECUTION_OUTPUT_SPILL_THRESHOLD_KB", "256"))
+EXECUTION_OUTPUT_PREVIEW_CHARS = int(os.getenv("EXECUTION_OUTPUT_PREVIEW_CHARS", "512"))
+BLOB_STORE_BACKEND = os.getenv("BLOB_STORE_BACKEND", "local").lower()  # "local" or "s3"
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "blobs")
+BLOB_STORE_S3_BUCKET = os.getenv("BLOB_STORE_S3_BUCKET")
+BLOB_STORE_S3_PREFIX = os.getenv("BLOB_STORE_S3_PREFIX", "execution-outputs/")
+BLOB_STORE_S3_ENDPOINT_URL = os.getenv("BLOB_STORE_S3_ENDPOINT_URL")
+
+# Vector Bulk Ingest
+# Records buffered per COPY batch; bounds memory for large NDJSON uploads.
+VECTOR_INGEST_BATCH_SIZE = int(os.getenv("VECTOR_INGEST_BATCH_SIZE", "5000"))
+VECTOR_INGEST_MAX_LINE_BYTES = int(os.getenv("VECTOR_INGEST_MAX_LINE_BYTES", str(8 * 1024 * 1024)))
+# Embedding widths that get a partial HNSW index on vector_documents.embedding_vector.
+# The column itself is unconstrained (each collection has its own width); pgvector indexes
+# only fixed-width vectors of at most 2000 dimensions, so other widths are scanned.
+VECTOR_INDEXED_DIMENSIONS = tuple(
+    int(dimension) for dimension in os.getenv("VECTOR_INDEXED_DIMENSIONS", "384,768,1024,1536").split(",")
+    if dimension.strip()
+)
+
+# Vector Store Engine Registry
+# PGVector engines are shared per DSN across executions; idle engines are disposed.
+VECTOR_STORE_POOL_SIZE = int(os.getenv("VECTOR_STORE_POOL_SIZE", "5"))
+VECTOR_STORE_MAX_OVERFLOW = int(os.getenv("VECTOR_STORE_MAX_OVERFLOW", "5"))
+VECTOR_STORE_POOL_RECYCLE = int(os.getenv("VECTOR_STORE_POOL_RECYCLE", "1800"))
+VECTOR_STORE_ENGINE_IDLE_TTL = int(os.getenv("VECTOR_STORE_ENGINE_IDLE_TTL", "600"))
+VECTOR_STORE_MAX_ENGINES = int(os.getenv("VECTOR_STORE_MAX_ENGINES", "16"))
+VECTOR_STORE_COLLECTION_CACHE_TTL = int(os.getenv("VECTOR_STORE_COLLECTION_CACHE_TTL", "300"))
+
+# LLM HTTP Client Registry
+# Keep-alive httpx clients shared by chat model nodes, per (base URL, credential, timeout).
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20"))
+LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "10"))
+LLM_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60"))
+LLM_HTTP_CLIENT_IDLE_TTL = int(os.getenv("LLM_HTTP_CLIENT_IDLE_TTL", "900"))
+LLM_HTTP_MAX_CLIENTS = int(os.getenv("LLM_HTTP_MAX_CLIENTS", "64"))
+# Idle clients are swept on access and by a background task at most this often (seconds)
+LLM_HTTP_CLIENT_SWEEP_INTERVAL = float(os.getenv("LLM_HTTP_CLIENT_SWEEP_INTERVAL", "60"))
+
+# LLM Response Cache
+# Opt-in per LLM node; the backend is shared process-wide so entries survive node rebuilds.
+LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "memory").lower()  # "memory" or "postgres"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+LLM_CACHE_DEFAULT_TTL = int(os.getenv("LLM_CACHE_DEFAULT_TTL", "3600"))
+
+# Search Result Cache
+# TTL cache with single-flight coalescing for web search tools; a TTL of 0 disables caching.
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "2000"))
+
+# Webhook Rate Limiting and Stats Buffering
+# Token buckets live in process memory; stats and event logs are flushed to Postgres in batches.
+WEBHOOK_RATE_LIMIT_BURST_SECONDS = float(os.getenv("WEBHOOK_RATE_LIMIT_BURST_SECONDS", "10"))
+WEBHOOK_RATE_LIMIT_MAX_BUCKETS = int(os.getenv("WEBHOOK_RATE_LIMIT_MAX_BUCKETS", "10000"))
+WEBHOOK_STATS_FLUSH_INTERVAL = float(os.getenv("WEBHOOK_STATS_FLUSH_INTERVAL", "1.0"))
+WEBHOOK_STATS_MAX_PENDING_EVENTS = int(os.getenv("WEBHOOK_STATS_MAX_PENDING_EVENTS", "10000"))
+
+# Webhook Event Bus
+# Per-webhook ring buffers for replay; events are relayed between replicas with Postgres NOTIFY.
+WEBHOOK_EVENT_BUFFER_SIZE = int(os.getenv("WEBHOOK_EVENT_BUFFER_SIZE", "1000"))
+WEBHOOK_EVENT_MAX_WEBHOOKS = int(os.getenv("WEBHOOK_EVENT_MAX_WEBHOOKS", "1000"))
+WEBHOOK_EVENT_MAX_SUBSCRIBERS = int(os.getenv("WEBHOOK_EVENT_MAX_SUBSCRIBERS", "100"))
+WEBHOOK_EVENT_QUEUE_SIZE = int(os.getenv("WEBHOOK_EVENT_QUEUE_SIZE", "1000"))
+WEBHOOK_EVENT_CHANNEL = os.getenv("WEBHOOK_EVENT_CHANNEL", "kai_webhook_events")
+# Notifications waiting for the background relay task; overflow is dropped, never awaited on a request
+WEBHOOK_EVENT_RELAY_QUEUE_SIZE = int(os.getenv("WEBHOOK_EVENT_RELAY_QUEUE_SIZE", "10000"))
+
+# Conversation Memory Session Store
+# Resident ConversationMemory sessions per process; evicted sessions are rehydrated from the memories table.
+CONVERSATION_MEMORY_MAX_SESSIONS = int(os.getenv("CONVERSATION_MEMORY_MAX_SESSIONS", "1000"))
+CONVERSATION_MEMORY_IDLE_TTL = float(os.getenv("CONVERSATION_MEMORY_IDLE_TTL", "1800"))
+
+# Near-Duplicate Detection
+# MinHash signature length and word-shingle size used by the document loader's LSH dedup.
+DEDUP_NUM_PERM = int(os.getenv("DEDUP_NUM_PERM", "128"))
+DEDUP_SHINGLE_SIZE = int(os.getenv("DEDUP_SHINGLE_SIZE", "5"))
+
+# Trace Sampling and Export
+# Head sampling decides at trace start (every trace unless a strategy is configured, e.g.
+# "probabilistic" with TRACE_HEAD_SAMPLE_RATE); tail sampling additionally keeps failing and slow traces.
+# Kept traces go through a bounded queue drained by a background batch exporter (log, file, postgres or none).
+TRACE_SAMPLING_STRATEGY = os.getenv("TRACE_SAMPLING_STRATEGY", "always")
+TRACE_HEAD_SAMPLE_RATE = float(os.getenv("TRACE_HEAD_SAMPLE_RATE", "0.1"))
+TRACE_TAIL_SAMPLING = os.getenv("TRACE_TAIL_SAMPLING", "true").lower() in ("true", "1", "t")
+TRACE_TAIL_LATENCY_MS = float(os.getenv("TRACE_TAIL_LATENCY_MS", "5000"))
+TRACE_EXPORT_SINK = os.getenv("TRACE_EXPORT_SINK", "log")
+TRACE_EXPORT_FILE = os.getenv("TRACE_EXPORT_FILE", "traces.jsonl")
+TRACE_EXPORT_QUEUE_SIZE = int(os.getenv("TRACE_EXPORT_QUEUE_SIZE", "10000"))
+TRACE_EXPORT_BATCH_SIZE = int(os.getenv("TRACE_EXPORT_BATCH_SIZE", "512"))
+TRACE_EXPORT_INTERVAL = float(os.getenv("TRACE_EXPORT_INTERVAL", "2.0"))
+
+# Durable Execution Checkpoints
+# Per-workflow opt-in (flow_data.settings.checkpointing); enabled runs persist their latest
+# LangGraph checkpoint to execution_checkpoints after every superstep and can be resumed.
+EXECUTION_CHECKPOINTS_DEFAULT = os.getenv("EXECUTION_CHECKPOINTS_DEFAULT", "false").lower() in ("true", "1", "t")
+EXECUTION_CHECKPOINT_MAX_KB = int(os.getenv("EXECUTION_CHECKPOINT_MAX_KB", "1024"))
+# A checkpointed execution still "running" with no new checkpoint for this long lost its worker
+EXECUTION_ORPHAN_TIMEOUT_SECONDS = int(os.getenv("EXECUTION_ORPHAN_TIMEOUT_SECONDS", "900"))
+
+# Flow Validation
+# Validation results are cached per process by a hash of the flow's nodes and edges.
+FLOW_VALIDATION_CACHE_SIZE = int(os.getenv("FLOW_VALIDATION_CACHE_SIZE", "256"))
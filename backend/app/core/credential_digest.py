@@ -0,0 +1,16 @@
+"""
+Credential Digests
+==================
+
+Non-reversible identifiers for API keys, used wherever a cache or pool must be
+partitioned per credential without holding the secret itself (LLM HTTP client
+registry, search result cache).
+"""
+
+import hashlib
+from typing import Optional
+
+
+def credential_fingerprint(api_key: Optional[str]) -> str:
+    """Short, non-reversible identifier for an API key."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
@@ -3,12 +3,35 @@ KAI-Fusion Database Management - Clean & Simple Implementation
 ============================================================
 
 Simple, standard SQLAlchemy database configuration with proper session management.
+
+Read replica (optional, DATABASE_REPLICA_URL):
+• Read-only endpoints depend on ``get_read_db_session`` instead of
+  ``get_db_session``; without a replica both are the same primary session
+• Routing is per statement: plain SELECTs go to the replica, anything else
+  (flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, raw SQL) goes to the
+  primary and pins the rest of the session there, so a request reads its own writes
+• ``ReplicaLagMonitor`` measures replay lag in a background task every
+  REPLICA_LAG_CHECK_INTERVAL seconds, off the request path; beyond
+  REPLICA_MAX_LAG_SECONDS, if the replica is unreachable, or if no fresh
+  measurement exists, reads fall back to the primary
+
+To try it locally, run two Postgres instances (a streaming replica, or simply
+two independent servers with the same schema - a server that is not in
+recovery reports zero lag) and point DATABASE_URL / DATABASE_REPLICA_URL at them.
+
+Event loop guard (DB_EVENT_LOOP_GUARD): checking a connection out of the
+synchronous engine on the event loop thread stalls every request; it is logged
+("warn"), refused with BlockingDatabaseCallError ("raise") or ignored ("off").
+Code running on the loop uses the async engine instead.
 """
 
+import asyncio
 import logging
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import re
+import time
+from typing import Generator, Optional
+from sqlalchemy import Select, create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.pool import QueuePool
 
@@ -16,8 +39,11 @@ from app.core.constants import (
     DATABASE_URL, DISABLE_DATABASE,
     POSTGRES_USERNAME, POSTGRES_PASSWORD,
     DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
-    DB_POOL_RECYCLE, DB_POOL_PRE_PING
+    DB_POOL_RECYCLE, DB_POOL_PRE_PING,
+    DATABASE_REPLICA_URL, REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL,
+    DB_EVENT_LOOP_GUARD
 )
+from app.core.json_utils import json_dumps_str
 from app.core.logging_config import log_database_operation
 
 logger = logging.getLogger(__name__)
@@ -27,6 +53,142 @@ engine = None
 async_engine = None
 SessionLocal = None
 AsyncSessionLocal = None
+replica_engine = None
+ReadSessionLocal = None
+
+event_loop_guard_mode = DB_EVENT_LOOP_GUARD
+
+
+class BlockingDatabaseCallError(RuntimeError):
+    """A synchronous database call was made on the event loop thread."""
+
+
+def on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def guard_blocking_call(operation: str) -> None:
+    """Report, or in "raise" mode refuse, blocking database I/O on the event loop thread."""
+    if event_loop_guard_mode == "off" or not on_event_loop_thread():
+        return
+    message = f"Blocking database call on the event loop thread: {operation}"
+    if event_loop_guard_mode == "raise":
+        raise BlockingDatabaseCallError(message)
+    logger.warning(message)
+
+
+def install_event_loop_guard(sync_engine) -> None:
+    """Run ``guard_blocking_call`` on every connection checkout of a synchronous engine."""
+    operation = f"checkout from {sync_engine.url}"
+    event.listen(sync_engine, "checkout", lambda *_: guard_blocking_call(operation))
+
+# Replay lag of the replica in seconds; 0 when the server is not in recovery
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+class ReplicaLagMonitor:
+    """
+    Tracks whether the replica is fresh enough to serve reads. A background
+    task (started in the application lifespan) re-measures the lag every
+    ``interval`` seconds; requests only read ``usable``.
+    """
+
+    def __init__(self, max_lag: float = REPLICA_MAX_LAG_SECONDS,
+                 interval: float = REPLICA_LAG_CHECK_INTERVAL):
+        self.max_lag = max_lag
+        self.interval = interval
+        self.lag_seconds: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def usable(self) -> bool:
+        # A measurement the refresh task has not renewed (task stopped or stuck) is not trusted
+        fresh = self.checked_at is not None and time.monotonic() - self.checked_at <= 3 * max(self.interval, 1)
+        return fresh and self.error is None and self.lag_seconds is not None and self.lag_seconds <= self.max_lag
+
+    async def _measure(self, replica) -> float:
+        async with replica.connect() as conn:
+            return float(await conn.scalar(text(REPLICA_LAG_QUERY)) or 0)
+
+    async def refresh(self, replica) -> None:
+        try:
+            self.lag_seconds = await asyncio.wait_for(self._measure(replica), timeout=max(self.interval, 1))
+            self.error = None
+            if self.lag_seconds > self.max_lag:
+                logger.warning(f"Replica lag {self.lag_seconds:.1f}s exceeds {self.max_lag}s, reading from primary")
+        except Exception as e:
+            self.error = str(e) or type(e).__name__
+            logger.warning(f"Replica lag check failed, reading from primary: {self.error}")
+        finally:
+            self.checked_at = time.monotonic()
+
+    async def _run(self, replica) -> None:
+        while True:
+            await self.refresh(replica)
+            await asyncio.sleep(self.interval)
+
+    async def start(self, replica) -> None:
+        """Start refreshing in the background; without a replica there is nothing to watch."""
+        if replica is None or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(replica))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "usable": self.usable,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": self.max_lag,
+            "error": self.error,
+            "refreshing": self._task is not None and not self._task.done(),
+        }
+
+
+replica_lag_monitor = ReplicaLagMonitor()
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to the replica while the lag monitor
+    allows it. Anything that may write pins the session to the primary.
+    """
+
+    def __init__(self, *args, primary=None, replica=None, lag_monitor=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.lag_monitor = lag_monitor
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is None or self.info.get("primary_only"):
+            return self.primary
+        if isinstance(clause, Select) and clause._for_update_arg is None and not self._flushing:
+            if self.lag_monitor is None or self.lag_monitor.usable:
+                return self.replica
+            return self.primary
+        # Flushes, DML, locking reads and raw SQL: read-your-writes from here on
+        self.info["primary_only"] = True
+        return self.primary
 
 def create_database_url_variants(base_url: str) -> tuple[str, str]:
     """Create sync and async variants of database URL using psycopg3."""
@@ -56,9 +218,8 @@ def create_database_url_variants(base_url: str) -> tuple[str, str]:
     
     return sync_url, async_url
 
-def build_database_url() -> str:
-    """Build or modify DATABASE_URL with username/password if provided."""
-    database_url = DATABASE_URL
+def build_database_url(database_url: Optional[str] = DATABASE_URL) -> str:
+    """Build or modify DATABASE_URL (or the replica URL) with username/password if provided."""
     
     # If no DATABASE_URL provided, we can't build one without more info
     if not database_url:
@@ -102,9 +263,16 @@ def build_database_url() -> str:
     # Use DATABASE_URL as-is
     return database_url
 
+def build_asyncpg_dsn() -> Optional[str]:
+    """Build a plain ``postgresql://`` DSN for code that talks to asyncpg directly."""
+    database_url = build_database_url()
+    if not database_url:
+        return None
+    return re.sub(r'^postgresql\+\w+://', 'postgresql://', database_url)
+
 def initialize_database():
     """Initialize database engines and session factories."""
-    global engine, async_engine, SessionLocal, AsyncSessionLocal
+    global engine, async_engine, SessionLocal, AsyncSessionLocal, replica_engine, ReadSessionLocal
     
     if DISABLE_DATABASE:
         logger.info("Database is disabled")
@@ -140,6 +308,8 @@ def initialize_database():
             "pool_pre_ping": DB_POOL_PRE_PING,
             "poolclass": QueuePool,
             "echo": False,
+            # JSON/JSONB binds are encoded by orjson with the registered type handlers
+            "json_serializer": json_dumps_str,
         }
         
         # Connection pool configuration for async engine (no poolclass)
@@ -150,11 +320,13 @@ def initialize_database():
             "pool_recycle": DB_POOL_RECYCLE,
             "pool_pre_ping": DB_POOL_PRE_PING,
             "echo": False,
+            "json_serializer": json_dumps_str,
         }
         
         # Create synchronous engine
         if sync_url:
             engine = create_engine(sync_url, **sync_connection_args)
+            install_event_loop_guard(engine)
             SessionLocal = sessionmaker(
                 autocommit=False,
                 autoflush=False,
@@ -173,6 +345,24 @@ def initialize_database():
                 expire_on_commit=False
             )
             logger.info("✅ Asynchronous database engine initialized")
+        
+        # Optional read replica, used only through ReadSessionLocal
+        replica_url = build_database_url(DATABASE_REPLICA_URL) if DATABASE_REPLICA_URL else None
+        if replica_url and async_engine is not None:
+            _, replica_async_url = create_database_url_variants(replica_url)
+            replica_engine = create_async_engine(replica_async_url, **async_connection_args)
+            ReadSessionLocal = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                class_=AsyncSession,
+                sync_session_class=RoutingSession,
+                primary=async_engine.sync_engine,
+                replica=replica_engine.sync_engine,
+                lag_monitor=replica_lag_monitor,
+                expire_on_commit=False
+            )
+            masked_replica_url = re.sub(r'://([^:]+):([^@]+)@', r'://\1:***@', replica_url)
+            logger.info(f"✅ Read replica engine initialized: {masked_replica_url}")
             
     except Exception as e:
         logger.error(f"❌ Failed to initialize database: {e}")
@@ -207,6 +397,24 @@ async def get_db_session():
     async with AsyncSessionLocal() as session:
         yield session
 
+async def get_read_db_session():
+    """
+    Get async database session dependency for read-mostly endpoints.
+
+    Plain SELECTs are served by the read replica when one is configured and
+    its lag is within bounds; writes and everything after them use the primary.
+    """
+    if not AsyncSessionLocal:
+        raise RuntimeError("Database is not enabled. Set DATABASE_URL to enable database functionality.")
+    
+    if ReadSessionLocal is None:
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
+    
+    async with ReadSessionLocal() as session:
+        yield session
+
 def get_db_session_context():
     """Get database session as async context manager for manual usage."""
     if not AsyncSessionLocal:
@@ -265,8 +473,11 @@ def get_database_stats() -> dict:
         "database_enabled": True,
         "sync_engine": engine is not None,
         "async_engine": async_engine is not None,
-        "database_url_set": bool(DATABASE_URL)
+        "database_url_set": bool(DATABASE_URL),
+        "replica_engine": replica_engine is not None
     }
+    if replica_engine is not None:
+        stats["replica"] = replica_lag_monitor.stats()
     
     # Get pool status if available
     if engine and hasattr(engine, 'pool'):
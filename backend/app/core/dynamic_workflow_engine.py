@@ -293,7 +293,9 @@ class DynamicWorkflowEngine:
                 user_id=context.user_id,
                 owner_id=context.owner_id,
                 workflow_id=context.workflow_id,
-                stream=stream
+                stream=stream,
+                execution_id=context.runtime_config.get("execution_id"),
+                resume=context.runtime_config.get("resume", False),
             )
             
             logger.info(f"✅ Dynamic workflow execution completed")
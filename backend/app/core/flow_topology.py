@@ -0,0 +1,172 @@
+"""
+Flow Topology
+=============
+
+Linear-time structural analysis of a workflow graph, shared by
+``ValidationEngine`` and ``ConnectionManager``:
+
+• Components - strongly connected components (Tarjan, iterative so deep
+               chains do not hit the recursion limit)
+• Order      - a topological order of the components; nodes of one cycle are
+               adjacent, everything else is in dependency order
+• Cycles     - the components that actually contain a cycle (more than one
+               node, or a self-loop)
+• Handles    - every edge's sourceHandle/targetHandle checked against the
+               node type's declared outputs/inputs
+
+Everything is computed in one pass over the nodes and edges, O(V + E), so a
+flow with thousands of nodes is analyzed in milliseconds.
+
+Usage:
+    from app.core.flow_topology import analyze_flow
+
+    topology = analyze_flow(flow["nodes"], flow["edges"], handles_for=spec_lookup)
+    for cycle in topology.cycles:
+        ...
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# (input handle names, output handle names) declared by a node type
+HandleSpec = Tuple[Set[str], Set[str]]
+
+DEFAULT_SOURCE_HANDLE = "output"
+DEFAULT_TARGET_HANDLE = "input"
+# Node types that are never reported as isolated
+UNCONNECTED_OK_TYPES = {"StartNode", "EndNode"}
+
+
+@dataclass
+class FlowTopology:
+    """Structure of a flow, see the module docstring."""
+    order: List[str]
+    cycles: List[List[str]]
+    isolated: List[str]
+    handle_problems: List[str]
+
+    @property
+    def is_acyclic(self) -> bool:
+        return not self.cycles
+
+
+def strongly_connected_components(
+    nodes: Iterable[str], successors: Mapping[str, Iterable[str]]
+) -> List[List[str]]:
+    """
+    Strongly connected components of the graph, in topological order (a
+    component comes before every component it has an edge into).
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors.get(root, ())))]
+
+        while work:
+            node, neighbors = work[-1]
+            descended = False
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(successors.get(neighbor, ()))))
+                    descended = True
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    # Tarjan emits sink components first
+    components.reverse()
+    return components
+
+
+def is_cycle(component: List[str], successors: Mapping[str, Iterable[str]]) -> bool:
+    return len(component) > 1 or component[0] in successors.get(component[0], ())
+
+
+def analyze_flow(
+    nodes: List[Dict[str, Any]],
+    edges: List[Dict[str, Any]],
+    handles_for: Optional[Callable[[str], Optional[HandleSpec]]] = None,
+) -> FlowTopology:
+    """
+    Analyze a flow's nodes and edges in one pass.
+
+    ``handles_for`` maps a node type to its declared handles, or None to skip
+    the handle check for that type; it is called at most once per type.
+    Edges that reference unknown nodes are ignored here (validation reports them).
+    """
+    node_types = {node.get("id"): node.get("type") for node in nodes if node.get("id")}
+    successors: Dict[str, List[str]] = {node_id: [] for node_id in node_types}
+    connected: Set[str] = set()
+    specs: Dict[Any, Optional[HandleSpec]] = {}
+    handle_problems: List[str] = []
+
+    def spec_of(node_id: str) -> Optional[HandleSpec]:
+        node_type = node_types.get(node_id)
+        if handles_for is None or node_type is None:
+            return None
+        if node_type not in specs:
+            specs[node_type] = handles_for(node_type)
+        return specs[node_type]
+
+    for edge in edges:
+        source, target = edge.get("source"), edge.get("target")
+        if not source or not target:
+            continue
+        connected.add(source)
+        connected.add(target)
+        if source in node_types and target in node_types:
+            successors[source].append(target)
+
+        source_spec = spec_of(source)
+        source_handle = edge.get("sourceHandle") or DEFAULT_SOURCE_HANDLE
+        if (source_spec is not None and isinstance(source_handle, str)
+                and source_handle != DEFAULT_SOURCE_HANDLE and source_handle not in source_spec[1]):
+            handle_problems.append(
+                f"Edge {source} -> {target}: {node_types[source]} has no output handle '{source_handle}'"
+            )
+        target_spec = spec_of(target)
+        target_handle = edge.get("targetHandle") or DEFAULT_TARGET_HANDLE
+        if (target_spec is not None and isinstance(target_handle, str)
+                and target_handle != DEFAULT_TARGET_HANDLE and target_handle not in target_spec[0]):
+            handle_problems.append(
+                f"Edge {source} -> {target}: {node_types[target]} has no input handle '{target_handle}'"
+            )
+
+    components = strongly_connected_components(node_types, successors)
+    return FlowTopology(
+        order=[node_id for component in components for node_id in component],
+        cycles=[component for component in components if is_cycle(component, successors)],
+        isolated=[
+            node_id for node_id, node_type in node_types.items()
+            if node_id not in connected and node_type not in UNCONNECTED_OK_TYPES
+        ],
+        handle_problems=handle_problems,
+    )
@@ -53,6 +53,12 @@ from app.core.tracing import get_workflow_tracer
 from app.core.node_handlers import node_handler_registry
 from app.core.output_cache import default_connection_extractor
 from app.core.connection_manager import ConnectionManager
+from app.core.node_data_access import (
+    NODE_DATA_ACCESS_KEY,
+    NodeDataAccess,
+    node_data_access_from,
+    use_node_data_access,
+)
 
 # Extracted component imports
 from .types import (
@@ -491,7 +497,11 @@ class GraphBuilder:
     def _wrap_node_enhanced(self, node_id: str, gnode: GraphNodeInstance) -> Callable[[FlowState], Dict[str, Any]]:
         """Enhanced node wrapper that uses NodeExecutor for execution."""
         
-        def wrapper(state: FlowState) -> Dict[str, Any]:
+        def wrapper(state: FlowState, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
+            with use_node_data_access(node_data_access_from(config)):
+                return run_node(state)
+
+        def run_node(state: FlowState) -> Dict[str, Any]:
             try:
                 logger.info(f"EXECUTING: {node_id} ({gnode.type}) with NodeExecutor")
                 
@@ -570,8 +580,12 @@ class GraphBuilder:
             target_id = conn.target_node_id
             source_handle = conn.source_handle
             
+            # Outgoing edges of control-flow nodes are added by ControlFlowManager
+            if source_id in self.control_flow_nodes:
+                continue
+            
             # Skip if either node is not in our graph (StartNode/EndNode handled separately)
-            if source_id not in self.nodes or target_id not in self.nodes:
+            if source_id not in self.nodes or (target_id not in self.nodes and target_id not in self.control_flow_nodes):
                 logger.debug(f"Skipping edge {source_id} -> {target_id} (node not in graph)")
                 continue
             
@@ -684,7 +698,7 @@ class GraphBuilder:
         if self.explicit_start_nodes:
             logger.info(f"START -> {list(self.explicit_start_nodes)}")
             for start_target in self.explicit_start_nodes:
-                if start_target in self.nodes:
+                if start_target in self.nodes or start_target in self.control_flow_nodes:
                     graph.add_edge(START, start_target)
                     logger.debug(f"START -> {start_target}")
                 else:
@@ -731,8 +745,19 @@ class GraphBuilder:
         owner_id: Optional[str] = None,
         workflow_id: Optional[str] = None,
         stream: bool = False,
+        execution_id: Optional[str] = None,
+        resume: bool = False,
     ) -> Union[Dict[str, Any], AsyncGenerator[Dict[str, Any], None]]:
-        """Run the compiled graph - preserved from original implementation."""
+        """
+        Run the compiled graph - preserved from original implementation.
+
+        ``execution_id`` keys durable checkpoints (see ExecutionCheckpointSaver);
+        with ``resume`` the run continues from the latest checkpoint of that
+        execution instead of starting from ``inputs``.
+
+        Nodes reach the database through a NodeDataAccess opened here and
+        closed when the run (or the stream) ends.
+        """
         if not self.graph:
             raise ValueError("Graph has not been built. Call build_from_flow().")
 
@@ -751,19 +776,49 @@ class GraphBuilder:
             variables=inputs,
             webhook_data=webhook_data,  # Add webhook data for templating
         )
-        config: RunnableConfig = {"configurable": {"thread_id": init_state.session_id}}
+        configurable: Dict[str, Any] = {"thread_id": init_state.session_id}
+        if execution_id:
+            configurable["execution_id"] = str(execution_id)
+        config: RunnableConfig = {
+            "configurable": configurable,
+            "recursion_limit": self._recursion_limit(),
+        }
+
+        # A None graph input makes LangGraph continue from the thread's latest checkpoint
+        graph_input = init_state
+        if resume:
+            if not execution_id or await self.checkpointer.aget_tuple(config) is None:
+                raise ValueError(f"No checkpoint to resume execution {execution_id} from")
+            graph_input = None
 
+        data_access = await NodeDataAccess.open()
+        configurable[NODE_DATA_ACCESS_KEY] = data_access
         if stream:
-            return self._execute_stream(init_state, config)
-        else:
-            return await self._execute_sync(init_state, config)
+            return self._execute_stream(init_state, config, graph_input, data_access)
+        try:
+            return await self._execute_sync(init_state, config, graph_input)
+        finally:
+            await data_access.aclose()
 
-    async def _execute_sync(self, init_state: FlowState, config: RunnableConfig) -> Dict[str, Any]:
+    def _recursion_limit(self) -> int:
+        """
+        Superstep budget for one run. LangGraph's default of 25 caps a linear
+        chain at ~25 nodes; every node may run once per loop iteration.
+        """
+        steps = len(self.nodes) + len(self.control_flow_nodes) + 1
+        for info in self.control_flow_nodes.values():
+            if info["type"] == ControlFlowType.LOOP:
+                steps += int(info["data"].get("max_iterations", 10)) * (len(self.nodes) + 1)
+        return max(25, 2 * steps)
+
+    async def _execute_sync(
+        self, init_state: FlowState, config: RunnableConfig, graph_input: Optional[FlowState]
+    ) -> Dict[str, Any]:
         """Synchronous execution - preserved from original."""
         logger.info(f"Starting synchronous workflow execution")
         
         try:
-            result_state = await self.graph.ainvoke(init_state, config=config)
+            result_state = await self.graph.ainvoke(graph_input, config=config)
             logger.info(f"Graph execution completed successfully")
             
             # Convert FlowState to serializable format
@@ -853,7 +908,10 @@ class GraphBuilder:
                 "session_id": init_state.session_id
             }
 
-    async def _execute_stream(self, init_state: FlowState, config: RunnableConfig):
+    async def _execute_stream(
+        self, init_state: FlowState, config: RunnableConfig, graph_input: Optional[FlowState],
+        data_access: Optional[NodeDataAccess] = None,
+    ):
         """Streaming execution - preserved from original."""
         try:
             logger.info(f"Starting streaming execution for session: {init_state.session_id}")
@@ -864,7 +922,7 @@ class GraphBuilder:
             
             # Stream workflow execution events
             event_count = 0
-            async for ev in self.graph.astream_events(init_state, config=config):
+            async for ev in self.graph.astream_events(graph_input, config=config):
                 event_count += 1
                 
                 # Process and yield events (simplified version of original logic)
@@ -938,6 +996,9 @@ class GraphBuilder:
                 "error_type": type(e).__name__, 
                 "session_id": init_state.session_id
             }
+        finally:
+            if data_access is not None:
+                await data_access.aclose()
 
     async def execute_with_monitoring(
             self,
@@ -947,13 +1008,18 @@ class GraphBuilder:
             owner_id: Optional[str] = None,
             workflow_id: Optional[str] = None,
             stream: bool = False,
+            execution_id: Optional[str] = None,
+            resume: bool = False,
     ) -> Union[Dict[str, Any], AsyncGenerator[Dict[str, Any], None]]:
         """Execute workflow with enhanced monitoring - preserved from original."""
         logger.info(f"Starting enhanced execution (session: {session_id})")
         execution_start = time.time()
 
         try:
-            result = await self.execute(inputs, session_id, user_id, owner_id, workflow_id, stream)
+            result = await self.execute(
+                inputs, session_id, user_id, owner_id, workflow_id, stream,
+                execution_id=execution_id, resume=resume,
+            )
             execution_duration = time.time() - execution_start
             logger.info(f"Enhanced execution completed in {execution_duration:.3f}s")
             return result
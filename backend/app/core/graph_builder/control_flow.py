@@ -5,6 +5,11 @@ GraphBuilder Control Flow Manager
 Handles all control flow logic (conditional, loop, parallel) for the GraphBuilder system.
 Provides clean separation of control flow management from the main orchestrator.
 
+Control flow nodes return LangGraph *deltas* rather than whole states: LangGraph
+only writes the channels a node returns, so unchanged fields (notably the
+accumulated ``node_outputs``) are shared by reference instead of being dumped,
+copied and re-merged on every loop iteration or fan-out branch.
+
 AUTHORS: KAI-Fusion Workflow Orchestration Team
 VERSION: 2.1.0
 LAST_UPDATED: 2025-09-16
@@ -22,6 +27,27 @@ from langgraph.graph import StateGraph, END
 logger = logging.getLogger(__name__)
 
 
+def loop_counter_key(node_id: str) -> str:
+    """Variable name holding the iteration count of a loop node."""
+    return f"{node_id}_iterations"
+
+
+def loop_iteration_delta(state: FlowState, node_id: str) -> Dict[str, Any]:
+    """
+    State update for one loop iteration: only the incremented counter.
+
+    ``variables`` has no reducer, so a new top-level dict is returned; it is a
+    shallow copy whose values are shared with the previous state.
+    """
+    key = loop_counter_key(node_id)
+    return {"variables": {**state.variables, key: state.variables.get(key, 0) + 1}}
+
+
+def pass_through(state: FlowState) -> Dict[str, Any]:
+    """Routing-only node: no channel is written, so every branch reads the shared state."""
+    return {}
+
+
 class ControlFlowManager:
     """
     Handles all control flow logic (conditional, loop, parallel).
@@ -142,8 +168,8 @@ class ControlFlowManager:
                     logger.error(f"Error in conditional routing for {node_id}: {e}")
                     return outgoing[0].target_node_id  # Fallback to first connection
 
-            # Add dummy pass-through node and conditional edges
-            graph.add_node(node_id, lambda s: s)
+            # Add pass-through node and conditional edges
+            graph.add_node(node_id, pass_through)
             graph.add_conditional_edges(
                 node_id,
                 route,
@@ -182,7 +208,7 @@ class ControlFlowManager:
             def should_continue(state: FlowState) -> str:
                 """Determine if loop should continue."""
                 try:
-                    iterations = state.get_variable(f"{node_id}_iterations", 0)
+                    iterations = state.get_variable(loop_counter_key(node_id), 0)
                     
                     if iterations >= max_iterations:
                         logger.debug(f"Loop {node_id} reached max iterations ({max_iterations})")
@@ -209,11 +235,7 @@ class ControlFlowManager:
 
             # Add loop node that increments iteration counter
             def loop_node(state: FlowState) -> Dict[str, Any]:
-                current_iterations = state.get_variable(f"{node_id}_iterations", 0)
-                return {
-                    **state.model_dump(),
-                    f"{node_id}_iterations": current_iterations + 1
-                }
+                return loop_iteration_delta(state, node_id)
 
             graph.add_node(node_id, loop_node)
             graph.add_conditional_edges(
@@ -235,7 +257,7 @@ class ControlFlowManager:
     
     def add_parallel_fanout(self, graph: StateGraph, node_id: str, cfg: Dict[str, Any]) -> None:
         """
-        Add a fan-out node that duplicates state to multiple branches.
+        Add a fan-out node whose branches all read the same, uncopied state.
         
         Args:
             graph: LangGraph StateGraph instance
@@ -252,14 +274,10 @@ class ControlFlowManager:
 
             def fan_out(state: FlowState) -> Dict[str, Any]:
                 """Fan-out function for parallel execution."""
-                try:
-                    # Create mapping of channel -> state to create parallel branches
-                    logger.debug(f"Parallel fanout from {node_id} to {branch_ids}")
-                    return {bid: state.model_copy() for bid in branch_ids}
-                except Exception as e:
-                    logger.error(f"Error in parallel fanout for {node_id}: {e}")
-                    # Fallback to single state
-                    return {branch_ids[0]: state} if branch_ids else {}
+                # Branches are scheduled by the edges below and each receives the
+                # current channel values; their writes are combined by the reducers.
+                logger.debug(f"Parallel fanout from {node_id} to {branch_ids}")
+                return pass_through(state)
 
             graph.add_node(node_id, fan_out)
             
@@ -44,6 +44,7 @@ from .exceptions import NodeExecutionError
 from app.core.state import FlowState
 from app.core.output_cache import default_connection_extractor
 from app.core.node_handlers import node_handler_registry
+from app.core.node_data_access import current_node_data_access, load_user_credentials
 from app.core.connection_pool import ConnectionPool, PooledConnection
 from app.core.json_utils import make_json_serializable_with_langchain
 from langchain_core.runnables import Runnable
@@ -79,17 +80,19 @@ class NodeExecutor:
             node_id: ID of the node
         """
         try:
+            if getattr(state, 'workflow_id', None):
+                gnode.node_instance.workflow_id = str(state.workflow_id)
+            
+            # Per-execution async repository for the node's database access
+            gnode.node_instance.data_access = current_node_data_access()
+            
             # Setup User Context (User ID & Credentials)
             if hasattr(state, 'user_id') and state.user_id:
                 gnode.node_instance.user_id = state.user_id
                 
                 # Fetch and inject credentials
                 try:
-                    from app.core.credential_provider import credential_provider
-                    # Convert string user_id to UUID if necessary
-                    user_uuid = uuid.UUID(state.user_id) if isinstance(state.user_id, str) else state.user_id
-                    
-                    credentials = credential_provider.get_credentials_sync(user_uuid)
+                    credentials = load_user_credentials(state.user_id)
                     gnode.node_instance.credentials = credentials
                     logger.debug(f"Injected {len(credentials)} credentials for user {state.user_id} into node {node_id}")
                 except Exception as e:
@@ -465,7 +468,8 @@ class NodeExecutor:
                 context['webhook_trigger'] = webhook_payload
                 logger.info(f"[TEMPLATE] Added webhook_trigger to context: {list(webhook_payload.keys()) if isinstance(webhook_payload, dict) else type(webhook_payload)}")
 
-            for other_node_id in state.node_outputs.keys():
+            # Snapshot: parallel branches add their outputs to the shared dict concurrently
+            for other_node_id in list(state.node_outputs):
                 graph_node = self._nodes_registry.get(other_node_id)
                 if not graph_node:
                     continue
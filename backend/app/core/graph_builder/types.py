@@ -220,6 +220,15 @@ class ValidationResult:
         """Add validation warning."""
         self.warnings.append(warning)
     
+    def copy(self) -> "ValidationResult":
+        return ValidationResult(
+            valid=self.valid,
+            errors=list(self.errors),
+            warnings=list(self.warnings),
+            node_count=self.node_count,
+            connection_count=self.connection_count,
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
         return {
@@ -11,21 +11,48 @@ LAST_UPDATED: 2025-09-16
 LICENSE: Proprietary - KAI-Fusion Platform
 """
 
-from typing import Dict, Any, List, Optional, Type, Set
+from typing import Dict, Any, List, Optional, Type, Set, Tuple
+import hashlib
 import logging
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
+
+import orjson
 
 from .types import (
     ValidationResult, NodeRegistry, START_NODE_TYPE, END_NODE_TYPE,
     TERMINAL_NODE_TYPES, PooledConnection, ConnectionPoolStats, ConnectionPoolConfig,
-    DEFAULT_POOL_ENABLED, POOL_FEATURE_FLAG
+    DEFAULT_POOL_ENABLED, POOL_FEATURE_FLAG, CONTROL_FLOW_NODE_TYPES
 )
 from .exceptions import ValidationError
 from app.nodes import BaseNode
 from app.core.connection_pool import ConnectionPool
+from app.core.constants import FLOW_VALIDATION_CACHE_SIZE
+from app.core.flow_topology import FlowTopology, HandleSpec, analyze_flow
 
 logger = logging.getLogger(__name__)
 
+# Validation results by (registry, flow fingerprint); shared by all engines in the process
+_result_cache: "OrderedDict[Tuple[int, int, str], ValidationResult]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def flow_fingerprint(flow_data: Dict[str, Any]) -> Optional[str]:
+    """Stable hash of a flow's nodes and edges, or None if they are not JSON-serializable."""
+    try:
+        payload = orjson.dumps(
+            {"nodes": flow_data.get("nodes", []), "edges": flow_data.get("edges", [])},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:
+        return None
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def clear_validation_cache() -> None:
+    with _result_cache_lock:
+        _result_cache.clear()
+
 
 class ValidationEngine:
     """
@@ -58,6 +85,11 @@ class ValidationEngine:
         """
         Enhanced workflow validation before building.
         
+        Every check runs and all problems are reported together. Topology
+        (cycles, isolated nodes, handle compatibility) comes from a single
+        O(V + E) pass, and results are cached by flow fingerprint for node
+        registries that expose ``get_node_metadata``.
+        
         Args:
             flow_data: Complete workflow data including nodes and edges
             
@@ -67,6 +99,67 @@ class ValidationEngine:
         Raises:
             ValidationError: If validation fails critically
         """
+        cache_key = self._cache_key(flow_data)
+        if cache_key is not None:
+            with _result_cache_lock:
+                cached = _result_cache.get(cache_key)
+                if cached is not None:
+                    _result_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.debug("Validation result served from cache")
+                result = cached.copy()
+                self._record_stats(result, cached=True)
+                return result
+        
+        result = self._validate(flow_data)
+        
+        if cache_key is not None and FLOW_VALIDATION_CACHE_SIZE > 0:
+            with _result_cache_lock:
+                _result_cache[cache_key] = result.copy()
+                _result_cache.move_to_end(cache_key)
+                while len(_result_cache) > FLOW_VALIDATION_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
+        return result
+    
+    def _cache_key(self, flow_data: Dict[str, Any]) -> Optional[Tuple[int, int, str]]:
+        # Plain dict registries (tests, benchmarks) can be rebuilt at the same address
+        if not hasattr(self.node_registry, "get_node_metadata"):
+            return None
+        fingerprint = flow_fingerprint(flow_data)
+        if fingerprint is None:
+            return None
+        # The node count changes when nodes are registered at runtime
+        return id(self.node_registry), len(getattr(self.node_registry, "nodes", ())), fingerprint
+    
+    def _record_stats(self, result: ValidationResult, cached: bool = False) -> None:
+        self._validation_stats = {
+            "node_count": result.node_count,
+            "connection_count": result.connection_count,
+            "error_count": len(result.errors),
+            "warning_count": len(result.warnings),
+            "validation_passed": result.valid,
+            "cached": cached,
+        }
+    
+    def _handle_spec(self, node_type: str) -> Optional[HandleSpec]:
+        """Declared (inputs, outputs) of a node type; None skips the handle check."""
+        if node_type in CONTROL_FLOW_NODE_TYPES or node_type in getattr(self.node_registry, "dynamic_metadata", ()):
+            return None
+        try:
+            get_metadata = getattr(self.node_registry, "get_node_metadata", None)
+            if get_metadata is not None:
+                metadata = get_metadata(node_type)
+            else:
+                node_class = self.get_node(node_type)
+                metadata = node_class().metadata if node_class else None
+        except Exception as e:
+            logger.debug(f"No handle metadata for {node_type}: {e}")
+            return None
+        if metadata is None:
+            return None
+        return {i.name for i in metadata.inputs}, {o.name for o in metadata.outputs}
+    
+    def _validate(self, flow_data: Dict[str, Any]) -> ValidationResult:
         try:
             logger.info("🔍 Validating workflow structure")
             
@@ -86,10 +179,12 @@ class ValidationEngine:
             result.node_count = len(nodes)
             result.connection_count = len(edges)
             
+            nodes_by_id = {node.get("id"): node for node in nodes if node.get("id")}
+            
             # Perform validation steps
             self._validate_nodes(nodes, result)
             self._validate_edges(edges, nodes, result)
-            self._validate_multiple_connections(edges, nodes, result)
+            self._validate_multiple_connections(edges, nodes_by_id, result)
             self._validate_required_nodes(nodes, result)
             self._validate_workflow_topology(nodes, edges, result)
             
@@ -97,13 +192,7 @@ class ValidationEngine:
             result.valid = len(result.errors) == 0
             
             # Update validation stats
-            self._validation_stats = {
-                "node_count": result.node_count,
-                "connection_count": result.connection_count,
-                "error_count": len(result.errors),
-                "warning_count": len(result.warnings),
-                "validation_passed": result.valid
-            }
+            self._record_stats(result)
             
             # Log results
             status = "VALID" if result.valid else "INVALID"
@@ -160,6 +249,10 @@ class ValidationEngine:
                     result.add_error(f"Node {node_id} missing type")
                     continue
                 
+                # Control-flow nodes are built by ControlFlowManager, not the registry
+                if node_type in CONTROL_FLOW_NODE_TYPES:
+                    continue
+                
                 # Check if node type is registered
                 # node_registry.get_node() instead of node_registry.get_node
                 node_class = self.get_node(node_type)
@@ -255,7 +348,7 @@ class ValidationEngine:
         except Exception as e:
             result.add_error(f"Edge validation failed: {str(e)}")
     
-    def _validate_multiple_connections(self, edges: List[Dict[str, Any]], nodes: List[Dict[str, Any]], result: ValidationResult) -> None:
+    def _validate_multiple_connections(self, edges: List[Dict[str, Any]], nodes_by_id: Dict[str, Dict[str, Any]], result: ValidationResult) -> None:
         """
         Validate many-to-many connection scenarios.
         
@@ -265,7 +358,7 @@ class ValidationEngine:
         
         Args:
             edges: List of edge definitions
-            nodes: List of node definitions
+            nodes_by_id: Node definitions by ID
             result: ValidationResult to update
         """
         try:
@@ -285,7 +378,7 @@ class ValidationEngine:
             for target_key, target_edges in target_groups.items():
                 if len(target_edges) > 1:
                     many_to_many_targets += 1
-                    self._validate_many_to_many_target(target_key, target_edges, nodes, result)
+                    self._validate_many_to_many_target(target_key, target_edges, nodes_by_id, result)
                     
                     # Check for excessive connections (performance warning)
                     if len(target_edges) > 10:
@@ -308,7 +401,7 @@ class ValidationEngine:
         self,
         target_key: str,
         edges: List[Dict[str, Any]],
-        nodes: List[Dict[str, Any]],
+        nodes_by_id: Dict[str, Dict[str, Any]],
         result: ValidationResult
     ) -> None:
         """
@@ -321,14 +414,14 @@ class ValidationEngine:
         Args:
             target_key: Target identifier in format "node_id#handle"
             edges: List of edges targeting this handle
-            nodes: List of node definitions
+            nodes_by_id: Node definitions by ID
             result: ValidationResult to update
         """
         try:
             target_node_id, target_handle = target_key.split('#', 1)
             
             # Find target node definition
-            target_node = next((n for n in nodes if n.get('id') == target_node_id), None)
+            target_node = nodes_by_id.get(target_node_id)
             if not target_node:
                 result.add_error(f"Target node not found for many-to-many validation: {target_node_id}")
                 return
@@ -580,7 +673,7 @@ class ValidationEngine:
     
     def _validate_workflow_topology(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]], result: ValidationResult) -> None:
         """
-        Validate workflow topology and connectivity.
+        Validate workflow topology, connectivity and handle compatibility.
         
         Args:
             nodes: List of node definitions
@@ -592,85 +685,38 @@ class ValidationEngine:
                 result.add_warning("Workflow has no connections between nodes")
                 return
             
-            # Build topology maps
-            node_ids = {node.get("id") for node in nodes if node.get("id")}
-            source_nodes = {edge.get("source") for edge in edges if edge.get("source")}
-            target_nodes = {edge.get("target") for edge in edges if edge.get("target")}
+            topology = analyze_flow(nodes, edges, handles_for=self._handle_spec)
             
-            # Find isolated nodes (nodes with no connections)
-            connected_nodes = source_nodes | target_nodes
-            isolated_nodes = node_ids - connected_nodes
+            if topology.isolated:
+                result.add_warning(f"Isolated nodes found (not connected): {topology.isolated}")
             
-            # Filter out StartNode and EndNode from isolated check
-            start_end_types = {START_NODE_TYPE, END_NODE_TYPE}
-            truly_isolated = []
+            for problem in topology.handle_problems:
+                result.add_warning(f"Incompatible handle: {problem}")
             
-            for node_id in isolated_nodes:
-                node = next((n for n in nodes if n.get("id") == node_id), None)
-                if node and node.get("type") not in start_end_types:
-                    truly_isolated.append(node_id)
-            
-            if truly_isolated:
-                result.add_warning(f"Isolated nodes found (not connected): {truly_isolated}")
-            
-            # Check for potential cycles (simplified check)
-            self._check_for_cycles(edges, result)
+            self._check_for_cycles(topology, nodes, result)
             
             logger.debug(f"Topology validation complete")
             
         except Exception as e:
             result.add_error(f"Topology validation failed: {str(e)}")
     
-    def _check_for_cycles(self, edges: List[Dict[str, Any]], result: ValidationResult) -> None:
+    def _check_for_cycles(self, topology: FlowTopology, nodes: List[Dict[str, Any]], result: ValidationResult) -> None:
         """
-        Check for potential cycles in the workflow.
+        Report every cycle in the workflow.
+        
+        Cycles through a LoopNode are the loop itself and are not reported.
         
         Args:
-            edges: List of edge definitions
+            topology: Analyzed flow topology
+            nodes: List of node definitions
             result: ValidationResult to update
         """
-        try:
-            # Build adjacency list
-            graph = {}
-            for edge in edges:
-                source = edge.get("source")
-                target = edge.get("target")
-                
-                if source and target:
-                    if source not in graph:
-                        graph[source] = []
-                    graph[source].append(target)
-            
-            # Simple cycle detection using DFS
-            visited = set()
-            rec_stack = set()
-            
-            def has_cycle(node: str) -> bool:
-                if node in rec_stack:
-                    return True
-                if node in visited:
-                    return False
-                
-                visited.add(node)
-                rec_stack.add(node)
-                
-                for neighbor in graph.get(node, []):
-                    if has_cycle(neighbor):
-                        return True
-                
-                rec_stack.remove(node)
-                return False
-            
-            # Check each node
-            for node in graph:
-                if node not in visited:
-                    if has_cycle(node):
-                        result.add_warning(f"Potential cycle detected involving node: {node}")
-                        break  # Only report first cycle found
-            
-        except Exception as e:
-            logger.debug(f"Cycle detection failed: {e}")
-            # Don't add this as an error since it's not critical
+        if topology.is_acyclic:
+            return
+        loop_nodes = {node.get("id") for node in nodes if node.get("type") == "LoopNode"}
+        for cycle in topology.cycles:
+            if loop_nodes.isdisjoint(cycle):
+                result.add_warning(f"Potential cycle detected involving nodes: {cycle}")
     
     def validate_node_connections(self, node_id: str, connections: List[Dict[str, Any]]) -> List[str]:
         """
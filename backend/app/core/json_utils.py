@@ -16,9 +16,10 @@ Features:
 • Recursive handling of nested structures
 
 Best Practices:
-• Use orjson.dumps() for fast serialization (3-5x faster than json)
-• Use make_json_serializable() for complex objects before serialization
-• Use make_json_serializable_with_langchain() for LangChain objects
+• Use dumps_bytes() / encode_sse() on hot paths: one native orjson pass, with
+  non-native types resolved by registered type handlers (register_json_type)
+• Use to_jsonable() when plain Python data is required (e.g. event buffers)
+• Use make_json_serializable_with_langchain() to filter agent results
 • Prefer pydantic models for structured data with automatic validation
 
 Usage:
@@ -36,9 +37,12 @@ Usage:
     
     # Option 4: LangChain-aware serialization
     serializable = make_json_serializable_with_langchain(agent_result, filter_complex=True)
+    
+    # Option 5: Server-sent event frame, written to the response as bytes
+    yield encode_sse(event, event_id=event.get("event_id"))
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, date
 from decimal import Decimal
 import uuid
@@ -127,6 +131,144 @@ def json_serializer_default(obj: Any) -> Any:
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+# ================================================================================
+# TYPE HANDLER REGISTRY - SINGLE-PASS ENCODING
+# ================================================================================
+
+# Checked in registration order with issubclass; the result is cached per concrete type,
+# so orjson's ``default`` hook costs one dict lookup per non-native object.
+_JSON_TYPE_HANDLERS: List[Tuple[type, Callable[[Any], Any]]] = []
+_JSON_HANDLER_CACHE: Dict[type, Optional[Callable[[Any], Any]]] = {}
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def register_json_type(cls: type, handler: Callable[[Any], Any]) -> None:
+    """
+    Register how instances of ``cls`` (and its subclasses) are encoded.
+    
+    The handler returns any JSON-encodable value; nested non-native values in
+    it are resolved through the registry again. Earlier registrations win.
+    """
+    _JSON_TYPE_HANDLERS.append((cls, handler))
+    _JSON_HANDLER_CACHE.clear()
+
+
+def unregister_json_type(cls: type) -> bool:
+    """Remove the handlers registered for exactly ``cls``. Returns whether any was removed."""
+    before = len(_JSON_TYPE_HANDLERS)
+    _JSON_TYPE_HANDLERS[:] = [(base, h) for base, h in _JSON_TYPE_HANDLERS if base is not cls]
+    _JSON_HANDLER_CACHE.clear()
+    return len(_JSON_TYPE_HANDLERS) < before
+
+
+def _handler_for(cls: type) -> Optional[Callable[[Any], Any]]:
+    try:
+        return _JSON_HANDLER_CACHE[cls]
+    except KeyError:
+        pass
+    handler = next((h for base, h in _JSON_TYPE_HANDLERS if issubclass(cls, base)), None)
+    _JSON_HANDLER_CACHE[cls] = handler
+    return handler
+
+
+def _opaque(obj: Any) -> str:
+    return f"<{obj.__class__.__name__}>"
+
+
+def _model_dump(obj: Any) -> Any:
+    try:
+        return obj.model_dump()
+    except Exception:
+        return str(obj)
+
+
+def json_default(obj: Any) -> Any:
+    """
+    orjson ``default`` hook: registered handler, else the same fallbacks as
+    make_json_serializable (callables, Pydantic v1, ``__dict__``, ``str``). Never raises.
+    """
+    handler = _handler_for(type(obj))
+    if handler is not None:
+        return handler(obj)
+    if callable(obj) and not hasattr(obj, 'model_dump') and not hasattr(obj, 'dict'):
+        return _opaque(obj)
+    if hasattr(obj, 'model_dump'):
+        return _model_dump(obj)
+    if hasattr(obj, 'dict'):
+        try:
+            return obj.dict()
+        except Exception:
+            return str(obj)
+    if hasattr(obj, '__dict__'):
+        return obj.__dict__
+    return str(obj)
+
+
+# Opaque LangChain components first: tools and runnables are Pydantic models too,
+# but their dumps are huge and often not encodable.
+if _LANGCHAIN_AVAILABLE:
+    for _cls in (_BaseTool, _Runnable, _VectorStore, _BaseRetriever):
+        register_json_type(_cls, _opaque)
+register_json_type(datetime, lambda obj: obj.isoformat())
+register_json_type(date, lambda obj: obj.isoformat())
+register_json_type(uuid.UUID, str)
+register_json_type(Decimal, float)
+register_json_type((set, frozenset), list)
+# Subclasses of native scalars (e.g. numpy.float64, IntEnum) that orjson rejects
+register_json_type(int, int)
+register_json_type(float, float)
+try:
+    from pydantic import BaseModel as _PydanticModel
+    register_json_type(_PydanticModel, _model_dump)  # LangChain Documents and messages
+except ImportError:
+    pass
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Encode ``obj`` to UTF-8 JSON bytes in a single pass.
+    
+    Falls back to make_json_serializable() + json for what orjson cannot encode
+    (integers beyond 64 bits, unhashable dict keys) or when orjson is not installed.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS)
+        except (TypeError, ValueError):
+            pass
+    return json.dumps(make_json_serializable(obj), ensure_ascii=False).encode('utf-8')
+
+
+def json_dumps_str(obj: Any) -> str:
+    """String variant of dumps_bytes(), e.g. for SQLAlchemy's ``json_serializer``."""
+    return dumps_bytes(obj).decode('utf-8')
+
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    Plain JSON-compatible copy of ``obj`` (dicts, lists, str, numbers, None).
+    
+    Same result as make_json_serializable() for common payloads, produced by one
+    native encode/decode round trip instead of a recursive Python walk.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(orjson.dumps(obj, default=json_default, option=_ORJSON_OPTIONS))
+        except (TypeError, ValueError):
+            pass
+    return make_json_serializable(obj)
+
+
+def encode_sse(event: Any, event_id: Optional[str] = None) -> bytes:
+    """Encode a server-sent event frame (``id:`` line when given, then ``data:``)."""
+    frame = b"data: " + dumps_bytes(event) + b"\n\n"
+    if event_id:
+        return b"id: " + str(event_id).encode('utf-8') + b"\n" + frame
+    return frame
+
+
 def _contains_langchain_complex_objects(obj: Any) -> bool:
     """
     Check if object contains complex LangChain objects that can't be serialized.
@@ -323,10 +465,12 @@ def safe_json_dumps(obj: Any, **kwargs) -> str:
         >>> print(json_str)
         '{"timestamp":"2025-01-13T12:00:00"}'
     """
-    if ORJSON_AVAILABLE:
+    if ORJSON_AVAILABLE and not kwargs:
+        return json_dumps_str(obj)
+    elif ORJSON_AVAILABLE:
         try:
             # orjson returns bytes, decode to string
-            result = orjson.dumps(obj, default=json_serializer_default, **kwargs)
+            result = orjson.dumps(obj, default=json_default, **kwargs)
             return result.decode('utf-8')
         except (TypeError, ValueError):
             # Fallback to recursive conversion if orjson fails
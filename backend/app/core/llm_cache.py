@@ -0,0 +1,252 @@
+"""
+Deterministic LLM Response Cache
+================================
+
+Opt-in LangChain cache for LLM nodes. Chat models consult ``BaseCache.lookup``
+before calling the provider (``BaseChatModel._generate_with_cache``), so
+attaching ``cache=get_llm_cache(...)`` to a ``ChatOpenAI`` is enough for every
+caller - including ReAct agents that receive the model over a connection - to
+be served from the cache on exact replays.
+
+Cache keys are the SHA-256 of:
+• namespace        - the workflow ID, so TTLs and invalidation are per workflow
+• normalized prompt - the serialized message list with volatile per-run fields
+                      (message ``id``, ``response_metadata``, ``usage_metadata``) removed
+• llm string       - LangChain's model fingerprint: model name, temperature,
+                      seed and other params, plus bound tool schemas and stop words
+
+Backends:
+• ``memory``   - process-wide LRU with per-entry expiry (default)
+• ``postgres`` - ``llm_cache_entries`` table, shared across workers
+
+Usage:
+    from app.core.llm_cache import get_llm_cache
+
+    llm = ChatOpenAI(..., cache=get_llm_cache(namespace=workflow_id, ttl_seconds=3600))
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core import database
+from app.core.constants import LLM_CACHE_BACKEND, LLM_CACHE_DEFAULT_TTL, LLM_CACHE_MAX_ENTRIES
+from app.models.llm_cache import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_NAMESPACE = "global"
+VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    if isinstance(value, dict):
+        if value.get("lc") == 1 and value.get("type") == "constructor" and isinstance(value.get("kwargs"), dict):
+            kwargs = {
+                k: _strip_volatile(v) for k, v in value["kwargs"].items() if k not in VOLATILE_MESSAGE_FIELDS
+            }
+            return {**value, "kwargs": kwargs}
+        return {k: _strip_volatile(v) for k, v in value.items()}
+    return value
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Canonical JSON for a serialized message list, without per-run identifiers."""
+    try:
+        parsed = json.loads(prompt)
+    except (TypeError, ValueError):
+        return prompt
+    return json.dumps(_strip_volatile(parsed), sort_keys=True, separators=(",", ":"))
+
+
+def make_cache_key(prompt: str, llm_string: str, namespace: str = GLOBAL_NAMESPACE) -> str:
+    digest = hashlib.sha256()
+    for part in (namespace, normalize_prompt(prompt), llm_string):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LLMCacheBackend(ABC):
+    """Key/value storage for serialized generations."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, namespace: str, value: str, ttl_seconds: Optional[int]) -> None:
+        """Store ``value``; ``ttl_seconds`` of None or <= 0 means no expiry."""
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop all entries, or only those of ``namespace``."""
+
+
+class InMemoryLRUBackend(LLMCacheBackend):
+    """Bounded in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, value, expires_at = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, namespace: str, value: str, ttl_seconds: Optional[int]) -> None:
+        expires_at = self._clock() + ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        with self._lock:
+            self._entries[key] = (namespace, value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for key in [k for k, entry in self._entries.items() if entry[0] == namespace]:
+                del self._entries[key]
+
+
+class PostgresBackend(LLMCacheBackend):
+    """``llm_cache_entries`` table via the synchronous session factory."""
+
+    def _session(self):
+        if not database.SessionLocal:
+            raise RuntimeError("Database is not enabled. Set DATABASE_URL to enable database functionality.")
+        return database.SessionLocal()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._session() as session:
+            return session.execute(
+                select(LLMCacheEntry.value).where(
+                    LLMCacheEntry.cache_key == key,
+                    or_(LLMCacheEntry.expires_at.is_(None), LLMCacheEntry.expires_at > datetime.now(timezone.utc)),
+                )
+            ).scalar_one_or_none()
+
+    def set(self, key: str, namespace: str, value: str, ttl_seconds: Optional[int]) -> None:
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=ttl_seconds) if ttl_seconds and ttl_seconds > 0 else None
+        stmt = pg_insert(LLMCacheEntry).values(
+            cache_key=key, namespace=namespace, value=value, created_at=now, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.cache_key],
+            set_={"value": stmt.excluded.value, "created_at": now, "expires_at": stmt.excluded.expires_at},
+        )
+        with self._session() as session:
+            session.execute(stmt)
+            session.commit()
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        stmt = delete(LLMCacheEntry)
+        if namespace is not None:
+            stmt = stmt.where(LLMCacheEntry.namespace == namespace)
+        with self._session() as session:
+            session.execute(stmt)
+            session.commit()
+
+
+class DeterministicLLMCache(BaseCache):
+    """LangChain cache that normalizes prompts and scopes entries to a namespace."""
+
+    def __init__(
+        self,
+        backend: LLMCacheBackend,
+        namespace: Optional[str] = None,
+        ttl_seconds: Optional[int] = LLM_CACHE_DEFAULT_TTL,
+    ):
+        self.backend = backend
+        self.namespace = namespace or GLOBAL_NAMESPACE
+        self.ttl_seconds = ttl_seconds
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        try:
+            value = self.backend.get(make_cache_key(prompt, llm_string, self.namespace))
+            return loads(value) if value is not None else None
+        except Exception as e:
+            # A broken cache must never fail the LLM call
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        try:
+            key = make_cache_key(prompt, llm_string, self.namespace)
+            self.backend.set(key, self.namespace, dumps(return_val), self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"LLM cache update failed: {e}")
+
+    def clear(self, **kwargs: Any) -> None:
+        self.backend.clear(self.namespace)
+
+
+_backends: Dict[str, LLMCacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_llm_cache_backend(name: Optional[str] = None) -> LLMCacheBackend:
+    """Get the process-wide backend instance by name ("memory" or "postgres")."""
+    name = (name or LLM_CACHE_BACKEND).lower()
+    with _backends_lock:
+        if name not in _backends:
+            if name == "postgres":
+                _backends[name] = PostgresBackend()
+            elif name == "memory":
+                _backends[name] = InMemoryLRUBackend()
+            else:
+                raise ValueError(f"Unknown LLM cache backend: {name}")
+        return _backends[name]
+
+
+def get_llm_cache(
+    namespace: Optional[str] = None,
+    ttl_seconds: Optional[int] = LLM_CACHE_DEFAULT_TTL,
+    backend: Optional[str] = None,
+) -> DeterministicLLMCache:
+    """Build a cache view over the shared backend for one workflow."""
+    return DeterministicLLMCache(get_llm_cache_backend(backend), namespace=namespace, ttl_seconds=ttl_seconds)
+
+
+def get_node_llm_cache(user_data: Dict[str, Any], namespace: Optional[str] = None) -> Optional[DeterministicLLMCache]:
+    """
+    Return a cache for an LLM node when ``enable_cache`` is set in its configuration.
+    ``namespace`` must identify the workflow; without one caching is skipped, since a
+    shared namespace would serve one workflow's (or user's) responses to another.
+    """
+    enabled = user_data.get("enable_cache", False)
+    if isinstance(enabled, str):
+        enabled = enabled.strip().lower() in ("true", "1", "yes")
+    if not enabled:
+        return None
+    if not namespace:
+        logger.debug("LLM response cache skipped: node has no workflow id")
+        return None
+    ttl_seconds = int(user_data.get("cache_ttl_seconds") or LLM_CACHE_DEFAULT_TTL)
+    return get_llm_cache(namespace=namespace, ttl_seconds=ttl_seconds)
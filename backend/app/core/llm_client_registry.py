@@ -0,0 +1,253 @@
+"""
+LLM HTTP Client Registry
+========================
+
+Process-wide pool of long-lived, keep-alive ``httpx`` clients handed to the
+``ChatOpenAI`` instances built by the LLM nodes.
+
+Chat model nodes are rebuilt on every workflow execution. Without a shared
+client each ``ChatOpenAI`` starts from a cold connection pool and pays DNS,
+TCP and TLS setup on its first request. Clients here are keyed by:
+
+• base URL          - one pool per upstream host/API root
+• credential digest - tenants never share a pool (the key itself is not stored)
+• timeout profile   - requests with different timeouts never share a client
+
+Each client enforces ``LLM_HTTP_MAX_CONNECTIONS`` concurrent connections to its
+host. Entries unused for ``LLM_HTTP_CLIENT_IDLE_TTL`` seconds whose chat models
+have all been garbage collected are closed; the sweep runs on access (at most
+every ``LLM_HTTP_CLIENT_SWEEP_INTERVAL`` seconds) and from a background task
+started with the application. Async clients evicted outside an event loop are
+closed by the next sweep or at shutdown. Hit/miss/eviction counters and the
+number of open sockets are exposed via ``stats()`` and the /health endpoint.
+
+Usage:
+    from app.core.llm_client_registry import get_llm_client_registry
+
+    registry = get_llm_client_registry()
+    clients = registry.get_clients(base_url, api_key, timeout)
+    llm = ChatOpenAI(**config, **clients.chat_model_kwargs())
+    registry.attach(clients.key, llm)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.constants import (
+    LLM_HTTP_CLIENT_IDLE_TTL,
+    LLM_HTTP_CLIENT_SWEEP_INTERVAL,
+    LLM_HTTP_KEEPALIVE_EXPIRY,
+    LLM_HTTP_MAX_CLIENTS,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE,
+)
+from app.core.credential_digest import credential_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+ClientKey = Tuple[str, str, float]
+
+
+def _open_sockets(client: Any) -> int:
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    return len(getattr(pool, "connections", ()) or ())
+
+
+@dataclass
+class LLMHttpClients:
+    """Sync and async clients for one registry key."""
+
+    key: ClientKey
+    sync: httpx.Client
+    async_: httpx.AsyncClient
+
+    def chat_model_kwargs(self) -> Dict[str, Any]:
+        return {"http_client": self.sync, "http_async_client": self.async_}
+
+
+@dataclass
+class _ClientEntry:
+    clients: LLMHttpClients
+    last_used: float
+    # Keyed by id(): pydantic chat models are not hashable, so a WeakSet cannot hold them
+    owners: "weakref.WeakValueDictionary[int, Any]" = field(default_factory=weakref.WeakValueDictionary)
+
+
+class LLMClientRegistry:
+    """Thread-safe registry of shared httpx clients for LLM providers."""
+
+    def __init__(
+        self,
+        max_connections: int = LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive: int = LLM_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry: float = LLM_HTTP_KEEPALIVE_EXPIRY,
+        idle_ttl: int = LLM_HTTP_CLIENT_IDLE_TTL,
+        max_clients: int = LLM_HTTP_MAX_CLIENTS,
+        sweep_interval: float = LLM_HTTP_CLIENT_SWEEP_INTERVAL,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.idle_ttl = idle_ttl
+        self.max_clients = max(1, max_clients)
+        self.sweep_interval = sweep_interval
+        self._entries: "OrderedDict[ClientKey, _ClientEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval
+        # Async clients evicted with no running loop to close them on
+        self._pending_async_close: List[httpx.AsyncClient] = []
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(base_url: Optional[str], api_key: Optional[str], timeout: float) -> ClientKey:
+        return ((base_url or DEFAULT_OPENAI_BASE_URL).rstrip("/"), credential_fingerprint(api_key), float(timeout))
+
+    def get_clients(self, base_url: Optional[str], api_key: Optional[str], timeout: float) -> LLMHttpClients:
+        """Return the shared clients for this base URL, credential and timeout."""
+        key = self.make_key(base_url, api_key, timeout)
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._evict_locked(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                entry.last_used = now
+                self._entries.move_to_end(key)
+                return entry.clients
+
+            self.misses += 1
+            self._evict_locked(now, reserve=1)
+            http_timeout = httpx.Timeout(key[2], connect=min(10.0, key[2]))
+            clients = LLMHttpClients(
+                key=key,
+                sync=httpx.Client(timeout=http_timeout, limits=self.limits),
+                async_=httpx.AsyncClient(timeout=http_timeout, limits=self.limits),
+            )
+            self._entries[key] = _ClientEntry(clients=clients, last_used=now)
+            logger.debug(f"Created LLM HTTP clients for {key[0]} ({len(self._entries)} active)")
+            return clients
+
+    def attach(self, key: ClientKey, owner: Any) -> None:
+        """Pin an entry while ``owner`` (typically the chat model) is alive."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.owners[id(owner)] = owner
+
+    def evict_idle(self) -> int:
+        """Close idle, unowned clients. Returns the number of entries closed."""
+        with self._lock:
+            return self._evict_locked(time.monotonic())
+
+    async def sweep(self) -> int:
+        """Evict idle clients and close async clients left pending by earlier evictions."""
+        evicted = self.evict_idle()
+        await self._close_pending()
+        return evicted
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.warning(f"LLM HTTP client sweep failed: {e}")
+
+    async def start(self) -> None:
+        """Start the periodic idle sweep on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def aclose_all(self) -> None:
+        """Stop the sweep and close every client (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.clients.sync.close()
+            await entry.clients.async_.aclose()
+        await self._close_pending()
+
+    async def _close_pending(self) -> None:
+        with self._lock:
+            pending, self._pending_async_close = self._pending_async_close, []
+        for client in pending:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close evicted async LLM HTTP client: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "clients": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "pending_async_close": len(self._pending_async_close),
+                "open_sockets": sum(
+                    _open_sockets(e.clients.sync) + _open_sockets(e.clients.async_) for e in self._entries.values()
+                ),
+            }
+
+    def _evict_locked(self, now: float, reserve: int = 0) -> int:
+        self._next_sweep = now + self.sweep_interval
+        evicted = 0
+        over_capacity = len(self._entries) + reserve - self.max_clients
+        # Oldest first; entries still referenced by live chat models are never closed
+        for key, entry in list(self._entries.items()):
+            if len(entry.owners):
+                continue
+            if now - entry.last_used > self.idle_ttl or evicted < over_capacity:
+                del self._entries[key]
+                entry.clients.sync.close()
+                self._close_async_client_locked(entry.clients.async_)
+                evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def _close_async_client_locked(self, client: httpx.AsyncClient) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to await on here; the next sweep or shutdown closes it
+            self._pending_async_close.append(client)
+            return
+        loop.create_task(client.aclose())
+
+
+_registry: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Get the process-wide LLM HTTP client registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMClientRegistry()
+    return _registry
@@ -0,0 +1,213 @@
+"""
+Near-Duplicate Detection
+========================
+
+Shingle-based MinHash signatures with a banded LSH index, used by
+``DocumentLoaderNode`` to drop near-duplicate documents before chunking and
+embedding.
+
+• Shingles   - overlapping ``DEDUP_SHINGLE_SIZE``-word windows over the
+               case-folded, whitespace-normalized text, hashed to 32 bits
+• Signature  - ``DEDUP_NUM_PERM`` minimums of universal hashes
+               ``(a * x + b) mod p``; the fraction of equal positions between two
+               signatures estimates the Jaccard similarity of their shingle sets
+• LSH        - the signature is split into ``bands`` of ``rows`` positions; documents
+               sharing any band bucket are candidates, and candidates are confirmed
+               with the estimated Jaccard similarity against ``threshold``
+
+Unlike a hash of the first N characters, this catches re-exports and
+boilerplate-heavy copies, and never merges documents that only share a header.
+
+Signatures can be persisted per collection (``document_signatures`` table) so
+repeat ingests into the same collection skip documents that were already loaded.
+
+Usage:
+    from app.core.near_duplicates import NearDuplicateIndex
+
+    index = NearDuplicateIndex(threshold=0.85)
+    for doc in documents:
+        if index.find_duplicate(doc.page_content) is None:
+            index.add(doc.metadata["source"], doc.page_content)
+"""
+
+import hashlib
+import logging
+import re
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.core.constants import DEDUP_NUM_PERM, DEDUP_SHINGLE_SIZE
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_SEED = 1
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def shingle_hashes(text: str, shingle_size: int = DEDUP_SHINGLE_SIZE) -> np.ndarray:
+    """32-bit hashes of the distinct word shingles of ``text``."""
+    tokens = _TOKEN_RE.findall((text or "").casefold())
+    if len(tokens) < shingle_size:
+        shingles = {" ".join(tokens)} if tokens else set()
+    else:
+        shingles = {" ".join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)}
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures; identical parameters give comparable signatures."""
+
+    def __init__(self, num_perm: int = DEDUP_NUM_PERM, shingle_size: int = DEDUP_SHINGLE_SIZE):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(_SEED)
+        self._a = rng.randint(1, _MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = shingle_hashes(text, self.shingle_size)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        # a, x < 2**32, so a * x + b fits in uint64 before the modulus
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted.min(axis=0) & _MAX_HASH).astype(np.uint32)
+
+
+def estimate_jaccard(first: np.ndarray, second: np.ndarray) -> float:
+    return float(np.count_nonzero(first == second)) / len(first)
+
+
+def lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick ``(bands, rows)`` with ``bands * rows == num_perm`` whose S-curve midpoint
+    ``(1 / bands) ** (1 / rows)`` lies closest to, but not above, ``threshold``,
+    so true near-duplicates are rarely missed; candidates are verified afterwards.
+    """
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    below = [(b, r) for b, r in options if (1 / b) ** (1 / r) <= threshold]
+    return max(below or options, key=lambda br: (1 / br[0]) ** (1 / br[1]))
+
+
+class NearDuplicateIndex:
+    """In-memory MinHash LSH index over document signatures."""
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        num_perm: int = DEDUP_NUM_PERM,
+        shingle_size: int = DEDUP_SHINGLE_SIZE,
+    ):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add_signature(self, key: str, signature: np.ndarray) -> None:
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def add(self, key: str, text: str) -> np.ndarray:
+        signature = self.hasher.signature(text)
+        self.add_signature(key, signature)
+        return signature
+
+    def query_signature(self, signature: np.ndarray) -> List[Tuple[str, float]]:
+        """Indexed keys whose estimated Jaccard similarity reaches the threshold, best first."""
+        candidates: Set[str] = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        matches = [(key, estimate_jaccard(signature, self._signatures[key])) for key in candidates]
+        return sorted((m for m in matches if m[1] >= self.threshold), key=lambda m: -m[1])
+
+    def find_duplicate(self, text: str) -> Optional[Tuple[str, float]]:
+        matches = self.query_signature(self.hasher.signature(text))
+        return matches[0] if matches else None
+
+
+# ================================================================================
+# PER-COLLECTION PERSISTENCE
+# ================================================================================
+
+def load_collection_index(user_id: Any, collection: str, threshold: float) -> NearDuplicateIndex:
+    """Index pre-filled with the signatures ``user_id`` persisted in ``collection`` (empty without a database)."""
+    from app.core import database
+    from app.models.document_signature import DocumentSignature
+
+    index = NearDuplicateIndex(threshold=threshold)
+    if not database.SessionLocal:
+        return index
+    try:
+        with database.SessionLocal() as db:
+            rows = db.query(DocumentSignature.source_key, DocumentSignature.signature).filter(
+                DocumentSignature.user_id == _as_uuid(user_id),
+                DocumentSignature.collection == collection,
+                DocumentSignature.num_perm == index.hasher.num_perm,
+                DocumentSignature.shingle_size == index.hasher.shingle_size,
+            ).all()
+    except Exception as e:
+        logger.warning(f"Failed to load near-duplicate signatures for collection '{collection}': {e}")
+        return index
+    for source_key, signature in rows:
+        index.add_signature(source_key, np.frombuffer(signature, dtype=np.uint32))
+    logger.info(f"Loaded {len(rows)} near-duplicate signatures for collection '{collection}'")
+    return index
+
+
+def save_collection_signatures(
+    user_id: Any,
+    collection: str,
+    index: NearDuplicateIndex,
+    entries: List[Tuple[str, np.ndarray]],
+) -> int:
+    """Persist newly accepted signatures of ``user_id`` for ``collection``. Returns the number written."""
+    from app.core import database
+    from app.models.document_signature import DocumentSignature
+
+    if not entries or not database.SessionLocal:
+        return 0
+    try:
+        with database.SessionLocal() as db:
+            db.add_all([
+                DocumentSignature(
+                    user_id=_as_uuid(user_id),
+                    collection=collection,
+                    source_key=source_key,
+                    num_perm=index.hasher.num_perm,
+                    shingle_size=index.hasher.shingle_size,
+                    signature=signature.tobytes(),
+                )
+                for source_key, signature in entries
+            ])
+            db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to persist near-duplicate signatures for collection '{collection}': {e}")
+        return 0
+    return len(entries)
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
@@ -0,0 +1,285 @@
+"""
+Node Data Access
+================
+
+Async repository through which nodes reach the application database during an
+execution, instead of opening synchronous sessions of their own:
+
+• Lifecycle  - GraphBuilder.execute opens one per execution, hands it to every
+               node through the run config and closes it when the run ends, so
+               its session (and pooled connection) never outlives the execution
+• Session    - one AsyncSession on the execution's event loop, opened on first
+               use; a lock serializes parallel branches, and each unit of work
+               ends its transaction, so the connection never sits idle in
+               transaction between node calls
+• Threads    - sync node code runs in LangGraph's worker threads; ``call`` hands
+               a coroutine to the execution's loop and waits for the result
+               there, so the loop itself never blocks. Async node code on
+               another loop awaits ``run``
+• Caching    - credentials are loaded and decrypted once per user per execution
+
+Usage inside a node:
+    data_access = self.data_access
+    if data_access is not None:
+        records = data_access.call(data_access.load_memories(session_id, user_id, limit=10))
+"""
+
+import asyncio
+import logging
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import desc, select
+
+from app.core import database
+from app.core.constants import NODE_DB_CALL_TIMEOUT
+from app.core.database import BlockingDatabaseCallError, on_event_loop_thread
+
+logger = logging.getLogger(__name__)
+
+# Key of the repository in RunnableConfig["configurable"]
+NODE_DATA_ACCESS_KEY = "node_data_access"
+
+# (content, context, metadata) of one memory record to save
+MemoryEntry = Tuple[str, str, Dict[str, Any]]
+
+_current_data_access: ContextVar[Optional["NodeDataAccess"]] = ContextVar("node_data_access", default=None)
+
+
+class NodeDataAccess:
+    """Per-execution async repository for nodes, see the module docstring."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        timeout: float = NODE_DB_CALL_TIMEOUT,
+    ):
+        self._session_factory = session_factory
+        self._loop = loop
+        self.timeout = timeout
+        self._session = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._credentials: Dict[str, List[Dict[str, Any]]] = {}
+        self._closed = False
+        self._stats = {"calls": 0, "sessions_opened": 0}
+
+    @classmethod
+    async def open(cls, session_factory: Optional[Callable[[], Any]] = None) -> "NodeDataAccess":
+        """Repository bound to the running loop."""
+        return cls(session_factory=session_factory, loop=asyncio.get_running_loop())
+
+    # ------------------------------------------------------------------
+    # Session lifecycle
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        The execution's session, exclusively, for one unit of work: committed
+        when the block succeeds (which also ends a read's transaction), rolled
+        back when it raises.
+        """
+        if self._closed:
+            raise RuntimeError("NodeDataAccess is closed; its execution has finished")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._session is None:
+                factory = self._session_factory or database.AsyncSessionLocal
+                if factory is None:
+                    raise RuntimeError("Database is not enabled. Set DATABASE_URL to enable database functionality.")
+                self._session = factory()
+                self._stats["sessions_opened"] += 1
+            try:
+                yield self._session
+                await self._session.commit()
+            except BaseException:
+                # Also when a timed-out ``call`` cancels the unit of work
+                await self._session.rollback()
+                raise
+
+    async def aclose(self) -> None:
+        """Close the session; called once when the execution ends."""
+        self._closed = True
+        session, self._session = self._session, None
+        if session is not None:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Failed to close node data access session: {e}")
+
+    # ------------------------------------------------------------------
+    # Bridges for node code
+    # ------------------------------------------------------------------
+
+    def call(self, coroutine: Awaitable[Any]) -> Any:
+        """
+        Run ``coroutine`` on the execution's loop from a worker thread and
+        return its result. Refuses to run on an event loop thread, where
+        waiting would block that loop.
+        """
+        if on_event_loop_thread():
+            coroutine.close()
+            raise BlockingDatabaseCallError(
+                "NodeDataAccess.call() on the event loop thread; await NodeDataAccess.run() instead"
+            )
+        if self._loop is None or self._loop.is_closed():
+            coroutine.close()
+            raise RuntimeError("NodeDataAccess is not bound to a running event loop")
+        self._stats["calls"] += 1
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def run(self, coroutine: Awaitable[Any]) -> Any:
+        """Await ``coroutine`` on the execution's loop from any loop."""
+        self._stats["calls"] += 1
+        if self._loop is None or asyncio.get_running_loop() is self._loop:
+            return await coroutine
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+
+    # ------------------------------------------------------------------
+    # Repository
+    # ------------------------------------------------------------------
+
+    async def get_credentials(self, user_id: Any) -> List[Dict[str, Any]]:
+        """All decrypted credentials of a user, loaded once per execution."""
+        key = str(user_id)
+        if key not in self._credentials:
+            from app.core.credential_provider import credential_provider
+            from app.models.user_credential import UserCredential
+
+            async with self.session() as db:
+                result = await db.execute(select(UserCredential).where(UserCredential.user_id == _as_uuid(user_id)))
+                credentials = result.scalars().all()
+            self._credentials[key] = [credential_provider._process_credential_data(c) for c in credentials]
+        return self._credentials[key]
+
+    async def load_memories(self, session_id: str, user_id: Any, limit: int = 10) -> List[Any]:
+        """Most recent memory records of a user's session, newest first."""
+        async with self.session() as db:
+            result = await db.execute(_session_memories_query(session_id, user_id, limit))
+            return list(result.scalars().all())
+
+    async def save_memories(
+        self,
+        user_id: Any,
+        session_id: str,
+        entries: Sequence[MemoryEntry],
+        source_type: str = "chat",
+    ) -> int:
+        """Persist memory records in one transaction; returns the number saved."""
+        from app.models.memory import Memory
+
+        if not entries:
+            return 0
+        async with self.session() as db:
+            db.add_all([
+                Memory(
+                    user_id=_as_uuid(user_id) if user_id else None,
+                    session_id=session_id,
+                    content=content,
+                    context=context,
+                    memory_metadata=metadata or {},
+                    source_type=source_type,
+                )
+                for content, context, metadata in entries
+            ])
+        return len(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "closed": self._closed, "cached_credential_users": len(self._credentials)}
+
+
+def _as_uuid(value: Any) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _session_memories_query(session_id: str, user_id: Any, limit: int):
+    """Memories of ``session_id`` written for ``user_id`` (or without a user), newest first."""
+    from app.models.memory import Memory
+
+    owner = Memory.user_id == _as_uuid(user_id) if user_id else Memory.user_id.is_(None)
+    return (
+        select(Memory)
+        .where(Memory.session_id == session_id, owner)
+        .order_by(desc(Memory.created_at))
+        .limit(limit)
+    )
+
+
+def node_data_access_from(config: Optional[Dict[str, Any]]) -> Optional[NodeDataAccess]:
+    """The repository carried by a LangGraph run config, if any."""
+    return ((config or {}).get("configurable") or {}).get(NODE_DATA_ACCESS_KEY)
+
+
+def current_node_data_access() -> Optional[NodeDataAccess]:
+    """The repository of the node currently executing in this thread, if any."""
+    return _current_data_access.get()
+
+
+@contextmanager
+def use_node_data_access(data_access: Optional[NodeDataAccess]) -> Iterator[Optional[NodeDataAccess]]:
+    """Make ``data_access`` current for the node executing in this context."""
+    token = _current_data_access.set(data_access)
+    try:
+        yield data_access
+    finally:
+        _current_data_access.reset(token)
+
+
+def load_session_memories(
+    data_access: Optional[NodeDataAccess],
+    session_id: str,
+    limit: int,
+    user_id: Any = None,
+) -> List[Any]:
+    """Most recent memory records of a user's session, newest first (see ``load_user_credentials``)."""
+    if data_access is not None:
+        return data_access.call(data_access.load_memories(session_id, user_id, limit=limit))
+    if not database.SessionLocal:
+        return []
+
+    with database.SessionLocal() as db:
+        return list(db.execute(_session_memories_query(session_id, user_id, limit)).scalars().all())
+
+
+def save_session_memories(
+    data_access: Optional[NodeDataAccess],
+    user_id: Any,
+    session_id: str,
+    entries: Sequence[MemoryEntry],
+    source_type: str = "chat",
+) -> int:
+    """Persist memory records of a session (see ``load_user_credentials``)."""
+    if data_access is not None:
+        return data_access.call(data_access.save_memories(user_id, session_id, entries, source_type))
+    if not database.SessionLocal:
+        return 0
+    from app.services.memory import save_memory
+
+    with database.SessionLocal() as db:
+        for content, context, metadata in entries:
+            save_memory(db=db, user_id=str(user_id) if user_id else None, session_id=session_id,
+                        content=content, context=context, metadata=metadata, source_type=source_type)
+    return len(entries)
+
+
+def load_user_credentials(user_id: Any) -> List[Dict[str, Any]]:
+    """
+    Credentials for node injection: through the current execution's repository,
+    or a short-lived synchronous session when a node runs outside an execution.
+    """
+    data_access = current_node_data_access()
+    if data_access is not None:
+        return data_access.call(data_access.get_credentials(user_id))
+    from app.core.credential_provider import credential_provider
+
+    return credential_provider.get_credentials_sync(_as_uuid(user_id))
@@ -21,7 +21,7 @@ import uuid
 
 from app.core.state import FlowState
 from app.nodes.base import NodeType
-from app.core.credential_provider import credential_provider
+from app.core.node_data_access import current_node_data_access, load_user_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -64,12 +64,13 @@ class NodeExecutionHandler(ABC):
         logger.debug(f"[{node_type.upper()}] {action}: {node_id}")
 
     def _inject_user_context(self, node_instance: Any, state: FlowState, node_id: str):
-        """Inject user context (user_id and credentials) into node instance if supported."""
+        """Inject user context (data access and credentials) into node instance if supported."""
+        node_instance.data_access = current_node_data_access()
         # Use owner_id if available (workflow owner), otherwise user_id (executor)
         context_user_id = state.owner_id or state.user_id
         
         if node_instance.user_data.get('credential_id') and context_user_id:
-            node_instance.credentials = credential_provider.get_credentials_sync(user_id=context_user_id)
+            node_instance.credentials = load_user_credentials(context_user_id)
 
 class MemoryNodeHandler(NodeExecutionHandler):
     """
@@ -0,0 +1,164 @@
+"""
+Node Registry Manifest
+======================
+
+Precomputed index of every node the registry would discover, so application
+startup can serve node listings without importing the node modules.
+
+``NodeRegistry.discover_nodes`` imports every module under ``app/nodes`` and
+instantiates every node class, which pulls in LangChain integrations and
+provider SDKs before the first request is served. The manifest stores, per node:
+
+• name        - registry key (``metadata.name``)
+• module      - defining module, e.g. ``app.nodes.tools.tavily_search``
+• class_name  - class to import from that module on first use
+• metadata    - JSON-serialized ``NodeMetadata``
+• dynamic     - True when metadata differs per instance (e.g. a generated webhook
+                ID default); such nodes are still instantiated for every listing,
+                and the per-instance values are stored as DYNAMIC_VALUE so that
+                rebuilding the manifest is deterministic
+
+together with a SHA-256 fingerprint of the node sources. A manifest whose
+fingerprint no longer matches the tree is treated as stale and the registry
+falls back to import-based discovery, so an outdated file can slow startup
+but never serve wrong metadata.
+
+Command line (run from the backend directory):
+    python -m app.core.node_manifest build   # regenerate app/nodes/manifest.json
+    python -m app.core.node_manifest check   # exit 1 if missing, stale or unloadable
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+NODES_DIR = (Path(__file__).parent.parent / "nodes").resolve()
+MANIFEST_PATH = NODES_DIR / "manifest.json"
+
+# Stored in place of metadata values that differ between two instances of a node
+DYNAMIC_VALUE = "<generated per node instance>"
+
+
+def compute_source_fingerprint(nodes_dir: Path = NODES_DIR) -> str:
+    """SHA-256 over the relative path and content of every node source file."""
+    digest = hashlib.sha256()
+    for path in sorted(nodes_dir.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        digest.update(path.relative_to(nodes_dir).as_posix().encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(path.read_bytes())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def normalize_dynamic_values(first: Any, second: Any) -> Any:
+    """``first`` with every value that differs from ``second`` replaced by DYNAMIC_VALUE."""
+    if isinstance(first, dict) and isinstance(second, dict) and first.keys() == second.keys():
+        return {key: normalize_dynamic_values(first[key], second[key]) for key in first}
+    if isinstance(first, list) and isinstance(second, list) and len(first) == len(second):
+        return [normalize_dynamic_values(a, b) for a, b in zip(first, second)]
+    return first if first == second else DYNAMIC_VALUE
+
+
+def build_manifest(nodes_dir: Path = NODES_DIR) -> Dict[str, Any]:
+    """Import every node module via full discovery and describe what was registered."""
+    from app.core.node_registry import NodeRegistry
+
+    registry = NodeRegistry()
+    registry.discover_nodes(use_manifest=False)
+
+    entries: List[Dict[str, Any]] = []
+    for name in sorted(registry.nodes):
+        node_class = registry.nodes[name]
+        metadata = registry.node_configs[name].model_dump(mode="json")
+        other_instance = node_class().metadata.model_dump(mode="json")
+        entries.append({
+            "name": name,
+            "module": node_class.__module__,
+            "class_name": node_class.__qualname__,
+            "metadata": normalize_dynamic_values(metadata, other_instance),
+            "dynamic": other_instance != metadata,
+        })
+
+    return {
+        "version": MANIFEST_VERSION,
+        "source_fingerprint": compute_source_fingerprint(nodes_dir),
+        "nodes": entries,
+    }
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path = MANIFEST_PATH) -> None:
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def load_manifest(path: Path = MANIFEST_PATH, nodes_dir: Path = NODES_DIR) -> Optional[Dict[str, Any]]:
+    """Return the manifest if it exists and matches the current node sources, else None."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.info(f"Node manifest not found at {path}")
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Node manifest unreadable: {e}")
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        logger.warning(f"Node manifest version {manifest.get('version')} is not supported")
+        return None
+    if manifest.get("source_fingerprint") != compute_source_fingerprint(nodes_dir):
+        logger.warning("Node manifest is stale; run 'python -m app.core.node_manifest build'")
+        return None
+    return manifest
+
+
+def validate_manifest(path: Path = MANIFEST_PATH) -> List[str]:
+    """Check the manifest against the tree and against live node classes. Returns a list of problems."""
+    manifest = load_manifest(path)
+    if manifest is None:
+        return [f"{path} is missing, unreadable or stale"]
+
+    problems = []
+    expected = build_manifest()
+    recorded = {entry["name"]: entry for entry in manifest["nodes"]}
+    actual = {entry["name"]: entry for entry in expected["nodes"]}
+    for name in sorted(set(actual) - set(recorded)):
+        problems.append(f"node {name} is missing from the manifest")
+    for name in sorted(set(recorded) - set(actual)):
+        problems.append(f"node {name} is in the manifest but no longer discovered")
+    for name in sorted(set(recorded) & set(actual)):
+        fields = ("module", "class_name", "dynamic") if actual[name]["dynamic"] else tuple(actual[name])
+        if any(recorded[name].get(f) != actual[name][f] for f in fields):
+            problems.append(f"node {name} differs from its live metadata")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or validate the node registry manifest")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("--path", type=Path, default=MANIFEST_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        manifest = build_manifest()
+        write_manifest(manifest, args.path)
+        print(f"Wrote {len(manifest['nodes'])} nodes to {args.path}")
+        return 0
+
+    problems = validate_manifest(args.path)
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not problems:
+        print(f"✅ {args.path} is up to date")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
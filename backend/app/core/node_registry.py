@@ -220,16 +220,94 @@ IMPLEMENTATION DETAILS:
 ──────────────────────────────────────────────────────────────
 """
 
-from typing import Dict, Type, List, Optional
-from app.nodes import BaseNode, NodeMetadata
+from typing import Any, Dict, Type, List, Optional, Tuple
+from app.nodes.base import BaseNode, NodeMetadata
 import importlib
 import inspect
 import logging
 import os
+import threading
 from pathlib import Path
 
+from app.core.constants import NODE_MANIFEST_ENABLED
+
 logger = logging.getLogger(__name__)
 
+NodeSpec = Tuple[str, str]  # (module path, class name)
+
+
+class LazyNodeMap(dict):
+    """
+    ``name -> node class`` mapping whose classes may still be unimported.
+
+    Entries loaded from the manifest hold a ``(module, class_name)`` spec; the
+    module is imported the first time the class is read through ``[]``,
+    ``get``, ``values`` or ``items``. Membership, ``len`` and key iteration
+    never import anything.
+    """
+
+    def __init__(self, on_load_error=None):
+        super().__init__()
+        self._on_load_error = on_load_error
+        self._lock = threading.RLock()
+
+    def add_spec(self, name: str, module: str, class_name: str) -> None:
+        super().__setitem__(name, (module, class_name))
+
+    def is_loaded(self, name: str) -> bool:
+        return not isinstance(super().get(name), tuple)
+
+    def spec(self, name: str) -> Optional[NodeSpec]:
+        value = super().get(name)
+        if value is None:
+            return None
+        if isinstance(value, tuple):
+            return value
+        return (value.__module__, value.__qualname__)
+
+    def _resolve(self, name: str) -> Optional[Type[BaseNode]]:
+        value = super().__getitem__(name)
+        if not isinstance(value, tuple):
+            return value
+        with self._lock:
+            value = super().__getitem__(name)
+            if not isinstance(value, tuple):
+                return value
+            module_path, class_name = value
+            try:
+                node_class = getattr(importlib.import_module(module_path), class_name)
+            except Exception as e:  # noqa: BLE001
+                print(f"❌ Error loading node {name} from {module_path}: {e}")
+                super().__delitem__(name)
+                if self._on_load_error:
+                    self._on_load_error(name)
+                return None
+            super().__setitem__(name, node_class)
+            logger.debug(f"Lazily loaded node: {name}")
+            return node_class
+
+    def __getitem__(self, name: str) -> Type[BaseNode]:
+        node_class = self._resolve(name)
+        if node_class is None:
+            raise KeyError(name)
+        return node_class
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if not super().__contains__(name):
+            return default
+        node_class = self._resolve(name)
+        return default if node_class is None else node_class
+
+    def values(self):
+        return [node_class for _, node_class in self.items()]
+
+    def items(self):
+        resolved = [(name, self._resolve(name)) for name in list(self.keys())]
+        return [(name, node_class) for name, node_class in resolved if node_class is not None]
+
+    def copy(self) -> Dict[str, Type[BaseNode]]:
+        return dict(self.items())
+
 class NodeRegistry:
     """
     Enterprise-Grade Node Discovery & Management Engine
@@ -517,8 +595,9 @@ class NodeRegistry:
     """
     
     def __init__(self):
-        self.nodes: Dict[str, Type[BaseNode]] = {}
         self.node_configs: Dict[str, NodeMetadata] = {}
+        self.nodes: LazyNodeMap = LazyNodeMap(on_load_error=lambda name: self.node_configs.pop(name, None))
+        self.dynamic_metadata: set = set()  # Nodes whose metadata must be rebuilt per instance
         self.hidden_aliases: set = set(('ProcessorNode', 'TerminatorNode', 'ProviderNode'))  # Track aliases that shouldn't be shown in UI
         
         # Explicitly register the fundamental, non-abstract base nodes
@@ -556,19 +635,75 @@ class NodeRegistry:
         """Get a node class by name"""
         return self.nodes.get(node_name)
     
+    def get_node_metadata(self, node_name: str) -> Optional[NodeMetadata]:
+        """Metadata for a node; only nodes with per-instance metadata are imported and instantiated."""
+        if node_name in self.dynamic_metadata:
+            node_class = self.get_node(node_name)
+            if node_class is not None:
+                return node_class().metadata
+        return self.node_configs.get(node_name)
+
     def get_all_nodes(self) -> List[NodeMetadata]:
         """Get all available node configurations (excluding hidden aliases)"""
-        return [config for name, config in self.node_configs.items() if name not in self.hidden_aliases]
+        return [
+            self.get_node_metadata(name) if name in self.dynamic_metadata else config
+            for name, config in self.node_configs.items()
+            if name not in self.hidden_aliases
+        ]
     
     def get_nodes_by_category(self, category: str) -> List[NodeMetadata]:
         """Get nodes filtered by category"""
         return [
-            config for config in self.node_configs.values()
+            self.get_node_metadata(name) if name in self.dynamic_metadata else config
+            for name, config in self.node_configs.items()
             if config.category == category
         ]
     
-    def discover_nodes(self):
-        """Discover and register all nodes in the nodes directory"""
+    def node_class_names(self) -> List[str]:
+        """Class names of all registered nodes, without importing lazily registered ones."""
+        return sorted({self.nodes.spec(name)[1] for name in self.nodes})
+
+    def discover_nodes(self, use_manifest: bool = NODE_MANIFEST_ENABLED):
+        """
+        Discover and register all nodes in the nodes directory.
+
+        With ``use_manifest`` and an up-to-date ``app/nodes/manifest.json``, nodes
+        are registered from the manifest and their modules are imported on first
+        use. Otherwise every node module is imported and inspected.
+        """
+        if use_manifest and self.load_manifest():
+            return
+        self._discover_by_import()
+
+    def load_manifest(self) -> bool:
+        """Register nodes from the precomputed manifest. Returns False if it is missing or stale."""
+        from app.core.node_manifest import load_manifest
+
+        manifest = load_manifest()
+        if manifest is None:
+            return False
+
+        try:
+            entries = [
+                (entry["name"], entry["module"], entry["class_name"], NodeMetadata.model_validate(entry["metadata"]),
+                 bool(entry.get("dynamic")))
+                for entry in manifest["nodes"]
+            ]
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Node manifest is invalid, falling back to import discovery: {e}")
+            return False
+
+        for name, module_path, class_name, metadata, dynamic in entries:
+            if name not in self.nodes:
+                self.nodes.add_spec(name, module_path, class_name)
+                self.node_configs[name] = metadata
+                if dynamic:
+                    self.dynamic_metadata.add(name)
+        logger.info(f"Registered {len(entries)} nodes from manifest")
+        return True
+
+    def _discover_by_import(self):
+        """Import every node module and register its BaseNode subclasses."""
         current_dir = Path(__file__).parent
         nodes_dir = (current_dir.parent / "nodes").resolve()
         
@@ -614,6 +749,7 @@ class NodeRegistry:
         """Clear all registered nodes"""
         self.nodes.clear()
         self.node_configs.clear()
+        self.dynamic_metadata.clear()
         self.hidden_aliases.clear()
 
 # Global node registry instance
@@ -0,0 +1,116 @@
+"""
+In-Memory Token Bucket Rate Limiter
+===================================
+
+Process-local, per-key token buckets used to rate limit inbound webhooks
+without a database round trip per request.
+
+Each key (webhook ID) gets a bucket refilled continuously at
+``rate_per_minute / 60`` tokens per second, holding at most ``burst`` tokens.
+A request is admitted when it can take one token. The number of buckets is
+capped at ``WEBHOOK_RATE_LIMIT_MAX_BUCKETS``; the least recently used bucket is
+dropped first, which at worst lets that key start again from a full bucket.
+
+Limits are enforced per worker process: with N workers an endpoint can accept
+up to N times its configured rate.
+
+Usage:
+    from app.core.rate_limiter import get_webhook_rate_limiter
+
+    if not get_webhook_rate_limiter().try_acquire(webhook_id, rate_per_minute=60):
+        raise HTTPException(status_code=429, detail="Rate limit exceeded")
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from app.core.constants import WEBHOOK_RATE_LIMIT_BURST_SECONDS, WEBHOOK_RATE_LIMIT_MAX_BUCKETS
+
+
+@dataclass
+class TokenBucket:
+    tokens: float
+    updated_at: float
+
+
+def burst_for_rate(rate_per_minute: float, burst_seconds: float = WEBHOOK_RATE_LIMIT_BURST_SECONDS) -> float:
+    """Bucket capacity: ``burst_seconds`` worth of tokens, never less than one request."""
+    return max(1.0, rate_per_minute / 60.0 * burst_seconds)
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe, bounded map of token buckets."""
+
+    def __init__(
+        self,
+        max_buckets: int = WEBHOOK_RATE_LIMIT_MAX_BUCKETS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_buckets = max(1, max_buckets)
+        self._clock = clock
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.limited = 0
+
+    def _refill_locked(self, key: str, rate_per_minute: float, burst: float, now: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(tokens=burst, updated_at=now)
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            elapsed = max(0.0, now - bucket.updated_at)
+            bucket.tokens = min(burst, bucket.tokens + elapsed * rate_per_minute / 60.0)
+            bucket.updated_at = now
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def try_acquire(self, key: str, rate_per_minute: float, burst: Optional[float] = None) -> bool:
+        """Take one token for ``key``. Returns False when the caller is rate limited."""
+        burst = burst if burst is not None else burst_for_rate(rate_per_minute)
+        with self._lock:
+            bucket = self._refill_locked(key, rate_per_minute, burst, self._clock())
+            if bucket.tokens >= 1.0:
+                bucket.tokens -= 1.0
+                self.allowed += 1
+                return True
+            self.limited += 1
+            return False
+
+    def is_limited(self, key: str, rate_per_minute: float, burst: Optional[float] = None) -> bool:
+        """Whether the next request for ``key`` would be rejected, without consuming a token."""
+        burst = burst if burst is not None else burst_for_rate(rate_per_minute)
+        with self._lock:
+            if key not in self._buckets:
+                return False
+            return self._refill_locked(key, rate_per_minute, burst, self._clock()).tokens < 1.0
+
+    def reset(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"buckets": len(self._buckets), "allowed": self.allowed, "limited": self.limited}
+
+
+_limiter: Optional[TokenBucketRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_webhook_rate_limiter() -> TokenBucketRateLimiter:
+    """Get the process-wide webhook rate limiter."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = TokenBucketRateLimiter()
+    return _limiter
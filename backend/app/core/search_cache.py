@@ -0,0 +1,165 @@
+"""
+Search Result Cache
+===================
+
+Process-wide TTL cache with single-flight request coalescing for web search
+tools such as ``TavilySearchNode``.
+
+Agents call the search tool once per reasoning step, and concurrent sessions
+frequently ask the same question within seconds of each other. Entries are
+keyed by:
+
+• provider          - results from different engines never mix
+• normalized query  - case-folded, whitespace-collapsed
+• search options    - depth, max results, domain filters, etc. (order-insensitive)
+• credential digest - tenants with different API keys never share results
+
+While a search for a key is in flight, further callers for the same key wait
+for that call instead of issuing their own (single-flight). Failures are
+propagated to every waiter and are never cached. Hit/miss/coalesced counters
+are exposed via ``stats()`` and the /health endpoint.
+
+Usage:
+    from app.core.search_cache import get_search_cache
+
+    cache = get_search_cache()
+    results = cache.get_or_fetch("tavily", query, options, lambda: client.run(query))
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.constants import SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share an entry."""
+    return " ".join((query or "").split()).casefold()
+
+
+def make_search_key(provider: str, query: str, options: Optional[Dict[str, Any]] = None) -> str:
+    payload = json.dumps(
+        {"provider": provider, "query": normalize_query(query), "options": options or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """Thread-safe TTL/LRU result cache with single-flight coalescing."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = SEARCH_CACHE_TTL,
+        max_entries: int = SEARCH_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def get_or_fetch(
+        self,
+        provider: str,
+        query: str,
+        options: Optional[Dict[str, Any]],
+        fetch: Callable[[], Any],
+        ttl_seconds: Optional[int] = None,
+    ) -> Any:
+        """
+        Return a cached result, join an in-flight search for the same key, or run ``fetch``.
+
+        A ``ttl_seconds`` of 0 disables caching for the call; coalescing still applies.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        key = make_search_key(provider, query, options)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if self._clock() < expires_at:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self.errors += 1
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if ttl and ttl > 0:
+                self._entries[key] = (value, self._clock() + ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "inflight": len(self._inflight),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            }
+
+
+_cache: Optional[SearchResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchResultCache:
+    """Get the process-wide search result cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SearchResultCache()
+    return _cache
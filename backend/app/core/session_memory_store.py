@@ -0,0 +1,161 @@
+"""
+Session Memory Store
+====================
+
+Bounded, process-wide store for per-session conversation memory objects
+(``ConversationMemoryNode``).
+
+A long-running API process sees an unbounded number of distinct chat sessions,
+but only a small working set is active at any time. The store keeps at most
+``CONVERSATION_MEMORY_MAX_SESSIONS`` entries and evicts:
+
+• idle entries - not accessed for ``CONVERSATION_MEMORY_IDLE_TTL`` seconds
+• LRU entries  - the least recently used session once the cap is reached
+
+Eviction is swept on access (entries are kept in access order, so a sweep only
+touches what it evicts). An evicted session is transparently rebuilt by the
+caller's loader on its next access, e.g. rehydrated from the ``memories`` table.
+
+Resident sessions, hits, misses and evictions are exposed via ``stats()`` and
+the /health endpoint, so pods can be sized against the real working set.
+
+Usage:
+    from app.core.session_memory_store import get_session_memory_store
+
+    memory = get_session_memory_store().get_or_load(
+        (session_id, memory_key), lambda: build_memory(session_id)
+    )
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.constants import CONVERSATION_MEMORY_IDLE_TTL, CONVERSATION_MEMORY_MAX_SESSIONS
+
+
+class SessionMemoryStore:
+    """Thread-safe LRU map with idle-TTL eviction and load-on-miss."""
+
+    def __init__(
+        self,
+        max_sessions: int = CONVERSATION_MEMORY_MAX_SESSIONS,
+        idle_ttl_seconds: float = CONVERSATION_MEMORY_IDLE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_sessions = max(1, max_sessions)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.load_errors = 0
+        self.idle_evictions = 0
+        self.lru_evictions = 0
+
+    def _evict_idle_locked(self, now: float) -> None:
+        if not self.idle_ttl_seconds or self.idle_ttl_seconds <= 0:
+            return
+        while self._entries:
+            key, (_, last_access) = next(iter(self._entries.items()))
+            if now - last_access < self.idle_ttl_seconds:
+                break
+            del self._entries[key]
+            self.idle_evictions += 1
+
+    def _get_locked(self, key: Hashable, now: float) -> Optional[Any]:
+        self._evict_idle_locked(now)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries[key] = (entry[0], now)
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            return self._get_locked(key, self._clock())
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+                self.lru_evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the resident value for ``key`` or build it with ``loader``.
+
+        The loader runs outside the lock so a slow rehydration never blocks other
+        sessions; if two callers race on the same key, the first stored value wins.
+        """
+        with self._lock:
+            value = self._get_locked(key, self._clock())
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        try:
+            loaded = loader()
+        except Exception:
+            with self._lock:
+                self.load_errors += 1
+            raise
+
+        with self._lock:
+            value = self._get_locked(key, self._clock())
+            if value is not None:
+                return value
+        self.put(key, loaded)
+        return loaded
+
+    def discard(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def evict_idle(self) -> int:
+        """Evict every idle entry now. Returns the number evicted."""
+        with self._lock:
+            before = len(self._entries)
+            self._evict_idle_locked(self._clock())
+            return before - len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "resident_sessions": len(self._entries),
+                "max_sessions": self.max_sessions,
+                "idle_ttl_seconds": self.idle_ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "load_errors": self.load_errors,
+                "idle_evictions": self.idle_evictions,
+                "lru_evictions": self.lru_evictions,
+            }
+
+
+_store: Optional[SessionMemoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_memory_store() -> SessionMemoryStore:
+    """Get the process-wide conversation session store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionMemoryStore()
+    return _store
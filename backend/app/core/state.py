@@ -113,6 +113,23 @@ def merge_errors(left: List[str], right: List[str]) -> List[str]:
     # Combine all errors (duplicates allowed for error tracking)
     return left + right
 
+def take_latest(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """
+    Reducer for last_output to handle LangGraph state merges.
+    
+    Parallel branches finishing in the same step each write last_output;
+    LangGraph applies the writes in node-id order, so the same branch wins on
+    every run. Each branch's output is still kept in node_outputs.
+    
+    Args:
+        left: Existing last output (from previous state)
+        right: New last output (from node return)
+    
+    Returns:
+        The newer output
+    """
+    return right
+
 class FlowState(BaseModel):
     """
     State object for LangGraph workflows
@@ -125,7 +142,7 @@ class FlowState(BaseModel):
     memory_data: Dict[str, Any] = Field(default_factory=dict, description="General purpose memory storage")
     
     # Last output from any node
-    last_output: Optional[str] = Field(default=None, description="Output from the last executed node")
+    last_output: Annotated[Optional[str], take_latest] = Field(default=None, description="Output from the last executed node")
     
     # Current input being processed
     current_input: Optional[str] = Field(default=None, description="Current input being processed")
@@ -0,0 +1,248 @@
+"""
+Batched Span Export
+===================
+
+Takes span export off the workflow execution path. ``DistributedTracer.finish_trace``
+only appends a kept trace's spans to a bounded in-process queue; a daemon
+thread drains the queue in batches of ``TRACE_EXPORT_BATCH_SIZE`` (or every
+``TRACE_EXPORT_INTERVAL`` seconds) and hands each batch to the configured sinks:
+
+• log      - one summary line per batch, span details at DEBUG (only with
+             ENABLE_WORKFLOW_TRACING)
+• file     - JSON lines appended to ``TRACE_EXPORT_FILE``
+• postgres - one multi-row INSERT into ``trace_spans`` per batch
+• none     - spans are sampled and counted but not written
+
+Guarantees:
+• Constant per-trace cost - enqueueing never waits on a sink, however slow.
+• Bounded memory - at most ``TRACE_EXPORT_QUEUE_SIZE`` spans are queued; a trace
+  that does not fit is dropped whole (and counted) rather than exported partially.
+• A failing sink is logged and its batch discarded; other sinks still receive it.
+• ``shutdown()`` drains what is queued (application shutdown).
+
+Usage:
+    from app.core.trace_export import get_span_exporter
+
+    get_span_exporter().submit(trace_context.get_all_spans())
+"""
+
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.constants import (
+    ENABLE_WORKFLOW_TRACING,
+    TRACE_EXPORT_BATCH_SIZE,
+    TRACE_EXPORT_FILE,
+    TRACE_EXPORT_INTERVAL,
+    TRACE_EXPORT_QUEUE_SIZE,
+    TRACE_EXPORT_SINK,
+)
+from app.core.json_utils import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+# Sinks receive a batch of ``tracing.Span`` objects
+SpanSink = Callable[[List[Any]], None]
+
+
+# ================================================================================
+# SINKS
+# ================================================================================
+
+def log_span_sink(spans: List[Any]) -> None:
+    if not ENABLE_WORKFLOW_TRACING:
+        return
+    logger.info(f"📤 Exporting {len(spans)} spans to logs")
+    for span in spans:
+        logger.debug(f"📋 Span: {span.operation_name} ({span.span_type.value}) - {span.status} - {span.duration_ms}ms")
+
+
+class FileSpanSink:
+    """Appends spans as JSON lines to a local file."""
+
+    def __init__(self, path: str = TRACE_EXPORT_FILE):
+        self.path = Path(path)
+
+    def __call__(self, spans: List[Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as f:
+            f.write(b"".join(dumps_bytes(span.to_dict()) + b"\n" for span in spans))
+
+
+class PostgresSpanSink:
+    """Writes each batch into ``trace_spans`` with one multi-row INSERT."""
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        self._session_factory = session_factory
+
+    def __call__(self, spans: List[Any]) -> None:
+        from sqlalchemy import insert
+
+        from app.core import database
+        from app.models.trace_span import TraceSpan
+
+        session_factory = self._session_factory or database.SessionLocal
+        if not session_factory:
+            return
+        rows = [
+            {
+                "span_id": span.span_id,
+                "trace_id": span.trace_id,
+                "parent_span_id": span.parent_span_id,
+                "correlation_id": span.correlation_id,
+                "operation_name": span.operation_name[:255],
+                "span_type": span.span_type.value,
+                "status": span.status,
+                "start_time": span.start_time,
+                "end_time": span.end_time,
+                "duration_ms": span.duration_ms,
+                "tags": span.tags,
+                "logs": span.logs,
+                "error_message": span.error_message,
+            }
+            for span in spans
+        ]
+        with session_factory() as db:
+            db.execute(insert(TraceSpan), rows)
+            db.commit()
+
+
+def build_span_sink(kind: str = TRACE_EXPORT_SINK) -> Optional[SpanSink]:
+    """Sink for a ``TRACE_EXPORT_SINK`` value; ``None`` for ``none``."""
+    kind = (kind or "none").strip().lower()
+    if kind == "log":
+        return log_span_sink
+    if kind == "file":
+        return FileSpanSink()
+    if kind == "postgres":
+        return PostgresSpanSink()
+    if kind != "none":
+        logger.warning(f"Unknown TRACE_EXPORT_SINK '{kind}', spans will not be exported")
+    return None
+
+
+# ================================================================================
+# BATCH EXPORTER
+# ================================================================================
+
+class BatchSpanExporter:
+    """Bounded span queue drained by a background thread into the registered sinks."""
+
+    def __init__(
+        self,
+        sinks: Optional[Sequence[SpanSink]] = None,
+        max_queue_size: int = TRACE_EXPORT_QUEUE_SIZE,
+        batch_size: int = TRACE_EXPORT_BATCH_SIZE,
+        flush_interval: float = TRACE_EXPORT_INTERVAL,
+    ):
+        self.sinks: List[SpanSink] = list(sinks or [])
+        self.max_queue_size = max(1, max_queue_size)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._shutdown = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.enqueued_spans = 0
+        self.dropped_spans = 0
+        self.exported_spans = 0
+        self.failed_batches = 0
+
+    def add_sink(self, sink: SpanSink) -> None:
+        self.sinks.append(sink)
+
+    def submit(self, spans: Sequence[Any]) -> bool:
+        """Queue the spans of one trace. Returns False if the trace was dropped."""
+        if not spans or not self.sinks:
+            return False
+        with self._lock:
+            if len(self._queue) + len(spans) > self.max_queue_size:
+                self.dropped_spans += len(spans)
+                return False
+            self._queue.extend(spans)
+            self.enqueued_spans += len(spans)
+            batch_ready = len(self._queue) >= self.batch_size
+        self._ensure_started()
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def _next_batch(self) -> List[Any]:
+        with self._lock:
+            count = min(self.batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def flush(self) -> int:
+        """Export everything queued now. Returns the number of spans exported."""
+        exported = 0
+        with self._export_lock:
+            while True:
+                batch = self._next_batch()
+                if not batch:
+                    return exported
+                for sink in self.sinks:
+                    try:
+                        sink(batch)
+                    except Exception as e:
+                        self.failed_batches += 1
+                        logger.error(f"Span export to {getattr(sink, '__name__', type(sink).__name__)} failed: {e}")
+                exported += len(batch)
+                with self._lock:
+                    self.exported_spans += len(batch)
+
+    def _run(self) -> None:
+        while not self._shutdown.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._shutdown.clear()
+            self._thread = threading.Thread(target=self._run, name="TraceSpan-Exporter", daemon=True)
+            self._thread.start()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the export thread and drain the queue."""
+        self._shutdown.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queued_spans": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "enqueued_spans": self.enqueued_spans,
+                "exported_spans": self.exported_spans,
+                "dropped_spans": self.dropped_spans,
+                "failed_batches": self.failed_batches,
+                "sinks": len(self.sinks),
+            }
+
+
+_exporter: Optional[BatchSpanExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_span_exporter() -> BatchSpanExporter:
+    """Get the process-wide span exporter, with the sink selected by ``TRACE_EXPORT_SINK``."""
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                sink = build_span_sink()
+                _exporter = BatchSpanExporter(sinks=[sink] if sink else [])
+    return _exporter
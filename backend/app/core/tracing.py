@@ -275,6 +275,8 @@ import uuid
 import traceback
 import json
 import asyncio
+import random
+import threading
 from typing import Dict, Any, Optional, List, Union, Callable
 from functools import wraps
 from contextlib import contextmanager, asynccontextmanager
@@ -282,7 +284,7 @@ from contextvars import ContextVar
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from collections import defaultdict, deque
+from collections import defaultdict
 from langchain_core.tracers import LangChainTracer
 from langchain_core.callbacks import CallbackManager
 
@@ -291,8 +293,13 @@ from .constants import (
     ENABLE_WORKFLOW_TRACING, 
     TRACE_MEMORY_OPERATIONS, 
     LANGCHAIN_TRACING_V2,
-    TRACE_AGENT_REASONING
+    TRACE_AGENT_REASONING,
+    TRACE_SAMPLING_STRATEGY,
+    TRACE_HEAD_SAMPLE_RATE,
+    TRACE_TAIL_SAMPLING,
+    TRACE_TAIL_LATENCY_MS
 )
+from .trace_export import BatchSpanExporter, get_span_exporter
 
 # Import performance monitor for enhanced tracing capabilities
 from .performance_monitor import get_performance_monitor
@@ -407,7 +414,8 @@ class TraceContext:
     active_spans: Dict[str, Span] = field(default_factory=dict)
     finished_spans: List[Span] = field(default_factory=list)
     baggage: Dict[str, Any] = field(default_factory=dict)
-    sampling_decision: bool = True
+    sampling_decision: bool = True  # Head decision; tail sampling may still keep the trace
+    recording: bool = True  # Spans are collected until the tail decision in finish_trace
     custom_metrics: Dict[str, float] = field(default_factory=dict)
     
     def create_span(
@@ -452,14 +460,32 @@ class TraceContext:
 
 
 class SamplingDecision:
-    """Sampling decision for traces."""
+    """
+    Head and tail sampling for traces.
+
+    The head decision is taken when a trace starts (``should_sample``). With tail
+    sampling enabled, traces that lose the head decision are still recorded and
+    kept at ``should_keep`` time if any span failed or the root span ran for at
+    least ``latency_threshold_ms``.
+    """
     
-    def __init__(self, strategy: SamplingStrategy = SamplingStrategy.ALWAYS, **config):
+    def __init__(self,
+                 strategy: SamplingStrategy = SamplingStrategy.ALWAYS,
+                 tail_sampling: bool = False,
+                 latency_threshold_ms: float = TRACE_TAIL_LATENCY_MS,
+                 **config):
         self.strategy = strategy
+        self.tail_sampling = tail_sampling and strategy != SamplingStrategy.NEVER
+        self.latency_threshold_ms = latency_threshold_ms
         self.config = config
-        self._rate_limiter = defaultdict(lambda: deque(maxlen=100))
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        # operation_name -> (tokens, last refill time); refilled at rate_limit per minute
+        self._rate_buckets: Dict[str, tuple] = {}
         self._error_count = 0
         self._total_count = 0
+        self.kept = defaultdict(int)
+        self.dropped_count = 0
     
     def should_sample(
         self, 
@@ -467,7 +493,7 @@ class SamplingDecision:
         tags: Optional[Dict[str, Any]] = None,
         has_error: bool = False
     ) -> bool:
-        """Determine if this trace should be sampled."""
+        """Head decision: should this trace be kept regardless of its outcome."""
         self._total_count += 1
         if has_error:
             self._error_count += 1
@@ -480,22 +506,61 @@ class SamplingDecision:
             return has_error
         elif self.strategy == SamplingStrategy.PROBABILISTIC:
             probability = self.config.get('probability', 0.1)
-            return hash(operation_name) % 100 < probability * 100
+            return self._random.random() < probability
         elif self.strategy == SamplingStrategy.RATE_LIMITED:
             rate_limit = self.config.get('rate_limit', 10)  # per minute
-            now = time.time()
-            self._rate_limiter[operation_name].append(now)
-            recent_samples = [t for t in self._rate_limiter[operation_name] if now - t < 60]
-            return len(recent_samples) <= rate_limit
+            return self._take_token(operation_name, rate_limit)
         elif self.strategy == SamplingStrategy.ADAPTIVE:
             # Sample more when error rate is high
             error_rate = self._error_count / max(self._total_count, 1)
             base_rate = self.config.get('base_rate', 0.1)
             error_boost = self.config.get('error_boost', 0.5)
             adaptive_rate = min(base_rate + (error_rate * error_boost), 1.0)
-            return hash(operation_name) % 100 < adaptive_rate * 100
+            return self._random.random() < adaptive_rate
         
         return True
+    
+    def _take_token(self, operation_name: str, rate_limit: float) -> bool:
+        """Token bucket per operation: O(1) per decision, bursts up to ``rate_limit``."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._rate_buckets.get(operation_name, (float(rate_limit), now))
+            tokens = min(float(rate_limit), tokens + (now - last) * rate_limit / 60.0)
+            allowed = tokens >= 1.0
+            self._rate_buckets[operation_name] = (tokens - 1.0 if allowed else tokens, now)
+            return allowed
+    
+    def should_keep(self, trace_context: 'TraceContext') -> Optional[str]:
+        """Tail decision for a finished trace. Returns the keep reason, or None to drop it."""
+        reason = None
+        if trace_context.sampling_decision:
+            reason = "head"
+        elif self.tail_sampling:
+            spans = trace_context.finished_spans
+            if any(span.status == "error" or span.tags.get("error") or span.tags.get("workflow.error") for span in spans):
+                reason = "error"
+            else:
+                root = next((span for span in spans if span.tags.get("is_root")), None)
+                if root and (root.duration_ms or 0) >= self.latency_threshold_ms:
+                    reason = "latency"
+        
+        with self._lock:
+            if reason:
+                self.kept[reason] += 1
+            else:
+                self.dropped_count += 1
+        return reason
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "strategy": self.strategy.value,
+                "tail_sampling": self.tail_sampling,
+                "latency_threshold_ms": self.latency_threshold_ms,
+                "total_traces": self._total_count,
+                "kept_traces": dict(self.kept),
+                "dropped_traces": self.dropped_count,
+            }
 
 
 class DistributedTracer:
@@ -504,12 +569,27 @@ class DistributedTracer:
     def __init__(self, 
                  service_name: str = "kai-fusion",
                  sampling_strategy: SamplingStrategy = SamplingStrategy.ALWAYS,
+                 exporter: Optional[BatchSpanExporter] = None,
+                 tail_sampling: bool = False,
+                 tail_latency_ms: float = TRACE_TAIL_LATENCY_MS,
                  **sampling_config):
         self.service_name = service_name
-        self.sampling_decision = SamplingDecision(sampling_strategy, **sampling_config)
-        self.exporters: List[Callable[[List[Span]], None]] = []
+        self.sampling_decision = SamplingDecision(
+            sampling_strategy,
+            tail_sampling=tail_sampling,
+            latency_threshold_ms=tail_latency_ms,
+            **sampling_config
+        )
+        self.exporter = exporter or BatchSpanExporter()
         self._metrics = defaultdict(float)
         self._custom_metrics = {}
+        # Time spent in WorkflowTracer node hooks (count, total, max), to keep an eye on tracing overhead
+        self._overhead_lock = threading.Lock()
+        self._node_overhead = [0, 0.0, 0.0]
+    
+    @property
+    def exporters(self) -> List[Callable[[List[Span]], None]]:
+        return self.exporter.sinks
     
     def start_trace(
         self, 
@@ -530,10 +610,11 @@ class DistributedTracer:
         trace_context = TraceContext(
             trace_id=trace_id,
             correlation_id=correlation_id,
-            sampling_decision=should_sample
+            sampling_decision=should_sample,
+            recording=should_sample or self.sampling_decision.tail_sampling
         )
         
-        if should_sample:
+        if trace_context.recording:
             # Create root span
             root_span = trace_context.create_span(operation_name, span_type)
             for key, value in tags.items():
@@ -553,7 +634,7 @@ class DistributedTracer:
         **tags
     ) -> Optional[Span]:
         """Create a child span in an existing trace."""
-        if not trace_context.sampling_decision:
+        if not trace_context.recording:
             return None
         
         span = trace_context.create_span(operation_name, span_type, parent_span_id)
@@ -564,41 +645,99 @@ class DistributedTracer:
         return span
     
     def finish_trace(self, trace_context: TraceContext):
-        """Finish a trace and export spans."""
-        if not trace_context.sampling_decision:
+        """Finish a trace, apply tail sampling and queue kept spans for export."""
+        if not trace_context.recording:
             return
         
         # Finish any remaining active spans
         for span_id in list(trace_context.active_spans.keys()):
             trace_context.finish_span(span_id)
         
-        # Export spans
-        all_spans = trace_context.get_all_spans()
-        for exporter in self.exporters:
-            try:
-                exporter(all_spans)
-            except Exception as e:
-                logger.error(f"Span export failed: {e}")
+        keep_reason = self.sampling_decision.should_keep(trace_context)
+        if keep_reason:
+            all_spans = trace_context.get_all_spans()
+            for span in all_spans:
+                if span.tags.get("is_root"):
+                    span.add_tag("sampling.reason", keep_reason)
+            # Never blocks: sinks run on the exporter thread
+            self.exporter.submit(all_spans)
         
         # Record custom metrics
         for metric_name, value in trace_context.custom_metrics.items():
             self._custom_metrics[metric_name] = value
     
     def add_exporter(self, exporter: Callable[[List[Span]], None]):
-        """Add a span exporter."""
-        self.exporters.append(exporter)
+        """Add a span exporter (sink); it receives batches on the exporter thread."""
+        self.exporter.add_sink(exporter)
+    
+    def record_node_overhead(self, seconds: float):
+        """Record time spent in tracing hooks for one node execution."""
+        with self._overhead_lock:
+            self._node_overhead[0] += 1
+            self._node_overhead[1] += seconds
+            self._node_overhead[2] = max(self._node_overhead[2], seconds)
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get tracer metrics."""
+        with self._overhead_lock:
+            count, total, peak = self._node_overhead
         return {
             "service_name": self.service_name,
             "sampling_strategy": self.sampling_decision.strategy.value,
             "total_traces": self.sampling_decision._total_count,
             "error_traces": self.sampling_decision._error_count,
+            "sampling": self.sampling_decision.stats(),
+            "export": self.exporter.stats(),
+            "node_overhead_us": {
+                "count": count,
+                "avg": round(total / count * 1e6, 2) if count else 0.0,
+                "max": round(peak * 1e6, 2),
+            },
             "custom_metrics": self._custom_metrics
         }
 
 
+def langsmith_span_exporter(spans: List[Span]):
+    """Export spans to LangSmith."""
+    if not LANGCHAIN_TRACING_V2:
+        return
+    
+    try:
+        # Convert spans to LangSmith format and send
+        logger.info(f"📤 Exporting {len(spans)} spans to LangSmith")
+        # Implementation would depend on LangSmith SDK
+    except Exception as e:
+        logger.error(f"Failed to export spans to LangSmith: {e}")
+
+
+_distributed_tracer: Optional[DistributedTracer] = None
+_distributed_tracer_lock = threading.Lock()
+
+
+def get_distributed_tracer() -> DistributedTracer:
+    """Get the process-wide distributed tracer (sampler and batch exporter)."""
+    global _distributed_tracer
+    if _distributed_tracer is None:
+        with _distributed_tracer_lock:
+            if _distributed_tracer is None:
+                try:
+                    strategy = SamplingStrategy(TRACE_SAMPLING_STRATEGY.lower())
+                except ValueError:
+                    logger.warning(f"Unknown TRACE_SAMPLING_STRATEGY '{TRACE_SAMPLING_STRATEGY}', sampling every trace")
+                    strategy = SamplingStrategy.ALWAYS
+                tracer = DistributedTracer(
+                    sampling_strategy=strategy,
+                    exporter=get_span_exporter(),
+                    tail_sampling=TRACE_TAIL_SAMPLING,
+                    probability=TRACE_HEAD_SAMPLE_RATE,
+                    base_rate=TRACE_HEAD_SAMPLE_RATE
+                )
+                if LANGCHAIN_TRACING_V2:
+                    tracer.add_exporter(langsmith_span_exporter)
+                _distributed_tracer = tracer
+    return _distributed_tracer
+
+
 # Context managers for distributed tracing
 @contextmanager
 def trace_operation(
@@ -697,7 +836,7 @@ class WorkflowTracer:
                  session_id: Optional[str] = None, 
                  user_id: Optional[str] = None,
                  distributed_tracer: Optional[DistributedTracer] = None,
-                 sampling_strategy: SamplingStrategy = SamplingStrategy.ALWAYS):
+                 sampling_strategy: Optional[SamplingStrategy] = None):
         self.session_id = session_id
         self.user_id = user_id
         self.workflow_start_time: Optional[float] = None
@@ -706,13 +845,17 @@ class WorkflowTracer:
         self.memory_operations: List[Dict[str, Any]] = []
         self.performance_monitor = get_performance_monitor()
         
-        # Distributed tracing integration
-        self.distributed_tracer = distributed_tracer or DistributedTracer(
-            sampling_strategy=sampling_strategy
-        )
+        # Distributed tracing integration; the process-wide tracer owns sampling and export
+        if distributed_tracer is None:
+            distributed_tracer = (
+                DistributedTracer(sampling_strategy=sampling_strategy)
+                if sampling_strategy is not None else get_distributed_tracer()
+            )
+        self.distributed_tracer = distributed_tracer
         self.trace_context: Optional[TraceContext] = None
         self.workflow_span: Optional[Span] = None
         self.node_spans: Dict[str, Span] = {}  # node_id -> span
+        self.node_hook_time: Dict[str, float] = {}  # node_id -> seconds spent in start_node_execution
         
         # Error tracking
         self.error_history: List[Dict[str, Any]] = []
@@ -721,11 +864,6 @@ class WorkflowTracer:
         # Custom metrics
         self.business_metrics: Dict[str, float] = {}
         
-        # Add default exporters
-        self.distributed_tracer.add_exporter(self._log_exporter)
-        if LANGCHAIN_TRACING_V2:
-            self.distributed_tracer.add_exporter(self._langsmith_exporter)
-        
     def start_workflow(self, 
                       workflow_id: Optional[str] = None, 
                       flow_data: Optional[Dict[str, Any]] = None,
@@ -786,8 +924,11 @@ class WorkflowTracer:
                             inputs: Dict[str, Any],
                             parent_span_id: Optional[str] = None):
         """Start tracking a node execution with enhanced distributed tracing."""
+        hook_started = time.perf_counter()
+        
         # Create distributed trace span for node execution
-        if self.trace_context:
+        if self.trace_context and self.trace_context.recording:
+            input_size = sum(len(str(v)) for v in inputs.values()) if inputs else 0
             node_span = self.distributed_tracer.create_child_span(
                 self.trace_context,
                 operation_name=f"node_{node_id}",
@@ -796,7 +937,7 @@ class WorkflowTracer:
                 node_id=node_id,
                 node_type=node_type,
                 input_keys=list(inputs.keys()),
-                input_size=sum(len(str(v)) for v in inputs.values()) if inputs else 0
+                input_size=input_size
             )
             
             if node_span:
@@ -805,7 +946,7 @@ class WorkflowTracer:
                 # Add detailed input analysis
                 if inputs:
                     node_span.add_tag("inputs.count", len(inputs))
-                    node_span.add_tag("inputs.total_size", sum(len(str(v)) for v in inputs.values()))
+                    node_span.add_tag("inputs.total_size", input_size)
                     
                     # Track specific input types
                     for key, value in inputs.items():
@@ -837,6 +978,8 @@ class WorkflowTracer:
                 self.node_spans[node_id].add_tag("agent.reasoning", True)
                 self.node_spans[node_id].add_log("info", "Agent reasoning started", 
                                                 inputs=list(inputs.keys()))
+        
+        self.node_hook_time[node_id] = time.perf_counter() - hook_started
     
     def end_node_execution(self, 
                           node_id: str, 
@@ -846,6 +989,8 @@ class WorkflowTracer:
                           error_message: Optional[str] = None,
                           exception: Optional[Exception] = None):
         """End tracking a node execution with enhanced error tracking and distributed tracing."""
+        hook_started = time.perf_counter()
+        
         # Finish distributed trace span
         if node_id in self.node_spans and self.trace_context:
             node_span = self.node_spans[node_id]
@@ -932,6 +1077,10 @@ class WorkflowTracer:
                                                     duration=duration, outputs=list(outputs.keys()))
             
             logger.info(f"⏱️ Node {node_id} executed in {duration:.2f}s")
+        
+        self.distributed_tracer.record_node_overhead(
+            self.node_hook_time.pop(node_id, 0.0) + time.perf_counter() - hook_started
+        )
     
     def track_memory_operation(self, 
                               operation: str, 
@@ -1164,27 +1313,6 @@ class WorkflowTracer:
         
         return base_score + connection_penalty + density_penalty
     
-    def _log_exporter(self, spans: List[Span]):
-        """Export spans to logs."""
-        if not ENABLE_WORKFLOW_TRACING:
-            return
-        
-        logger.info(f"📤 Exporting {len(spans)} spans to logs")
-        for span in spans:
-            logger.debug(f"📋 Span: {span.operation_name} ({span.span_type.value}) - {span.status} - {span.duration_ms}ms")
-    
-    def _langsmith_exporter(self, spans: List[Span]):
-        """Export spans to LangSmith."""
-        if not LANGCHAIN_TRACING_V2:
-            return
-        
-        try:
-            # Convert spans to LangSmith format and send
-            logger.info(f"📤 Exporting {len(spans)} spans to LangSmith")
-            # Implementation would depend on LangSmith SDK
-        except Exception as e:
-            logger.error(f"Failed to export spans to LangSmith: {e}")
-    
     def get_callback_manager(self) -> Optional[CallbackManager]:
         """Get callback manager for LangSmith integration with enhanced correlation."""
         if LANGCHAIN_TRACING_V2:
@@ -1367,7 +1495,7 @@ def trace_memory_operation(operation: str):
 
 
 def get_workflow_tracer(session_id: Optional[str] = None, user_id: Optional[str] = None) -> WorkflowTracer:
-    """Get an enhanced workflow tracer instance."""
+    """Get a workflow tracer for one execution; sampling and export are shared process-wide."""
     return WorkflowTracer(session_id=session_id, user_id=user_id)
 
 
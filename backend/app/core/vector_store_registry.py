@@ -0,0 +1,264 @@
+"""
+Vector Store Engine Registry
+============================
+
+Process-wide cache of SQLAlchemy engines and PGVector collection lookups used by
+the retriever and vector store nodes.
+
+Building ``PGVector(connection=<dsn>)`` directly creates a fresh engine and
+connection pool per execution and runs ``CREATE EXTENSION``, ``create_all`` and
+a collection get-or-create before the first query. This registry instead:
+
+• keeps one bounded pool per DSN, shared by every execution that targets it
+• disposes engines that have been idle longer than ``VECTOR_STORE_ENGINE_IDLE_TTL``
+  and caps the number of live engines at ``VECTOR_STORE_MAX_ENGINES`` (LRU)
+• remembers the collection row per (DSN, collection, embedding model) so warm
+  stores skip the DDL and the per-query ``langchain_pg_collection`` lookup
+
+Usage:
+    from app.core.vector_store_registry import get_vector_store_registry
+
+    registry = get_vector_store_registry()
+    vectorstore = registry.get_vectorstore(dsn, "docs", embedder)
+    with registry.raw_connection(dsn) as conn:
+        ...
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from langchain_postgres import PGVector
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.constants import (
+    VECTOR_STORE_COLLECTION_CACHE_TTL,
+    VECTOR_STORE_ENGINE_IDLE_TTL,
+    VECTOR_STORE_MAX_ENGINES,
+    VECTOR_STORE_MAX_OVERFLOW,
+    VECTOR_STORE_POOL_RECYCLE,
+    VECTOR_STORE_POOL_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+CollectionKey = Tuple[str, str, str]
+
+
+def embedding_model_key(embeddings: Any) -> str:
+    """Identify an embeddings provider by class and model name (not by instance)."""
+    model = getattr(embeddings, "model", None) or getattr(embeddings, "model_name", None) or ""
+    cls = type(embeddings)
+    return f"{cls.__module__}.{cls.__qualname__}:{model}"
+
+
+@dataclass
+class _EngineEntry:
+    engine: Engine
+    last_used: float
+
+
+@dataclass
+class _CachedCollection:
+    uuid: uuid.UUID
+    cmetadata: Any
+    cached_at: float
+
+
+class PooledPGVector(PGVector):
+    """
+    PGVector bound to a registry-managed engine.
+
+    Once the collection row is cached, construction skips extension/table/collection
+    DDL and ``get_collection`` reattaches the cached row instead of querying for it.
+    """
+
+    def __init__(self, *args: Any, registry: "VectorStoreEngineRegistry", registry_key: CollectionKey, **kwargs: Any):
+        self._registry = registry
+        self._registry_key = registry_key
+        super().__init__(*args, **kwargs)
+
+    def _is_warm(self) -> bool:
+        return not self.pre_delete_collection and self._registry.get_cached_collection(self._registry_key) is not None
+
+    def create_vector_extension(self) -> None:
+        if not self._is_warm():
+            super().create_vector_extension()
+
+    def create_tables_if_not_exists(self) -> None:
+        if not self._is_warm():
+            super().create_tables_if_not_exists()
+
+    def create_collection(self) -> None:
+        if self.pre_delete_collection:
+            self.delete_collection()
+        elif self._is_warm():
+            return
+
+        with self._make_sync_session() as session:
+            collection, _ = self.CollectionStore.get_or_create(
+                session, self.collection_name, cmetadata=self.collection_metadata
+            )
+            # Read before commit; committed instances are expired
+            collection_id, cmetadata = collection.uuid, collection.cmetadata
+            session.commit()
+        self._registry.cache_collection(self._registry_key, collection_id, cmetadata)
+
+    def get_collection(self, session: Session) -> Any:
+        cached = self._registry.get_cached_collection(self._registry_key)
+        if cached is None:
+            collection = super().get_collection(session)
+            if collection is not None:
+                self._registry.cache_collection(self._registry_key, collection.uuid, collection.cmetadata)
+            return collection
+
+        collection = self.CollectionStore(uuid=cached.uuid, name=self.collection_name, cmetadata=cached.cmetadata)
+        make_transient_to_detached(collection)
+        return session.merge(collection, load=False)
+
+    def delete_collection(self) -> None:
+        self._registry.forget_collection(self._registry_key)
+        super().delete_collection()
+
+
+class VectorStoreEngineRegistry:
+    """Thread-safe registry of per-DSN engines and cached collection rows."""
+
+    def __init__(
+        self,
+        pool_size: int = VECTOR_STORE_POOL_SIZE,
+        max_overflow: int = VECTOR_STORE_MAX_OVERFLOW,
+        pool_recycle: int = VECTOR_STORE_POOL_RECYCLE,
+        idle_ttl: int = VECTOR_STORE_ENGINE_IDLE_TTL,
+        max_engines: int = VECTOR_STORE_MAX_ENGINES,
+        collection_ttl: int = VECTOR_STORE_COLLECTION_CACHE_TTL,
+    ):
+        self.engine_args: Dict[str, Any] = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": True,
+        }
+        self.idle_ttl = idle_ttl
+        self.max_engines = max(1, max_engines)
+        self.collection_ttl = collection_ttl
+        self._engines: "OrderedDict[str, _EngineEntry]" = OrderedDict()
+        self._collections: Dict[CollectionKey, _CachedCollection] = {}
+        self._lock = threading.Lock()
+
+    def get_engine(self, dsn: str) -> Engine:
+        """Return the shared engine for ``dsn``, creating it on first use."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle_locked(now)
+            entry = self._engines.get(dsn)
+            if entry is None:
+                entry = _EngineEntry(engine=create_engine(dsn, **self.engine_args), last_used=now)
+                self._engines[dsn] = entry
+                logger.info(f"Created pooled vector store engine ({len(self._engines)} active)")
+                while len(self._engines) > self.max_engines:
+                    evicted_dsn, evicted = self._engines.popitem(last=False)
+                    self._drop_engine_locked(evicted_dsn, evicted)
+            else:
+                entry.last_used = now
+                self._engines.move_to_end(dsn)
+            return entry.engine
+
+    def get_vectorstore(self, dsn: str, collection_name: str, embeddings: Any, **kwargs: Any) -> PooledPGVector:
+        """Build a PGVector for ``collection_name`` on the shared engine for ``dsn``."""
+        key: CollectionKey = (dsn, collection_name, embedding_model_key(embeddings))
+        return PooledPGVector(
+            connection=self.get_engine(dsn),
+            collection_name=collection_name,
+            embeddings=embeddings,
+            registry=self,
+            registry_key=key,
+            **kwargs,
+        )
+
+    @contextmanager
+    def raw_connection(self, dsn: str) -> Iterator[Any]:
+        """Borrow a pooled DBAPI connection; commits on success, rolls back on error."""
+        conn = self.get_engine(dsn).raw_connection()
+        try:
+            yield conn.driver_connection
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def get_cached_collection(self, key: CollectionKey) -> Optional[_CachedCollection]:
+        with self._lock:
+            cached = self._collections.get(key)
+            if cached is not None and time.monotonic() - cached.cached_at > self.collection_ttl:
+                del self._collections[key]
+                return None
+            return cached
+
+    def cache_collection(self, key: CollectionKey, collection_id: uuid.UUID, cmetadata: Any) -> None:
+        with self._lock:
+            self._collections[key] = _CachedCollection(collection_id, cmetadata, time.monotonic())
+
+    def forget_collection(self, key: CollectionKey) -> None:
+        with self._lock:
+            # A collection row is shared by every embedding model using that name
+            for cached_key in [k for k in self._collections if k[:2] == key[:2]]:
+                del self._collections[cached_key]
+
+    def evict_idle(self) -> int:
+        """Dispose engines idle for longer than ``idle_ttl``. Returns the number evicted."""
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def dispose_all(self) -> None:
+        """Dispose every engine and clear the collection cache (e.g. on shutdown)."""
+        with self._lock:
+            while self._engines:
+                dsn, entry = self._engines.popitem()
+                self._drop_engine_locked(dsn, entry)
+            self._collections.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "engines": len(self._engines),
+                "cached_collections": len(self._collections),
+                "pools": [entry.engine.pool.status() for entry in self._engines.values()],
+            }
+
+    def _evict_idle_locked(self, now: float) -> int:
+        idle = [dsn for dsn, entry in self._engines.items() if now - entry.last_used > self.idle_ttl]
+        for dsn in idle:
+            self._drop_engine_locked(dsn, self._engines.pop(dsn))
+        return len(idle)
+
+    def _drop_engine_locked(self, dsn: str, entry: _EngineEntry) -> None:
+        # dispose() only closes checked-in connections; stores still holding the
+        # engine keep working and will reconnect lazily.
+        entry.engine.dispose()
+        for key in [k for k in self._collections if k[0] == dsn]:
+            del self._collections[key]
+        logger.info("Disposed pooled vector store engine")
+
+
+_registry: Optional[VectorStoreEngineRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_vector_store_registry() -> VectorStoreEngineRegistry:
+    """Get the process-wide vector store engine registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = VectorStoreEngineRegistry()
+    return _registry
@@ -0,0 +1,459 @@
+"""
+Webhook Event Bus
+=================
+
+Cross-replica fan-out for webhook trigger events, replacing the per-process
+``webhook_events`` / ``webhook_subscribers`` dicts of the webhook trigger node.
+
+Every replica keeps, per webhook ID:
+
+• a ring buffer of the last ``WEBHOOK_EVENT_BUFFER_SIZE`` events, used for
+  "latest event" lookups and for SSE replay after a reconnect
+• a bounded list of bounded subscriber queues (SSE streams, streaming runnables)
+
+Events are delivered to local subscribers immediately and relayed to the other
+replicas with Postgres ``NOTIFY`` on ``WEBHOOK_EVENT_CHANNEL``; each replica
+``LISTEN``s on a dedicated asyncpg connection and ignores its own notifications.
+A subscriber connected to any pod therefore sees events received by every pod,
+without sticky sessions.
+
+The relay never runs on the request path: ``publish`` puts the event on a
+bounded queue (``WEBHOOK_EVENT_RELAY_QUEUE_SIZE``; overflow is dropped and
+counted) that a background task drains in batches. Replicas announce which
+webhooks they have subscribers for, so transient events (execution progress)
+are only relayed when another replica is streaming that webhook; stored events
+are always relayed to keep every ring buffer complete.
+
+Each event carries an ``event_id``. Passing the last seen ID to ``subscribe``
+replays the buffered events that followed it (SSE ``Last-Event-ID``). If the ID
+has already been evicted from the ring, the whole buffer is replayed.
+
+NOTIFY payloads are limited to 8000 bytes. Larger events are relayed without
+their bulky fields (``data``, ``headers``, ``event``, ``webhook_payload``) and
+marked ``"truncated": true``; if that is still too large only the event ID,
+type and timestamps are sent. The publishing replica still delivers the full
+event to its own subscribers.
+
+Without a database (or before ``start()``), the bus works as a single-process
+pub/sub.
+
+Usage:
+    from app.core.webhook_event_bus import get_webhook_event_bus
+
+    bus = get_webhook_event_bus()
+    await bus.publish(webhook_id, event)
+    subscription = bus.subscribe(webhook_id, last_event_id=request.headers.get("last-event-id"))
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+
+import asyncpg
+
+from app.core.constants import (
+    WEBHOOK_EVENT_BUFFER_SIZE,
+    WEBHOOK_EVENT_CHANNEL,
+    WEBHOOK_EVENT_MAX_SUBSCRIBERS,
+    WEBHOOK_EVENT_MAX_WEBHOOKS,
+    WEBHOOK_EVENT_QUEUE_SIZE,
+    WEBHOOK_EVENT_RELAY_QUEUE_SIZE,
+)
+from app.core.database import build_asyncpg_dsn
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_MAX_BYTES = 7900
+BULKY_EVENT_FIELDS = ("data", "headers", "event", "webhook_payload")
+MINIMAL_EVENT_FIELDS = ("event_id", "type", "event_type", "webhook_id", "received_at", "timestamp")
+RECONNECT_DELAY_SECONDS = 5.0
+INTEREST_REFRESH_SECONDS = 30.0     # Replicas re-announce their subscribed webhooks this often
+RELAY_BATCH_SIZE = 100              # Notifications sent per round-trip by the relay task
+ALL_WEBHOOKS = "*"
+
+# Queued relay item: an encoded control message, or (webhook_id, event, store)
+RelayItem = Union[str, Tuple[str, Dict[str, Any], bool]]
+
+
+@dataclass
+class Subscription:
+    """A subscriber queue plus the buffered events to send before live ones."""
+
+    webhook_id: str
+    queue: asyncio.Queue
+    backlog: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _Channel:
+    __slots__ = ("events", "subscribers")
+
+    def __init__(self, buffer_size: int):
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.subscribers: List[asyncio.Queue] = []
+
+
+class WebhookEventBus:
+    """Bounded per-webhook event buffers with local and LISTEN/NOTIFY fan-out."""
+
+    def __init__(
+        self,
+        buffer_size: int = WEBHOOK_EVENT_BUFFER_SIZE,
+        max_webhooks: int = WEBHOOK_EVENT_MAX_WEBHOOKS,
+        max_subscribers: int = WEBHOOK_EVENT_MAX_SUBSCRIBERS,
+        queue_size: int = WEBHOOK_EVENT_QUEUE_SIZE,
+        channel: str = WEBHOOK_EVENT_CHANNEL,
+        relay_queue_size: int = WEBHOOK_EVENT_RELAY_QUEUE_SIZE,
+    ):
+        self.buffer_size = max(1, buffer_size)
+        self.max_webhooks = max(1, max_webhooks)
+        self.max_subscribers = max(1, max_subscribers)
+        self.queue_size = queue_size
+        self.channel = channel
+        self.origin = uuid.uuid4().hex[:12]
+        self._seq = itertools.count(1)
+        self._channels: "OrderedDict[str, _Channel]" = OrderedDict()
+        self.relay_queue_size = max(1, relay_queue_size)
+        self._conn: Optional[asyncpg.Connection] = None
+        self._relay_queue: Optional[asyncio.Queue] = None
+        self._relay_task: Optional[asyncio.Task] = None
+        self._supervisor: Optional[asyncio.Task] = None
+        # origin -> (webhook IDs with subscribers there, or ALL_WEBHOOKS; expiry)
+        self._remote_interest: Dict[str, Tuple[Union[Set[str], str], float]] = {}
+        self.published = 0
+        self.relayed_in = 0
+        self.relayed_out = 0
+        self.relay_skipped = 0
+        self.relay_dropped = 0
+        self.relay_failures = 0
+
+    # ------------------------------------------------------------------
+    # Buffers
+    # ------------------------------------------------------------------
+    def _channel(self, webhook_id: str, create: bool = True) -> Optional[_Channel]:
+        channel = self._channels.get(webhook_id)
+        if channel is not None:
+            self._channels.move_to_end(webhook_id)
+            return channel
+        if not create:
+            return None
+        channel = self._channels[webhook_id] = _Channel(self.buffer_size)
+        if len(self._channels) > self.max_webhooks:
+            # Evict the least recently used webhook that nobody is streaming
+            for candidate, existing in self._channels.items():
+                if not existing.subscribers and candidate != webhook_id:
+                    del self._channels[candidate]
+                    break
+        return channel
+
+    def ensure(self, webhook_id: str) -> None:
+        self._channel(webhook_id)
+
+    def is_known(self, webhook_id: str) -> bool:
+        return webhook_id in self._channels
+
+    def webhook_ids(self) -> List[str]:
+        return list(self._channels)
+
+    def history(self, webhook_id: str) -> List[Dict[str, Any]]:
+        channel = self._channel(webhook_id, create=False)
+        return list(channel.events) if channel else []
+
+    def latest(self, webhook_id: str) -> Optional[Dict[str, Any]]:
+        channel = self._channel(webhook_id, create=False)
+        return channel.events[-1] if channel and channel.events else None
+
+    def replay(self, webhook_id: str, last_event_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Buffered events after ``last_event_id``; all of them if the ID is unknown."""
+        events = self.history(webhook_id)
+        if not last_event_id:
+            return []
+        for index in range(len(events) - 1, -1, -1):
+            if events[index].get("event_id") == last_event_id:
+                return events[index + 1:]
+        return events
+
+    def subscriber_count(self, webhook_id: str) -> int:
+        channel = self._channel(webhook_id, create=False)
+        return len(channel.subscribers) if channel else 0
+
+    def clear(self, webhook_id: str) -> None:
+        """Drop the buffered events and subscribers of one webhook."""
+        channel = self._channels.pop(webhook_id, None)
+        if channel is not None and channel.subscribers:
+            self._announce_interest()
+
+    def prune(self, max_age: timedelta) -> int:
+        """Drop buffered events older than ``max_age``. Returns the number removed."""
+        cutoff = datetime.now(timezone.utc) - max_age
+        removed = 0
+        for channel in self._channels.values():
+            while channel.events and _received_at(channel.events[0]) < cutoff:
+                channel.events.popleft()
+                removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Publish / subscribe
+    # ------------------------------------------------------------------
+    def subscribe(self, webhook_id: str, last_event_id: Optional[str] = None) -> Subscription:
+        channel = self._channel(webhook_id)
+        if len(channel.subscribers) >= self.max_subscribers:
+            oldest = channel.subscribers.pop(0)
+            _send_disconnect(oldest, "Maximum subscribers reached, disconnecting")
+            logger.warning(f"Maximum subscriber limit reached for webhook {webhook_id}, removed oldest subscriber")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        channel.subscribers.append(queue)
+        if len(channel.subscribers) == 1:
+            self._announce_interest()
+        return Subscription(webhook_id, queue, self.replay(webhook_id, last_event_id))
+
+    def unsubscribe(self, webhook_id: str, queue: asyncio.Queue) -> None:
+        channel = self._channel(webhook_id, create=False)
+        if channel and queue in channel.subscribers:
+            channel.subscribers.remove(queue)
+            if not channel.subscribers:
+                self._announce_interest()
+
+    async def publish(self, webhook_id: str, event: Dict[str, Any], store: bool = True) -> Dict[str, Any]:
+        """
+        Deliver ``event`` to local subscribers and relay it to other replicas.
+
+        ``store`` events are kept in the ring buffer; transient ones (e.g. UI
+        execution progress) are only streamed. Returns the event with its ``event_id``.
+        """
+        event = {**event, "event_id": f"{self.origin}-{next(self._seq)}"}
+        self.published += 1
+        self._deliver(webhook_id, event, store)
+        if self._relay_queue is not None:
+            if store or self._has_remote_interest(webhook_id):
+                self._enqueue((webhook_id, event, store))
+            else:
+                self.relay_skipped += 1
+        return event
+
+    def _deliver(self, webhook_id: str, event: Dict[str, Any], store: bool) -> None:
+        channel = self._channel(webhook_id)
+        if store:
+            channel.events.append(event)
+        for queue in list(channel.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning(f"Queue full for webhook {webhook_id}, removing subscriber")
+                channel.subscribers.remove(queue)
+                _send_disconnect(queue, "Queue full, disconnecting")
+                if not channel.subscribers:
+                    self._announce_interest()
+
+    # ------------------------------------------------------------------
+    # Cross-replica relay
+    # ------------------------------------------------------------------
+    def _local_interest(self) -> List[str]:
+        return [webhook_id for webhook_id, channel in self._channels.items() if channel.subscribers]
+
+    def _has_remote_interest(self, webhook_id: str) -> bool:
+        now = time.monotonic()
+        for origin, (webhook_ids, expires_at) in list(self._remote_interest.items()):
+            if expires_at < now:
+                del self._remote_interest[origin]
+            elif webhook_ids == ALL_WEBHOOKS or webhook_id in webhook_ids:
+                return True
+        return False
+
+    def _announce_interest(self, query: bool = False) -> None:
+        """Tell the other replicas which webhooks this one streams (``query`` asks them to answer)."""
+        if self._relay_queue is None:
+            return
+        message = {"o": self.origin, "i": sorted(self._local_interest())}
+        if query:
+            message["q"] = True
+        payload = json.dumps(message)
+        if len(payload.encode("utf-8")) > NOTIFY_MAX_BYTES:
+            payload = json.dumps({**message, "i": ALL_WEBHOOKS})
+        self._enqueue(payload)
+
+    def _enqueue(self, item: RelayItem) -> None:
+        try:
+            self._relay_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.relay_dropped += 1
+
+    async def _drain_relay(self) -> None:
+        """Send queued notifications in batches; the only user of the connection besides LISTEN."""
+        queue = self._relay_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < RELAY_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                conn = self._conn
+                if conn is None or conn.is_closed():
+                    self.relay_failures += len(batch)
+                    continue
+                payloads = [item if isinstance(item, str) else _encode_notification(self.origin, *item) for item in batch]
+                await conn.executemany("SELECT pg_notify($1, $2)", [(self.channel, payload) for payload in payloads])
+                self.relayed_out += len(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.relay_failures += len(batch)
+                logger.warning(f"Failed to relay {len(batch)} webhook event notifications: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def drain(self) -> None:
+        """Wait until every queued notification has been sent (or failed)."""
+        if self._relay_queue is not None and self._relay_task is not None:
+            await self._relay_queue.join()
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed webhook event notification")
+            return
+        origin = message.get("o")
+        if origin == self.origin:
+            return
+        if "i" in message:
+            interest = message["i"]
+            webhook_ids = ALL_WEBHOOKS if interest == ALL_WEBHOOKS else set(interest)
+            expires_at = time.monotonic() + 3 * INTEREST_REFRESH_SECONDS
+            self._remote_interest[origin] = (webhook_ids, expires_at)
+            if message.get("q"):
+                self._announce_interest()
+            return
+        self.relayed_in += 1
+        self._deliver(message["w"], message["e"], bool(message.get("s", True)))
+
+    async def _connect(self, dsn: str) -> asyncpg.Connection:
+        conn = await asyncpg.connect(dsn)
+        await conn.add_listener(self.channel, self._on_notification)
+        return conn
+
+    async def _supervise(self, dsn: str) -> None:
+        last_announced = 0.0
+        while True:
+            try:
+                now = time.monotonic()
+                if self._conn is None or self._conn.is_closed():
+                    self._conn = await self._connect(dsn)
+                    logger.info(f"Webhook event bus listening on '{self.channel}'")
+                    self._announce_interest(query=True)
+                    last_announced = now
+                elif now - last_announced >= INTEREST_REFRESH_SECONDS:
+                    self._announce_interest()
+                    last_announced = now
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Webhook event bus connection failed, retrying: {e}")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _start_relay(self) -> None:
+        self._relay_queue = asyncio.Queue(maxsize=self.relay_queue_size)
+        self._relay_task = asyncio.get_running_loop().create_task(self._drain_relay())
+
+    async def start(self, dsn: Optional[str] = None) -> None:
+        """Start relaying through Postgres; a no-op without a configured database."""
+        dsn = dsn or build_asyncpg_dsn()
+        if not dsn or self._supervisor is not None:
+            return
+        self._start_relay()
+        self._supervisor = asyncio.get_running_loop().create_task(self._supervise(dsn))
+
+    async def stop(self) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+            self._supervisor = None
+        if self._relay_task is not None:
+            try:
+                await asyncio.wait_for(self.drain(), RECONNECT_DELAY_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("Webhook event bus stopped with notifications still queued")
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+            self._relay_queue = None
+        if self._conn is not None and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "webhooks": len(self._channels),
+            "buffered_events": sum(len(c.events) for c in self._channels.values()),
+            "subscribers": sum(len(c.subscribers) for c in self._channels.values()),
+            "published": self.published,
+            "relayed_in": self.relayed_in,
+            "relayed_out": self.relayed_out,
+            "relay_queue": self._relay_queue.qsize() if self._relay_queue is not None else 0,
+            "relay_skipped": self.relay_skipped,
+            "relay_dropped": self.relay_dropped,
+            "relay_failures": self.relay_failures,
+            "remote_replicas": len(self._remote_interest),
+            "listening": self._conn is not None and not self._conn.is_closed(),
+        }
+
+
+def _received_at(event: Dict[str, Any]) -> datetime:
+    try:
+        return datetime.fromisoformat(str(event.get("received_at") or event.get("timestamp")).replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.now(timezone.utc)
+
+
+def _send_disconnect(queue: asyncio.Queue, reason: str) -> None:
+    message = {"type": "error", "error": reason, "timestamp": datetime.now(timezone.utc).isoformat()}
+    try:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+    except (asyncio.QueueEmpty, asyncio.QueueFull):
+        pass
+
+
+def _encode_notification(origin: str, webhook_id: str, event: Dict[str, Any], store: bool) -> str:
+    message = {"o": origin, "w": webhook_id, "s": store, "e": event}
+    payload = json.dumps(message, default=str)
+    if len(payload.encode("utf-8")) <= NOTIFY_MAX_BYTES:
+        return payload
+    slim = {k: v for k, v in event.items() if k not in BULKY_EVENT_FIELDS}
+    slim["truncated"] = True
+    payload = json.dumps({**message, "e": slim}, default=str)
+    if len(payload.encode("utf-8")) <= NOTIFY_MAX_BYTES:
+        return payload
+    minimal = {k: str(event[k])[:256] for k in MINIMAL_EVENT_FIELDS if k in event}
+    minimal["truncated"] = True
+    return json.dumps({**message, "w": webhook_id[:256], "e": minimal}, default=str)
+
+
+_bus: Optional[WebhookEventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_webhook_event_bus() -> WebhookEventBus:
+    """Get the process-wide webhook event bus."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = WebhookEventBus()
+    return _bus
@@ -73,14 +73,15 @@ class WorkflowExecutionEnhancer:
         
         return context
     
-    def enhanced_build(self, flow_data: Dict[str, Any], user_context: Dict[str, Any] = None):
+    def enhanced_build(self, flow_data: Dict[str, Any], user_context: Dict[str, Any] = None,
+                       checkpointer=None):
         """
         Enhanced build with dynamic capabilities.
         Returns: (DynamicWorkflowContext, CompiledGraph, DynamicWorkflowEngine)
         """
         
         # Create a FRESH engine for this request
-        engine = DynamicWorkflowEngine()
+        engine = DynamicWorkflowEngine(checkpointer)
         
         # Create context locally
         session_id = user_context.get('session_id') if user_context else f"build_{id(flow_data)}"
@@ -88,7 +89,10 @@ class WorkflowExecutionEnhancer:
             session_id=session_id,
             user_id=user_context.get('user_id') if user_context else None,
             owner_id=user_context.get('owner_id') if user_context else None,
-            workflow_id=user_context.get('workflow_id') if user_context else None
+            workflow_id=user_context.get('workflow_id') if user_context else None,
+            runtime_config={
+                key: user_context[key] for key in ("execution_id", "resume") if key in user_context
+            } if user_context else {}
         )
         
         try:
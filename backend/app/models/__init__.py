@@ -17,6 +17,9 @@ from .vector_collection import VectorCollection
 from .vector_document import VectorDocument
 from .document import DocumentCollection, Document, DocumentChunk, DocumentAccessLog, DocumentVersion
 from .external_workflow import ExternalWorkflow
+from .llm_cache import LLMCacheEntry
+from .document_signature import DocumentSignature
+from .trace_span import TraceSpan
 
 __all__ = [
     "Base",
@@ -48,6 +51,9 @@ __all__ = [
     "DocumentChunk",
     "DocumentAccessLog",
     "DocumentVersion",
-    "ExternalWorkflow"
+    "ExternalWorkflow",
+    "LLMCacheEntry",
+    "DocumentSignature",
+    "TraceSpan"
 ]
 
@@ -1,9 +1,9 @@
 
 
-from sqlalchemy import Column, String, UUID, Text, Boolean, Integer, TIMESTAMP, ForeignKey, Index, Float, text
+from sqlalchemy import Column, String, UUID, Text, Boolean, Integer, TIMESTAMP, ForeignKey, Index, Float, Computed, text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB, ARRAY
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY, TSVECTOR
 import uuid
 from datetime import datetime
 from .base import Base
@@ -78,6 +78,17 @@ class Document(Base):
     tags = Column(ARRAY(String), default=[], index=True)
     is_public = Column(Boolean, default=False, index=True)
     
+    # Full-text search vector, maintained by PostgreSQL (title weighted above content).
+    # Deferred so regular document loads don't pull the tsvector over the wire.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+    
     # Version control and lifecycle
     version = Column(Integer, default=1)
     is_archived = Column(Boolean, default=False, index=True)
@@ -105,8 +116,7 @@ class Document(Base):
         Index('idx_documents_collection_format', 'collection_id', 'document_format'),
         
         # Full-text search optimization
-        Index('idx_documents_content_fts', text("to_tsvector('english', content)"), postgresql_using='gin'),
-        Index('idx_documents_title_fts', text("to_tsvector('english', title)"), postgresql_using='gin'),
+        Index('idx_documents_search_vector_gin', 'search_vector', postgresql_using='gin'),
         
         # Metadata and tag search
         Index('idx_documents_metadata_gin', 'doc_metadata', postgresql_using='gin'),
@@ -118,6 +128,7 @@ class Document(Base):
         
         # Deduplication and content analysis
         Index('idx_documents_content_hash', 'content_hash'),
+        Index('uq_documents_user_content_hash', 'user_id', 'content_hash', unique=True),
         Index('idx_documents_source_url', 'source_url'),
         
         # Public and archived document access
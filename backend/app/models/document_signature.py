@@ -0,0 +1,23 @@
+from sqlalchemy import Column, ForeignKey, String, Integer, LargeBinary, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.models.base import Base
+
+
+class DocumentSignature(Base):
+    __tablename__ = "document_signatures"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)  # Owner; collections are per user
+    collection = Column(String(255), nullable=False)  # Dedup scope set on the Document Loader node
+    source_key = Column(String(1024), nullable=False)  # Document source (file ID, URL or path)
+    num_perm = Column(Integer, nullable=False)  # Signature parameters; only matching signatures are compared
+    shingle_size = Column(Integer, nullable=False)
+    signature = Column(LargeBinary, nullable=False)  # MinHash signature, num_perm little-endian uint32 values
+    created_at = Column(TIMESTAMP(timezone=True), default=func.now())
+    
+    __table_args__ = (
+        Index('idx_document_signatures_user_collection', 'user_id', 'collection'),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index
+from sqlalchemy.sql import func
+from app.models.base import Base
+
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache_entries"
+    
+    cache_key = Column(String(64), primary_key=True)  # SHA-256 of namespace + normalized prompt + model params
+    namespace = Column(String(255), nullable=False)  # Workflow ID (or "global")
+    value = Column(Text, nullable=False)  # LangChain-serialized generations
+    created_at = Column(TIMESTAMP(timezone=True), default=func.now())
+    expires_at = Column(TIMESTAMP(timezone=True))
+    
+    __table_args__ = (
+        Index('idx_llm_cache_entries_namespace', 'namespace'),
+        Index('idx_llm_cache_entries_expires_at', 'expires_at'),
+    )
@@ -1,8 +1,8 @@
 """Memory database models for KAI Fusion."""
 
-from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey, Index
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey, Index, Computed
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from datetime import datetime
 import uuid
 
@@ -25,6 +25,17 @@ class Memory(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # Lexical search index, maintained by PostgreSQL on every insert/update (content weighted above context).
+    # Deferred so regular memory loads don't pull the tsvector over the wire.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(content, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(context, '')), 'B')",
+            persisted=True,
+        ),
+    ))
+
     # Relationship to user (optional for session-based)
     user = relationship("User", back_populates="memories")
 
@@ -36,6 +47,7 @@ class Memory(Base):
         Index("idx_memories_session_source", "session_id", "source_type"),
         Index("idx_memories_chatflow_id", "chatflow_id"),
         Index("idx_memories_session_chatflow", "session_id", "chatflow_id"),
+        Index("idx_memories_search_vector_gin", "search_vector", postgresql_using="gin"),
     )
 
     def __repr__(self):
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Text, Float, TIMESTAMP, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from app.models.base import Base
+
+
+class TraceSpan(Base):
+    __tablename__ = "trace_spans"
+    
+    span_id = Column(String(36), primary_key=True)
+    trace_id = Column(String(36), nullable=False)
+    parent_span_id = Column(String(36))
+    correlation_id = Column(String(255))
+    operation_name = Column(String(255), nullable=False)
+    span_type = Column(String(32), nullable=False)  # SpanType value (workflow, node, memory_operation, ...)
+    status = Column(String(16), nullable=False, default="ok")
+    start_time = Column(TIMESTAMP(timezone=True), nullable=False)
+    end_time = Column(TIMESTAMP(timezone=True))
+    duration_ms = Column(Float)
+    tags = Column(JSONB)
+    logs = Column(JSONB)
+    error_message = Column(Text)
+    
+    __table_args__ = (
+        Index('idx_trace_spans_trace_id', 'trace_id'),
+        Index('idx_trace_spans_start_time', 'start_time'),
+    )
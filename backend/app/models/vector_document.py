@@ -1,11 +1,31 @@
-from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, ForeignKey, Index, cast
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from pgvector.sqlalchemy import Vector
 from sqlalchemy.sql import func
 from app.models.base import Base
+from app.core.constants import VECTOR_INDEXED_DIMENSIONS
 import uuid
 
 
+def _embedding_hnsw_indexes(embedding_vector):
+    """
+    One partial HNSW index per indexed width. Nearest-neighbour queries use one
+    when they filter on ``vector_dims(embedding_vector) = <width>`` and order by
+    ``CAST(embedding_vector AS vector(<width>)) <=> :query``.
+    """
+    return tuple(
+        Index(
+            f'idx_vector_documents_embedding_hnsw_{dimension}',
+            cast(embedding_vector, Vector(dimension)).label(f'embedding_{dimension}'),
+            postgresql_using='hnsw',
+            postgresql_ops={f'embedding_{dimension}': 'vector_cosine_ops'},
+            postgresql_where=func.vector_dims(embedding_vector) == dimension,
+        )
+        for dimension in VECTOR_INDEXED_DIMENSIONS
+    )
+
+
 class VectorDocument(Base):
     __tablename__ = "vector_documents"
     
@@ -13,7 +33,8 @@ class VectorDocument(Base):
     collection_id = Column(UUID(as_uuid=True), ForeignKey('vector_collections.id', ondelete='CASCADE'), nullable=False)
     content = Column(Text, nullable=False)
     document_metadata = Column(JSONB, default={})
-    embedding = Column(String)  # Will store vector as string, can be converted to actual vector type
+    embedding = Column(String)  # Legacy text representation; new rows use embedding_vector
+    embedding_vector = Column(Vector())  # Native pgvector column (dimension enforced per collection)
     source_url = Column(Text)
     source_type = Column(String(50))
     chunk_index = Column(Integer)
@@ -24,4 +45,5 @@ class VectorDocument(Base):
     __table_args__ = (
         Index('idx_vector_documents_collection', 'collection_id'),
         Index('idx_vector_documents_metadata', 'document_metadata', postgresql_using='gin'),
+        *_embedding_hnsw_indexes(embedding_vector),
     ) 
\ No newline at end of file
@@ -284,7 +284,7 @@ IMPLEMENTATION DETAILS:
 ──────────────────────────────────────────────────────────────
 """
 
-from sqlalchemy import Column, String, UUID, Text, Boolean, Integer, TIMESTAMP, ForeignKey, Index
+from sqlalchemy import Column, String, UUID, Text, Boolean, Integer, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
@@ -319,8 +319,19 @@ class Workflow(Base):
         Index('idx_workflows_user_created', 'user_id', 'created_at'),
         Index('idx_workflows_public_created', 'is_public', 'created_at'),
         Index('idx_workflows_user_public', 'user_id', 'is_public'),
+        # Substring (ILIKE) search on name/description; requires the pg_trgm extension
+        Index('idx_workflows_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('idx_workflows_description_trgm', 'description', postgresql_using='gin',
+              postgresql_ops={'description': 'gin_trgm_ops'}),
     )
 
+# Keyset pagination of list views: (last activity, id) newest first. updated_at is
+# nullable, so rows never updated sort by created_at (see WorkflowService.ACTIVITY_AT)
+Index('idx_workflows_user_activity_id', Workflow.user_id,
+      func.coalesce(Workflow.updated_at, Workflow.created_at), Workflow.id)
+Index('idx_workflows_public_activity_id', func.coalesce(Workflow.updated_at, Workflow.created_at),
+      Workflow.id, postgresql_where=text('is_public'))
+
 class WorkflowTemplate(Base):
     __tablename__ = "workflow_templates"
     
@@ -4,48 +4,67 @@
 # Base Classes
 from .base import BaseNode, ProviderNode, ProcessorNode, TerminatorNode, NodeMetadata, NodeInput, NodeOutput, NodeType
 
-# LLM Nodes
-from .llms.openai_node import OpenAINode, OpenAIChatNode
+# Node classes are resolved lazily (PEP 562) so that importing ``app.nodes.base``
+# does not import every provider SDK; the registry imports node modules on first use.
+_LAZY_EXPORTS = {
+    # LLM Nodes
+    "OpenAINode": ".llms.openai_node",
+    "OpenAIChatNode": ".llms.openai_node",
+
+    # Agent Nodes
+    "ReactAgentNode": ".agents.react_agent",
+    "ToolAgentNode": ".agents.react_agent",
+
+    # Embedding Nodes
+    "OpenAIEmbeddingsProvider": ".embeddings.openai_embeddings_provider",
+
+    # Memory Nodes
+    "ConversationMemoryNode": ".memory.conversation_memory",
+    "BufferMemoryNode": ".memory.buffer_memory",
+
+    # Tool Nodes
+    "TavilySearchNode": ".tools.tavily_search",
+    "HttpClientNode": ".tools.http_client",
+    "CohereRerankerNode": ".tools.cohere_reranker",
+    "BM25RerankerNode": ".tools.bm25_reranker",
+    "RetrieverProvider": ".tools.retriever",
 
-# Agent Nodes
-from .agents.react_agent import ReactAgentNode, ToolAgentNode
+    # Document Loaders
+    "WebScraperNode": ".document_loaders.web_scraper",
 
-# Embedding Nodes
-from .embeddings.openai_embeddings_provider import OpenAIEmbeddingsProvider
+    # Splitters (moved from text_processing)
+    "ChunkSplitterNode": ".splitters.chunk_splitter",
 
-# Memory Nodes
-from .memory.conversation_memory import ConversationMemoryNode
-from .memory.buffer_memory import BufferMemoryNode
+    # Vector Stores
+    "VectorStoreOrchestrator": ".vector_stores.vector_store_orchestrator",
 
-# Tool Nodes
-from .tools.tavily_search import TavilySearchNode
-from .tools.http_client import HttpClientNode
-from .tools.cohere_reranker import CohereRerankerNode
-from .tools.retriever import RetrieverProvider
+    # Default Nodes
+    "StartNode": ".default.start_node",
+    "EndNode": ".default.end_node",
 
-# Document Loaders
-from .document_loaders.web_scraper import WebScraperNode
+    # Trigger Nodes
+    "WebhookTriggerNode": ".triggers.webhook_trigger",
+    "TimerStartNode": ".triggers.timer_start_node",
 
-# Splitters (moved from text_processing)
-from .splitters.chunk_splitter import ChunkSplitterNode
+    # Text Processing Nodes
+    "StringInputNode": ".text_processing.string_input_node",
 
-# Vector Stores
-from .vector_stores.vector_store_orchestrator import VectorStoreOrchestrator
+    # Processing Nodes
+    "CodeNode": ".processing.code_node",
+    "ConditionNode": ".processing.condition_node",
+}
 
-# Default Nodes
-from .default.start_node import StartNode
-from .default.end_node import EndNode
 
-# Trigger Nodes
-from .triggers.webhook_trigger import WebhookTriggerNode
-from .triggers.timer_start_node import TimerStartNode
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
 
-# Text Processing Nodes
-from .text_processing.string_input_node import StringInputNode
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
 
-# Processing Nodes
-from .processing.code_node import CodeNode
-from .processing.condition_node import ConditionNode
 
 # ================================================================
 # DEPRECATED: Legacy node registry systems - kept for compatibility
@@ -72,7 +91,7 @@ __all__ = [
     "ConversationMemoryNode", "BufferMemoryNode",
     
     # Tools
-    "TavilySearchNode", "HttpClientNode", "CohereRerankerNode", "RetrieverProvider",
+    "TavilySearchNode", "HttpClientNode", "CohereRerankerNode", "BM25RerankerNode", "RetrieverProvider",
     
     # Document Loaders
     "WebScraperNode",
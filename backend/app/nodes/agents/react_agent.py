@@ -99,6 +99,7 @@ LICENSE: Proprietary
 
 from ..base import NodePosition, ProcessorNode, NodeInput, NodePropertyType, NodeType, NodeOutput, NodeProperty
 from app.nodes.memory import BufferMemoryNode
+from app.nodes.memory.conversation_memory import PersistentWindowMemory
 from app.core.tool import AutoToolManager
 from typing import Dict, Any, Sequence, List, Optional
 from langchain_core.runnables import Runnable, RunnableLambda
@@ -562,7 +563,7 @@ class ReactAgentNode(ProcessorNode):
 
             # Prepare final input and execute
             final_input = self._prepare_final_input_for_graph(user_input, memory)
-            return self._execute_graph_with_error_handling(agent_graph, final_input, memory)
+            return self._execute_graph_with_error_handling(agent_graph, final_input, memory, user_input)
 
         return RunnableLambda(agent_executor_lambda)
 
@@ -828,7 +829,8 @@ class ReactAgentNode(ProcessorNode):
 
         return ""
 
-    def _execute_graph_with_error_handling(self, agent_graph: CompiledStateGraph, final_input: Dict[str, Any], memory: Any) -> Dict[str, Any]:
+    def _execute_graph_with_error_handling(self, agent_graph: CompiledStateGraph, final_input: Dict[str, Any], memory: Any,
+                                           user_input: str = "") -> Dict[str, Any]:
         """Execute the agent graph with comprehensive error handling."""
         try:
 
@@ -843,9 +845,13 @@ class ReactAgentNode(ProcessorNode):
                 if memory:
                     try:
                         print("   [PERSIST] Persisting conversation to database via memory node...")
-                        session_id = memory.memory_key
-
-                        BufferMemoryNode().save_messages(session_id=session_id, messages=[last_ai_message])
+                        if isinstance(memory, PersistentWindowMemory):
+                            # Writes the turn with explicit roles under the memory's own user and session
+                            memory.save_context({"input": user_input}, {"output": output_content})
+                            session_id = memory.session_id
+                        else:
+                            session_id = memory.memory_key
+                            BufferMemoryNode().save_messages(session_id=session_id, messages=[last_ai_message])
                         print(f"   [SUCCESS] Conversation persisted for session {session_id[:8]}...")
                     except Exception as e:
                         print(f"   [ERROR] Failed to persist memory via _persist_to_database: {e}")
@@ -962,33 +968,5 @@ class ReactAgentNode(ProcessorNode):
 
         return f"{header}\n{tool_rule}\n\n{custom_instructions}".strip()
 
-    def _save_conversation_to_database(self, session_id: str, user_content: str, ai_content: str, user_id: str):
-        """Save conversation to database through memory service"""
-        try:
-            # Import database service
-            from app.services.memory import db_memory_store
-            
-            if db_memory_store:
-                result = db_memory_store.save_session_memory(
-                    session_id=session_id,
-                    user_input=user_content,
-                    ai_response=ai_content,
-                    user_id=user_id,
-                    metadata={
-                        'source': 'react_agent',
-                        'agent_type': 'react_agent_node',
-                        'timestamp': str(__import__('datetime').datetime.now())
-                    }
-                )
-                if result:
-                    print(f"   [SUCCESS] Database save successful: {result[:8]}...")
-                else:
-                    print(f"   [ERROR] Database save failed: empty result")
-            else:
-                print(f"   [WARNING] Database store not available")
-                
-        except Exception as e:
-            print(f"   [WARNING] Database save exception: {e}")
-
 # Alias for frontend compatibility
 ToolAgentNode = ReactAgentNode
@@ -246,12 +246,12 @@ class NodeProperty(BaseModel):
         description="Whether this input must be provided for node execution"
     )
 
-    min: Optional[int] = Field(
+    min: Optional[Union[int, float]] = Field(
         default=None,
         description="Minimum value of the input"
     )
     
-    max: Optional[int] = Field(
+    max: Optional[Union[int, float]] = Field(
         default=None,
         description="Maximum value of the input"
     )
@@ -643,20 +643,24 @@ class BaseNode(ABC):
     node_id: Optional[str]
     context_id: Optional[str]
     session_id: Optional[str]
+    workflow_id: Optional[str]
     _input_connections: Dict[str, Dict[str, str]]
     _output_connections: Dict[str, List[Dict[str, str]]]
     user_data: Dict[str, Any]
     credentials: List[Dict[str, Any]]
+    data_access: Optional[Any]
     
     def __init__(self):
         self.node_id = None  # Will be set by GraphBuilder
         self.context_id = None  # Credential context for provider
         self.session_id = None  # Session ID for conversation continuity
+        self.workflow_id = None  # Set by NodeExecutor; scopes per-workflow caches
         # Connection mappings set by GraphBuilder
         self._input_connections = {}
         self._output_connections = {}
         self.user_data = {}  # User configuration from frontend
         self.credentials = []  # List of user credentials (not dict!)
+        self.data_access = None  # Per-execution NodeDataAccess, set by NodeExecutor
     
     @property
     def metadata(self) -> NodeMetadata:
@@ -308,6 +308,7 @@ from ..base import ProcessorNode, NodeInput, NodeOutput, NodeType, NodePropertyT
 from app.models.node import NodeCategory
 from app.services.document_service import DocumentService
 from app.core.database import get_db_session_context
+from app.core.near_duplicates import NearDuplicateIndex, load_collection_index, save_collection_signatures
 
 logger = logging.getLogger(__name__)
 
@@ -492,6 +493,20 @@ class DocumentLoaderNode(ProcessorNode):
                     default=True,
                     required=False,
                 ),
+                NodeInput(
+                    name="dedup_threshold",
+                    type="slider",
+                    description="Estimated Jaccard similarity above which documents are treated as near-duplicates",
+                    default=0.85,
+                    required=False,
+                ),
+                NodeInput(
+                    name="dedup_collection",
+                    type="string",
+                    description="Persist document signatures under this collection so repeat ingests skip known near-duplicates",
+                    default="",
+                    required=False,
+                ),
                 NodeInput(
                     name="quality_threshold",
                     type="slider",
@@ -702,6 +717,37 @@ class DocumentLoaderNode(ProcessorNode):
                     default=True,
                     required=False,
                 ),
+                NodeProperty(
+                    name="dedup_threshold",
+                    displayName="Similarity Threshold",
+                    type=NodePropertyType.RANGE,
+                    description="Estimated Jaccard similarity above which documents are treated as near-duplicates",
+                    default=0.85,
+                    min=0.5,
+                    max=1.0,
+                    step=0.05,
+                    minLabel="Loose",
+                    maxLabel="Exact",
+                    displayOptions={
+                        "show": {
+                            "deduplicate": True
+                        }
+                    },
+                    required=False,
+                ),
+                NodeProperty(
+                    name="dedup_collection",
+                    displayName="Dedup Collection",
+                    type=NodePropertyType.TEXT,
+                    description="Persist document signatures under this collection so repeat ingests skip known near-duplicates",
+                    placeholder="e.g. product-docs",
+                    displayOptions={
+                        "show": {
+                            "deduplicate": True
+                        }
+                    },
+                    required=False,
+                ),
             ]
         }
 
@@ -1340,33 +1386,58 @@ class DocumentLoaderNode(ProcessorNode):
         
         return min(1.0, score)
 
-    def _deduplicate_documents(self, documents: List[Document]) -> List[Document]:
-        """Remove duplicate documents based on content similarity."""
-        if len(documents) <= 1:
-            return documents
-        
-        unique_docs = []
-        seen_hashes = set()
-        
-        for doc in documents:
-            # Simple hash-based deduplication
-            content_hash = hash(doc.page_content[:1000])  # Use first 1000 chars
-            
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
-                unique_docs.append(doc)
-            else:
-                logger.info(f"Removing duplicate document: {doc.metadata.get('source', 'unknown')}")
-        
-        return unique_docs
-
-
-
+    def _deduplicate_documents(
+        self,
+        documents: List[Document],
+        threshold: float = 0.85,
+        collection: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> List[Document]:
+        """
+        Remove near-duplicate documents using MinHash signatures and an LSH index.
 
+        With a ``collection`` and a ``user_id``, the index is preloaded with the
+        signatures persisted by that user's earlier ingests into the collection and
+        the signatures of the documents kept here are stored, so re-ingesting known
+        content is skipped before it is chunked and embedded. Collections are never
+        shared between users.
+        """
+        if collection and not user_id:
+            logger.warning(f"No user_id for dedup collection '{collection}'; deduplicating within this batch only")
+            collection = None
+        if collection:
+            index = load_collection_index(user_id, collection, threshold)
+        elif len(documents) <= 1:
+            return documents
+        else:
+            index = NearDuplicateIndex(threshold=threshold)
 
+        unique_docs = []
+        new_signatures = []
+
+        for position, doc in enumerate(documents):
+            signature = index.hasher.signature(doc.page_content)
+            matches = index.query_signature(signature)
+            if matches:
+                duplicate_of, similarity = matches[0]
+                logger.info(
+                    f"Removing near-duplicate document: {doc.metadata.get('source', 'unknown')} "
+                    f"(similarity {similarity:.2f} with {duplicate_of})"
+                )
+                continue
 
+            key = str(doc.metadata.get("source") or doc.metadata.get("doc_id") or f"document-{position}")
+            if key in index:
+                key = f"{key}#{uuid.uuid4().hex[:8]}"
+            index.add_signature(key, signature)
+            new_signatures.append((key, signature))
+            unique_docs.append(doc)
 
+        if collection:
+            saved = save_collection_signatures(user_id, collection, index, new_signatures)
+            logger.info(f"Persisted {saved} document signatures for dedup collection '{collection}'")
 
+        return unique_docs
 
     def execute(self, inputs: Dict[str, Any], connected_nodes: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1404,6 +1475,9 @@ class DocumentLoaderNode(ProcessorNode):
             max_file_size_mb = int(inputs.get("max_file_size_mb", 50))
             storage_enabled = inputs.get("storage_enabled", False)
             deduplicate = inputs.get("deduplicate", True)
+            # Below 0.5 almost any two documents in the same language would collide
+            dedup_threshold = min(1.0, max(0.5, float(inputs.get("dedup_threshold", 0.85))))
+            dedup_collection = (inputs.get("dedup_collection") or "").strip() or None
             quality_threshold = float(inputs.get("quality_threshold", 0.5))
             
             # Google Drive authentication configuration
@@ -1708,9 +1782,13 @@ class DocumentLoaderNode(ProcessorNode):
             documents = high_quality_docs
             
             # Deduplication
-            if deduplicate and len(documents) > 1:
+            if deduplicate and (len(documents) > 1 or (dedup_collection and documents)):
                 original_count = len(documents)
-                documents = self._deduplicate_documents(documents)
+                documents = self._deduplicate_documents(
+                    documents, dedup_threshold, dedup_collection,
+                    # Only the executor-set user; inputs are user-controlled
+                    user_id=getattr(self, "user_id", None),
+                )
                 duplicate_count = original_count - len(documents)
                 
                 if duplicate_count > 0:
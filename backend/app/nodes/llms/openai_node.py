@@ -243,6 +243,8 @@ from langchain_openai import ChatOpenAI
 from langchain_core.runnables import Runnable
 from pydantic import SecretStr
 
+from app.core.llm_cache import get_node_llm_cache
+from app.core.llm_client_registry import get_llm_client_registry
 from ..base import BaseNode, NodeType, NodeInput, NodeOutput, NodeProperty, NodePosition, NodePropertyType
 
 
@@ -643,6 +645,26 @@ class OpenAINode(BaseNode):
                     min=1,
                     max=4096,
                     required=True
+                ),
+                NodeProperty(
+                    name="enable_cache",
+                    displayName="Cache Responses",
+                    tabName="advanced",
+                    type=NodePropertyType.CHECKBOX,
+                    default=False,
+                    description="Serve identical prompts from the LLM response cache",
+                    required=False
+                ),
+                NodeProperty(
+                    name="cache_ttl_seconds",
+                    displayName="Cache TTL",
+                    tabName="advanced",
+                    type=NodePropertyType.NUMBER,
+                    default=3600,
+                    min=1,
+                    max=2592000,
+                    description="How long cached responses are reused, in seconds",
+                    required=False
                 )
             ],
         }
@@ -788,9 +810,20 @@ class OpenAINode(BaseNode):
             "streaming": streaming
         }
         
+        # Opt-in response cache, scoped to the workflow
+        llm_cache = get_node_llm_cache(self.user_data, getattr(self, "workflow_id", None))
+        if llm_cache is not None:
+            llm_config["cache"] = llm_cache
+        
+        # Reuse warm keep-alive connections across executions
+        registry = get_llm_client_registry()
+        http_clients = registry.get_clients(None, str(api_key), timeout)
+        llm_config.update(http_clients.chat_model_kwargs())
+        
         # Create OpenAI Chat model
         try:
             llm = ChatOpenAI(**llm_config)
+            registry.attach(http_clients.key, llm)
             
             # Log successful creation
             print(f"   Model: {model_name} | Temp: {temperature} | Max Tokens: {max_tokens}")
@@ -152,8 +152,7 @@ from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, System
 from typing import cast, Dict, Optional, List
 from sqlalchemy.orm import Session
 from app.core.tracing import trace_memory_operation
-from app.services.memory import save_memory, get_memories_by_session, get_memory_count_by_session
-from app.core.database import get_db
+from app.core.node_data_access import load_session_memories, save_session_memories
 
 # ================================================================================
 # BUFFER MEMORY NODE - ENTERPRISE COMPLETE HISTORY MANAGEMENT
@@ -288,9 +287,10 @@ class BufferMemoryNode(MemoryNode):
         Loads conversation history from the database for a given session ID.
         """
         try:
-            db = next(get_db())
             print(f"Loading messages for session {session_id} from database...")
-            db_memories = get_memories_by_session(db, session_id, limit=5)
+            user_id = kwargs.get('user_id') or getattr(self, 'user_id', None)
+            db_memories = load_session_memories(getattr(self, 'data_access', None), session_id, limit=5,
+                                                user_id=user_id)
             messages = [self._convert_db_memory_to_message(mem) for mem in db_memories]
             # Filter out any None values that may result from conversion errors
             return [msg for msg in messages if msg is not None]
@@ -303,10 +303,10 @@ class BufferMemoryNode(MemoryNode):
         Saves a list of messages to the database for a given session ID.
         """
         try:
-            db = next(get_db())
             user_id = kwargs.get('user_id') or getattr(self, 'user_id', None)
             print(f"Saving {len(messages)} messages for session {session_id} to database...")
             
+            entries = []
             for message in messages:
                 if isinstance(message, HumanMessage):
                     context = "human"
@@ -316,19 +316,10 @@ class BufferMemoryNode(MemoryNode):
                     context = "system"
                 else:
                     context = "unknown"
+                entries.append((message.content, context, {"message_type": message.__class__.__name__}))
 
-                try:
-                    save_memory(
-                        db=db,
-                        user_id=user_id,
-                        session_id=session_id,
-                        content=message.content,
-                        context=context,
-                        metadata={"message_type": message.__class__.__name__},
-                        source_type="buffer_memory"
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to persist a message to the database: {e}")
+            save_session_memories(getattr(self, 'data_access', None), user_id, session_id, entries,
+                                  source_type="buffer_memory")
         except Exception as e:
             print(f"Warning: Database not available, skipping message persistence: {e}")
 
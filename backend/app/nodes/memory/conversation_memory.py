@@ -198,11 +198,42 @@ LICENSE: Proprietary - KAI-Fusion Platform
 
 from ..base import MemoryNode, NodeInput, NodeOutput, NodeType, NodeProperty, NodePosition, NodePropertyType
 from langchain.memory import ConversationBufferWindowMemory
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.runnables import Runnable
-from typing import cast, Dict
-import uuid
+from typing import Any, Dict, List, Optional
+import logging
 
-from app.services.memory import db_memory_store
+from app.core.node_data_access import current_node_data_access, load_session_memories, save_session_memories
+from app.core.session_memory_store import get_session_memory_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_ID = "default_session"
+
+# Roles persisted in ``memories.context`` and the messages they rehydrate into;
+# rows with any other context were not written by this node and are skipped.
+MESSAGE_ROLES = {"human": HumanMessage, "ai": AIMessage}
+
+
+class PersistentWindowMemory(ConversationBufferWindowMemory):
+    """Window memory that also writes every turn to the ``memories`` table."""
+
+    session_id: str = DEFAULT_SESSION_ID
+    user_id: Optional[str] = None
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        super().save_context(inputs, outputs)
+        input_str, output_str = self._get_input_output(inputs, outputs)
+        try:
+            save_session_memories(
+                current_node_data_access(),
+                self.user_id,
+                self.session_id,
+                [(input_str, "human", {}), (output_str, "ai", {})],
+                source_type="conversation_memory",
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist conversation turn for session {self.session_id}: {e}")
 
 
 # ================================================================================
@@ -370,36 +401,64 @@ class ConversationMemoryNode(MemoryNode):
             ]
         })
         # Standard inputs are now inherited from MemoryNode
-        
-        # In-memory storage for different sessions
-        self._session_memories: Dict[str, ConversationBufferWindowMemory] = {}
+        # Session memories live in the process-wide bounded store (LRU + idle TTL),
+        # so they outlive node instances without growing with every session ever seen.
 
     def execute(self, **kwargs) -> Runnable:
         """
         Retrieves or creates a session-aware memory instance using the standardized flow.
         """
-        session_id = self.get_session_id(**kwargs)
-        print(f"ConversationMemoryNode session_id: {session_id}")
+        session_id = kwargs.pop("session_id", None) or self.session_id or DEFAULT_SESSION_ID
+        logger.debug(f"ConversationMemoryNode session_id: {session_id}")
         
         return self.get_memory_instance(session_id, **kwargs)
 
     def get_memory_instance(self, session_id: str, **kwargs) -> Runnable:
         """
-        Creates or retrieves a ConversationBufferWindowMemory instance for a
-        given session ID. This method implements the abstract method from
+        Creates or retrieves a PersistentWindowMemory instance for a given
+        session ID. This method implements the abstract method from
         BaseMemoryNode.
+        
+        Every turn saved to the memory is written to the ``memories`` table, and
+        sessions evicted from the store are rebuilt on their next access with the
+        user's last ``k`` exchanges of that session.
         """
         k = kwargs.get("k", 5)
         memory_key = kwargs.get("memory_key", "history")
+        user_id = getattr(self, "user_id", None)
+        user_id = str(user_id) if user_id else None
         
-        if session_id not in self._session_memories:
-            print(f"Creating new ConversationBufferWindowMemory for session: {session_id}")
-            self._session_memories[session_id] = ConversationBufferWindowMemory(
-                k=k,
-                memory_key=memory_key,
-                return_messages=True
-            )
-        else:
-            print(f"Reusing existing ConversationBufferWindowMemory for session: {session_id}")
-            
-        return self._session_memories[session_id]
+        memory = get_session_memory_store().get_or_load(
+            (user_id, session_id, memory_key),
+            lambda: self._create_memory(session_id, user_id, k, memory_key),
+        )
+        memory.k = k
+        return memory
+
+    def _create_memory(self, session_id: str, user_id: Optional[str], k: int, memory_key: str) -> PersistentWindowMemory:
+        memory = PersistentWindowMemory(
+            k=k,
+            memory_key=memory_key,
+            return_messages=True,
+            session_id=session_id,
+            user_id=user_id,
+        )
+        history = self._load_history(session_id, user_id, limit=2 * k)
+        if history:
+            memory.chat_memory.messages = history
+        logger.debug(f"Created PersistentWindowMemory for session {session_id} ({len(history)} messages rehydrated)")
+        return memory
+
+    def _load_history(self, session_id: str, user_id: Optional[str], limit: int) -> List[BaseMessage]:
+        """The user's most recent persisted messages of a session, oldest first; empty without a database."""
+        try:
+            records = load_session_memories(getattr(self, 'data_access', None), session_id, limit, user_id=user_id)
+        except Exception as e:
+            logger.warning(f"Failed to rehydrate conversation history for session {session_id}: {e}")
+            return []
+        
+        return [
+            MESSAGE_ROLES[record.context](content=record.content)
+            for record in reversed(records)
+            if record.context in MESSAGE_ROLES
+        ]
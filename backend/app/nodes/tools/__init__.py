@@ -7,6 +7,7 @@ from .http_client import (
 )
 from .tavily_search import TavilySearchNode
 from .cohere_reranker import CohereRerankerNode
+from .bm25_reranker import BM25RerankerNode
 from .retriever import RetrieverProvider
 
 __all__ = [
@@ -15,5 +16,6 @@ __all__ = [
     "HttpResponse",
     "TavilySearchNode",
     "CohereRerankerNode",
+    "BM25RerankerNode",
     "RetrieverProvider"
 ]
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""
+BM25 Reranker Provider Node
+===========================
+
+This module provides an in-process reranker that re-scores retrieved documents
+with Okapi BM25 (``rank-bm25``) instead of calling a remote reranking API.
+
+Like ``CohereRerankerNode`` it produces a LangChain document compressor, so it
+plugs into the ``reranker`` input of ``RetrieverProvider`` and is applied via
+``ContextualCompressionRetriever`` to the documents the retriever returns.
+
+Key Features:
+- No network round trip: predictable latency, works in air-gapped deployments
+- Optional reciprocal-rank fusion (RRF) of the BM25 ranking with the incoming
+  vector-search ranking, so lexical matches boost rather than replace semantics
+- Scores written to ``metadata["relevance_score"]`` (same key as CohereRerank)
+  plus ``bm25_score`` for debugging
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor, Document
+from pydantic import Field
+from rank_bm25 import BM25Okapi
+
+from ..base import ProviderNode, NodeType, NodeInput, NodeOutput, NodeProperty, NodePosition, NodePropertyType
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+FUSION_MODES = ("none", "rrf")
+DEFAULT_FUSION = "rrf"
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; shared by corpus and query so they match."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+class BM25Reranker(BaseDocumentCompressor):
+    """Rerank documents against the query with BM25, optionally fused with the input order via RRF."""
+
+    top_n: int = 5
+    k1: float = 1.5
+    b: float = 0.75
+    fusion: str = Field(default=DEFAULT_FUSION, description="'none' for pure BM25, 'rrf' to fuse with vector rank")
+    rrf_k: int = 60
+    bm25_weight: float = 0.5
+
+    def rerank(self, documents: Sequence[Document], query: str) -> List[Document]:
+        if not documents:
+            return []
+
+        corpus = [tokenize(doc.page_content) for doc in documents]
+        query_tokens = tokenize(query)
+        if not query_tokens or not any(corpus):
+            bm25_scores = [0.0] * len(documents)
+        else:
+            bm25_scores = list(BM25Okapi(corpus, k1=self.k1, b=self.b).get_scores(query_tokens))
+
+        bm25_order = sorted(range(len(documents)), key=lambda i: bm25_scores[i], reverse=True)
+
+        if self.fusion == "rrf":
+            # Input order is the vector-search ranking
+            bm25_rank = {doc_idx: rank for rank, doc_idx in enumerate(bm25_order, start=1)}
+            scores = [
+                self.bm25_weight / (self.rrf_k + bm25_rank[i]) + (1 - self.bm25_weight) / (self.rrf_k + i + 1)
+                for i in range(len(documents))
+            ]
+            order = sorted(range(len(documents)), key=lambda i: scores[i], reverse=True)
+        else:
+            scores = bm25_scores
+            order = bm25_order
+
+        reranked = []
+        for i in order[: self.top_n]:
+            doc = documents[i]
+            metadata = {**doc.metadata, "relevance_score": float(scores[i]), "bm25_score": float(bm25_scores[i])}
+            reranked.append(Document(page_content=doc.page_content, metadata=metadata, id=doc.id))
+        return reranked
+
+    def compress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Optional[Callbacks] = None,
+    ) -> Sequence[Document]:
+        return self.rerank(documents, query)
+
+
+class BM25RerankerNode(ProviderNode):
+    """
+    Provider Node for a Local BM25 Reranker
+
+    Creates a ``BM25Reranker`` compressor that downstream nodes (e.g. the
+    Retriever Provider) apply to their retrieved documents. No credentials or
+    network access are needed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._metadata = {
+            "name": "BM25RerankerProvider",
+            "display_name": "BM25 Reranker Provider",
+            "description": (
+                "Provider node that creates a local BM25 reranker. "
+                "Re-scores retrieved documents in-process, optionally fused with vector ranking."
+            ),
+            "category": "Tool",
+            "node_type": NodeType.PROVIDER,
+            "icon": {"name": "list-ordered", "path": None, "alt": None},
+            "colors": ["emerald-500", "teal-600"],
+            "inputs": [
+                NodeInput(
+                    name="top_n",
+                    type="int",
+                    description="Number of top results to return",
+                    default=5,
+                    required=False,
+                ),
+                NodeInput(
+                    name="fusion",
+                    type="str",
+                    description="Score fusion: 'none' (pure BM25) or 'rrf' (reciprocal-rank fusion with vector rank)",
+                    default=DEFAULT_FUSION,
+                    required=False,
+                ),
+            ],
+            "outputs": [
+                NodeOutput(
+                    name="reranker",
+                    displayName="Reranker Model",
+                    type="BM25Reranker",
+                    description="Configured BM25 reranker compressor ready for use",
+                    direction=NodePosition.TOP,
+                    is_connection=True
+                )
+            ],
+            "properties": [
+                NodeProperty(
+                    name="top_n",
+                    displayName="Top N",
+                    type=NodePropertyType.RANGE,
+                    default=5,
+                    min=1,
+                    max=50,
+                    minLabel="1",
+                    maxLabel="50",
+                    required=True
+                ),
+                NodeProperty(
+                    name="fusion",
+                    displayName="Score Fusion",
+                    type=NodePropertyType.SELECT,
+                    default=DEFAULT_FUSION,
+                    options=[
+                        {"label": "Reciprocal Rank Fusion (BM25 + Vector)", "value": "rrf"},
+                        {"label": "BM25 Only", "value": "none"},
+                    ],
+                    required=True
+                ),
+                NodeProperty(
+                    name="bm25_weight",
+                    displayName="BM25 Weight",
+                    type=NodePropertyType.RANGE,
+                    default=0.5,
+                    min=0.0,
+                    max=1.0,
+                    step=0.1,
+                    minLabel="Vector",
+                    maxLabel="Lexical",
+                    required=False
+                ),
+                NodeProperty(
+                    name="k1",
+                    displayName="k1 (Term Saturation)",
+                    type=NodePropertyType.NUMBER,
+                    default=1.5,
+                    min=0.0,
+                    max=3.0,
+                    required=False
+                ),
+                NodeProperty(
+                    name="b",
+                    displayName="b (Length Normalization)",
+                    type=NodePropertyType.NUMBER,
+                    default=0.75,
+                    min=0.0,
+                    max=1.0,
+                    required=False
+                ),
+            ]
+        }
+
+    def get_required_packages(self) -> list[str]:
+        """Python packages needed by the BM25 reranker for dynamic export."""
+        return [
+            "rank-bm25>=0.2.2",
+            "langchain-core>=0.3.0",
+        ]
+
+    def execute(self, **kwargs) -> BM25Reranker:
+        """
+        Create and configure a BM25 reranker instance.
+
+        Returns:
+            BM25Reranker: Document compressor for ContextualCompressionRetriever
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        config: Dict[str, Any] = {**self.user_data, **{k: v for k, v in kwargs.items() if v is not None}}
+
+        top_n = int(config.get("top_n", 5))
+        fusion = str(config.get("fusion", DEFAULT_FUSION)).lower()
+        bm25_weight = float(config.get("bm25_weight", 0.5))
+
+        if top_n < 1 or top_n > 50:
+            raise ValueError("top_n must be an integer between 1 and 50")
+        if fusion not in FUSION_MODES:
+            raise ValueError(f"Unsupported fusion mode: {fusion}. Supported modes: {list(FUSION_MODES)}")
+        if not 0.0 <= bm25_weight <= 1.0:
+            raise ValueError("bm25_weight must be between 0 and 1")
+
+        return BM25Reranker(
+            top_n=top_n,
+            k1=float(config.get("k1", 1.5)),
+            b=float(config.get("b", 0.75)),
+            fusion=fusion,
+            bm25_weight=bm25_weight,
+        )
+
+
+# Export for node registry
+__all__ = ["BM25RerankerNode", "BM25Reranker"]
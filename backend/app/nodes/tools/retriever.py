@@ -47,6 +47,7 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_postgres import PGVector
 from langchain.retrievers import ContextualCompressionRetriever
 
+from app.core.vector_store_registry import get_vector_store_registry
 from app.nodes.base import ProviderNode, NodeInput, NodeOutput, NodeType, NodeProperty, NodePosition, NodePropertyType
 
 logger = logging.getLogger(__name__)
@@ -212,7 +213,7 @@ class RetrieverProvider(ProviderNode):
                     name="reranker",
                     displayName="Reranker",
                     type="reranker",
-                    description="Optional reranker service for enhanced retrieval (CohereReranker, etc.)",
+                    description="Optional reranker service for enhanced retrieval (CohereReranker, BM25Reranker, etc.)",
                     required=False,
                     default=None,
                     ui_config=None,
@@ -421,22 +422,11 @@ class RetrieverProvider(ProviderNode):
             raise ValueError(error_msg) from e
 
     def _create_vectorstore_connection(self, connection_string: str, collection_name: str, embedder) -> PGVector:
-        """Create connection to existing vector database."""
+        """Connect to an existing vector database through the shared engine registry."""
         try:
-            ## Convert to async connection string for new API
-            #if connection_string.startswith('postgresql://'):
-            #    async_connection_string = connection_string.replace('postgresql://', 'postgresql+asyncpg://')
-            #else:
-            #    async_connection_string = connection_string
-
-            # Create engine
-            #engine = PGEngine.from_connection_string(async_connection_string)
-            
-            # Connect to existing vector store (don't create new tables)
-            retriever = PGVector(
-                connection=connection_string,
-                collection_name=collection_name,
-                embeddings=embedder,
+            # Reuses the pooled engine and cached collection row for this DSN/collection/model
+            retriever = get_vector_store_registry().get_vectorstore(
+                connection_string, collection_name, embedder
             )
 
             logger.info(f"[SUCCESS] Connected to vector database collection: {collection_name}")
@@ -168,6 +168,9 @@ from ..base import NodeProperty, ProviderNode, NodeInput, NodeOutput, NodeType,
 from app.models.node import NodeCategory
 from langchain_tavily import TavilySearch
 from langchain_core.tools import Tool
+from app.core.constants import SEARCH_CACHE_TTL
+from app.core.credential_digest import credential_fingerprint
+from app.core.search_cache import get_search_cache
 
 # ================================================================================
 # TAVILY SEARCH NODE - ENTERPRISE WEB INTELLIGENCE PROVIDER
@@ -498,6 +501,14 @@ class TavilySearchNode(ProviderNode):
                     type= NodePropertyType.CHECKBOX,
                     hint= "Include image URLs in search results"
                 ),
+                NodeProperty(
+                    name="cache_ttl_seconds",
+                    displayName="Result Cache TTL (seconds)",
+                    type=NodePropertyType.NUMBER,
+                    default=SEARCH_CACHE_TTL,
+                    min=0,
+                    hint="Reuse identical search results for this long; 0 disables caching"
+                ),
             ]
         }
     
@@ -564,13 +575,15 @@ class TavilySearchNode(ProviderNode):
                 "include_raw_content": include_raw_content,
                 "include_images": include_images,
                 "include_domains": include_domains,
-                "exclude_domains": exclude_domains
+                "exclude_domains": exclude_domains,
+                "cache_ttl_seconds": int(self.user_data.get("cache_ttl_seconds", SEARCH_CACHE_TTL)),
+                "credential": credential_fingerprint(api_key),
             }
 
             # 5. Create Tavily search instance
             tavily_search = self._create_tavily_search(api_key, search_config)
 
-            # 6. Test the API connection
+            # 6. Test the API connection (never answered from the result cache)
             try:
                 test_result = tavily_search.run("test query")
                 print(f"   API Test: Success ({len(str(test_result))} chars)")
@@ -615,6 +628,18 @@ class TavilySearchNode(ProviderNode):
         except Exception as e:
             raise ValueError(f"Failed to create Tavily search instance: {str(e)}") from e
 
+    @staticmethod
+    def _cached_search(tavily_search: TavilySearch, search_config: Dict[str, Any], query: str) -> Any:
+        """Run a search through the shared result cache, coalescing concurrent duplicates."""
+        options = {k: v for k, v in search_config.items() if k != "cache_ttl_seconds"}
+        return get_search_cache().get_or_fetch(
+            "tavily",
+            query,
+            options,
+            lambda: tavily_search.run(query),
+            ttl_seconds=search_config.get("cache_ttl_seconds"),
+        )
+
     def _create_search_tool(self, tavily_search: TavilySearch, search_config: Dict[str, Any]) -> Tool:
         """Create LangChain Tool with agent-optimized formatting."""
 
@@ -623,8 +648,8 @@ class TavilySearchNode(ProviderNode):
             try:
                 print(f"Agent performing web search for: {query}")
 
-                # Perform search using Tavily
-                raw_results = tavily_search.run(query)
+                # Perform search using Tavily (served from cache on repeats)
+                raw_results = self._cached_search(tavily_search, search_config, query)
 
                 # Handle empty results
                 if not raw_results or (isinstance(raw_results, str) and not raw_results.strip()):
@@ -36,8 +36,9 @@ from sqlalchemy import select, text, bindparam
 
 from ..base import TerminatorNode, NodeInput, NodeOutput, NodeType, NodeProperty, NodePropertyType
 from app.core.database import get_db_session_context
-from app.core.json_utils import make_json_serializable
+from app.core.json_utils import dumps_bytes, encode_sse, make_json_serializable, to_jsonable
 from app.core.credential_provider import credential_provider
+from app.core.webhook_event_bus import get_webhook_event_bus
 from app.models.workflow import Workflow
 from app.services.workflow_executor import (
     get_workflow_executor
@@ -258,7 +259,7 @@ async def webhook_router_health():
     return {
         "status": "healthy",
         "router": "webhook_trigger",
-        "active_webhooks": len(webhook_events),
+        "active_webhooks": len(get_webhook_event_bus().webhook_ids()),
         "message": "Webhook router is operational"
     }
 
@@ -279,12 +280,12 @@ async def handle_webhook_request(
     """Handle incoming webhook requests for any HTTP method."""
     
     # Check if webhook exists, create if not (for dynamic webhook support)
-    if webhook_id not in webhook_events:
+    event_bus = get_webhook_event_bus()
+    if not event_bus.is_known(webhook_id):
         # Auto-create webhook entry for valid webhook IDs
-        webhook_events[webhook_id] = []
-        webhook_subscribers[webhook_id] = []
+        event_bus.ensure(webhook_id)
         logger.info(f"🔧 Auto-created webhook storage for {webhook_id}")
-    
+
     correlation_id = str(uuid.uuid4())
     received_at = datetime.now(timezone.utc)
     
@@ -467,24 +468,9 @@ async def handle_webhook_request(
             "url": str(request.url),
         }
         
-        # Store event
-        webhook_events[webhook_id].append(webhook_event)
-        
-        # Maintain event history limit
-        if len(webhook_events[webhook_id]) > 1000:
-            webhook_events[webhook_id] = webhook_events[webhook_id][-1000:]
-        
-        # Notify subscribers (for streaming)
-        async def notify_subscribers(event: Dict[str, Any]):
-            if webhook_id in webhook_subscribers:
-                for queue in webhook_subscribers[webhook_id]:
-                    try:
-                        await queue.put(event)
-                    except Exception as e:
-                        logger.warning(f"Failed to notify subscriber: {e}")
-        
-        background_tasks.add_task(notify_subscribers, webhook_event)
-        
+        # Store event in the bounded ring buffer and fan it out to subscribers on every replica
+        webhook_event = await event_bus.publish(webhook_id, webhook_event)
+
         # Execute workflow synchronously to get response from RespondToWebhookNode
         webhook_response_data = None
         result = None
@@ -575,15 +561,8 @@ async def handle_webhook_request(
                             
                             # Broadcast event to UI via webhook subscribers
                             # This allows UI to visualize execution in real-time
-                            if enable_frontend_stream and webhook_id in webhook_subscribers:
-                                # Make event_chunk serializable before creating UI event
-                                serializable_event_chunk = make_json_serializable(event_chunk)
-
+                            if enable_frontend_stream:
                                 # Include original HTTP request payload (body) for UI inspection
-                                safe_webhook_payload = make_json_serializable(
-                                    webhook_event.get("data")
-                                )
-
                                 ui_event = {
                                     "type": "webhook_execution_event",
                                     "webhook_id": webhook_id,
@@ -591,61 +570,15 @@ async def handle_webhook_request(
                                     "execution_id": str(ctx.execution_id)
                                     if ctx.execution_id
                                     else None,
-                                    "event": serializable_event_chunk,
-                                    "webhook_payload": safe_webhook_payload,
+                                    "event": event_chunk,
+                                    "webhook_payload": webhook_event.get("data"),
                                     "timestamp": datetime.now(timezone.utc).isoformat(),
                                 }
-                                # Make entire UI event serializable as well
-                                serializable_ui_event = make_json_serializable(ui_event)
-
-                                # Send event to all subscribers with improved error handling
-                                subscribers = webhook_subscribers[webhook_id].copy()  # Copy to avoid modification during iteration
-                                for queue in subscribers:
-                                    try:
-                                        # Check queue size to prevent memory issues
-                                        if queue.qsize() >= MAX_QUEUE_LENGTH:
-                                            logger.warning(
-                                                f"Queue full for webhook {webhook_id}, removing subscriber"
-                                            )
-                                            # Remove full queue and notify client
-                                            try:
-                                                await queue.put({
-                                                    "type": "error",
-                                                    "error": "Queue full, disconnecting",
-                                                    "timestamp": datetime.now(timezone.utc).isoformat()
-                                                })
-                                            except:
-                                                pass
-                                            webhook_subscribers[webhook_id].remove(queue)
-                                            continue
-                                        
-                                        # Use put_nowait with timeout fallback for better performance
-                                        try:
-                                            queue.put_nowait(serializable_ui_event)
-                                        except asyncio.QueueFull:
-                                            # Queue is full, use blocking put with timeout
-                                            try:
-                                                await asyncio.wait_for(
-                                                    queue.put(serializable_ui_event),
-                                                    timeout=1.0
-                                                )
-                                            except asyncio.TimeoutError:
-                                                logger.warning(
-                                                    f"Timeout sending event to subscriber for webhook {webhook_id}"
-                                                )
-                                                webhook_subscribers[webhook_id].remove(queue)
-                                    except asyncio.CancelledError:
-                                        # Subscriber disconnected, remove from list
-                                        if queue in webhook_subscribers[webhook_id]:
-                                            webhook_subscribers[webhook_id].remove(queue)
-                                    except Exception as e:
-                                        logger.warning(
-                                            f"Failed to send UI event to subscriber for webhook {webhook_id}: {e}",
-                                            exc_info=True
-                                        )
-                                        # Remove problematic subscriber
-                                        if queue in webhook_subscribers[webhook_id]:
-                                            webhook_subscribers[webhook_id].remove(queue)
+
+                                # Execution progress is streamed only, never kept in the replay buffer.
+                                # Subscribers whose queue is full are disconnected by the bus.
+                                # Converted once here; the bus and SSE writers encode plain data only.
+                                await event_bus.publish(webhook_id, to_jsonable(ui_event), store=False)
                 else:
                     # Fallback: if not a generator, use as result
                     result = result_stream
@@ -726,11 +659,11 @@ async def handle_webhook_request(
                 
                 # Determine response class based on content type
                 if "application/json" in content_type:
-                    # Ensure body is JSON-serializable
-                    serializable_body = make_json_serializable(body)
-                    return JSONResponse(
+                    # Encode in one pass straight to the response body
+                    return Response(
                         status_code=status_code,
-                        content=serializable_body,
+                        content=dumps_bytes(body),
+                        media_type="application/json",
                         headers=headers
                     )
                 elif "text/html" in content_type:
@@ -796,13 +729,11 @@ async def handle_webhook_request(
                     else:
                         flattened_output["output"] = node_output
             
-            # Make flattened output JSON-serializable
-            serializable_output = make_json_serializable(flattened_output)
-            
-            # Return flattened node outputs (without node IDs)
-            return JSONResponse(
+            # Return flattened node outputs (without node IDs), encoded in one pass
+            return Response(
                 status_code=200,
-                content=serializable_output,
+                content=dumps_bytes(flattened_output),
+                media_type="application/json",
             )
         else:
             # Fallback if result is not a dict (e.g., plain string from LLM)
@@ -892,49 +823,39 @@ async def head_webhook_test(
 
 # Webhook streaming endpoint - TEST ROUTER
 @webhook_test_router.get("/{webhook_id}/stream")
-async def webhook_stream_test(webhook_id: str):
-    """Stream webhook events for a specific webhook"""
+async def webhook_stream_test(webhook_id: str, request: Request, last_event_id: Optional[str] = None):
+    """
+    Stream webhook events for a specific webhook.
+
+    Reconnecting clients resume from the ``Last-Event-ID`` header (sent automatically
+    by EventSource) or the ``last_event_id`` query parameter; buffered events after
+    that ID are replayed before live ones.
+    """
+    event_bus = get_webhook_event_bus()
     # Auto-create webhook entry if it doesn't exist (for UI connections)
-    if webhook_id not in webhook_events:
-        webhook_events[webhook_id] = []
-        webhook_subscribers[webhook_id] = []
+    if not event_bus.is_known(webhook_id):
+        event_bus.ensure(webhook_id)
         logger.info(f"🔧 Auto-created webhook storage for stream: {webhook_id}")
-    
+    resume_from = request.headers.get("last-event-id") or last_event_id
+
+    def format_event(event: Dict[str, Any]) -> bytes:
+        return encode_sse(event, event_id=event.get("event_id"))
+
     async def event_stream():
-        queue = asyncio.Queue(maxsize=MAX_QUEUE_LENGTH)
-        if webhook_id not in webhook_subscribers:
-            webhook_subscribers[webhook_id] = []
-        
-        # Enforce maximum subscriber limit
-        if len(webhook_subscribers[webhook_id]) >= MAX_QUEUE_SIZE:
-            logger.warning(
-                f"Maximum subscriber limit reached for webhook {webhook_id}, "
-                f"removing oldest subscriber"
-            )
-            # Remove oldest subscriber
-            if webhook_subscribers[webhook_id]:
-                oldest_queue = webhook_subscribers[webhook_id].pop(0)
-                try:
-                    await oldest_queue.put({
-                        "type": "error",
-                        "error": "Maximum subscribers reached, disconnecting",
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
-                except:
-                    pass
-        
-        webhook_subscribers[webhook_id].append(queue)
-        
+        subscription = event_bus.subscribe(webhook_id, last_event_id=resume_from)
+        queue = subscription.queue
+
         try:
             # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connected', 'webhook_id': webhook_id, 'timestamp': datetime.now(timezone.utc).isoformat()})}\n\n"
-            
+            yield f"data: {json.dumps({'type': 'connected', 'webhook_id': webhook_id, 'replayed': len(subscription.backlog), 'timestamp': datetime.now(timezone.utc).isoformat()})}\n\n"
+
+            for event in subscription.backlog:
+                yield format_event(event)
+
             while True:
                 try:
                     event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    # Make event JSON serializable before sending
-                    serializable_event = make_json_serializable(event)
-                    yield f"data: {json.dumps(serializable_event)}\n\n"
+                    yield format_event(event)
                 except asyncio.TimeoutError:
                     # Send ping to keep connection alive
                     yield f"data: {json.dumps({'type': 'ping', 'timestamp': datetime.now(timezone.utc).isoformat()})}\n\n"
@@ -950,8 +871,7 @@ async def webhook_stream_test(webhook_id: str):
         except asyncio.CancelledError:
             pass
         finally:
-            if webhook_id in webhook_subscribers and queue in webhook_subscribers[webhook_id]:
-                webhook_subscribers[webhook_id].remove(queue)
+            event_bus.unsubscribe(webhook_id, queue)
     
     return StreamingResponse(
         event_stream(),
@@ -1050,10 +970,8 @@ async def webhook_stream_production(webhook_id: str):
 @webhook_router.post("/{webhook_id}/start-listening")
 async def start_listening(webhook_id: str):
     """Start listening for webhook events"""
-    if webhook_id not in webhook_events:
-        # Create new webhook if it doesn't exist
-        webhook_events[webhook_id] = []
-        webhook_subscribers[webhook_id] = []
+    # Create new webhook if it doesn't exist
+    get_webhook_event_bus().ensure(webhook_id)
     
     return {
         "success": True,
@@ -1066,10 +984,8 @@ async def start_listening(webhook_id: str):
 @webhook_router.post("/{webhook_id}/stop-listening")
 async def stop_listening(webhook_id: str):
     """Stop listening for webhook events"""
-    if webhook_id in webhook_events:
-        # Clear events and subscribers
-        webhook_events[webhook_id] = []
-        webhook_subscribers[webhook_id] = []
+    # Clear events and subscribers
+    get_webhook_event_bus().clear(webhook_id)
     
     return {
         "success": True,
@@ -1082,26 +998,19 @@ async def stop_listening(webhook_id: str):
 @webhook_router.get("/{webhook_id}/stats")
 async def get_webhook_stats(webhook_id: str):
     """Get webhook statistics"""
-    if webhook_id not in webhook_events:
+    event_bus = get_webhook_event_bus()
+    if not event_bus.is_known(webhook_id):
         raise HTTPException(status_code=404, detail="Webhook not found")
     
-    events = webhook_events[webhook_id]
+    events = event_bus.history(webhook_id)
     return {
         "webhook_id": webhook_id,
         "total_events": len(events),
         "last_event_at": events[-1]["timestamp"] if events else None,
-        "active_subscribers": len(webhook_subscribers[webhook_id]),
+        "active_subscribers": event_bus.subscriber_count(webhook_id),
         "timestamp": datetime.now().isoformat()
     }
 
-# Webhook event storage for streaming
-webhook_events: Dict[str, List[Dict[str, Any]]] = {}
-webhook_subscribers: Dict[str, List[asyncio.Queue]] = {}
-
-# Constants for webhook streaming
-MAX_QUEUE_SIZE = 100  # Maximum number of subscribers per webhook
-MAX_QUEUE_LENGTH = 1000  # Maximum queue length per subscriber
-
 class WebhookPayload(BaseModel):
     """Standard webhook payload model."""
     event_type: str = Field(default="webhook.received", description="Type of webhook event")
@@ -1134,10 +1043,6 @@ class WebhookTriggerNode(TerminatorNode):
         self.endpoint_path = f"/{self.webhook_id}"
         self.secret_token = f"wht_{uuid.uuid4().hex}"
         
-        # Initialize event storage
-        webhook_events[self.webhook_id] = []
-        webhook_subscribers[self.webhook_id] = []
-        
         self._metadata = {
             "name": "WebhookTrigger",
             "display_name": "Webhook Trigger",
@@ -1385,12 +1290,7 @@ class WebhookTriggerNode(TerminatorNode):
     
     async def _notify_subscribers(self, event: Dict[str, Any]) -> None:
         """Notify all subscribers of new webhook event."""
-        if self.webhook_id in webhook_subscribers:
-            for queue in webhook_subscribers[self.webhook_id]:
-                try:
-                    await queue.put(event)
-                except Exception as e:
-                    logger.warning(f"Failed to notify subscriber: {e}")
+        await get_webhook_event_bus().publish(self.webhook_id, event)
     
     def _execute(self, state) -> Dict[str, Any]:
         """
@@ -1409,9 +1309,9 @@ class WebhookTriggerNode(TerminatorNode):
         
         # If no payload in user_data, get latest webhook event
         if not webhook_payload:
-            events = webhook_events.get(self.webhook_id, [])
-            if events:
-                webhook_payload = events[-1].get("data", {})
+            latest_event = get_webhook_event_bus().latest(self.webhook_id)
+            if latest_event:
+                webhook_payload = latest_event.get("data", {})
         
         # Generate webhook configuration
         base_url = os.getenv("WEBHOOK_BASE_URL", "http://localhost:8000")
@@ -1510,9 +1410,9 @@ class WebhookTriggerNode(TerminatorNode):
             
             def invoke(self, input: None, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
                 """Get latest webhook event."""
-                events = webhook_events.get(self.webhook_id, [])
-                if events:
-                    return events[-1]  # Return most recent event
+                latest_event = get_webhook_event_bus().latest(self.webhook_id)
+                if latest_event:
+                    return latest_event  # Return most recent event
                 return {"message": "No webhook events received"}
             
             async def ainvoke(self, input: None, config: Optional[RunnableConfig] = None) -> Dict[str, Any]:
@@ -1522,16 +1422,14 @@ class WebhookTriggerNode(TerminatorNode):
             async def astream(self, input: None, config: Optional[RunnableConfig] = None) -> AsyncGenerator[Dict[str, Any], None]:
                 """Stream webhook events as they arrive."""
                 # Subscribe to webhook events
-                queue = asyncio.Queue()
-                if self.webhook_id not in webhook_subscribers:
-                    webhook_subscribers[self.webhook_id] = []
-                webhook_subscribers[self.webhook_id].append(queue)
+                event_bus = get_webhook_event_bus()
+                queue = event_bus.subscribe(self.webhook_id).queue
                 
                 try:
                     logger.info(f"🔄 Webhook streaming started: {self.webhook_id}")
                     
                     # Yield any existing events first
-                    existing_events = webhook_events.get(self.webhook_id, [])
+                    existing_events = event_bus.history(self.webhook_id)
                     for event in existing_events[-10:]:  # Last 10 events
                         yield event
                     
@@ -1553,11 +1451,7 @@ class WebhookTriggerNode(TerminatorNode):
                             
                 finally:
                     # Cleanup subscriber
-                    if self.webhook_id in webhook_subscribers:
-                        try:
-                            webhook_subscribers[self.webhook_id].remove(queue)
-                        except ValueError:
-                            pass
+                    event_bus.unsubscribe(self.webhook_id, queue)
                     logger.info(f"🔄 Webhook streaming ended: {self.webhook_id}")
         
         # Add LangSmith tracing if enabled
@@ -1574,7 +1468,7 @@ class WebhookTriggerNode(TerminatorNode):
     
     def get_webhook_stats(self) -> Dict[str, Any]:
         """Get webhook statistics and recent events."""
-        events = webhook_events.get(self.webhook_id, [])
+        events = get_webhook_event_bus().history(self.webhook_id)
         
         if not events:
             return {
@@ -1620,27 +1514,20 @@ class WebhookTriggerNode(TerminatorNode):
 # Utility functions for webhook management
 def get_active_webhooks() -> List[Dict[str, Any]]:
     """Get all active webhook endpoints."""
-    return [
-        {
+    event_bus = get_webhook_event_bus()
+    active = []
+    for webhook_id in event_bus.webhook_ids():
+        events = event_bus.history(webhook_id)
+        active.append({
             "webhook_id": webhook_id,
             "event_count": len(events),
             "last_event": events[-1].get("received_at") if events else None,
-        }
-        for webhook_id, events in webhook_events.items()
-    ]
+        })
+    return active
 
 def cleanup_webhook_events(max_age_hours: int = 24) -> int:
     """Clean up old webhook events."""
-    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    cleaned_count = 0
-    
-    for webhook_id in list(webhook_events.keys()):
-        original_count = len(webhook_events[webhook_id])
-        webhook_events[webhook_id] = [
-            event for event in webhook_events[webhook_id]
-            if datetime.fromisoformat(event["received_at"].replace('Z', '+00:00')) > cutoff_time
-        ]
-        cleaned_count += original_count - len(webhook_events[webhook_id])
+    cleaned_count = get_webhook_event_bus().prune(timedelta(hours=max_age_hours))
     
     logger.info(f"🧹 Cleaned up {cleaned_count} old webhook events")
     return cleaned_count
@@ -55,11 +55,8 @@ from datetime import datetime
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStoreRetriever
 
-# Use new langchain_postgres API with legacy fallback
-
-from langchain_postgres import PGVector
-
-
+from app.core.database import guard_blocking_call
+from app.core.vector_store_registry import get_vector_store_registry
 from ..base import ProcessorNode, NodeInput, NodeOutput, NodeType, NodeProperty, NodePosition, NodePropertyType
 
 logger = logging.getLogger(__name__)
@@ -396,10 +393,11 @@ class VectorStoreOrchestrator(ProcessorNode):
             return connection_string
 
     def _get_db_connection(self, connection_string: str):
-        """Create database connection for optimization operations."""
+        """Borrow a pooled connection for optimization operations (worker threads only)."""
+        guard_blocking_call("vector store schema connection")
         try:
             dsn = self._normalize_psycopg2_dsn(connection_string)
-            return psycopg2.connect(dsn)
+            return get_vector_store_registry().raw_connection(dsn)
         except Exception as e:
             raise ValueError(f"Failed to connect to database: {str(e)}")
 
@@ -876,10 +874,8 @@ class VectorStoreOrchestrator(ProcessorNode):
             logger.info(f"Creating vector store: {collection_name} with {len(processed_docs)} docs")
 
             # Create vector store
-            vectorstore = PGVector(
-                connection=connection_string,
-                collection_name=collection_name,
-                embeddings=embedder
+            vectorstore = get_vector_store_registry().get_vectorstore(
+                connection_string, collection_name, embedder
             )
 
             vectorstore.add_documents(processed_docs)
@@ -157,6 +157,13 @@ class DocumentSearchRequest(BaseModel):
     # Pagination
     limit: Optional[int] = Field(50, ge=1, le=1000, description="Maximum results")
     offset: Optional[int] = Field(0, ge=0, description="Results offset")
+    cursor: Optional[str] = Field(None, description="Opaque keyset cursor from a previous response (overrides offset)")
+    count_mode: Optional[str] = Field("capped", description="Total count strategy: exact, capped or none")
+    
+    # Hybrid retrieval
+    mode: Optional[str] = Field("fulltext", description="Search mode: fulltext or hybrid")
+    query_embedding: Optional[List[float]] = Field(None, description="Query embedding for hybrid mode")
+    rrf_k: Optional[int] = Field(60, ge=1, description="Reciprocal rank fusion constant")
     
     @validator('order_by')
     def validate_order_by(cls, v):
@@ -171,6 +178,24 @@ class DocumentSearchRequest(BaseModel):
             raise ValueError("order_direction must be 'asc' or 'desc'")
         return v
     
+    @validator('count_mode')
+    def validate_count_mode(cls, v):
+        if v not in ['exact', 'capped', 'none']:
+            raise ValueError("count_mode must be 'exact', 'capped' or 'none'")
+        return v
+    
+    @validator('mode')
+    def validate_mode(cls, v):
+        if v not in ['fulltext', 'hybrid']:
+            raise ValueError("mode must be 'fulltext' or 'hybrid'")
+        return v
+    
+    @validator('query_embedding', always=True)
+    def validate_query_embedding(cls, v, values):
+        if values.get('mode') == 'hybrid' and not v:
+            raise ValueError("query_embedding is required when mode is 'hybrid'")
+        return v
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -189,10 +214,12 @@ class DocumentSearchRequest(BaseModel):
 class DocumentSearchResponse(BaseModel):
     """Schema for document search responses."""
     documents: List[DocumentResponse] = Field(..., description="Search results")
-    total_count: int = Field(..., description="Total matching documents")
+    total_count: Optional[int] = Field(..., description="Total matching documents (lower bound when count_is_estimate)")
+    count_is_estimate: bool = Field(False, description="True when total_count hit the count cap")
     returned_count: int = Field(..., description="Number of documents returned")
     limit: int = Field(..., description="Query limit")
     offset: int = Field(..., description="Query offset")
+    next_cursor: Optional[str] = Field(None, description="Keyset cursor for the next page")
     search_params: Dict[str, Any] = Field(..., description="Search parameters used")
     
     class Config:
@@ -43,6 +43,21 @@ class WorkflowResponse(WorkflowBase):
     class Config:
         from_attributes = True
 
+# Schema for list views: summary columns only, flow_data is never loaded
+class WorkflowSummaryResponse(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    user: Optional[UserInfo] = None
+    name: str
+    description: Optional[str] = None
+    is_public: bool = False
+    version: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
 # --- Workflow Template Schemas ---
 
 # Base schema for workflow template fields
@@ -1,7 +1,9 @@
+import asyncio
 import uuid
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.core.blob_store import spill_large_outputs
 from app.models.execution import WorkflowExecution
 from app.services.base import BaseService
 from app.schemas.execution import WorkflowExecutionCreate, WorkflowExecutionUpdate
@@ -72,11 +74,18 @@ class ExecutionService(BaseService[WorkflowExecution]):
     ) -> WorkflowExecution:
         """
         Update a workflow execution.
+
+        Large output values are spilled to the blob store so the JSONB row
+        only carries references and inline previews.
         """
         execution = await self.get(db, execution_id)
         if not execution:
             raise Exception("Execution not found") # Replace with a proper HTTPException
 
+        if execution_in.outputs:
+            outputs = await asyncio.to_thread(spill_large_outputs, execution_in.outputs)
+            execution_in = execution_in.model_copy(update={"outputs": outputs})
+
         execution = await self.update(db, db_obj=execution, obj_in=execution_in)
         return execution
 
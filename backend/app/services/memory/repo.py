@@ -1,9 +1,9 @@
 """Memory repository for pure database operations."""
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, literal_column
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from app.models.memory import Memory
@@ -47,14 +47,25 @@ class MemoryRepo:
     
     def search_memories_by_content(self, db: Session, user_id: str, query: str, 
                                   limit: int = 10) -> List[Memory]:
-        """Search memories by content using basic text search."""
-        search_filter = func.lower(Memory.content).contains(query.lower()) | \
-                       func.lower(Memory.context).contains(query.lower())
+        """Search memories by content, best lexical matches first."""
+        return [memory for memory, _ in self.search_memories_ranked(db, user_id, query, limit)]
+    
+    def search_memories_ranked(self, db: Session, user_id: str, query: str, 
+                               limit: int = 10) -> List[Tuple[Memory, float]]:
+        """
+        Full-text search over the stored ``search_vector`` column (GIN indexed).
         
-        return db.query(Memory).filter(
+        Matching and ranking read the index PostgreSQL maintains on insert/update/delete,
+        so cost depends on the number of matching rows, not on the user's memory count.
+        Returns ``(memory, rank)`` pairs ordered by ``ts_rank_cd``, newest first on ties.
+        """
+        ts_query = func.plainto_tsquery(literal_column("'english'::regconfig"), query)
+        rank = func.ts_rank_cd(Memory.search_vector, ts_query)
+        
+        return db.query(Memory, rank).filter(
             Memory.user_id == UUID(user_id),
-            search_filter
-        ).order_by(desc(Memory.created_at)).limit(limit).all()
+            Memory.search_vector.op("@@")(ts_query)
+        ).order_by(desc(rank), desc(Memory.created_at)).limit(limit).all()
     
     def get_memory_by_id(self, db: Session, memory_id: str) -> Optional[Memory]:
         """Get a specific memory by ID."""
@@ -38,18 +38,21 @@ class MemoryService:
     
     def retrieve_memories(self, db: Session, user_id: str, query: str = "", 
                          limit: int = 10, semantic_search: bool = True) -> List[MemoryItem]:
-        """Retrieve memories with optional semantic search."""
-        if query:
-            memories = self.memory_repo.search_memories_by_content(db, user_id, query, limit)
-        else:
-            memories = self.memory_repo.get_memories_by_user(db, user_id, limit)
+        """
+        Retrieve memories, ranked by the full-text index when a query is given.
         
-        # Convert to MemoryItem objects
-        memory_items = self._convert_to_memory_items(memories)
+        With ``semantic_search`` the index rank is exposed as ``similarity_score`` in each
+        item's metadata.
+        """
+        if not query:
+            memories = self.memory_repo.get_memories_by_user(db, user_id, limit)
+            return self._convert_to_memory_items(memories)
         
-        # Apply semantic search if enabled and query provided
-        if query and semantic_search and memory_items:
-            return self._apply_semantic_search(memory_items, query, limit)
+        ranked = self.memory_repo.search_memories_ranked(db, user_id, query, limit)
+        memory_items = self._convert_to_memory_items([memory for memory, _ in ranked])
+        if semantic_search:
+            for memory_item, (_, rank) in zip(memory_items, ranked):
+                memory_item.metadata = {**memory_item.metadata, 'similarity_score': float(rank)}
         
         return memory_items
     
@@ -160,41 +163,6 @@ class MemoryService:
             memory_items.append(memory_item)
         return memory_items
     
-    def _apply_semantic_search(self, memories: List[MemoryItem], query: str, limit: int) -> List[MemoryItem]:
-        """Apply semantic search using TF-IDF."""
-        try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.metrics.pairwise import cosine_similarity
-            import numpy as np
-            
-            memory_texts = [f"{m.content} {m.context}" for m in memories]
-            
-            # Create TF-IDF vectorizer
-            vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-            tfidf_matrix = vectorizer.fit_transform(memory_texts + [query])
-            
-            # Calculate cosine similarity
-            query_vector = tfidf_matrix[-1]
-            memory_vectors = tfidf_matrix[:-1]
-            similarities = cosine_similarity(query_vector, memory_vectors).flatten()
-            
-            # Get top similar memories
-            similar_indices = np.argsort(similarities)[::-1]
-            
-            # Filter memories with similarity > 0.1
-            relevant_memories = []
-            for idx in similar_indices:
-                if similarities[idx] > 0.1:
-                    memory = memories[idx]
-                    memory.metadata['similarity_score'] = float(similarities[idx])
-                    relevant_memories.append(memory)
-            
-            return relevant_memories[:limit]
-
-        except Exception as e:
-            print(f"Semantic search failed: {e}")
-            return memories[:limit]
-    
     def _analyze_word_frequency(self, memories: List[Memory]) -> List[Dict[str, Any]]:
         """Analyze word frequency in memories."""
         all_content = " ".join(m.content.lower() for m in memories)
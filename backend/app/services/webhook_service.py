@@ -125,6 +125,8 @@ from app.schemas.webhook import (
     WebhookHealthCheck,
 )
 from app.services.base import BaseService
+from app.services.webhook_stats_writer import get_webhook_stats_writer
+from app.core.rate_limiter import get_webhook_rate_limiter
 
 
 class WebhookService(BaseService[WebhookEndpoint]):
@@ -336,6 +338,50 @@ class WebhookService(BaseService[WebhookEndpoint]):
 
         return event
 
+    def record_event(
+        self,
+        *,
+        webhook_id: str,
+        event_type: str = "webhook.received",
+        payload: Dict[str, Any],
+        source_ip: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        request_method: str = "POST",
+        request_headers: Optional[Dict[str, Any]] = None,
+        request_ip: Optional[str] = None,
+        response_status: Optional[int] = None,
+        response_body: Optional[Dict[str, Any]] = None,
+        execution_time_ms: Optional[int] = None,
+        error_message: Optional[str] = None
+    ) -> None:
+        """
+        Buffer a webhook event for the next batched write.
+
+        Unlike ``log_event`` this does not touch the database on the request
+        path; the event row and the endpoint statistics are written by the
+        webhook stats writer within ``WEBHOOK_STATS_FLUSH_INTERVAL`` seconds.
+
+        Args:
+            Same as ``log_event``.
+        """
+        event_data = WebhookEventCreate(
+            webhook_id=webhook_id,
+            event_type=event_type,
+            payload=payload,
+            source_ip=source_ip,
+            user_agent=user_agent,
+            request_method=request_method,
+            request_headers=request_headers,
+            request_ip=request_ip,
+        )
+        get_webhook_stats_writer().record_event({
+            **event_data.model_dump(),
+            "response_status": response_status,
+            "response_body": response_body,
+            "execution_time_ms": execution_time_ms,
+            "error_message": error_message,
+        })
+
     async def get_events_by_webhook(
         self,
         db: AsyncSession,
@@ -539,7 +585,9 @@ class WebhookService(BaseService[WebhookEndpoint]):
         return WebhookHealthCheck(
             webhook_id=webhook_id,
             is_active=endpoint.is_active,
-            is_rate_limited=endpoint.is_rate_limited(),
+            is_rate_limited=get_webhook_rate_limiter().is_limited(
+                webhook_id, (endpoint.config or {}).get("rate_limit_per_minute", 60)
+            ),
             last_triggered=endpoint.last_triggered,
             avg_response_time_ms=endpoint.avg_response_time_ms,
             error_count_last_24h=error_count_last_24h,
@@ -567,22 +615,30 @@ class WebhookService(BaseService[WebhookEndpoint]):
 
         return endpoint.secret_token == token
 
-    async def check_rate_limit(self, db: AsyncSession, webhook_id: str) -> bool:
+    async def check_rate_limit(
+        self, db: AsyncSession, webhook_id: str, endpoint: Optional[WebhookEndpoint] = None
+    ) -> bool:
         """
-        Check if webhook is rate limited.
+        Check if webhook is rate limited and consume one request from its budget.
+
+        Uses an in-process token bucket per endpoint, so no database access is
+        needed when the caller already loaded ``endpoint``.
 
         Args:
             db: Database session
             webhook_id: Webhook identifier
+            endpoint: Already loaded endpoint, if available
 
         Returns:
             True if rate limited, False otherwise
         """
-        endpoint = await self.get_endpoint_by_id(db, webhook_id)
+        if endpoint is None:
+            endpoint = await self.get_endpoint_by_id(db, webhook_id)
         if not endpoint:
             return True  # Rate limit if endpoint not found
 
-        return endpoint.is_rate_limited()
+        rate_limit = (endpoint.config or {}).get("rate_limit_per_minute", 60)
+        return not get_webhook_rate_limiter().try_acquire(webhook_id, rate_limit)
 
     async def _update_endpoint_stats(
         self,
@@ -592,7 +648,7 @@ class WebhookService(BaseService[WebhookEndpoint]):
         response_status: Optional[int],
     ) -> None:
         """
-        Update endpoint statistics.
+        Queue endpoint statistics for the buffered stats writer.
 
         Args:
             db: Database session
@@ -600,15 +656,8 @@ class WebhookService(BaseService[WebhookEndpoint]):
             execution_time_ms: Execution time in milliseconds
             response_status: HTTP response status
         """
-        endpoint = await self.get_endpoint_by_id(db, webhook_id)
-        if not endpoint:
-            return
-
-        success = response_status and 200 <= response_status < 300
-        endpoint.update_trigger_stats(execution_time_ms, success)
-
-        db.add(endpoint)
-        await db.commit()
+        success = bool(response_status and 200 <= response_status < 300)
+        get_webhook_stats_writer().record_stats(webhook_id, execution_time_ms, success)
 
     def _generate_secret_token(self, length: int = 32) -> str:
         """
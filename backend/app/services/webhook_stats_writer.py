@@ -0,0 +1,241 @@
+"""
+KAI-Fusion Webhook Stats Writer - Buffered Endpoint Counters and Event Log
+==========================================================================
+
+Takes webhook bookkeeping off the request path. Before this writer, every
+inbound webhook committed a ``webhook_events`` row and then re-read and updated
+its ``webhook_endpoints`` row. Now the trigger endpoint only appends to
+in-memory buffers, and a background task flushes them every
+``WEBHOOK_STATS_FLUSH_INTERVAL`` seconds in one transaction:
+
+• one multi-row INSERT for all buffered events
+• one UPDATE per endpoint that was triggered during the window, with relative
+  increments (``trigger_count = trigger_count + n``) so concurrent workers
+  never overwrite each other's counts
+
+Guarantees:
+• Bounded memory - at most ``WEBHOOK_STATS_MAX_PENDING_EVENTS`` events are
+  buffered; further events are dropped (and counted) until the next flush.
+  Endpoint counters are still aggregated for dropped events.
+• A crash loses at most the current, unflushed window. ``stop()`` flushes on
+  shutdown.
+• A failed batch is retried once with the endpoint counters in their own
+  transaction and each event in its own savepoint, so one bad row is dropped
+  (and counted) instead of the whole window. If the retry fails too, the batch
+  is logged and discarded, so a database outage cannot grow the buffers.
+"""
+
+import asyncio
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func, insert, update
+
+from app.core import database
+from app.core.constants import WEBHOOK_STATS_FLUSH_INTERVAL, WEBHOOK_STATS_MAX_PENDING_EVENTS
+from app.models.webhook import WebhookEndpoint, WebhookEvent
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointCounters:
+    """Aggregated statistics for one endpoint within a flush window."""
+
+    count: int = 0
+    errors: int = 0
+    total_time_ms: int = 0
+    last_triggered: Optional[datetime] = None
+
+    @property
+    def avg_time_ms(self) -> int:
+        return self.total_time_ms // self.count if self.count else 0
+
+
+class WebhookStatsWriter:
+    """Buffers webhook events and endpoint counters and writes them in periodic batches."""
+
+    def __init__(
+        self,
+        flush_interval: float = WEBHOOK_STATS_FLUSH_INTERVAL,
+        max_pending_events: int = WEBHOOK_STATS_MAX_PENDING_EVENTS,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending_events = max(1, max_pending_events)
+        self._session_factory = session_factory
+        self._events: List[Dict[str, Any]] = []
+        self._counters: Dict[str, EndpointCounters] = {}
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.flushed_events = 0
+        self.dropped_events = 0
+        self.rejected_events = 0
+        self.failed_flushes = 0
+
+    # ------------------------------------------------------------------
+    # Request path
+    # ------------------------------------------------------------------
+    def record_stats(self, webhook_id: str, execution_time_ms: int, success: bool) -> None:
+        """Aggregate one trigger into the endpoint counters."""
+        with self._lock:
+            self._record_stats_locked(webhook_id, execution_time_ms, success)
+        self._ensure_started()
+
+    def record_event(self, event: Dict[str, Any]) -> None:
+        """Buffer a ``webhook_events`` row and aggregate its endpoint counters."""
+        status = event.get("response_status")
+        success = bool(status and 200 <= status < 300)
+        row = {"id": uuid.uuid4(), "created_at": datetime.now(timezone.utc), **event}
+        with self._lock:
+            self._record_stats_locked(row["webhook_id"], row.get("execution_time_ms") or 0, success)
+            if len(self._events) < self.max_pending_events:
+                self._events.append(row)
+            else:
+                self.dropped_events += 1
+        self._ensure_started()
+
+    def _record_stats_locked(self, webhook_id: str, execution_time_ms: int, success: bool) -> None:
+        counters = self._counters.get(webhook_id)
+        if counters is None:
+            counters = self._counters[webhook_id] = EndpointCounters()
+        counters.count += 1
+        counters.total_time_ms += max(0, int(execution_time_ms))
+        counters.last_triggered = datetime.now(timezone.utc)
+        if not success:
+            counters.errors += 1
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    def _session(self):
+        if self._session_factory is not None:
+            return self._session_factory()
+        if not database.AsyncSessionLocal:
+            raise RuntimeError("Database is not enabled. Set DATABASE_URL to enable database functionality.")
+        return database.AsyncSessionLocal()
+
+    async def flush(self) -> int:
+        """Write everything buffered so far. Returns the number of events written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            with self._lock:
+                events, self._events = self._events, []
+                counters, self._counters = self._counters, {}
+            if not events and not counters:
+                return 0
+
+            try:
+                async with self._session() as session:
+                    if events:
+                        await session.execute(insert(WebhookEvent), events)
+                    await self._update_endpoints(session, counters)
+                    await session.commit()
+                written = len(events)
+            except Exception as e:
+                logger.warning(f"Webhook stats batch flush failed, retrying row by row: {e}")
+                try:
+                    written = await self._flush_row_by_row(events, counters)
+                except Exception as e:
+                    self.failed_flushes += 1
+                    logger.error(f"Webhook stats flush failed, dropped {len(events)} events: {e}")
+                    return 0
+
+            self.flushed_events += written
+            return written
+
+    async def _update_endpoints(self, session, counters: Dict[str, EndpointCounters]) -> None:
+        for webhook_id, c in counters.items():
+            current_count = func.coalesce(WebhookEndpoint.trigger_count, 0)
+            current_avg = func.coalesce(WebhookEndpoint.avg_response_time_ms, 0)
+            await session.execute(
+                update(WebhookEndpoint)
+                .where(WebhookEndpoint.webhook_id == webhook_id)
+                .values(
+                    trigger_count=current_count + c.count,
+                    error_count=func.coalesce(WebhookEndpoint.error_count, 0) + c.errors,
+                    last_triggered=c.last_triggered,
+                    # Weighted by request counts; SET expressions read the pre-update row
+                    avg_response_time_ms=(current_avg * current_count + c.total_time_ms)
+                    / (current_count + c.count),
+                )
+            )
+
+    async def _flush_row_by_row(self, events: List[Dict[str, Any]], counters: Dict[str, EndpointCounters]) -> int:
+        """Retry a failed batch: counters in one transaction, each event in its own savepoint."""
+        if counters:
+            async with self._session() as session:
+                await self._update_endpoints(session, counters)
+                await session.commit()
+
+        written = 0
+        async with self._session() as session:
+            for event in events:
+                try:
+                    async with session.begin_nested():
+                        await session.execute(insert(WebhookEvent), [event])
+                    written += 1
+                except Exception as e:
+                    self.rejected_events += 1
+                    logger.warning(f"Dropped webhook event {event.get('id')} for {event.get('webhook_id')}: {e}")
+            await session.commit()
+        return written
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run())
+
+    async def start(self) -> None:
+        self._ensure_started()
+
+    async def stop(self) -> None:
+        """Cancel the flush loop and write what is still buffered (application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending_events": len(self._events),
+                "pending_endpoints": len(self._counters),
+                "flushed_events": self.flushed_events,
+                "dropped_events": self.dropped_events,
+                "rejected_events": self.rejected_events,
+                "failed_flushes": self.failed_flushes,
+            }
+
+
+_writer: Optional[WebhookStatsWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_webhook_stats_writer() -> WebhookStatsWriter:
+    """Get the process-wide webhook stats writer."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = WebhookStatsWriter()
+    return _writer
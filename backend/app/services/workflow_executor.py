@@ -29,7 +29,8 @@ from app.schemas.execution import WorkflowExecutionCreate, WorkflowExecutionUpda
 from app.schemas.auth import UserSignUpData
 from app.services.user_service import UserService
 from app.services.execution_service import ExecutionService
-from app.core.json_utils import make_json_serializable
+from app.core.checkpointer import create_execution_checkpointer
+from app.core.json_utils import to_jsonable
 
 logger = logging.getLogger(__name__)
 
@@ -315,22 +316,33 @@ class WorkflowExecutor:
         ctx: WorkflowExecutionContext,
         db: AsyncSession,
         stream: bool = False,
+        resume: bool = False,
     ) -> Union[Dict[str, Any], AsyncGenerator]:
         """
         Execute workflow using the engine.
         Always creates and tracks execution records in the database.
         
+        Workflows with checkpointing enabled (flow_data.settings.checkpointing)
+        persist a checkpoint after every superstep; ``resume`` continues
+        ``ctx.execution_id`` from its latest checkpoint instead of starting over.
+        
         Args:
             ctx: WorkflowExecutionContext containing workflow, user, and execution inputs
             db: Database session (required for execution tracking)
             stream: Whether to stream results (default: False)
+            resume: Resume the existing execution ctx.execution_id (default: False)
             
         Returns:
             Execution result (dict if stream=False, AsyncGenerator if stream=True)
             
         Raises:
+            ValueError: If resume is requested without an execution or a durable checkpointer
             RuntimeError: If workflow execution fails
         """
+        checkpointer = create_execution_checkpointer(ctx.workflow.flow_data, force=resume)
+        if resume and (checkpointer is None or not ctx.execution_id):
+            raise ValueError("Resuming requires an existing execution and a configured database")
+        
         execution_id = ctx.execution_id
         
         # Create execution record if not already exists
@@ -340,11 +352,16 @@ class WorkflowExecutor:
                 ctx.workflow,
                 ctx.user,
                 ctx.execution_inputs,
-                clean_pending=True,
+                # Interrupted checkpointed runs stay resumable, so they are not cleaned up
+                clean_pending=checkpointer is None,
             )
             execution_id = execution.id
             ctx.execution_id = execution_id
         
+        if checkpointer is not None:
+            ctx.user_context["execution_id"] = str(execution_id)
+            ctx.user_context["resume"] = resume
+        
         # Update status to running
         try:
             await self.update_execution_status(
@@ -362,6 +379,7 @@ class WorkflowExecutor:
             build_result = self.workflow_enhancer.enhanced_build(
                 flow_data=ctx.workflow.flow_data,
                 user_context=ctx.user_context,
+                checkpointer=checkpointer,
             )
             
             # Execute workflow using enhancer with the build result
@@ -413,8 +431,8 @@ class WorkflowExecutor:
                 # For streaming results, we might want to handle this differently
                 # For now, update when execution completes
                 if isinstance(result, dict) and not stream:
-                    # Make outputs JSON-serializable by converting datetime objects to strings
-                    outputs = make_json_serializable(result)
+                    # Make outputs JSON-serializable (single native pass via registered type handlers)
+                    outputs = to_jsonable(result)
                 else:
                     outputs = {"result": "streamed"}
                 
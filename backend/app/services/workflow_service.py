@@ -107,11 +107,10 @@ workflow = await workflow_service.create(
 )
 
 # Retrieve user workflows with intelligent filtering
-user_workflows = await workflow_service.get_user_workflows(
+user_workflows, next_cursor = await workflow_service.get_user_workflows(
     db, 
     user_id=user.id,
     search="data processing",
-    skip=0, 
     limit=50
 )
 ```
@@ -305,12 +304,40 @@ from app.models.user import User
 from app.services.base import BaseService
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy import desc, or_, and_, func
-from typing import Optional, List
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy import desc, or_, and_, func, literal, tuple_
+from datetime import datetime
+from typing import Optional, List, Tuple
+import base64
+import json
 import uuid
 
 
+class InvalidWorkflowCursorError(ValueError):
+    """A workflow listing cursor that was not produced by this service (client error)."""
+
+
+def encode_workflow_cursor(activity_at: datetime, workflow_id: uuid.UUID) -> str:
+    """Encode the last row's (activity time, id) keyset position as an opaque cursor."""
+    payload = json.dumps([activity_at.isoformat(), str(workflow_id)])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_workflow_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_workflow_cursor."""
+    try:
+        activity_at, workflow_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(activity_at), uuid.UUID(workflow_id)
+    except Exception as e:
+        raise InvalidWorkflowCursorError(f"Invalid workflow cursor: {e}") from e
+
+
+def _contains_pattern(search: str) -> str:
+    """ILIKE pattern matching ``search`` literally anywhere (served by the trigram indexes)."""
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 class WorkflowService(BaseService[Workflow]):
     def __init__(self):
         super().__init__(Workflow)
@@ -329,56 +356,93 @@ class WorkflowService(BaseService[Workflow]):
         result = await db.execute(query)
         return result.scalars().first()
 
+    # Columns needed by list views; flow_data is never loaded for listings
+    SUMMARY_COLUMNS = (
+        Workflow.id, Workflow.user_id, Workflow.name, Workflow.description,
+        Workflow.is_public, Workflow.version, Workflow.created_at, Workflow.updated_at,
+    )
+    # Listing sort key; updated_at is nullable, so never-updated rows fall back to created_at.
+    # Matches the idx_workflows_*_activity_id expression indexes.
+    ACTIVITY_AT = func.coalesce(Workflow.updated_at, Workflow.created_at)
+
+    async def _list_summaries(
+        self,
+        db: AsyncSession,
+        filters: list,
+        search: Optional[str],
+        cursor: Optional[str],
+        skip: int,
+        limit: int,
+        include_user: bool = False,
+    ) -> Tuple[List[Workflow], Optional[str]]:
+        """
+        Summary rows ordered by ACTIVITY_AT then ``id``, newest first.
+
+        With a ``cursor`` the page continues strictly after the cursor position
+        (keyset pagination), so every page costs the same index range scan;
+        ``skip`` is only honoured without a cursor.
+        """
+        query = select(self.model).options(load_only(*self.SUMMARY_COLUMNS)).filter(*filters)
+        if include_user:
+            query = query.options(selectinload(self.model.user).load_only(User.id, User.full_name))
+
+        if search:
+            pattern = _contains_pattern(search)
+            query = query.filter(or_(
+                self.model.name.ilike(pattern, escape="\\"),
+                self.model.description.ilike(pattern, escape="\\"),
+            ))
+
+        if cursor:
+            activity_at, workflow_id = decode_workflow_cursor(cursor)
+            query = query.filter(
+                tuple_(self.ACTIVITY_AT, self.model.id) < tuple_(literal(activity_at), literal(workflow_id))
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        query = query.order_by(desc(self.ACTIVITY_AT), desc(self.model.id)).limit(limit)
+        result = await db.execute(query)
+        workflows = result.scalars().all()
+
+        next_cursor = None
+        if limit and len(workflows) == limit:
+            last = workflows[-1]
+            next_cursor = encode_workflow_cursor(last.updated_at or last.created_at, last.id)
+        return workflows, next_cursor
+
     async def get_user_workflows(
         self, 
         db: AsyncSession, 
         user_id: uuid.UUID, 
         skip: int = 0, 
         limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[Workflow]:
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Workflow], Optional[str]]:
         """
-        Get all workflows for a specific user with optional search.
+        Get a page of a user's workflows (summary columns only) with optional search.
+        Returns the workflows and the cursor of the next page, if any.
         """
-        query = select(self.model).filter_by(user_id=user_id)
-        
-        # Add search filter if provided
-        if search:
-            search_filter = or_(
-                self.model.name.icontains(search),
-                self.model.description.icontains(search)
-            )
-            query = query.filter(search_filter)
-        
-        query = query.order_by(desc(self.model.updated_at)).offset(skip).limit(limit)
-        
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self._list_summaries(
+            db, [self.model.user_id == user_id], search, cursor, skip, limit
+        )
 
     async def get_public_workflows(
         self, 
         db: AsyncSession, 
         skip: int = 0, 
         limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[Workflow]:
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Workflow], Optional[str]]:
         """
-        Get all public workflows with optional search, including user information.
+        Get a page of public workflows (summary columns only) with optional search,
+        including user information. Returns the workflows and the next page cursor.
         """
-        query = select(self.model).options(selectinload(self.model.user)).filter_by(is_public=True)
-        
-        # Add search filter if provided
-        if search:
-            search_filter = or_(
-                self.model.name.icontains(search),
-                self.model.description.icontains(search)
-            )
-            query = query.filter(search_filter)
-        
-        query = query.order_by(desc(self.model.updated_at)).offset(skip).limit(limit)
-        
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self._list_summaries(
+            db, [self.model.is_public == True], search, cursor, skip, limit, include_user=True
+        )
 
     async def get_accessible_workflow(
         self, db: AsyncSession, workflow_id: uuid.UUID, user_id: Optional[uuid.UUID] = None
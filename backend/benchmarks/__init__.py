@@ -0,0 +1 @@
+"""KAI-Fusion performance benchmarks."""
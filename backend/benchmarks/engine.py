@@ -0,0 +1,265 @@
+"""
+Engine Benchmark Suite
+======================
+
+Reproducible benchmarks for ``GraphBuilder.build_from_flow`` and the execution
+paths, on synthetic flows built from stub nodes (no network, no database, no LLM).
+
+Shapes (each at 10, 100 and 1,000 nodes by default):
+• linear  - StartNode → n stub nodes in a chain → EndNode
+• fanout  - StartNode → n parallel stub nodes → EndNode
+• loop    - StartNode → LoopNode ⇄ stub body, n iterations
+
+Reported per case (median of ``--repeats`` runs after one warm-up):
+• build_ms            - build_from_flow (validation, instantiation, compile)
+• execute_ms          - one synchronous run
+• node_overhead_us    - execute_ms per stub invocation; the stubs do no work, so
+                        this is pure engine overhead
+• stream_first_node_ms, stream_gap_p95_ms - event-stream latency: time to the first
+                        node_end event and 95th percentile gap between events
+• peak_rss_mb         - process peak RSS after the case (cases run smallest first)
+
+Timings are compared against a stored baseline relative to a fixed pure-Python
+calibration workload timed in the same run, so a slower or busier machine is not
+read as an engine regression. Any metric slower than
+``baseline * speed_ratio * (1 + threshold)`` is a regression and the run exits
+non-zero.
+
+Usage (from backend/):
+    python -m benchmarks.engine                          # compare with benchmarks/baseline.json
+    python -m benchmarks.engine --sizes 10,100 --threshold 0.75
+    python -m benchmarks.engine --update-baseline        # record a new baseline
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from app.core.graph_builder import GraphBuilder
+from benchmarks.flows import NODE_REGISTRY, StubNode, linear_chain, loop_flow, wide_fanout
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_REPEATS = 7
+DEFAULT_THRESHOLD = 0.5
+# Metrics compared against the baseline (lower is better)
+COMPARED_METRICS = ("build_ms", "execute_ms", "node_overhead_us", "stream_first_node_ms", "stream_gap_p95_ms", "peak_rss_mb")
+# Absolute slack so sub-millisecond metrics do not flap on scheduler noise
+ABSOLUTE_SLACK = {"build_ms": 2.0, "execute_ms": 2.0, "node_overhead_us": 50.0,
+                  "stream_first_node_ms": 2.0, "stream_gap_p95_ms": 1.0, "peak_rss_mb": 16.0}
+# Metrics that scale with machine speed; peak RSS does not
+TIMED_METRICS = ("build_ms", "execute_ms", "node_overhead_us", "stream_first_node_ms", "stream_gap_p95_ms")
+
+
+# ================================================================================
+# SYNTHETIC FLOWS
+# ================================================================================
+
+SHAPES: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "linear": linear_chain,
+    "fanout": wide_fanout,
+    "loop": loop_flow,
+}
+
+
+# ================================================================================
+# MEASUREMENT
+# ================================================================================
+
+def calibrate(rounds: int = 5) -> float:
+    """Median milliseconds of a fixed pure-Python workload (sorting and dict churn)."""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        table = {str(n): n for n in range(100_000)}
+        sorted(table, key=lambda key: table[key] % 977)
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence node debug prints and warning-level logs so terminal I/O does not dominate the timings."""
+    previous = logging.root.manager.disable
+    logging.disable(logging.WARNING)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        logging.disable(previous)
+
+
+async def _run_once(flow: Dict[str, Any]) -> Dict[str, float]:
+    builder = GraphBuilder(NODE_REGISTRY)
+    started = time.perf_counter()
+    builder.build_from_flow(flow)
+    build_s = time.perf_counter() - started
+
+    StubNode.invocations = 0
+    started = time.perf_counter()
+    result = await builder.execute({"input": "benchmark"})
+    execute_s = time.perf_counter() - started
+    if not result.get("success"):
+        raise RuntimeError(f"Benchmark flow failed: {result.get('error')}")
+    invocations = StubNode.invocations
+
+    stamps: List[Tuple[float, str]] = []
+    started = time.perf_counter()
+    async for event in await builder.execute({"input": "benchmark"}, stream=True):
+        stamps.append((time.perf_counter(), event.get("type", "")))
+        if event.get("type") == "error":
+            raise RuntimeError(f"Benchmark stream failed: {event.get('error')}")
+    first_node = next((t for t, kind in stamps if kind == "node_end"), stamps[-1][0])
+    gaps = sorted(b[0] - a[0] for a, b in zip(stamps, stamps[1:])) or [0.0]
+
+    return {
+        "build_ms": build_s * 1000,
+        "execute_ms": execute_s * 1000,
+        "node_overhead_us": execute_s / max(invocations, 1) * 1e6,
+        "stream_first_node_ms": (first_node - started) * 1000,
+        "stream_gap_p95_ms": gaps[min(len(gaps) - 1, int(len(gaps) * 0.95))] * 1000,
+        "node_executions": invocations,
+    }
+
+
+def run_case(shape: str, size: int, repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    """Benchmark one shape/size: one warm-up run, then the median of ``repeats`` runs."""
+    flow = SHAPES[shape](size)
+    with _quiet():
+        asyncio.run(_run_once(flow))
+        runs = [asyncio.run(_run_once(flow)) for _ in range(max(1, repeats))]
+    case = {key: round(statistics.median(run[key] for run in runs), 3) for key in runs[0]}
+    case["node_executions"] = int(case["node_executions"])
+    case["peak_rss_mb"] = _peak_rss_mb()
+    return case
+
+
+def run_suite(
+    sizes=DEFAULT_SIZES,
+    shapes=tuple(SHAPES),
+    repeats: int = DEFAULT_REPEATS,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    cases: Dict[str, Dict[str, Any]] = {}
+    calibration_ms = calibrate()
+    for size in sorted(sizes):
+        for shape in shapes:
+            name = f"{shape}-{size}"
+            cases[name] = run_case(shape, size, repeats)
+            if progress:
+                progress(name, cases[name])
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "repeats": repeats,
+        # Re-timed after the cases; the faster reading is the least disturbed one
+        "calibration_ms": min(calibration_ms, calibrate()),
+        "cases": cases,
+    }
+
+
+def speed_ratio(results: Dict[str, Any], baseline: Dict[str, Any]) -> float:
+    """How much slower this run's machine is than the baseline's (1.0 without calibration data)."""
+    current, previous = results.get("calibration_ms"), baseline.get("calibration_ms")
+    if not current or not previous:
+        return 1.0
+    return current / previous
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Regressions of ``results`` against ``baseline``, one message per metric."""
+    regressions = []
+    ratio = speed_ratio(results, baseline)
+    for name, case in results["cases"].items():
+        reference = baseline.get("cases", {}).get(name)
+        if not reference:
+            continue
+        for metric in COMPARED_METRICS:
+            current, previous = case.get(metric), reference.get(metric)
+            if current is None or previous is None:
+                continue
+            scale = ratio if metric in TIMED_METRICS else 1.0
+            limit = previous * scale * (1 + threshold) + ABSOLUTE_SLACK.get(metric, 0.0)
+            if current > limit:
+                regressions.append(
+                    f"{name} {metric}: {current:.2f} > {limit:.2f} "
+                    f"(baseline {previous:.2f}, machine speed x{scale:.2f}, +{threshold:.0%})"
+                )
+    return regressions
+
+
+def _format_case(name: str, case: Dict[str, Any]) -> str:
+    return (
+        f"{name:<12} build {case['build_ms']:>9.1f}ms  execute {case['execute_ms']:>9.1f}ms  "
+        f"per-node {case['node_overhead_us']:>8.1f}us  first-node {case['stream_first_node_ms']:>8.1f}ms  "
+        f"gap p95 {case['stream_gap_p95_ms']:>7.2f}ms  rss {case['peak_rss_mb']}MB"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KAI-Fusion engine benchmark suite")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown per metric before failing (0.25 = 25%%)")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    shapes = [s for s in args.shapes.split(",") if s]
+    unknown = set(shapes) - set(SHAPES)
+    if unknown:
+        parser.error(f"unknown shapes: {sorted(unknown)}")
+
+    results = run_suite(sizes, shapes, args.repeats, progress=lambda n, c: print(_format_case(n, c), flush=True))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    print(f"Machine speed relative to the baseline: x{speed_ratio(results, baseline):.2f}")
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(regressions)} regression(s) against {baseline_path.name} at +{args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
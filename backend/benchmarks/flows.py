@@ -0,0 +1,81 @@
+"""
+Synthetic Flows
+===============
+
+Stub processor node and synthetic flow builders shared by the engine
+benchmarks and tests. The stub does no I/O, so flows built from it exercise
+only GraphBuilder.
+"""
+
+from typing import Any, Dict, Optional
+
+from app.nodes.base import NodeInput, NodeOutput, NodeType, ProcessorNode
+from app.nodes.default.end_node import EndNode
+from app.nodes.default.start_node import StartNode
+
+
+class StubNode(ProcessorNode):
+    """Processor node that returns a constant; counts its invocations."""
+
+    invocations = 0
+
+    def __init__(self):
+        super().__init__()
+        self._metadata = {
+            "name": "StubNode",
+            "display_name": "Stub",
+            "description": "Returns a constant output without any I/O, for engine benchmarks and tests",
+            "node_type": NodeType.PROCESSOR,
+            "inputs": [
+                NodeInput(name="input", type="any", description="Output of the upstream node",
+                          is_connection=True, required=False),
+            ],
+            "outputs": [
+                NodeOutput(name="output", type="any", description="Constant stub output"),
+            ],
+        }
+
+    def execute(self, inputs: Dict[str, Any], connected_nodes: Dict[str, Any]) -> Dict[str, Any]:
+        StubNode.invocations += 1
+        return {"output": "ok"}
+
+
+NODE_REGISTRY = {"StartNode": StartNode, "EndNode": EndNode, "StubNode": StubNode}
+
+
+def node(node_id: str, node_type: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return {"id": node_id, "type": node_type, "position": {"x": 0, "y": 0}, "data": data or {}}
+
+
+def edge(source: str, target: str, target_handle: str = "input") -> Dict[str, Any]:
+    return {"id": f"{source}->{target}", "source": source, "target": target,
+            "sourceHandle": "output", "targetHandle": target_handle}
+
+
+def linear_chain(size: int) -> Dict[str, Any]:
+    """StartNode → ``size`` chained stubs → EndNode."""
+    ids = [f"stub_{i}" for i in range(size)]
+    nodes = [node("start", "StartNode")] + [node(i, "StubNode") for i in ids] + [node("end", "EndNode")]
+    path = ["start"] + ids
+    edges = [edge(a, b) for a, b in zip(path, path[1:])] + [edge(ids[-1], "end", "target")]
+    return {"nodes": nodes, "edges": edges}
+
+
+def wide_fanout(size: int) -> Dict[str, Any]:
+    """StartNode → ``size`` parallel stubs → EndNode."""
+    ids = [f"stub_{i}" for i in range(size)]
+    nodes = [node("start", "StartNode")] + [node(i, "StubNode") for i in ids] + [node("end", "EndNode")]
+    edges = [edge("start", i) for i in ids] + [edge(i, "end", "target") for i in ids]
+    return {"nodes": nodes, "edges": edges}
+
+
+def loop_flow(iterations: int) -> Dict[str, Any]:
+    """StartNode → LoopNode ⇄ stub body, ``iterations`` body runs."""
+    nodes = [
+        node("start", "StartNode"),
+        # The counter is incremented before the exit check, so n body runs need n + 1
+        node("loop", "LoopNode", {"max_iterations": iterations + 1}),
+        node("body", "StubNode"),
+    ]
+    edges = [edge("start", "loop"), edge("loop", "body"), edge("body", "loop")]
+    return {"nodes": nodes, "edges": edges}
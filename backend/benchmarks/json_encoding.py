@@ -0,0 +1,155 @@
+"""
+JSON Encoding Benchmark
+=======================
+
+Times the JSON paths of execution results and SSE frames on large synthetic
+agent transcripts (LangChain messages and documents, UUIDs, datetimes,
+Decimals and an opaque runnable), without network or database:
+
+• encode stdlib  - make_json_serializable() walk + json.dumps (the previous path)
+• encode orjson  - dumps_bytes(): one native orjson pass with registered type handlers
+• decode stdlib  - json.loads of the encoded transcript
+• decode orjson  - safe_json_loads (orjson.loads)
+
+Both encoders must produce the same JSON; a mismatch aborts the run. Each case
+reports the median of ``--repeats`` runs after one warm-up, the payload size and
+the orjson speedup. ``--min-speedup`` makes the run exit non-zero when the
+orjson encoder is not at least that many times faster on every case.
+
+Usage (from backend/):
+    python -m benchmarks.json_encoding
+    python -m benchmarks.json_encoding --turns 1000,10000 --repeats 5
+    python -m benchmarks.json_encoding --min-speedup 2
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+from app.core.json_utils import ORJSON_AVAILABLE, dumps_bytes, make_json_serializable, safe_json_loads
+
+DEFAULT_TURNS = (100, 1000, 5000)
+DEFAULT_REPEATS = 5
+
+
+def agent_transcript(turns: int) -> Dict[str, Any]:
+    """An execution result carrying ``turns`` chat messages, retrieved sources and step records."""
+    started = datetime(2025, 7, 1, tzinfo=timezone.utc)
+    return {
+        "session_id": uuid.UUID(int=turns),
+        "messages": [
+            (HumanMessage if n % 2 else AIMessage)(content=f"turn {n} " + "lorem ipsum dolor " * 30)
+            for n in range(turns)
+        ],
+        "sources": [
+            Document(page_content="chunk text " * 50, metadata={"id": uuid.UUID(int=n), "at": started})
+            for n in range(turns // 4)
+        ],
+        "steps": [
+            {"node_id": f"agent_{n % 8}", "at": started, "cost": Decimal("0.0025"), "tokens": n}
+            for n in range(turns)
+        ],
+        "agent": RunnableLambda(lambda x: x),
+    }
+
+
+def encode_stdlib(obj: Any) -> bytes:
+    return json.dumps(make_json_serializable(obj), ensure_ascii=False).encode("utf-8")
+
+
+def _median_ms(fn: Callable[[], Any], repeats: int) -> float:
+    fn()  # warm-up
+    timings = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def run_case(turns: int, repeats: int = DEFAULT_REPEATS) -> Dict[str, Any]:
+    """Benchmark one transcript size; raises if the two encoders disagree."""
+    transcript = agent_transcript(turns)
+    stdlib_payload, orjson_payload = encode_stdlib(transcript), dumps_bytes(transcript)
+    if json.loads(stdlib_payload) != json.loads(orjson_payload):
+        raise RuntimeError(f"Encoders disagree on the {turns}-turn transcript")
+
+    case = {
+        "payload_kb": round(len(orjson_payload) / 1024, 1),
+        "encode_stdlib_ms": _median_ms(lambda: encode_stdlib(transcript), repeats),
+        "encode_orjson_ms": _median_ms(lambda: dumps_bytes(transcript), repeats),
+        "decode_stdlib_ms": _median_ms(lambda: json.loads(orjson_payload), repeats),
+        "decode_orjson_ms": _median_ms(lambda: safe_json_loads(orjson_payload), repeats),
+    }
+    case["encode_speedup"] = case["encode_stdlib_ms"] / max(case["encode_orjson_ms"], 1e-9)
+    case["decode_speedup"] = case["decode_stdlib_ms"] / max(case["decode_orjson_ms"], 1e-9)
+    return {key: round(value, 3) for key, value in case.items()}
+
+
+def run_suite(
+    turns=DEFAULT_TURNS,
+    repeats: int = DEFAULT_REPEATS,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    cases: Dict[str, Dict[str, Any]] = {}
+    for count in sorted(turns):
+        name = f"transcript-{count}"
+        cases[name] = run_case(count, repeats)
+        if progress:
+            progress(name, cases[name])
+    return {"orjson": ORJSON_AVAILABLE, "repeats": repeats, "cases": cases}
+
+
+def check_speedup(results: Dict[str, Any], min_speedup: float) -> List[str]:
+    """Cases whose orjson encode is less than ``min_speedup`` times faster than the stdlib path."""
+    return [
+        f"{name} encode speedup x{case['encode_speedup']:.2f} < x{min_speedup:.2f}"
+        for name, case in results["cases"].items()
+        if case["encode_speedup"] < min_speedup
+    ]
+
+
+def _format_case(name: str, case: Dict[str, Any]) -> str:
+    return (
+        f"{name:<18} {case['payload_kb']:>9.1f}KB  "
+        f"encode {case['encode_stdlib_ms']:>8.2f} -> {case['encode_orjson_ms']:>7.2f}ms (x{case['encode_speedup']:.1f})  "
+        f"decode {case['decode_stdlib_ms']:>8.2f} -> {case['decode_orjson_ms']:>7.2f}ms (x{case['decode_speedup']:.1f})"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KAI-Fusion JSON encoding benchmark")
+    parser.add_argument("--turns", default=",".join(map(str, DEFAULT_TURNS)))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--min-speedup", type=float, help="fail unless orjson encodes at least this many times faster")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if not ORJSON_AVAILABLE:
+        print("orjson is not installed; dumps_bytes() falls back to the stdlib path")
+    turns = [int(t) for t in args.turns.split(",") if t]
+    results = run_suite(turns, args.repeats, progress=lambda n, c: print(_format_case(n, c), flush=True))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.min_speedup is None:
+        return 0
+    failures = check_speedup(results, args.min_speedup)
+    for line in failures:
+        print(f"TOO SLOW {line}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
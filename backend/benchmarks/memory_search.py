@@ -0,0 +1,284 @@
+"""
+Memory Search Benchmark
+=======================
+
+Seeds one user with a synthetic memory corpus (100,000 memories by default) in
+the Postgres configured in ``DATABASE_URL`` and times memory search over it:
+
+• ranked - MemoryRepo.search_memories_ranked: ``search_vector @@ plainto_tsquery``
+           ordered by ``ts_rank_cd``, served by the GIN index on the generated column
+• ilike  - the previous path: ``LOWER(content) LIKE '%q%' OR LOWER(context) LIKE '%q%'``
+           ordered by ``created_at`` (a scan of the user's memories)
+
+Queries cover a common, a mid-frequency and a rare corpus word, plus a phrase
+planted in a fixed share of the memories. Each (path, query) pair runs
+``--repeats`` times after one warm-up; the report gives p50/p95/max in
+milliseconds, the number of rows returned and the ranked-path speedup at p50.
+
+Prerequisites: a reachable Postgres in ``DATABASE_URL`` with the schema created
+(``python migrations/database_setup.py``). The run creates its own user and
+memories and deletes them afterwards (``--keep`` leaves them in place).
+
+Usage (from backend/):
+    python -m benchmarks.memory_search
+    python -m benchmarks.memory_search --memories 10000 --repeats 50
+    python -m benchmarks.memory_search --min-speedup 5
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from benchmarks.webhook_load import percentile
+
+DEFAULT_MEMORIES = 100_000
+DEFAULT_REPEATS = 20
+DEFAULT_LIMIT = 10
+SEED_BATCH_SIZE = 5_000
+VOCABULARY_SIZE = 5_000
+# Phrase planted in one memory out of PLANTED_EVERY
+PLANTED_PHRASE = "quarterly invoice reconciliation"
+PLANTED_EVERY = 1_000
+PATHS = ("ranked", "ilike")
+
+_SYLLABLES = ("ka", "lo", "mi", "ren", "tor", "vas", "sel", "dun", "pri", "gal", "bex", "fen", "rho", "tam", "qui")
+
+
+# ================================================================================
+# SYNTHETIC CORPUS
+# ================================================================================
+
+def vocabulary(size: int = VOCABULARY_SIZE) -> List[str]:
+    """Distinct pseudo-words (``n`` spelled in base-15 syllables), most frequent first."""
+    words = []
+    for n in range(size):
+        digits = [(n // len(_SYLLABLES) ** power) % len(_SYLLABLES) for power in range(4)]
+        words.append("".join(_SYLLABLES[digit] for digit in digits))
+    return words
+
+
+def memory_texts(count: int, seed: int = 7) -> Iterator[Tuple[str, str]]:
+    """``(content, context)`` pairs with Zipf-distributed words; every PLANTED_EVERY-th holds the phrase."""
+    rng = random.Random(seed)
+    words = vocabulary()
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    for n in range(count):
+        content = rng.choices(words, weights, k=rng.randint(12, 40))
+        if n % PLANTED_EVERY == 0:
+            content[rng.randrange(len(content))] = PLANTED_PHRASE
+        context = rng.choices(words, weights, k=rng.randint(4, 12))
+        yield " ".join(content), " ".join(context)
+
+
+def benchmark_queries() -> Dict[str, str]:
+    words = vocabulary()
+    return {
+        "common": words[2],
+        "medium": words[300],
+        "rare": words[4000],
+        "phrase": PLANTED_PHRASE,
+    }
+
+
+# ================================================================================
+# SEARCH PATHS
+# ================================================================================
+
+def ilike_search(db, user_id: str, query: str, limit: int = DEFAULT_LIMIT):
+    """The search_memories_by_content query before the tsvector index."""
+    from sqlalchemy import desc, func
+
+    from app.models.memory import Memory
+
+    search_filter = func.lower(Memory.content).contains(query.lower()) | \
+        func.lower(Memory.context).contains(query.lower())
+    return db.query(Memory).filter(
+        Memory.user_id == uuid.UUID(user_id),
+        search_filter
+    ).order_by(desc(Memory.created_at)).limit(limit).all()
+
+
+def search_paths() -> Dict[str, Callable]:
+    from app.services.memory.repo import MemoryRepo
+
+    return {"ranked": MemoryRepo().search_memories_ranked, "ilike": ilike_search}
+
+
+def time_query(search: Callable[[], Sequence[Any]], repeats: int) -> Dict[str, float]:
+    """p50/p95/max of ``repeats`` calls after one warm-up, with the rows returned."""
+    rows = len(search())
+    durations = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        search()
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+    return {
+        "rows": rows,
+        "p50_ms": round(percentile(durations, 50), 3),
+        "p95_ms": round(percentile(durations, 95), 3),
+        "max_ms": round(durations[-1], 3),
+    }
+
+
+def speedups(results: Dict[str, Any]) -> Dict[str, float]:
+    """ilike p50 / ranked p50 per query."""
+    return {
+        name: round(paths["ilike"]["p50_ms"] / max(paths["ranked"]["p50_ms"], 1e-6), 2)
+        for name, paths in results["queries"].items()
+        if "ilike" in paths and "ranked" in paths
+    }
+
+
+def check_speedup(results: Dict[str, Any], min_speedup: float) -> List[str]:
+    return [
+        f"{name} ranked speedup x{ratio:.2f} < x{min_speedup:.2f}"
+        for name, ratio in speedups(results).items()
+        if ratio < min_speedup
+    ]
+
+
+# ================================================================================
+# RUN
+# ================================================================================
+
+@contextlib.contextmanager
+def seeded_memories(count: int, keep: bool = False) -> Iterator[str]:
+    """Create the benchmark user and its memories; delete them afterwards. Yields the user id."""
+    from sqlalchemy import delete, insert, text
+
+    from app.core import database
+    from app.models.memory import Memory
+    from app.models.user import User
+
+    run_id = uuid.uuid4().hex[:12]
+    with database.SessionLocal() as db:
+        user = User(email=f"membench+{run_id}@kai-fusion.local", full_name="Memory search benchmark",
+                    password_hash="!", status="active")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+        started_at = datetime.utcnow() - timedelta(seconds=count)
+        batch = []
+        for n, (content, context) in enumerate(memory_texts(count)):
+            at = started_at + timedelta(seconds=n)
+            batch.append({
+                "id": uuid.uuid4(), "user_id": user_id, "session_id": f"membench-{run_id}-{n // 50}",
+                "content": content, "context": context, "memory_metadata": {}, "source_type": "chat",
+                "created_at": at, "updated_at": at,
+            })
+            if len(batch) == SEED_BATCH_SIZE:
+                db.execute(insert(Memory), batch)
+                batch = []
+        if batch:
+            db.execute(insert(Memory), batch)
+        db.commit()
+        db.execute(text("ANALYZE memories"))
+        db.commit()
+
+    try:
+        yield str(user_id)
+    finally:
+        if not keep:
+            with database.SessionLocal() as db:
+                db.execute(delete(Memory).where(Memory.user_id == user_id))
+                db.execute(delete(User).where(User.id == user_id))
+                db.commit()
+
+
+def run_benchmark(
+    memories: int = DEFAULT_MEMORIES,
+    repeats: int = DEFAULT_REPEATS,
+    paths: Sequence[str] = PATHS,
+    keep: bool = False,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    from app.core import database
+
+    searches = search_paths()
+    queries: Dict[str, Dict[str, Any]] = {}
+    seeding = time.perf_counter()
+    with seeded_memories(memories, keep) as user_id:
+        seed_s = time.perf_counter() - seeding
+        with database.SessionLocal() as db:
+            for name, query in benchmark_queries().items():
+                queries[name] = {
+                    path: time_query(functools.partial(searches[path], db, user_id, query, DEFAULT_LIMIT), repeats)
+                    for path in paths
+                }
+                if progress:
+                    progress(name, {"query": query, **queries[name]})
+
+    return {
+        "database": os.getenv("DATABASE_URL", "").rsplit("@", 1)[-1],
+        "memories": memories,
+        "repeats": repeats,
+        "seed_s": round(seed_s, 1),
+        "queries": queries,
+    }
+
+
+def format_query(name: str, row: Dict[str, Any]) -> str:
+    lines = [f"{name} ({row['query']!r})"]
+    for path in PATHS:
+        if path in row:
+            stats = row[path]
+            lines.append(
+                f"  {path:<8} rows {stats['rows']:>3}  p50 {stats['p50_ms']:>9.2f}ms  "
+                f"p95 {stats['p95_ms']:>9.2f}ms  max {stats['max_ms']:>9.2f}ms"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KAI-Fusion memory search benchmark")
+    parser.add_argument("--memories", type=int, default=DEFAULT_MEMORIES, help="memories seeded for the benchmark user")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--paths", default=",".join(PATHS))
+    parser.add_argument("--min-speedup", type=float,
+                        help="fail unless the ranked path is at least this many times faster at p50 on every query")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark user and its memories")
+    args = parser.parse_args(argv)
+
+    paths = [p for p in args.paths.split(",") if p]
+    unknown = set(paths) - set(PATHS)
+    if unknown:
+        parser.error(f"unknown paths: {sorted(unknown)}")
+    if not os.getenv("DATABASE_URL"):
+        parser.error("DATABASE_URL must point at a Postgres database with the schema created")
+
+    logging.disable(logging.WARNING)
+    print(f"Seeding {args.memories} memories...", flush=True)
+    results = run_benchmark(
+        memories=args.memories,
+        repeats=args.repeats,
+        paths=paths,
+        keep=args.keep,
+        progress=lambda name, row: print(format_query(name, row), flush=True),
+    )
+    print(f"Seeded in {results['seed_s']}s; ranked speedup at p50: {speedups(results)}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.min_speedup is None:
+        return 0
+    failures = check_speedup(results, args.min_speedup)
+    for line in failures:
+        print(f"TOO SLOW {line}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
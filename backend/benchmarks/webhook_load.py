@@ -0,0 +1,459 @@
+"""
+Webhook Ingest Load Test
+========================
+
+Drives the FastAPI app in-process (httpx ``ASGITransport``, application lifespan
+included) against the Postgres configured in ``DATABASE_URL``, with a trivial
+stub workflow (WebhookTrigger → EndNode), and reports per-stage latency so
+ingest SLOs can be set and checked.
+
+Routes (each run at every concurrency level of the ramp):
+• node     - POST /api/v1/webhook/{id}: workflow lookup by webhook path, graph build
+             and execution (the WebhookTrigger node route)
+• trigger  - POST /api/v1/webhooks/trigger/{id}: endpoint lookup, token bucket rate
+             limiting and buffered stats writes (endpoint without a bound workflow,
+             so no loopback HTTP execution is measured)
+
+Stages (timed by wrapping the functions on the request path for the duration of the run):
+• request         - end to end, as seen by the client
+• route_lookup    - webhook_trigger.find_workflow (called up to three times per node request)
+• endpoint_lookup - WebhookService.get_endpoint_by_id
+• rate_limit      - TokenBucketRateLimiter.try_acquire
+• stats_record    - WebhookStatsWriter.record_event / record_stats (request path)
+• stats_flush     - WebhookStatsWriter.flush (background batch write, forced after each level)
+• graph_build     - WorkflowExecutionEnhancer.enhanced_build
+• execution       - WorkflowExecutionEnhancer.enhanced_execute until its stream is drained
+
+Each table row gives count, p50/p95/p99/max in milliseconds and the error rate.
+Errors are 5xx responses and transport failures for ``request``, a missing workflow
+for ``route_lookup`` and raised exceptions elsewhere; 429 responses are reported
+separately as the rate-limited share.
+
+Prerequisites: a reachable Postgres in ``DATABASE_URL`` with the schema created
+(``python migrations/database_setup.py``). The run creates its own user, workflow
+and webhook endpoint and deletes them afterwards (``--keep`` leaves them in place).
+
+Usage (from backend/):
+    python -m benchmarks.webhook_load
+    python -m benchmarks.webhook_load --concurrency 1,8,32,128 --requests 500
+    python -m benchmarks.webhook_load --slo request.p99=250 --slo route_lookup.p95=20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import inspect
+import io
+import json
+import logging
+import os
+import secrets
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_CONCURRENCY = (1, 4, 16, 64)
+DEFAULT_REQUESTS = 200
+ROUTES = ("node", "trigger")
+STAGE_ORDER = (
+    "request", "route_lookup", "endpoint_lookup", "rate_limit",
+    "stats_record", "stats_flush", "graph_build", "execution",
+)
+
+
+# ================================================================================
+# STAGE TIMINGS
+# ================================================================================
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending sequence (``q`` in 0-100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[min(len(sorted_values), int(rank)) - 1]
+
+
+class StageRecorder:
+    """Collects (duration, ok) samples per stage."""
+
+    def __init__(self):
+        self._samples: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float, ok: bool = True) -> None:
+        self._samples[stage].append((seconds, ok))
+
+    @contextlib.contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(stage, time.perf_counter() - started, ok)
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        rows = {}
+        for stage, samples in self._samples.items():
+            durations = sorted(seconds * 1000 for seconds, _ in samples)
+            errors = sum(1 for _, ok in samples if not ok)
+            rows[stage] = {
+                "count": len(samples),
+                "p50_ms": round(percentile(durations, 50), 3),
+                "p95_ms": round(percentile(durations, 95), 3),
+                "p99_ms": round(percentile(durations, 99), 3),
+                "max_ms": round(durations[-1], 3),
+                "error_rate": round(errors / len(samples), 4),
+            }
+        order = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+        return dict(sorted(rows.items(), key=lambda item: order.get(item[0], len(order))))
+
+
+def _timed(recorder: StageRecorder, stage: str, fn: Callable, is_ok: Callable[[Any], bool] = lambda _: True) -> Callable:
+    """Wrap a sync or async function so each call records a sample for ``stage``."""
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+            except BaseException:
+                recorder.record(stage, time.perf_counter() - started, False)
+                raise
+            recorder.record(stage, time.perf_counter() - started, is_ok(result))
+            return result
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            recorder.record(stage, time.perf_counter() - started, False)
+            raise
+        recorder.record(stage, time.perf_counter() - started, is_ok(result))
+        return result
+    return wrapper
+
+
+def _timed_execution(recorder: StageRecorder, fn: Callable) -> Callable:
+    """Like ``_timed`` for enhanced_execute, but a returned stream is timed until it is drained."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException:
+            recorder.record("execution", time.perf_counter() - started, False)
+            raise
+        if not inspect.isasyncgen(result):
+            recorder.record("execution", time.perf_counter() - started, True)
+            return result
+
+        async def drain():
+            completed = failed = False
+            try:
+                async for event in result:
+                    failed = failed or (isinstance(event, dict) and event.get("type") == "error")
+                    yield event
+                completed = True
+            finally:
+                recorder.record("execution", time.perf_counter() - started, completed and not failed)
+        return drain()
+    return wrapper
+
+
+@contextlib.contextmanager
+def stage_probes(recorder: StageRecorder) -> Iterator[None]:
+    """Install timing wrappers on the webhook request path; restored on exit."""
+    from app.core.rate_limiter import TokenBucketRateLimiter
+    from app.core.workflow_enhancer import WorkflowExecutionEnhancer
+    from app.nodes.triggers import webhook_trigger
+    from app.services.webhook_service import WebhookService
+    from app.services.webhook_stats_writer import WebhookStatsWriter
+
+    found = lambda result: result is not None
+    patches = [
+        (webhook_trigger, "find_workflow", _timed(recorder, "route_lookup", webhook_trigger.find_workflow, found)),
+        (WebhookService, "get_endpoint_by_id", _timed(recorder, "endpoint_lookup", WebhookService.get_endpoint_by_id, found)),
+        (TokenBucketRateLimiter, "try_acquire", _timed(recorder, "rate_limit", TokenBucketRateLimiter.try_acquire)),
+        (WebhookStatsWriter, "record_event", _timed(recorder, "stats_record", WebhookStatsWriter.record_event)),
+        (WebhookStatsWriter, "record_stats", _timed(recorder, "stats_record", WebhookStatsWriter.record_stats)),
+        (WebhookStatsWriter, "flush", _timed(recorder, "stats_flush", WebhookStatsWriter.flush)),
+        (WorkflowExecutionEnhancer, "enhanced_build", _timed(recorder, "graph_build", WorkflowExecutionEnhancer.enhanced_build)),
+        (WorkflowExecutionEnhancer, "enhanced_execute", _timed_execution(recorder, WorkflowExecutionEnhancer.enhanced_execute)),
+    ]
+    originals = [(owner, name, owner.__dict__[name]) for owner, name, _ in patches]
+    try:
+        for owner, name, wrapped in patches:
+            setattr(owner, name, wrapped)
+        yield
+    finally:
+        for owner, name, original in originals:
+            setattr(owner, name, original)
+
+
+# ================================================================================
+# LOAD GENERATION
+# ================================================================================
+
+class _DiscardingStream(io.TextIOBase):
+    """stdout sink that drops node debug output without any file I/O on the event loop."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+async def drive(
+    send: Callable[[], Any],
+    total: int,
+    concurrency: int,
+    recorder: StageRecorder,
+) -> Dict[str, Any]:
+    """
+    Closed-loop load: ``concurrency`` workers issue ``total`` requests through
+    ``send`` (a coroutine factory returning a response with ``status_code``).
+    """
+    statuses: Counter = Counter()
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await send()
+                status_code = response.status_code
+            except Exception as e:
+                status_code = type(e).__name__
+            recorder.record("request", time.perf_counter() - started, not (isinstance(status_code, str) or status_code >= 500))
+            statuses[status_code] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, total)))))
+    duration = time.perf_counter() - started
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(total / duration, 1) if duration else 0.0,
+        "rate_limited": round(statuses.get(429, 0) / total, 4) if total else 0.0,
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=lambda kv: str(kv[0]))},
+    }
+
+
+def _stub_flow(path: str) -> Dict[str, Any]:
+    return {
+        "nodes": [
+            {"id": "WebhookTrigger__loadtest", "type": "WebhookTrigger", "position": {"x": 0, "y": 0},
+             "data": {"path": path}},
+            {"id": "EndNode__loadtest", "type": "EndNode", "position": {"x": 300, "y": 0}, "data": {}},
+        ],
+        "edges": [
+            {"id": "loadtest-edge", "source": "WebhookTrigger__loadtest", "target": "EndNode__loadtest",
+             "sourceHandle": "output", "targetHandle": "target"},
+        ],
+    }
+
+
+@contextlib.asynccontextmanager
+async def load_test_fixtures(rate_limit_per_minute: int, keep: bool = False):
+    """Create the load-test user, stub workflow and trigger endpoint; delete them afterwards."""
+    from sqlalchemy import delete
+
+    from app.core.database import get_db_session_context
+    from app.models.execution import WorkflowExecution
+    from app.models.user import User
+    from app.models.webhook import WebhookEndpoint, WebhookEvent
+    from app.models.workflow import Workflow
+
+    run_id = uuid.uuid4().hex[:12]
+    node_webhook_id = f"loadtest-{run_id}"
+    # Trigger endpoint ids must match WebhookEventCreate's ^wh_[a-zA-Z0-9]{8,}$
+    trigger_webhook_id = f"wh_loadtest{run_id}"
+    token = secrets.token_urlsafe(32)
+
+    async with get_db_session_context() as db:
+        user = User(email=f"loadtest+{run_id}@kai-fusion.local", full_name="Webhook load test",
+                    password_hash="!", status="active")
+        db.add(user)
+        await db.flush()
+        workflow = Workflow(user_id=user.id, name=f"Webhook load test {run_id}", flow_data=_stub_flow(node_webhook_id))
+        db.add(workflow)
+        db.add(WebhookEndpoint(
+            webhook_id=trigger_webhook_id,
+            node_id="WebhookTrigger__loadtest",
+            endpoint_path=f"/{trigger_webhook_id}",
+            secret_token=token,
+            config={"rate_limit_per_minute": rate_limit_per_minute},
+        ))
+        await db.commit()
+        user_id, workflow_id = user.id, workflow.id
+
+    try:
+        yield {"node_webhook_id": node_webhook_id, "trigger_webhook_id": trigger_webhook_id, "token": token}
+    finally:
+        if not keep:
+            async with get_db_session_context() as db:
+                await db.execute(delete(WebhookEvent).where(WebhookEvent.webhook_id == trigger_webhook_id))
+                await db.execute(delete(WebhookEndpoint).where(WebhookEndpoint.webhook_id == trigger_webhook_id))
+                await db.execute(delete(WorkflowExecution).where(WorkflowExecution.workflow_id == workflow_id))
+                await db.execute(delete(Workflow).where(Workflow.id == workflow_id))
+                await db.execute(delete(User).where(User.id == user_id))
+                await db.commit()
+
+
+async def run_load_test(
+    concurrency_levels: Sequence[int] = DEFAULT_CONCURRENCY,
+    requests_per_level: int = DEFAULT_REQUESTS,
+    routes: Sequence[str] = ROUTES,
+    rate_limit_per_minute: int = 10000,
+    keep: bool = False,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    import httpx
+
+    from app.core.constants import API_START, API_VERSION
+    from app.services.webhook_stats_writer import get_webhook_stats_writer
+    from main import app
+
+    recorder = StageRecorder()
+    levels: List[Dict[str, Any]] = []
+    payload = {"event_type": "loadtest.ping", "data": {"message": "hello", "n": 1}}
+
+    async with app.router.lifespan_context(app), load_test_fixtures(rate_limit_per_minute, keep) as fx:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+            senders = {
+                "node": lambda: client.post(f"/{API_START}/{API_VERSION}/webhook/{fx['node_webhook_id']}", json=payload),
+                "trigger": lambda: client.post(
+                    f"/{API_START}/{API_VERSION}/webhooks/trigger/{fx['trigger_webhook_id']}",
+                    json=payload,
+                    headers={"Authorization": f"Bearer {fx['token']}"},
+                ),
+            }
+            writer = get_webhook_stats_writer()
+            with stage_probes(recorder):
+                # One untimed request per route so imports and pools are warm
+                for route in routes:
+                    await senders[route]()
+                await writer.flush()
+                for concurrency in concurrency_levels:
+                    for route in routes:
+                        recorder.reset()
+                        # Nodes print debug output; keep it off the terminal while measuring
+                        with contextlib.redirect_stdout(_DiscardingStream()):
+                            level = await drive(senders[route], requests_per_level, concurrency, recorder)
+                            await writer.flush()
+                        level = {"route": route, **level, "stages": recorder.summary()}
+                        levels.append(level)
+                        if progress:
+                            progress(f"{route}@{concurrency}", level)
+
+    return {
+        "database": os.getenv("DATABASE_URL", "").rsplit("@", 1)[-1],
+        "requests_per_level": requests_per_level,
+        "rate_limit_per_minute": rate_limit_per_minute,
+        "levels": levels,
+    }
+
+
+# ================================================================================
+# REPORTING
+# ================================================================================
+
+def format_level(level: Dict[str, Any]) -> str:
+    lines = [
+        f"{level['route']} route, concurrency {level['concurrency']}: {level['requests']} requests in "
+        f"{level['duration_s']:.2f}s ({level['throughput_rps']} req/s), 429 {level['rate_limited']:.1%}, "
+        f"statuses {level['statuses']}",
+        f"  {'stage':<16}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>9}",
+    ]
+    for stage, row in level["stages"].items():
+        lines.append(
+            f"  {stage:<16}{row['count']:>7}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+            f"{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}{row['error_rate']:>9.2%}"
+        )
+    return "\n".join(lines)
+
+
+def parse_slo(spec: str) -> Tuple[str, str, float]:
+    """``stage.metric=limit``, e.g. ``request.p99=250`` (ms) or ``request.errors=0.01`` (rate)."""
+    try:
+        key, limit = spec.split("=", 1)
+        stage, metric = key.split(".", 1)
+        column = {"errors": "error_rate"}.get(metric, f"{metric}_ms")
+        return stage, column, float(limit)
+    except ValueError:
+        raise ValueError(f"Invalid SLO '{spec}', expected stage.metric=limit (e.g. request.p99=250)")
+
+
+def check_slos(results: Dict[str, Any], slos: Sequence[Tuple[str, str, float]]) -> List[str]:
+    """SLO violations across all levels, one message per stage/metric/level."""
+    violations = []
+    for level in results["levels"]:
+        for stage, column, limit in slos:
+            value = level["stages"].get(stage, {}).get(column)
+            if value is not None and value > limit:
+                violations.append(
+                    f"{level['route']}@{level['concurrency']} {stage} {column}: {value} > {limit}"
+                )
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KAI-Fusion webhook ingest load test")
+    parser.add_argument("--concurrency", default=",".join(map(str, DEFAULT_CONCURRENCY)),
+                        help="comma-separated concurrency ramp")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="requests per route and level")
+    parser.add_argument("--routes", default=",".join(ROUTES))
+    parser.add_argument("--rate-limit", type=int, default=10000,
+                        help="rate_limit_per_minute of the trigger endpoint (lower it to load the 429 path)")
+    parser.add_argument("--slo", action="append", default=[],
+                        help="stage.metric=limit, metric one of p50/p95/p99/max (ms) or errors (rate); repeatable")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--keep", action="store_true", help="keep the load-test user, workflow and endpoint")
+    args = parser.parse_args(argv)
+
+    routes = [r for r in args.routes.split(",") if r]
+    unknown = set(routes) - set(ROUTES)
+    if unknown:
+        parser.error(f"unknown routes: {sorted(unknown)}")
+    try:
+        slos = [parse_slo(spec) for spec in args.slo]
+    except ValueError as e:
+        parser.error(str(e))
+    if not os.getenv("DATABASE_URL"):
+        parser.error("DATABASE_URL must point at a Postgres database with the schema created")
+
+    logging.disable(logging.WARNING)
+    results = asyncio.run(run_load_test(
+        concurrency_levels=[int(c) for c in args.concurrency.split(",") if c],
+        requests_per_level=args.requests,
+        routes=routes,
+        rate_limit_per_minute=args.rate_limit,
+        keep=args.keep,
+        progress=lambda name, level: print(format_level(level) + "\n", flush=True),
+    ))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    violations = check_slos(results, slos)
+    for line in violations:
+        print(f"SLO VIOLATION {line}")
+    if slos:
+        print(f"{len(violations)} SLO violation(s)")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -77,8 +77,17 @@ from fastapi import APIRouter
 # Core imports
 from app.core.node_registry import node_registry
 from app.core.engine import get_engine
+from app.core import database
 from app.core.database import get_db_session, check_database_health, get_database_stats
-from app.core.tracing import setup_tracing
+from app.core.tracing import setup_tracing, get_distributed_tracer
+from app.core.trace_export import get_span_exporter
+from app.core.checkpointer import interrupt_orphaned_executions
+from app.core.vector_store_registry import get_vector_store_registry
+from app.core.llm_client_registry import get_llm_client_registry
+from app.core.search_cache import get_search_cache
+from app.services.webhook_stats_writer import get_webhook_stats_writer
+from app.core.webhook_event_bus import get_webhook_event_bus
+from app.core.session_memory_store import get_session_memory_store
 from app.core.error_handlers import register_exception_handlers
 from app.core.constants import PORT, ROOT_PATH, SSL_KEYFILE, SSL_CERTFILE,API_START,API_VERSION
 # Middleware imports
@@ -158,12 +167,48 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}")
         raise e
     
+    try:
+        interrupted = await interrupt_orphaned_executions()
+        if interrupted:
+            logger.info(f"Marked {interrupted} orphaned checkpointed executions as interrupted")
+    except Exception as e:
+        logger.error(f"Failed to sweep orphaned executions: {e}")
+
+    await get_webhook_stats_writer().start()
+    await get_webhook_event_bus().start()
+    await get_llm_client_registry().start()
+    await database.replica_lag_monitor.start(database.replica_engine)
+    
     logger.info("Backend initialization complete - KAI Fusion Ready!")
     
     yield
     
     # Cleanup
     logger.info("Shutting down KAI Fusion Backend...")
+    try:
+        await database.replica_lag_monitor.stop()
+    except Exception as e:
+        logger.error(f"Failed to stop replica lag monitor: {e}")
+    try:
+        await get_webhook_event_bus().stop()
+    except Exception as e:
+        logger.error(f"Failed to stop webhook event bus: {e}")
+    try:
+        await get_webhook_stats_writer().stop()
+    except Exception as e:
+        logger.error(f"Failed to flush webhook stats: {e}")
+    try:
+        get_span_exporter().shutdown()
+    except Exception as e:
+        logger.error(f"Failed to flush trace spans: {e}")
+    try:
+        get_vector_store_registry().dispose_all()
+    except Exception as e:
+        logger.error(f"Failed to dispose vector store engines: {e}")
+    try:
+        await get_llm_client_registry().aclose_all()
+    except Exception as e:
+        logger.error(f"Failed to close LLM HTTP clients: {e}")
     logger.info("Backend shutdown complete")
 
 
@@ -206,6 +251,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset cursor of paginated list endpoints
 )
 
 # Add comprehensive logging middleware
@@ -311,13 +357,22 @@ async def health_check():
                 "node_registry": {
                     "status": "healthy" if nodes_healthy else "error",
                     "nodes_registered": len(node_registry.nodes),
-                    "node_types": list(set(node.__name__ for node in node_registry.nodes.values()))
+                    "node_types": node_registry.node_class_names()
                 },
                 "engine": {
                     "status": "healthy" if engine_healthy else "error",
                     "type": "LangGraph Unified Engine"
                 },
                 "database": db_status,
+                "llm_clients": get_llm_client_registry().stats(),
+                "search_cache": get_search_cache().stats(),
+                "webhook_stats": get_webhook_stats_writer().stats(),
+                "webhook_events": get_webhook_event_bus().stats(),
+                "conversation_sessions": get_session_memory_store().stats(),
+                "tracing": {
+                    key: value for key, value in get_distributed_tracer().get_metrics().items()
+                    if key in ("sampling", "export", "node_overhead_us")
+                },
                 "logging": {
                     "status": "healthy",
                     "middleware_active": True,
@@ -355,7 +410,7 @@ async def get_info():
             ],
             "statistics": {
                 "total_nodes": len(node_registry.nodes),
-                "node_types": list(set(node.__name__ for node in node_registry.nodes.values())),
+                "node_types": node_registry.node_class_names(),
                 "api_endpoints": 25,  # Approximate count
                 "database_enabled": True
             },
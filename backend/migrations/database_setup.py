@@ -14,6 +14,9 @@ Desteklenen Tablolar:
 - Document ve chunk tabloları
 - Webhook ve event tabloları
 - Vector storage tabloları (vector_collections, vector_documents)
+- LLM yanıt önbelleği tablosu (llm_cache_entries)
+- Doküman near-duplicate imzaları (document_signatures)
+- Workflow trace span'leri (trace_spans)
 
 Yeni Özellikler:
 - Otomatik sütun senkronizasyonu
@@ -34,6 +37,7 @@ Sütun Yönetimi Parametreleri:
     --no-sync-columns      : Sütun senkronizasyonunu devre dışı bırakır
     --no-add-columns       : Eksik sütun eklemeyi devre dışı bırakır  
     --remove-extra-columns : Fazla sütunları siler (DIKKAT: Veri kaybı!)
+    --cleanup-duplicates   : Unique index'leri engelleyen çift kayıtları siler (DIKKAT: Veri kaybı!)
 
 Örnekler:
     # Sadece kontrol et
@@ -54,7 +58,8 @@ import sys
 import os
 import argparse
 import logging
-from typing import List, Dict, Any, Set
+import tempfile
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy import text, inspect, MetaData, Table, Column
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -65,13 +70,14 @@ from dotenv import load_dotenv
 backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, backend_dir)
 
-# Logging konfigürasyonu
+# Logging konfigürasyonu (log dosyası kaynak ağacının dışına yazılır)
+DATABASE_SETUP_LOG = os.getenv("DATABASE_SETUP_LOG", os.path.join(tempfile.gettempdir(), "database_setup.log"))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('database_setup.log', encoding='utf-8')
+        logging.FileHandler(DATABASE_SETUP_LOG, encoding='utf-8')
     ]
 )
 logger = logging.getLogger(__name__)
@@ -80,6 +86,60 @@ logger = logging.getLogger(__name__)
 DATABASE_URL = os.getenv("DATABASE_URL")
 CREATE_DATABASE = os.getenv("CREATE_DATABASE", "true").lower() in ("true", "1", "t")
 
+# Kurulması gereken PostgreSQL eklentileri (eklenti -> kullanım yeri). Kurulamayan bir
+# eklentiye bağlı tablo, sütun ve index'ler atlanır; kurulumun geri kalanı devam eder.
+REQUIRED_EXTENSIONS: Dict[str, str] = {
+    "vector": "vector_documents.embedding_vector",
+    "pg_trgm": "workflows.name/description trigram index'leri",
+}
+
+# Yerini yeni index'lere bırakan eski index'ler (tablo -> index adları)
+SUPERSEDED_INDEXES: Dict[str, List[str]] = {
+    # documents.search_vector GIN index'i ile değiştirildi
+    "documents": ["idx_documents_content_fts", "idx_documents_title_fts"],
+}
+
+# Aynı (user_id, content_hash) grubunda en eski kayıttan sonraki dokümanlar
+_DUPLICATE_DOCUMENT_IDS = """
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY user_id, content_hash
+            ORDER BY created_at NULLS LAST, id
+        ) AS duplicate_rank
+        FROM documents
+        WHERE content_hash IS NOT NULL
+    ) ranked
+    WHERE duplicate_rank > 1
+"""
+
+# Index oluşturmayı engelleyen kayıtlar (index adı -> (sayma SQL'i, temizlik SQL'i)).
+# Engelleyen kayıt varsa sayısı raporlanır ve index atlanır; temizlik veri sildiği için
+# yalnızca --cleanup-duplicates ile çalışır.
+INDEX_BLOCKERS: Dict[str, Tuple[str, str]] = {
+    # Mevcut çift kayıtlar unique index'i başarısız kılar; temizlikte her gruptan en eski kayıt
+    # kalır (chunk'ları da cascade ile silinir). Index yokken store_documents yeni çiftleri
+    # content_hash sorgusuyla yine ayıklar.
+    "uq_documents_user_content_hash": (
+        f"SELECT count(*) FROM ({_DUPLICATE_DOCUMENT_IDS}) duplicates",
+        f"DELETE FROM documents WHERE id IN ({_DUPLICATE_DOCUMENT_IDS})",
+    ),
+}
+
+def required_extension(item: Any) -> Optional[str]:
+    """Tablonun, index'in ya da sütun türünün DDL'i için gereken PostgreSQL eklentisi."""
+    if isinstance(item, str):
+        return "vector" if item.upper().startswith("VECTOR") else None
+    if isinstance(item, Table):
+        from pgvector.sqlalchemy import Vector
+
+        return "vector" if any(isinstance(column.type, Vector) for column in item.columns) else None
+    options = item.dialect_options["postgresql"]
+    if options.get("using") in ("hnsw", "ivfflat"):
+        return "vector"
+    if any("trgm" in ops for ops in (options.get("ops") or {}).values()):
+        return "pg_trgm"
+    return None
+
 
 class DatabaseSetup:
     """Veritabanı kurulum ve yönetim sınıfı."""
@@ -87,6 +147,8 @@ class DatabaseSetup:
     def __init__(self):
         self.engine = None
         self.session_factory = None
+        # ensure_extensions'ın kuramadığı eklentiler
+        self.missing_extensions: Set[str] = set()
         self.expected_tables = [
             "users",
             "user_credentials",
@@ -116,7 +178,10 @@ class DatabaseSetup:
             "webhook_events",
             "vector_collections",
             "vector_documents",
-            "external_workflows"
+            "external_workflows",
+            "llm_cache_entries",
+            "document_signatures",
+            "trace_spans"
         ]
 
     async def initialize(self):
@@ -271,7 +336,7 @@ class DatabaseSetup:
                 DocumentCollection, Document, DocumentChunk, DocumentAccessLog, DocumentVersion,
                 WebhookEndpoint, WebhookEvent,
                 VectorCollection, VectorDocument,
-                ExternalWorkflow
+                ExternalWorkflow, LLMCacheEntry, DocumentSignature, TraceSpan
             )
 
             # API Key modelini kontrol et
@@ -309,7 +374,10 @@ class DatabaseSetup:
                 'webhook_events': WebhookEvent,
                 'vector_collections': VectorCollection,
                 'vector_documents': VectorDocument,
-                'external_workflows': ExternalWorkflow
+                'external_workflows': ExternalWorkflow,
+                'llm_cache_entries': LLMCacheEntry,
+                'document_signatures': DocumentSignature,
+                'trace_spans': TraceSpan
             }
 
             # API Key'i de ekle eğer varsa
@@ -333,7 +401,8 @@ class DatabaseSetup:
                     "type": self._sqlalchemy_type_to_postgres(column.type),
                     "nullable": column.nullable,
                     "default": str(column.default) if column.default else None,
-                    "primary_key": column.primary_key
+                    "primary_key": column.primary_key,
+                    "computed": str(column.computed.sqltext) if column.computed is not None else None
                 })
 
             return {"exists": True, "columns": model_columns}
@@ -434,6 +503,10 @@ class DatabaseSetup:
                     col_type = column["type"]
                     nullable = "NULL" if column["nullable"] else "NOT NULL"
 
+                    if required_extension(col_type) in self.missing_extensions:
+                        logger.warning(f"⚠️ {table_name}.{col_name} atlandı: {col_type} eklentisi kurulu değil")
+                        continue
+
                     # Primary key sütunları için özel işlem
                     if column.get("primary_key"):
                         logger.info(f"⚠️ Primary key sütunu {col_name} atlanıyor (manuel müdahale gerekli)")
@@ -446,6 +519,13 @@ class DatabaseSetup:
 
                     alter_sql = f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type} {nullable}{default_clause}"
 
+                    # Generated (computed) sütunlar için ifade ile ekle
+                    if column.get("computed"):
+                        alter_sql = (
+                            f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type} "
+                            f"GENERATED ALWAYS AS ({column['computed']}) STORED"
+                        )
+
                     logger.info(f"📝 Sütun ekleniyor: {table_name}.{col_name}")
                     await conn.execute(text(alter_sql))
 
@@ -521,6 +601,86 @@ class DatabaseSetup:
 
         return success
 
+    async def ensure_indexes(self, table_name: str, cleanup_duplicates: bool = False) -> bool:
+        """
+        Model'de tanımlı olup veritabanında olmayan index'leri oluşturur ve
+        SUPERSEDED_INDEXES'teki eski index'leri kaldırır.
+
+        INDEX_BLOCKERS'taki bir index'i engelleyen kayıtlar varsa sayıları
+        raporlanır ve index atlanır; ``cleanup_duplicates`` verilirse kayıtlar
+        silinip index oluşturulur.
+        """
+        try:
+            from app.models.base import Base
+            import app.models  # noqa: F401 - tüm modelleri metadata'ya kaydeder
+
+            table = Base.metadata.tables.get(table_name)
+            if table is None:
+                return True
+
+            def _create_missing(sync_conn):
+                existing = {index["name"] for index in inspect(sync_conn).get_indexes(table_name)}
+                for index in table.indexes:
+                    if index.name in existing:
+                        continue
+                    extension = required_extension(index)
+                    if extension in self.missing_extensions:
+                        logger.warning(f"⚠️ {index.name} atlandı: {extension} eklentisi kurulu değil")
+                        continue
+                    blocker = INDEX_BLOCKERS.get(index.name)
+                    if blocker:
+                        count_sql, cleanup_sql = blocker
+                        blocking = sync_conn.execute(text(count_sql)).scalar() or 0
+                        if blocking and not cleanup_duplicates:
+                            logger.warning(
+                                f"⚠️ {index.name} atlandı: {blocking} çift kayıt var. "
+                                f"Kayıtları inceleyip --cleanup-duplicates ile temizleyin"
+                            )
+                            continue
+                        if blocking:
+                            removed = sync_conn.execute(text(cleanup_sql)).rowcount
+                            logger.warning(f"🧹 {index.name} öncesi {removed} çift kayıt silindi")
+                    index.create(sync_conn)
+
+            async with self.engine.begin() as conn:
+                for index_name in SUPERSEDED_INDEXES.get(table_name, []):
+                    await conn.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+                await conn.run_sync(_create_missing)
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ {table_name} index oluşturma hatası: {e}")
+            return False
+
+    async def ensure_extensions(self) -> bool:
+        """
+        Gerekli PostgreSQL eklentilerini (pgvector, pg_trgm) kurar.
+
+        Her eklenti kendi transaction'ında kurulur; biri başarısız olursa
+        diğerinin kurulumu geri alınmaz. Kurulamayanlar ``missing_extensions``'a
+        yazılır ve onlara bağlı şema nesneleri atlanır.
+        """
+        self.missing_extensions = set()
+        for extension, purpose in REQUIRED_EXTENSIONS.items():
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+                logger.info(f"✅ {extension} eklentisi hazır ({purpose})")
+            except Exception as e:
+                logger.error(f"❌ {extension} eklentisi kurulamadı, {purpose} atlanacak: {e}")
+                self.missing_extensions.add(extension)
+        return not self.missing_extensions
+
+    def extension_dependent_tables(self) -> List[str]:
+        """Kurulamayan eklentiler yüzünden oluşturulmayacak tablolar."""
+        from app.models.base import Base
+        import app.models  # noqa: F401 - tüm modelleri metadata'ya kaydeder
+
+        return [
+            name for name, table in Base.metadata.tables.items()
+            if required_extension(table) in self.missing_extensions
+        ]
+
     async def create_tables(self, force: bool = False):
         """Tüm tabloları oluşturur."""
         if not self.engine:
@@ -539,7 +699,7 @@ class DatabaseSetup:
                 DocumentCollection, Document, DocumentChunk, DocumentAccessLog, DocumentVersion,
                 WebhookEndpoint, WebhookEvent,
                 VectorCollection, VectorDocument,
-                ExternalWorkflow
+                ExternalWorkflow, LLMCacheEntry, DocumentSignature, TraceSpan
             )
 
             # API Key modelini kontrol et
@@ -555,9 +715,20 @@ class DatabaseSetup:
                     await conn.run_sync(Base.metadata.drop_all)
                 logger.info("🗑️ Tüm tablolar silindi")
 
-            # Tabloları oluştur
+            # Tabloları oluştur; kurulamayan eklentilere bağlı tablo ve index'ler atlanır
+            skipped_tables = set(self.extension_dependent_tables())
+            tables = [table for table in Base.metadata.sorted_tables if table.name not in skipped_tables]
+            for table in tables:
+                for index in table.indexes:
+                    extension = required_extension(index)
+                    if extension:
+                        index.ddl_if(callable_=lambda *args, extension=extension, **kwargs:
+                                     extension not in self.missing_extensions)
+            if skipped_tables:
+                logger.warning(f"⚠️ Eklenti eksik, atlanan tablolar: {', '.join(sorted(skipped_tables))}")
+
             async with self.engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(Base.metadata.create_all, tables=tables)
 
             logger.info("✅ Tüm tablolar başarıyla oluşturuldu")
             return True
@@ -619,7 +790,7 @@ class DatabaseSetup:
 
     async def setup_database(self, force: bool = False, check_only: bool = False, drop_all: bool = False,
                              sync_columns: bool = True, add_missing_columns: bool = True,
-                             remove_extra_columns: bool = False):
+                             remove_extra_columns: bool = False, cleanup_duplicates: bool = False):
         """Ana veritabanı kurulum fonksiyonu."""
         logger.info("🚀 KAI-Fusion Veritabanı Kurulum Scripti Başlatılıyor...")
 
@@ -644,6 +815,14 @@ class DatabaseSetup:
             if not await self.drop_all_tables():
                 return False
 
+        # vector_documents.embedding_vector için pgvector, workflows trigram index'leri için pg_trgm gerekli;
+        # kurulamayan eklentiye bağlı nesneler atlanır, kurulumun geri kalanı devam eder
+        if not await self.ensure_extensions():
+            logger.warning(
+                f"⚠️ Eksik eklentiler ({', '.join(sorted(self.missing_extensions))}); "
+                f"bunlara bağlı tablo, sütun ve index'ler atlanacak"
+            )
+
         # Mevcut durumu kontrol et
         validation = await self.validate_tables(check_columns=sync_columns)
         self._print_validation_results(validation)
@@ -661,8 +840,10 @@ class DatabaseSetup:
             post_validation = await self.validate_tables(check_columns=sync_columns)
             self._print_validation_results(post_validation)
 
-            if post_validation["missing_tables"]:
-                logger.error(f"❌ Hala eksik tablolar var: {', '.join(post_validation['missing_tables'])}")
+            skipped_tables = set(self.extension_dependent_tables())
+            still_missing = [table for table in post_validation["missing_tables"] if table not in skipped_tables]
+            if still_missing:
+                logger.error(f"❌ Hala eksik tablolar var: {', '.join(still_missing)}")
                 return False
             else:
                 logger.info("✅ Tüm tablolar başarıyla oluşturuldu ve doğrulandı")
@@ -691,6 +872,11 @@ class DatabaseSetup:
             else:
                 logger.info("✅ Tüm sütunlar başarıyla senkronize edildi")
 
+        # Yeni eklenen sütunlara ait index'leri oluştur (ör. documents.search_vector GIN)
+        if sync_columns and add_missing_columns:
+            for table_name in self.expected_tables:
+                await self.ensure_indexes(table_name, cleanup_duplicates=cleanup_duplicates)
+
         return True
 
     def _print_validation_results(self, validation: Dict[str, Any]):
@@ -755,6 +941,8 @@ async def main():
     parser.add_argument("--no-add-columns", action="store_true", help="Eksik sütun eklemeyi devre dışı bırakır")
     parser.add_argument("--remove-extra-columns", action="store_true",
                         help="Fazla sütunları siler (dikkatli kullanın!)")
+    parser.add_argument("--cleanup-duplicates", action="store_true",
+                        help="Unique index'leri engelleyen çift kayıtları siler (dikkatli kullanın!)")
 
     args = parser.parse_args()
 
@@ -774,6 +962,11 @@ async def main():
         logger.warning("⚠️ DIKKAT: --remove-extra-columns parametresi fazla sütunları siler!")
         logger.warning("⚠️ Bu işlem geri alınamaz ve veri kaybına sebep olabilir!")
 
+    # Çift kayıt silme uyarısı
+    if args.cleanup_duplicates:
+        logger.warning("⚠️ DIKKAT: --cleanup-duplicates çift dokümanları (ve chunk'larını) siler!")
+        logger.warning("⚠️ Bu işlem geri alınamaz; önce yedek alın!")
+
     # Database setup başlat
     db_setup = DatabaseSetup()
 
@@ -784,7 +977,8 @@ async def main():
             drop_all=args.drop_all,
             sync_columns=not args.no_sync_columns,
             add_missing_columns=not args.no_add_columns,
-            remove_extra_columns=args.remove_extra_columns
+            remove_extra_columns=args.remove_extra_columns,
+            cleanup_duplicates=args.cleanup_duplicates
         )
 
         if success:
@@ -0,0 +1,82 @@
+"""
+Blob Store Spill Tests
+======================
+
+Checks that oversized execution outputs are moved to the content-addressed
+blob store and can be streamed back by digest, and that nested outputs are
+encoded once rather than once per level.
+"""
+
+import json
+
+from app.core import blob_store, json_utils
+from app.core.blob_store import (
+    BLOB_REF_KEY,
+    LocalBlobStore,
+    collect_blob_refs,
+    is_blob_ref,
+    spill_large_outputs,
+)
+
+
+def test_large_node_output_is_spilled(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    chunks = [{"page_content": "x" * 200, "metadata": {"i": i}} for i in range(50)]
+    outputs = {
+        "success": True,
+        "node_outputs": {"loader": {"documents": chunks}, "llm": {"output": "hi"}},
+    }
+
+    spilled = spill_large_outputs(outputs, threshold_bytes=1024, store=store, preview_chars=64)
+
+    assert spilled["success"] is True
+    assert spilled["node_outputs"]["llm"] == {"output": "hi"}
+    ref = spilled["node_outputs"]["loader"]
+    assert is_blob_ref(ref)
+    assert len(ref["preview"]) <= 64
+
+    (digest,) = collect_blob_refs(spilled)
+    assert json.loads(store.get(digest)) == {"documents": chunks}
+
+
+def test_identical_outputs_share_one_blob(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    payload = ["y" * 4096]
+
+    first = spill_large_outputs({"a": payload}, threshold_bytes=1024, store=store)
+    second = spill_large_outputs({"b": payload}, threshold_bytes=1024, store=store)
+
+    assert first["a"][BLOB_REF_KEY] == second["b"][BLOB_REF_KEY]
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+
+def test_small_outputs_stay_inline(tmp_path):
+    store = LocalBlobStore(str(tmp_path))
+    outputs = {"output": "short", "node_outputs": {"n1": {"output": "ok"}}}
+
+    assert spill_large_outputs(outputs, threshold_bytes=1024, store=store) == outputs
+    assert not any(tmp_path.iterdir())
+
+
+def test_nested_outputs_are_encoded_once(tmp_path, monkeypatch):
+    encoded, dumps_bytes = [], blob_store.dumps_bytes
+
+    def counting_dumps(value):
+        data = dumps_bytes(value)
+        encoded.append(len(data))
+        return data
+
+    # Count every encode, including through json_utils helpers
+    monkeypatch.setattr(json_utils, "dumps_bytes", counting_dumps)
+    monkeypatch.setattr(blob_store, "dumps_bytes", counting_dumps)
+    store = LocalBlobStore(str(tmp_path))
+    # Each node output is under the threshold; together they are not
+    node_outputs = {f"node_{i}": {"output": "x" * 400, "tokens": i} for i in range(50)}
+
+    spilled = spill_large_outputs({"node_outputs": node_outputs}, threshold_bytes=4096, store=store, max_depth=3)
+
+    (digest,) = collect_blob_refs(spilled)
+    blob = store.get(digest)
+    assert json.loads(blob) == node_outputs
+    assert sum(encoded) < 1.2 * len(blob)  # re-encoding each level used to cost ~3x
+
@@ -0,0 +1,49 @@
+"""
+BM25 Reranker Tests
+===================
+
+Checks lexical reranking and reciprocal-rank fusion over retriever output,
+and that the reranker and its node default to the same fusion mode.
+"""
+
+from langchain_core.documents import Document
+
+from app.nodes.tools.bm25_reranker import BM25Reranker, BM25RerankerNode
+
+DOCS = [
+    Document(page_content="Vector databases store embeddings for semantic search.", metadata={"source": "a"}),
+    Document(page_content="Postgres supports full text search with tsvector.", metadata={"source": "b"}),
+    Document(page_content="The BM25 ranking function scores keyword matches in search engines.", metadata={"source": "c"}),
+]
+
+
+def test_bm25_promotes_lexical_match():
+    reranked = BM25Reranker(top_n=2, fusion="none").compress_documents(DOCS, "bm25 keyword ranking")
+
+    assert [d.metadata["source"] for d in reranked][0] == "c"
+    assert len(reranked) == 2
+    assert reranked[0].metadata["relevance_score"] >= reranked[1].metadata["relevance_score"]
+    assert "relevance_score" not in DOCS[2].metadata
+
+
+def test_rrf_keeps_vector_rank_as_tiebreaker():
+    reranked = BM25Reranker(top_n=3, fusion="rrf").compress_documents(DOCS, "unrelated words")
+
+    assert [d.metadata["source"] for d in reranked] == ["a", "b", "c"]
+
+
+def test_node_builds_configured_reranker():
+    node = BM25RerankerNode()
+    node.user_data = {"top_n": 3, "fusion": "none"}
+
+    reranker = node.execute()
+
+    assert isinstance(reranker, BM25Reranker)
+    assert reranker.top_n == 3 and reranker.fusion == "none"
+
+
+def test_reranker_and_node_default_to_the_same_fusion():
+    node = BM25RerankerNode()
+    node.user_data = {}
+
+    assert node.execute().fusion == BM25Reranker().fusion == "rrf"
@@ -0,0 +1,127 @@
+"""
+Control Flow Tests
+==================
+
+Loop and fan-out nodes emit deltas: loops terminate on their iteration counter,
+fan-out branches share one state, and a loop iteration never copies or dumps
+the accumulated ``node_outputs``, so its cost does not grow with them. A
+1,000-iteration loop compiled by GraphBuilder keeps a flat per-iteration time.
+"""
+
+import asyncio
+import statistics
+import time
+
+from langgraph.graph import END, StateGraph
+
+from app.core.graph_builder import GraphBuilder
+from app.core.graph_builder.control_flow import ControlFlowManager, loop_iteration_delta
+from app.core.graph_builder.types import NodeConnection
+from app.core.state import FlowState
+from benchmarks.flows import NODE_REGISTRY, StubNode, edge, node
+
+ITERATIONS = 1000
+
+
+def _state_with_outputs(count: int) -> FlowState:
+    outputs = {f"node_{i}": {"output": "x" * 1024, "items": list(range(50))} for i in range(count)}
+    return FlowState(session_id="bench", node_outputs=outputs)
+
+
+def test_loop_runs_until_max_iterations():
+    manager = ControlFlowManager([NodeConnection("loop", "output", "body", "input")])
+    graph = StateGraph(FlowState)
+    graph.add_node("body", lambda state: {"last_output": "step"})
+    graph.add_edge("body", "loop")
+    manager.add_loop_logic(graph, "loop", {"max_iterations": 3})
+    graph.set_entry_point("loop")
+
+    result = graph.compile().invoke(FlowState(session_id="s"), {"recursion_limit": 20})
+
+    assert result["variables"]["loop_iterations"] == 3
+
+
+def test_fanout_branches_share_state():
+    manager = ControlFlowManager([
+        NodeConnection("fan", "output", "a", "input"),
+        NodeConnection("fan", "output", "b", "input"),
+    ])
+    graph = StateGraph(FlowState)
+    manager.add_parallel_fanout(graph, "fan", {})
+    graph.add_node("a", lambda state: {"node_outputs": {"a": len(state.node_outputs)}})
+    graph.add_node("b", lambda state: {"node_outputs": {"b": len(state.node_outputs)}})
+    graph.add_edge("a", END)
+    graph.add_edge("b", END)
+    graph.set_entry_point("fan")
+
+    result = graph.compile().invoke(FlowState(session_id="s", node_outputs={"seed": 1}))
+
+    assert result["node_outputs"] == {"seed": 1, "a": 1, "b": 1}
+
+
+def test_loop_iteration_does_not_copy_node_outputs(monkeypatch):
+    copies = []
+
+    def counting(name, original):
+        def method(self, *args, **kwargs):
+            copies.append(name)
+            return original(self, *args, **kwargs)
+        return method
+
+    for name in ("model_dump", "model_copy", "__deepcopy__", "__copy__"):
+        monkeypatch.setattr(FlowState, name, counting(name, getattr(FlowState, name)))
+
+    state = _state_with_outputs(2000)
+    state.variables = {"shared": {"big": list(range(100))}}
+    node_outputs = state.node_outputs
+    for _ in range(ITERATIONS):
+        delta = loop_iteration_delta(state, "loop")
+        assert set(delta) == {"variables"}
+        assert delta["variables"]["shared"] is state.variables["shared"]  # shallow copy only
+        state.variables = delta["variables"]
+
+    assert copies == []
+    assert state.node_outputs is node_outputs
+    assert state.variables["loop_iterations"] == ITERATIONS
+
+
+class _PayloadNode(StubNode):
+    """Stub whose output is large, so node_outputs carries it through every iteration."""
+
+    def execute(self, inputs, connected_nodes):
+        super().execute(inputs, connected_nodes)
+        return {"output": "x" * 64_000}
+
+
+class _TimedNode(StubNode):
+    """Stub that records when each loop iteration reaches it."""
+
+    stamps = []
+
+    def execute(self, inputs, connected_nodes):
+        _TimedNode.stamps.append(time.perf_counter())
+        return super().execute(inputs, connected_nodes)
+
+
+def test_compiled_loop_iteration_time_stays_flat():
+    payloads = [f"payload_{i}" for i in range(4)]
+    path = ["start"] + payloads + ["loop"]
+    flow = {
+        "nodes": [node("start", "StartNode")] + [node(p, "PayloadNode") for p in payloads] + [
+            node("loop", "LoopNode", {"max_iterations": ITERATIONS + 1}),
+            node("body", "TimedNode"),
+        ],
+        "edges": [edge(a, b) for a, b in zip(path, path[1:])] + [edge("loop", "body"), edge("body", "loop")],
+    }
+    builder = GraphBuilder({**NODE_REGISTRY, "PayloadNode": _PayloadNode, "TimedNode": _TimedNode})
+    builder.build_from_flow(flow)
+    _TimedNode.stamps = []
+
+    result = asyncio.run(builder.execute({"input": "go"}))
+
+    assert result["success"], result.get("error")
+    assert len(_TimedNode.stamps) == ITERATIONS
+    gaps = [b - a for a, b in zip(_TimedNode.stamps, _TimedNode.stamps[1:])]
+    # Medians of the early and late iterations; a per-iteration copy of state would grow them apart
+    early, late = statistics.median(gaps[10:110]), statistics.median(gaps[-100:])
+    assert late < 2 * early, f"iteration time grew from {early * 1000:.2f}ms to {late * 1000:.2f}ms"
@@ -0,0 +1,168 @@
+"""
+Database Setup Tests
+====================
+
+Missing indexes are created on existing databases, but an index blocked by
+existing rows (duplicate documents for the unique content-hash index) is
+reported and skipped; the rows are only deleted when the operator opts in
+with --cleanup-duplicates. vector_documents is indexed by per-width partial
+HNSW indexes over an unconstrained column; only indexes that shipped before
+are dropped.
+
+Each extension is created in its own transaction; when one cannot be
+created, setup continues and skips only the tables, columns and indexes
+that need it. The setup log is written outside the source tree.
+"""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_mock_engine
+
+from app.core.constants import VECTOR_INDEXED_DIMENSIONS
+
+
+@pytest.fixture
+def database_setup(monkeypatch):
+    from migrations import database_setup
+
+    monkeypatch.setattr(database_setup, "inspect", lambda conn: SimpleNamespace(get_indexes=lambda table: []))
+    return database_setup
+
+
+class _SyncConnection:
+    """What ``run_sync`` hands the callback: answers counts, records statements and created indexes."""
+
+    def __init__(self, blocking_rows):
+        self.blocking_rows = blocking_rows
+        self.statements = []
+        self.created = []
+
+    def execute(self, statement):
+        sql = str(statement)
+        self.statements.append(sql)
+        return SimpleNamespace(scalar=lambda: self.blocking_rows, rowcount=self.blocking_rows)
+
+    def _run_ddl_visitor(self, visitor, element, **kwargs):
+        self.created.append(element.name)
+
+
+class _Engine:
+    def __init__(self, sync_connection):
+        self.sync_connection = sync_connection
+
+    def begin(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.sync_connection.statements.append(str(statement))
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_connection, *args, **kwargs)
+
+
+def _ensure_indexes(database_setup, table_name, blocking_rows=0, missing_extensions=(), **options):
+    connection = _SyncConnection(blocking_rows)
+    setup = database_setup.DatabaseSetup()
+    setup.engine = _Engine(connection)
+    setup.missing_extensions = set(missing_extensions)
+    assert asyncio.run(setup.ensure_indexes(table_name, **options))
+    return connection
+
+
+def test_duplicate_documents_block_the_unique_index_until_cleanup_is_requested(database_setup):
+    connection = _ensure_indexes(database_setup, "documents", blocking_rows=3)
+    assert connection.statements[:2] == [
+        'DROP INDEX IF EXISTS "idx_documents_content_fts"',
+        'DROP INDEX IF EXISTS "idx_documents_title_fts"',
+    ]
+    assert "uq_documents_user_content_hash" not in connection.created
+    assert "idx_documents_content_hash" in connection.created  # other indexes are still built
+    assert not any(sql.lstrip().startswith("DELETE") for sql in connection.statements)
+
+    connection = _ensure_indexes(database_setup, "documents", blocking_rows=3, cleanup_duplicates=True)
+    assert "uq_documents_user_content_hash" in connection.created
+    (cleanup,) = [sql for sql in connection.statements if sql.lstrip().startswith("DELETE")]
+    assert "duplicate_rank > 1" in cleanup
+
+    connection = _ensure_indexes(database_setup, "documents", blocking_rows=0)
+    assert "uq_documents_user_content_hash" in connection.created
+
+
+def test_vector_indexes_are_built_per_width_on_an_unconstrained_column(database_setup):
+    connection = _ensure_indexes(database_setup, "vector_documents")
+    assert not any(statement.startswith(("DROP", "ALTER")) for statement in connection.statements)
+    assert {f"idx_vector_documents_embedding_hnsw_{dimension}" for dimension in VECTOR_INDEXED_DIMENSIONS} <= set(
+        connection.created
+    )
+
+
+def test_setup_log_is_written_outside_the_source_tree(database_setup):
+    backend_dir = Path(database_setup.backend_dir).resolve()
+    assert backend_dir not in Path(database_setup.DATABASE_SETUP_LOG).resolve().parents
+
+
+def test_extensions_are_created_in_separate_transactions(database_setup):
+    transactions = []
+
+    class _Transaction:
+        def __init__(self):
+            self.statements = []
+
+        async def __aenter__(self):
+            transactions.append(self)
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, statement):
+            self.statements.append(str(statement))
+            if "vector" in str(statement):
+                raise RuntimeError('extension "vector" is not available')
+
+    setup = database_setup.DatabaseSetup()
+    setup.engine = SimpleNamespace(begin=_Transaction)
+
+    assert asyncio.run(setup.ensure_extensions()) is False  # pgvector is missing ...
+    assert [t.statements for t in transactions] == [
+        ["CREATE EXTENSION IF NOT EXISTS vector"],
+        ["CREATE EXTENSION IF NOT EXISTS pg_trgm"],  # ... and pg_trgm is still created
+    ]
+    assert setup.missing_extensions == {"vector"}
+
+
+def test_missing_extensions_skip_only_the_objects_that_need_them(database_setup):
+    ddl = []
+    engine = create_mock_engine("postgresql://", lambda statement, *_: ddl.append(
+        str(statement.compile(dialect=engine.dialect)).strip()
+    ))
+    setup = database_setup.DatabaseSetup()
+    setup.engine = _Engine(engine)
+    setup.missing_extensions = {"vector", "pg_trgm"}
+
+    assert asyncio.run(setup.create_tables())
+    created_tables = {statement.split()[2] for statement in ddl if statement.startswith("CREATE TABLE")}
+    assert {"workflows", "documents", "vector_collections"} <= created_tables
+    assert "vector_documents" not in created_tables
+    assert not [statement for statement in ddl if "gin_trgm_ops" in statement or "hnsw" in statement]
+    assert any("idx_workflows_user_activity_id" in statement for statement in ddl)
+    assert setup.extension_dependent_tables() == ["vector_documents"]
+
+    connection = _ensure_indexes(database_setup, "workflows", missing_extensions={"pg_trgm"})
+    assert "idx_workflows_user_activity_id" in connection.created
+    assert "idx_workflows_name_trgm" not in connection.created
+
+    setup.missing_extensions = set()
+    ddl.clear()
+    assert asyncio.run(setup.create_tables())
+    assert any(statement.startswith("CREATE TABLE vector_documents") for statement in ddl)
+    assert any("gin_trgm_ops" in statement for statement in ddl)
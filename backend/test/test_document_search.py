@@ -0,0 +1,142 @@
+"""
+Document Search Tests
+=====================
+
+Search pages continue from an opaque (sort value, id) keyset cursor, malformed
+cursors are client errors (400), the total is counted exactly, capped at
+SEARCH_COUNT_CAP or skipped, and hybrid mode fuses full-text and vector ranks
+with reciprocal rank fusion in one statement.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api.documents import search_documents as search_documents_endpoint
+from app.schemas.document import DocumentSearchRequest
+from app.services.document_service import (
+    SEARCH_COUNT_CAP,
+    DocumentService,
+    InvalidSearchCursorError,
+)
+
+
+class _RecordingSession:
+    """Captures statements and returns canned rows and counts."""
+
+    def __init__(self, rows=(), count=0):
+        self.rows = list(rows)
+        self.count = count
+        self.statements = []
+        self.scalar_statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+    async def scalar(self, statement):
+        self.scalar_statements.append(statement)
+        return self.count
+
+    @staticmethod
+    def sql(statement) -> str:
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class _Row(tuple):
+    """Result row of ``select(Document, <extra>.label(...))``."""
+
+    def __new__(cls, document, **labels):
+        row = super().__new__(cls, (document,))
+        row.__dict__.update(labels)
+        return row
+
+
+def _document_rows(count, **labels):
+    at = datetime(2025, 7, 1, tzinfo=timezone.utc)
+    return [_Row(SimpleNamespace(id=uuid.uuid4()), sort_value=at, **labels) for _ in range(count)]
+
+
+def _search(session, **params):
+    return asyncio.run(DocumentService(session).search_documents(uuid.uuid4(), params))
+
+
+def test_search_pages_continue_from_the_keyset_cursor():
+    first_page = _RecordingSession(_document_rows(2), count=5)
+    documents, metadata = _search(first_page, query="graph", limit=2)
+    (statement,) = first_page.statements
+    sql = first_page.sql(statement)
+    assert "documents.search_vector @@ plainto_tsquery" in sql
+    assert "to_tsvector" not in sql
+    assert "ORDER BY documents.updated_at DESC, documents.id DESC" in sql
+    assert metadata["next_cursor"] is not None
+
+    next_page = _RecordingSession(_document_rows(1), count=5)
+    _, metadata = _search(next_page, query="graph", limit=2, offset=40, cursor=metadata["next_cursor"])
+    (statement,) = next_page.statements
+    assert "(documents.updated_at, documents.id) < (" in next_page.sql(statement)
+    assert documents[-1].id in statement.compile(dialect=postgresql.dialect()).params.values()
+    assert metadata["offset"] == 0 and metadata["next_cursor"] is None
+
+    service = DocumentService(_RecordingSession())
+    at = datetime(2025, 7, 1, 12, 30, tzinfo=timezone.utc)
+    document_id = uuid.uuid4()
+    assert service._decode_search_cursor(service._encode_search_cursor(at, document_id), "updated_at") == (
+        at, document_id,
+    )
+
+
+def test_malformed_cursor_is_a_client_error():
+    with pytest.raises(InvalidSearchCursorError):
+        _search(_RecordingSession(), cursor="not-a-cursor")
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(search_documents_endpoint(
+            DocumentSearchRequest(cursor="not-a-cursor"),
+            current_user=SimpleNamespace(id=uuid.uuid4()),
+            session=_RecordingSession(),
+        ))
+    assert error.value.status_code == 400
+
+
+def test_count_modes():
+    session = _RecordingSession(count=SEARCH_COUNT_CAP)
+    _, metadata = _search(session)  # capped by default
+    (count_statement,) = session.scalar_statements
+    assert "LIMIT" in session.sql(count_statement)
+    assert metadata["total_count"] == SEARCH_COUNT_CAP and metadata["count_is_estimate"]
+
+    session = _RecordingSession(count=12_345)
+    _, metadata = _search(session, count_mode="exact")
+    (count_statement,) = session.scalar_statements
+    assert "LIMIT" not in session.sql(count_statement)
+    assert metadata["total_count"] == 12_345 and not metadata["count_is_estimate"]
+
+    session = _RecordingSession()
+    _, metadata = _search(session, count_mode="none")
+    assert session.scalar_statements == []
+    assert metadata["total_count"] is None
+
+
+def test_hybrid_search_fuses_ranks_in_one_statement():
+    session = _RecordingSession(_document_rows(2, total_count=7))
+    documents, metadata = _search(session, mode="hybrid", query="graph", query_embedding=[0.1, 0.2, 0.3], rrf_k=10)
+    (statement,) = session.statements
+    sql = session.sql(statement)
+    assert "WITH text_ranked AS" in sql and "vector_ranked AS" in sql
+    assert "FULL OUTER JOIN vector_ranked" in sql
+    assert "<=>" in sql  # cosine distance on the chunk embeddings
+    assert "ORDER BY fused.score DESC, documents.id" in sql
+    assert len(documents) == 2 and metadata["total_count"] == 7
+    assert session.scalar_statements == []  # the total comes from count(*) OVER ()
+
+    vector_only = _RecordingSession()
+    _, metadata = _search(vector_only, mode="hybrid", query_embedding=[0.1, 0.2, 0.3])
+    sql = vector_only.sql(vector_only.statements[0])
+    assert "text_ranked" not in sql and "FULL OUTER JOIN" not in sql
+    assert metadata["total_count"] == 0
@@ -0,0 +1,80 @@
+"""
+Document Storage Tests
+======================
+
+store_documents resolves duplicates with one content-hash lookup, drops
+in-batch repeats, writes the rest with ``INSERT ... ON CONFLICT DO NOTHING
+RETURNING`` and returns the rows the database actually persisted, so a
+document that loses a race with a concurrent ingest is not reported as stored.
+"""
+
+import asyncio
+import hashlib
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Insert
+
+from app.services.document_service import DocumentService
+
+
+def _hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class _StoringSession:
+    """Answers the hash lookup and inserts, losing ``conflicting`` hashes to a concurrent writer."""
+
+    def __init__(self, existing_hashes=(), conflicting_hashes=()):
+        self.existing_hashes = set(existing_hashes)
+        self.conflicting_hashes = set(conflicting_hashes)
+        self.inserts = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        if isinstance(statement, Insert):
+            self.inserts.append(statement)
+            rows = statement.compile(dialect=postgresql.dialect()).params
+            persisted = [
+                SimpleNamespace(id=rows[f"id_m{i}"], content_hash=rows[f"content_hash_m{i}"])
+                for i in range(len(statement._multi_values[0]))
+                if rows[f"content_hash_m{i}"] not in self.conflicting_hashes
+            ]
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: persisted))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: list(self.existing_hashes)))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _documents(*contents):
+    return [{"content": content, "format": "txt", "source": "notes.txt"} for content in contents]
+
+
+def test_duplicates_are_skipped_and_only_persisted_rows_are_returned():
+    session = _StoringSession(existing_hashes={_hash("already stored")}, conflicting_hashes={_hash("raced")})
+    stored = asyncio.run(DocumentService(session).store_documents(
+        uuid.uuid4(),
+        _documents("already stored", "fresh", "fresh", "raced", "also fresh"),
+        collection_id=uuid.uuid4(),
+    ))
+
+    assert [document.content_hash for document in stored] == [_hash("fresh"), _hash("also fresh")]
+    (insert,) = session.inserts
+    assert len(insert._multi_values[0]) == 3  # existing and in-batch duplicates never reach the INSERT
+    sql = str(insert.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT DO NOTHING" in sql
+    assert "RETURNING documents.id, documents.user_id" in sql  # full rows, not just ids
+    assert session.commits == 1
+
+
+def test_nothing_is_inserted_when_every_document_exists():
+    session = _StoringSession(existing_hashes={_hash("a"), _hash("b")})
+    stored = asyncio.run(DocumentService(session).store_documents(
+        uuid.uuid4(), _documents("a", "b", "a"), collection_id=uuid.uuid4()
+    ))
+    assert stored == [] and session.inserts == [] and session.commits == 0
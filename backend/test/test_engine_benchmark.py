@@ -0,0 +1,45 @@
+"""
+Engine Benchmark Suite Tests
+============================
+
+The synthetic linear, fan-out and loop flows build and run on stub nodes,
+every reported metric is present, and the baseline comparison flags
+regressions beyond the threshold relative to the measured machine speed.
+"""
+
+import json
+
+from benchmarks import engine
+
+
+def test_small_suite_runs_every_shape():
+    results = engine.run_suite(sizes=(10,), repeats=1)
+
+    assert set(results["cases"]) == {"linear-10", "fanout-10", "loop-10"}
+    assert results["calibration_ms"] > 0
+    for case in results["cases"].values():
+        assert case["node_executions"] == 10
+        assert all(case[metric] is not None for metric in engine.COMPARED_METRICS)
+
+
+def test_baseline_comparison_flags_regressions():
+    baseline = json.loads(engine.BASELINE_PATH.read_text())
+    assert {f"{shape}-{size}" for shape in engine.SHAPES for size in engine.DEFAULT_SIZES} <= set(baseline["cases"])
+
+    reference = baseline["cases"]["linear-100"]
+    slower = {**reference, "build_ms": reference["build_ms"] * 2 + 10}
+    results = {"cases": {"linear-100": slower}}
+
+    regressions = engine.compare(results, baseline, threshold=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("linear-100 build_ms")
+    assert engine.compare({"cases": {"linear-100": reference}}, baseline) == []
+
+
+def test_timings_are_compared_relative_to_machine_speed():
+    baseline = {"calibration_ms": 50.0, "cases": {"linear-100": {"execute_ms": 200.0, "peak_rss_mb": 100.0}}}
+    # A machine 1.7x slower: 340ms is the same engine speed, doubled memory is not
+    slower_machine = {"calibration_ms": 85.0, "cases": {"linear-100": {"execute_ms": 340.0, "peak_rss_mb": 200.0}}}
+
+    (regression,) = engine.compare(slower_machine, baseline, threshold=0.5)
+    assert regression.startswith("linear-100 peak_rss_mb")
+    assert engine.speed_ratio({"cases": {}}, baseline) == 1.0
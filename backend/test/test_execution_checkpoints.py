@@ -0,0 +1,235 @@
+"""
+Durable Execution Checkpoint Tests
+==================================
+
+Executions with an execution_id persist their latest checkpoint after every
+superstep; a fresh process (new saver, new graph) resumes from it without
+re-running completed nodes. Oversized checkpoints are not persisted, and
+checkpointing is opt-in per workflow. The resume endpoint claims only failed
+or interrupted executions, atomically, and runs them in the background;
+checkpointed executions left running by a lost worker are swept to
+interrupted, and can be resumed once their checkpoint has gone stale.
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.api import executions as executions_api
+from app.core.checkpointer import (
+    ExecutionCheckpointSaver,
+    checkpoint_settings,
+    interrupt_orphaned_executions,
+)
+from app.core.graph_builder import GraphBuilder
+from app.models.execution import ExecutionCheckpoint
+from app.models.workflow import Workflow
+from app.nodes.base import NodeInput, NodeOutput, NodeType, ProcessorNode
+
+from benchmarks.flows import NODE_REGISTRY, StubNode, linear_chain
+
+
+class FlakyNode(ProcessorNode):
+    """Fails while ``fail`` is set, simulating a crash mid-run."""
+
+    fail = True
+    invocations = 0
+
+    def __init__(self):
+        super().__init__()
+        self._metadata = {
+            "name": "FlakyNode",
+            "display_name": "Flaky",
+            "description": "Fails until told otherwise",
+            "node_type": NodeType.PROCESSOR,
+            "inputs": [NodeInput(name="input", type="any", description="Upstream output",
+                                 is_connection=True, required=False)],
+            "outputs": [NodeOutput(name="output", type="any", description="Constant output")],
+        }
+
+    def execute(self, inputs: Dict[str, Any], connected_nodes: Dict[str, Any]) -> Dict[str, Any]:
+        FlakyNode.invocations += 1
+        if FlakyNode.fail:
+            raise RuntimeError("worker lost")
+        return {"output": "recovered"}
+
+
+class DictCheckpointSaver(ExecutionCheckpointSaver):
+    """Keeps the execution_checkpoints rows in a dict shared across instances."""
+
+    def __init__(self, rows, **kwargs):
+        super().__init__(**kwargs)
+        self.rows = rows
+
+    async def _write_checkpoint(self, execution_id, payload):
+        self.rows[execution_id] = payload
+
+    async def _read_checkpoint(self, execution_id):
+        return self.rows.get(execution_id)
+
+
+def _flaky_flow():
+    flow = linear_chain(3)
+    flow["nodes"][2]["type"] = "FlakyNode"  # stub_0 → stub_1 (flaky) → stub_2
+    return flow
+
+
+def _builder(saver):
+    builder = GraphBuilder({**NODE_REGISTRY, "FlakyNode": FlakyNode}, checkpointer=saver)
+    builder.build_from_flow(_flaky_flow())
+    return builder
+
+
+def test_interrupted_execution_resumes_from_last_checkpoint():
+    rows, execution_id = {}, str(uuid.uuid4())
+    StubNode.invocations = FlakyNode.invocations = 0
+    FlakyNode.fail = True
+
+    first = _builder(DictCheckpointSaver(rows))
+    result = asyncio.run(first.execute({"input": "go"}, session_id="s1", execution_id=execution_id))
+    assert not result["success"] and "worker lost" in result["error"]
+    assert StubNode.invocations == 1 and execution_id in rows
+    assert first.checkpointer.stats()["persisted"] >= 2
+
+    # New process: nothing in memory, the row is the only state
+    FlakyNode.fail = False
+    resumed = _builder(DictCheckpointSaver(rows))
+    result = asyncio.run(resumed.execute({}, session_id="s2", execution_id=execution_id, resume=True))
+    assert result["success"]
+    assert StubNode.invocations == 2  # stub_0 was not re-run, stub_2 ran once
+    assert FlakyNode.invocations == 2
+    assert {"stub_0", "stub_1", "stub_2"} <= set(result["executed_nodes"])
+
+    with pytest.raises(ValueError):
+        asyncio.run(_builder(DictCheckpointSaver({})).execute({}, execution_id=str(uuid.uuid4()), resume=True))
+
+
+def test_checkpoint_size_bound_and_workflow_settings():
+    rows, execution_id = {}, str(uuid.uuid4())
+    FlakyNode.fail = False
+    builder = _builder(DictCheckpointSaver(rows, max_bytes=64))
+    assert asyncio.run(builder.execute({"input": "go"}, execution_id=execution_id))["success"]
+    assert rows == {} and builder.checkpointer.stats()["skipped_oversize"] > 0
+
+    # Without an execution_id nothing is persisted
+    builder = _builder(DictCheckpointSaver(rows))
+    assert asyncio.run(builder.execute({"input": "go"}))["success"]
+    assert rows == {}
+
+    assert checkpoint_settings({"nodes": []}) == (False, 1024 * 1024)
+    assert checkpoint_settings({"settings": {"checkpointing": True}})[0] is True
+    assert checkpoint_settings({"settings": {"checkpointing": {"enabled": True, "max_kb": 256}}}) == (True, 256 * 1024)
+
+
+class _ResumeSession:
+    """Answers the checkpoint and workflow lookups; the claim UPDATE matches ``claimable`` rows."""
+
+    def __init__(self, claimable):
+        self.claimable = claimable
+        self.updates, self.commits, self.rollbacks = [], 0, 0
+
+    async def get(self, model, key):
+        return {ExecutionCheckpoint: SimpleNamespace(), Workflow: SimpleNamespace(id=uuid.uuid4())}[model]
+
+    async def execute(self, statement):
+        self.updates.append(statement)
+        claimed = statement.compile().params["id_1"] if self.claimable else None
+        return SimpleNamespace(scalar_one_or_none=lambda: claimed)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def refresh(self, instance):
+        pass
+
+
+def _resume(session, execution_status):
+    execution = SimpleNamespace(id=uuid.uuid4(), workflow_id=uuid.uuid4(), status=execution_status)
+
+    async def get_execution(db, execution_id, user_id):
+        return execution
+
+    background = BackgroundTasks()
+    result = asyncio.run(executions_api.resume_workflow_execution(
+        execution.id,
+        background,
+        db=session,
+        current_user=SimpleNamespace(id=uuid.uuid4()),
+        execution_service=SimpleNamespace(get_execution=get_execution),
+    ))
+    return result, background
+
+
+def test_resume_claims_failed_executions_and_runs_in_the_background():
+    session = _ResumeSession(claimable=True)
+    execution, background = _resume(session, "failed")
+
+    (claim,) = session.updates
+    sql = str(claim.compile(dialect=postgresql.dialect()))
+    assert "workflow_executions.status IN (__[POSTCOMPILE_status_1])" in sql and "RETURNING" in sql
+    assert claim.compile().params["status_1"] == list(executions_api.RESUMABLE_STATUSES)
+    assert session.commits == 1
+    (task,) = background.tasks
+    assert task.func is executions_api._resume_in_background and task.args[0] == execution.id
+
+    session = _ResumeSession(claimable=False)  # running, completed, or claimed by a concurrent resume
+    with pytest.raises(HTTPException) as error:
+        _resume(session, "running")
+    assert error.value.status_code == 409 and session.commits == 0 and session.rollbacks == 1
+
+
+def _assert_matches_orphans(statement):
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "workflow_executions.status = %(status_" in sql
+    assert "coalesce(workflow_executions.started_at, workflow_executions.created_at) < now() -" in sql
+    assert "EXISTS (SELECT execution_checkpoints.execution_id" in sql
+    assert "execution_checkpoints.updated_at < now() -" in sql
+
+
+def test_resume_claims_running_executions_whose_checkpoint_went_stale():
+    # The pod died mid-run: the row still says running but its checkpoint stopped advancing
+    session = _ResumeSession(claimable=True)
+    execution, background = _resume(session, "running")
+
+    (claim,) = session.updates
+    _assert_matches_orphans(claim)
+    assert "running" in claim.compile().params.values()
+    assert session.commits == 1
+    (task,) = background.tasks
+    assert task.args[0] == execution.id
+
+
+class _SweepSession:
+    def __init__(self, rowcount):
+        self.rowcount, self.statements, self.commits = rowcount, [], 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(rowcount=self.rowcount)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_orphaned_running_executions_are_swept_to_interrupted():
+    session = _SweepSession(rowcount=2)
+    assert asyncio.run(interrupt_orphaned_executions(lambda: session, timeout_seconds=60)) == 2
+
+    (sweep,) = session.statements
+    _assert_matches_orphans(sweep)
+    assert sweep.compile().params["status"] == "interrupted"
+    assert session.commits == 1
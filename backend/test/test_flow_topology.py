@@ -0,0 +1,91 @@
+"""
+Flow Topology Tests
+===================
+
+Cycles, topological order and handle compatibility come from one linear pass
+(no recursion, so deep chains are fine); validation reports every problem at
+once and is cached by flow fingerprint; ConnectionManager only searches for
+cycles inside cyclic components.
+"""
+
+import time
+
+from app.core.connection_manager import ConnectionManager
+from app.core.flow_topology import analyze_flow, strongly_connected_components
+from app.core.graph_builder.types import NodeConnection
+from app.core.graph_builder.validation import ValidationEngine, clear_validation_cache
+from benchmarks.flows import NODE_REGISTRY, StubNode, edge, linear_chain, node
+
+
+def test_components_order_and_handles():
+    successors = {"a": ["b"], "b": ["c", "d"], "c": ["b"], "d": ["d"], "e": []}
+    components = strongly_connected_components(["e", "d", "c", "b", "a"], successors)
+    order = [node for component in components for node in component]
+    assert order.index("a") < order.index("b") < order.index("d")
+    assert sorted(map(sorted, components)) == [["a"], ["b", "c"], ["d"], ["e"]]
+
+    flow = linear_chain(3)
+    flow["edges"] += [edge("stub_2", "stub_0"), edge("stub_1", "stub_1", "bogus")]
+    flow["nodes"].append(node("lonely", "StubNode"))
+    stub_handles = lambda node_type: ({"input"}, {"output"}) if node_type == "StubNode" else None
+    topology = analyze_flow(flow["nodes"], flow["edges"], handles_for=stub_handles)
+    assert [sorted(cycle) for cycle in topology.cycles] == [["stub_0", "stub_1", "stub_2"]]
+    assert topology.isolated == ["lonely"]
+    assert topology.handle_problems == ["Edge stub_1 -> stub_1: StubNode has no input handle 'bogus'"]
+
+    deep = linear_chain(20_000)
+    assert analyze_flow(deep["nodes"], deep["edges"]).is_acyclic
+
+
+class _Registry:
+    """NodeRegistry stand-in exposing get_node_metadata, so results are cached."""
+
+    def __init__(self):
+        self.nodes = dict(NODE_REGISTRY)
+
+    def get_node(self, name):
+        return self.nodes.get(name)
+
+    def get_node_metadata(self, name):
+        node_class = self.nodes.get(name)
+        return node_class().metadata if node_class else None
+
+
+def test_validation_reports_everything_and_is_cached():
+    clear_validation_cache()
+    flow = linear_chain(2000)
+    flow["edges"] += [edge("stub_10", "stub_5"), edge("stub_20", "stub_15"),
+                      edge("stub_30", "stub_31", "bogus"), edge("stub_40", "ghost")]
+    engine = ValidationEngine(_Registry())
+
+    started = time.perf_counter()
+    result = engine.validate_workflow(flow)
+    assert time.perf_counter() - started < 1.0
+    assert result.errors == ["Edge references unknown target node: ghost"]
+    cycles = [w for w in result.warnings if w.startswith("Potential cycle")]
+    assert len(cycles) == 2
+    assert any("no input handle 'bogus'" in w for w in result.warnings)
+    assert engine.get_validation_stats()["cached"] is False
+
+    again = engine.validate_workflow(flow)
+    assert engine.get_validation_stats()["cached"] is True
+    assert again.warnings == result.warnings and again is not result
+
+    flow["edges"].pop()
+    assert ValidationEngine(_Registry()).validate_workflow(flow).valid
+
+
+def test_connection_manager_cycle_check_is_scoped_to_cycles():
+    count = 3000
+    nodes = {f"n{i}": StubNode() for i in range(count)}
+    chain = [NodeConnection(f"n{i}", "output", f"n{i + 1}", "input") for i in range(count - 1)]
+    manager = ConnectionManager()
+
+    # Reverse order used to cost a full DFS per edge and overflow the recursion limit
+    mappings = manager.build_connection_mappings(chain[::-1], nodes)
+    assert all(mappings[f"n{i}"].input_connections for i in range(1, count))
+
+    closing = NodeConnection("n2", "output", "n0", "input")
+    manager.build_connection_mappings(chain[:3] + [closing], nodes)
+    assert manager._cyclic_component.keys() == {"n0", "n1", "n2"}
+    assert "input" not in manager._connection_cache["n0"].input_connections
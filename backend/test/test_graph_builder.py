@@ -0,0 +1,83 @@
+"""
+Graph Builder Tests
+===================
+
+Loop nodes pass validation and are wired from START and from regular edges,
+long chains run past LangGraph's default recursion limit, parallel branches
+writing ``last_output`` in the same step keep a deterministic value, and output
+templating iterates a snapshot of ``node_outputs`` while sibling branches add
+to it.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from langgraph.graph import END, START, StateGraph
+
+from app.core.graph_builder import GraphBuilder
+from app.core.graph_builder.node_executor import NodeExecutor
+from app.core.state import FlowState
+
+from benchmarks.flows import NODE_REGISTRY, StubNode, linear_chain, loop_flow, wide_fanout
+
+
+def _run(flow):
+    builder = GraphBuilder(NODE_REGISTRY)
+    builder.build_from_flow(flow)
+    StubNode.invocations = 0
+    return asyncio.run(builder.execute({"input": "go"}))
+
+
+def test_loop_node_is_wired_from_start_and_regular_edges():
+    result = _run(loop_flow(4))
+    assert result["success"], result.get("error")
+    assert StubNode.invocations == 4
+
+
+def test_long_chain_runs_past_the_default_recursion_limit():
+    result = _run(linear_chain(60))
+    assert result["success"], result.get("error")
+    assert StubNode.invocations == 60
+
+
+def test_parallel_branches_keep_the_latest_output():
+    result = _run(wide_fanout(5))
+    assert result["success"], result.get("error")
+    assert StubNode.invocations == 5
+
+    def branch(name, delay):
+        async def write(state):
+            await asyncio.sleep(delay)
+            return {"last_output": name, "node_outputs": {name: name}}
+        return write
+
+    # "b" finishes first, yet the write order is by node id: "b" wins either way
+    for delay_a, delay_b in ((0.0, 0.02), (0.02, 0.0)):
+        graph = StateGraph(FlowState)
+        graph.add_node("b", branch("b", delay_b))
+        graph.add_node("a", branch("a", delay_a))
+        graph.add_edge(START, "a")
+        graph.add_edge(START, "b")
+        graph.add_edge("a", END)
+        graph.add_edge("b", END)
+        final = asyncio.run(graph.compile().ainvoke(FlowState(session_id="s")))
+        assert final["last_output"] == "b"
+        assert final["node_outputs"] == {"a": "a", "b": "b"}
+
+
+def test_templating_iterates_a_snapshot_of_node_outputs():
+    state = FlowState(session_id="s", current_input="hello", node_outputs={"stub_0": "ok"})
+
+    class _GrowingRegistry(dict):
+        """Looking up a node adds a sibling branch's output, as a concurrent branch would."""
+
+        def get(self, node_id, default=None):
+            state.node_outputs[f"{node_id}_sibling"] = "ok"
+            return default
+
+    executor = NodeExecutor()
+    executor.set_nodes_registry(_GrowingRegistry(stub_0=None))
+    rendered = executor._apply_node_output_templating(SimpleNamespace(id="stub_1"), {"prompt": "{{input}}!"}, state)
+
+    assert rendered == {"prompt": "hello!"}
+    assert "stub_0_sibling" in state.node_outputs
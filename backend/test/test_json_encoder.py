@@ -0,0 +1,84 @@
+"""
+Fast-Path JSON Encoder Tests
+============================
+
+The single-pass orjson encoder produces the same JSON as the recursive
+make_json_serializable walk, including LangChain types resolved through
+registered handlers, and encodes large agent transcripts without falling back
+to the recursive walk.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+import app.core.json_utils as json_utils
+from app.core.json_utils import (
+    dumps_bytes,
+    encode_sse,
+    make_json_serializable,
+    register_json_type,
+    to_jsonable,
+    unregister_json_type,
+)
+
+
+class Money:
+    def __init__(self, cents):
+        self.cents = cents
+
+
+@pytest.fixture
+def money_type():
+    register_json_type(Money, lambda m: f"{m.cents / 100:.2f} EUR")
+    yield Money
+    unregister_json_type(Money)
+
+
+def _transcript(turns: int):
+    return {
+        "session_id": uuid.uuid4(),
+        "messages": [
+            (HumanMessage if n % 2 else AIMessage)(content=f"turn {n} " + "lorem ipsum " * 40)
+            for n in range(turns)
+        ],
+        "sources": [
+            Document(page_content="chunk " * 60, metadata={"id": uuid.uuid4(), "at": datetime.now(timezone.utc)})
+            for _ in range(turns // 4)
+        ],
+        "steps": [{"at": datetime.now(timezone.utc), "cost": Decimal("0.25"), "n": n} for n in range(turns)],
+        "agent": RunnableLambda(lambda x: x),
+    }
+
+
+def test_matches_recursive_serializer():
+    transcript = _transcript(50)
+
+    assert to_jsonable(transcript) == make_json_serializable(transcript)
+    assert json.loads(dumps_bytes(transcript)) == make_json_serializable(transcript)
+    assert to_jsonable(transcript)["agent"] == "<RunnableLambda>"
+
+
+def test_registered_handlers_and_sse_frames(money_type):
+    assert json.loads(dumps_bytes({"price": money_type(1999), 1: {2, 3}})) == {"price": "19.99 EUR", "1": [2, 3]}
+    assert encode_sse({"type": "ping"}, event_id="a-1") == b'id: a-1\ndata: {"type":"ping"}\n\n'
+    # Integers beyond 64 bits fall back to the recursive path instead of failing
+    assert json.loads(dumps_bytes({"big": 2 ** 70})) == {"big": 2 ** 70}
+
+
+def test_large_transcript_is_encoded_in_a_single_pass(monkeypatch):
+    transcript = _transcript(2000)
+    expected = make_json_serializable(transcript)
+
+    def recursive_walk(*args, **kwargs):
+        raise AssertionError("fell back to make_json_serializable")
+
+    monkeypatch.setattr(json_utils, "make_json_serializable", recursive_walk)
+    assert json.loads(dumps_bytes(transcript)) == expected
+    assert to_jsonable(transcript) == expected
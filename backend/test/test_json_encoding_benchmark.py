@@ -0,0 +1,27 @@
+"""
+JSON Encoding Benchmark Tests
+=============================
+
+The transcript benchmark runs both encoders on the same payload, reports every
+timing and speedup, and flags cases below the required speedup.
+"""
+
+from benchmarks import json_encoding
+
+
+def test_small_transcripts_report_every_metric():
+    results = json_encoding.run_suite(turns=(8, 40), repeats=1)
+
+    assert set(results["cases"]) == {"transcript-8", "transcript-40"}
+    for case in results["cases"].values():
+        assert case["payload_kb"] > 0
+        assert all(case[key] > 0 for key in ("encode_stdlib_ms", "encode_orjson_ms", "decode_stdlib_ms", "decode_orjson_ms"))
+    assert results["cases"]["transcript-40"]["payload_kb"] > results["cases"]["transcript-8"]["payload_kb"]
+
+
+def test_speedup_check_flags_slow_cases():
+    results = {"cases": {"transcript-100": {"encode_speedup": 1.5}, "transcript-1000": {"encode_speedup": 6.0}}}
+
+    (failure,) = json_encoding.check_speedup(results, min_speedup=2.0)
+    assert failure.startswith("transcript-100 encode speedup")
+    assert json_encoding.check_speedup(results, min_speedup=1.0) == []
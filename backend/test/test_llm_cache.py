@@ -0,0 +1,50 @@
+"""
+LLM Response Cache Tests
+========================
+
+Replays prompts through a fake chat model to check cache hits, key
+normalization, per-entry expiry and that node caches are always workflow scoped.
+"""
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core.llm_cache import DeterministicLLMCache, InMemoryLRUBackend, get_node_llm_cache, make_cache_key
+
+
+def test_identical_prompt_is_served_from_cache():
+    cache = DeterministicLLMCache(InMemoryLRUBackend(), namespace="wf-1")
+    llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+
+    assert llm.invoke("hello").content == "first"
+    assert llm.invoke("hello").content == "first"
+    assert llm.invoke("different").content == "second"
+
+
+def test_volatile_message_fields_do_not_change_the_key():
+    from langchain_core.load import dumps
+
+    a = dumps([HumanMessage("hi"), AIMessage("yo", id="run-1", response_metadata={"latency": 1})])
+    b = dumps([HumanMessage("hi"), AIMessage("yo", id="run-2", response_metadata={"latency": 9})])
+
+    assert make_cache_key(a, "model") == make_cache_key(b, "model")
+    assert make_cache_key(a, "model", "wf-1") != make_cache_key(a, "model", "wf-2")
+    assert make_cache_key(a, "model") != make_cache_key(a, "other-model")
+
+
+def test_entries_expire_after_ttl():
+    now = [0.0]
+    backend = InMemoryLRUBackend(clock=lambda: now[0])
+    backend.set("k", "wf-1", "v", ttl_seconds=10)
+
+    assert backend.get("k") == "v"
+    now[0] = 10.0
+    assert backend.get("k") is None
+
+
+def test_node_cache_requires_a_workflow_namespace():
+    config = {"enable_cache": True, "cache_ttl_seconds": 60}
+
+    assert get_node_llm_cache(config, namespace=None) is None
+    assert get_node_llm_cache({"enable_cache": False}, namespace="wf-1") is None
+    assert get_node_llm_cache(config, namespace="wf-1").namespace == "wf-1"
@@ -0,0 +1,64 @@
+"""
+LLM Client Registry Tests
+=========================
+
+Checks client reuse per (base URL, credential, timeout), idle eviction on
+access, and that async clients evicted outside an event loop are still closed.
+"""
+
+import asyncio
+import gc
+
+from app.core.llm_client_registry import LLMClientRegistry
+
+
+class _FakeChatModel:
+    pass
+
+
+def test_clients_are_shared_per_key():
+    registry = LLMClientRegistry()
+
+    first = registry.get_clients("https://api.example.com/v1/", "sk-a", 60)
+    again = registry.get_clients("https://api.example.com/v1", "sk-a", 60)
+    other_key = registry.get_clients("https://api.example.com/v1", "sk-b", 60)
+    other_timeout = registry.get_clients("https://api.example.com/v1", "sk-a", 30)
+
+    assert again.sync is first.sync and again.async_ is first.async_
+    assert other_key.sync is not first.sync
+    assert other_timeout.sync is not first.sync
+    assert "sk-a" not in repr(first.key)
+    assert registry.stats()["hits"] == 1
+    assert registry.stats()["misses"] == 3
+
+
+def test_idle_eviction_skips_clients_with_live_owners():
+    registry = LLMClientRegistry(idle_ttl=-1)
+    owned = registry.get_clients(None, "sk-a", 60)
+    owner = _FakeChatModel()
+    registry.attach(owned.key, owner)
+    registry.get_clients(None, "sk-b", 60)
+
+    assert registry.evict_idle() == 1
+    assert registry.stats()["clients"] == 1
+
+    del owner
+    gc.collect()
+    assert registry.evict_idle() == 1
+    assert owned.sync.is_closed
+
+
+def test_idle_clients_are_swept_on_access_and_async_clients_closed_later():
+    registry = LLMClientRegistry(idle_ttl=-1, sweep_interval=0)
+    idle = registry.get_clients(None, "sk-a", 60)
+    registry.get_clients(None, "sk-b", 60)  # sweeps sk-a outside any event loop
+
+    assert idle.sync.is_closed and not idle.async_.is_closed
+    assert registry.stats()["pending_async_close"] == 1
+
+    asyncio.run(registry.sweep())
+    assert idle.async_.is_closed
+    assert registry.stats()["pending_async_close"] == 0
+
+    asyncio.run(registry.aclose_all())
+    assert registry.stats()["clients"] == 0
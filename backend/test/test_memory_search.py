@@ -0,0 +1,56 @@
+"""
+Memory Lexical Search Tests
+===========================
+
+Memory search reads the GIN-indexed ``search_vector`` column instead of
+scanning with LIKE or re-fitting TF-IDF over every memory per query.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from app.models.memory import Memory
+from app.services.memory import MemoryRepo, MemoryService
+
+USER_ID = str(uuid.uuid4())
+
+
+class _RecordingQuery(Query):
+    """Captures the compiled statement and returns canned rows instead of hitting a database."""
+
+    def all(self):
+        self.session.info["sql"] = str(self.statement.compile(dialect=postgresql.dialect()))
+        return self.session.info.get("rows", [])
+
+
+def _memory(content: str) -> Memory:
+    return Memory(
+        id=uuid.uuid4(), user_id=uuid.UUID(USER_ID), session_id="s1", content=content,
+        context="", memory_metadata={"tag": "x"}, created_at=datetime.utcnow(),
+    )
+
+
+def test_search_uses_full_text_index_not_like():
+    db = Session(query_cls=_RecordingQuery)
+    MemoryRepo().search_memories_ranked(db, USER_ID, "favourite coffee order", limit=5)
+    sql = db.info["sql"]
+
+    assert "memories.search_vector @@ plainto_tsquery" in sql
+    assert "ORDER BY ts_rank_cd(memories.search_vector" in sql
+    assert "LIKE" not in sql.upper()
+    assert Memory.__table__.c.search_vector.computed.persisted
+    assert any(ix.name == "idx_memories_search_vector_gin" for ix in Memory.__table__.indexes)
+
+
+def test_retrieve_memories_keeps_index_order_and_scores():
+    best, other = _memory("oat milk flat white"), _memory("flat tyre on the way home")
+    db = Session(query_cls=_RecordingQuery, info={"rows": [(best, 0.6), (other, 0.1)]})
+
+    items = MemoryService().retrieve_memories(db, USER_ID, query="flat white", limit=2)
+
+    assert [item.content for item in items] == [best.content, other.content]
+    assert items[0].metadata == {"tag": "x", "similarity_score": 0.6}
+    assert best.memory_metadata == {"tag": "x"}
@@ -0,0 +1,73 @@
+"""
+Memory Search Benchmark Tests
+=============================
+
+The database-free parts of benchmarks.memory_search: the synthetic corpus is
+deterministic, its words are distinct and the planted phrase lands in the
+expected share of memories; the ILIKE baseline is the previous LIKE query;
+speedups are derived from p50 and checked against the minimum.
+"""
+
+from sqlalchemy.dialects import postgresql
+
+from benchmarks import memory_search
+
+
+class _Query:
+    """Records the statement db.query(...).filter(...).order_by(...).limit(...) would run."""
+
+    def __init__(self, *entities):
+        self.entities, self.clauses = entities, []
+
+    def filter(self, *clauses):
+        self.clauses += clauses
+        return self
+
+    def order_by(self, *clauses):
+        self.ordering = clauses
+        return self
+
+    def limit(self, limit):
+        self.limit_value = limit
+        return self
+
+    def all(self):
+        return []
+
+
+def test_corpus_is_deterministic_with_a_planted_phrase():
+    words = memory_search.vocabulary()
+    assert len(set(words)) == memory_search.VOCABULARY_SIZE
+
+    corpus = list(memory_search.memory_texts(3_000))
+    assert corpus == list(memory_search.memory_texts(3_000))
+    planted = [content for content, _ in corpus if memory_search.PLANTED_PHRASE in content]
+    assert len(planted) == 3_000 // memory_search.PLANTED_EVERY
+    assert set(memory_search.benchmark_queries()) == {"common", "medium", "rare", "phrase"}
+
+
+def test_ilike_baseline_is_the_previous_like_query():
+    recorded = []
+
+    class _Session:
+        def query(self, *entities):
+            recorded.append(_Query(*entities))
+            return recorded[-1]
+
+    memory_search.ilike_search(_Session(), "00000000-0000-0000-0000-000000000001", "Invoice", limit=5)
+    (query,) = recorded
+    sql = " AND ".join(str(clause.compile(dialect=postgresql.dialect())) for clause in query.clauses)
+    assert "lower(memories.content) LIKE '%%' || %(lower_1)s || '%%'" in sql
+    assert "lower(memories.context) LIKE" in sql
+    assert query.limit_value == 5
+
+
+def test_speedups_are_checked_at_p50():
+    results = {"queries": {
+        "rare": {"ranked": {"p50_ms": 2.0}, "ilike": {"p50_ms": 20.0}},
+        "common": {"ranked": {"p50_ms": 50.0}, "ilike": {"p50_ms": 5.0}},
+    }}
+
+    assert memory_search.speedups(results) == {"rare": 10.0, "common": 0.1}
+    (failure,) = memory_search.check_speedup(results, min_speedup=2.0)
+    assert failure.startswith("common ranked speedup")
@@ -0,0 +1,146 @@
+"""
+Near-Duplicate Detection Tests
+==============================
+
+MinHash/LSH dedup in the document loader drops lightly edited copies, keeps
+documents that merely share a long header, and skips documents the same user
+already ingested into a persisted dedup collection; the collection owner is
+the executing user, never a node input.
+"""
+
+import random
+import uuid
+
+import numpy as np
+from langchain_core.documents import Document
+from sqlalchemy.dialects import postgresql
+
+from app.core import database, near_duplicates
+from app.core.near_duplicates import NearDuplicateIndex
+from app.nodes.document_loaders.document_loader import DocumentLoaderNode
+
+_WORDS = [f"w{n}" for n in range(2000)]
+
+
+def _text(seed: int, words: int = 400) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def test_near_duplicates_are_found_and_shared_headers_are_not():
+    original = _text(1)
+    edited = original.replace(original.split()[200], "EDITED", 1).upper()  # one edit, different casing
+    header = _text(2, words=300)
+
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("original", original)
+    index.add("report-a", header + " " + _text(3))
+
+    match = index.find_duplicate(edited)
+    assert match is not None and match[0] == "original" and match[1] > 0.9
+    # Same 300-word header, different body: the old first-1000-chars hash merged these
+    assert index.find_duplicate(header + " " + _text(4)) is None
+    assert index.find_duplicate(_text(5)) is None
+
+
+def test_loader_skips_documents_known_to_a_persisted_collection(monkeypatch):
+    stored = {}
+
+    def load(user_id, collection, threshold):
+        index = NearDuplicateIndex(threshold=threshold)
+        for key, raw in stored.get((user_id, collection), []):
+            index.add_signature(key, np.frombuffer(raw, dtype=np.uint32))
+        return index
+
+    def save(user_id, collection, index, entries):
+        stored.setdefault((user_id, collection), []).extend((key, sig.tobytes()) for key, sig in entries)
+        return len(entries)
+
+    monkeypatch.setattr("app.nodes.document_loaders.document_loader.load_collection_index", load)
+    monkeypatch.setattr("app.nodes.document_loaders.document_loader.save_collection_signatures", save)
+
+    node = DocumentLoaderNode()
+    first_batch = [Document(page_content=_text(n), metadata={"source": f"doc-{n}"}) for n in range(3)]
+    assert len(node._deduplicate_documents(first_batch, 0.85, "kb", user_id="user-1")) == 3
+
+    repeat = [Document(page_content=_text(1) + " appendix", metadata={"source": "doc-1-copy"}),
+              Document(page_content=_text(9), metadata={"source": "doc-9"})]
+    kept = node._deduplicate_documents(repeat, 0.85, "kb", user_id="user-1")
+    assert [d.metadata["source"] for d in kept] == ["doc-9"]
+    assert len(stored[("user-1", "kb")]) == 4
+    # Other collections, and the same collection name of another user, are independent
+    assert len(node._deduplicate_documents(repeat, 0.85, "other", user_id="user-1")) == 2
+    assert len(node._deduplicate_documents(repeat, 0.85, "kb", user_id="user-2")) == 2
+    # Without a user nothing is loaded or persisted
+    assert len(node._deduplicate_documents(repeat, 0.85, "kb")) == 2
+    assert set(stored) == {("user-1", "kb"), ("user-1", "other"), ("user-2", "kb")}
+
+
+def test_dedup_collection_owner_comes_from_the_executor_not_inputs(monkeypatch):
+    owners = []
+
+    def dedup(self, documents, threshold, collection=None, user_id=None):
+        owners.append((threshold, user_id))
+        return documents
+
+    monkeypatch.setattr(DocumentLoaderNode, "_deduplicate_documents", dedup)
+    documents = [Document(page_content=_text(n), metadata={"source": f"doc-{n}"}) for n in range(2)]
+    inputs = {"dedup_collection": "kb", "dedup_threshold": 0.1, "user_id": "someone-else", "quality_threshold": 0}
+
+    node = DocumentLoaderNode()
+    node.execute(inputs, {"input_documents": documents})
+    node.user_id = "user-1"
+    node.execute(inputs, {"input_documents": documents})
+    assert owners == [(0.5, None), (0.5, "user-1")]
+
+
+class _SignatureSession:
+    """Synchronous session recording query filters and added rows."""
+
+    def __init__(self):
+        self.filters, self.added = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def query(self, *columns):
+        return self
+
+    def filter(self, *criteria):
+        self.filters.append(criteria)
+        return self
+
+    def all(self):
+        return []
+
+    def add_all(self, rows):
+        self.added += rows
+
+    def commit(self):
+        pass
+
+
+def test_persisted_signatures_are_scoped_to_the_user(monkeypatch):
+    user_id = uuid.uuid4()
+    session = _SignatureSession()
+    monkeypatch.setattr(database, "SessionLocal", lambda: session)
+
+    index = near_duplicates.load_collection_index(str(user_id), "kb", 0.85)
+    assert near_duplicates.save_collection_signatures(user_id, "kb", index, [("doc-1", index.hasher.signature("x y z"))]) == 1
+
+    (criteria,) = session.filters
+    sql = " AND ".join(str(c.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+                       for c in criteria)
+    assert f"document_signatures.user_id = '{user_id}'" in sql and "document_signatures.collection = 'kb'" in sql
+    (signature,) = session.added
+    assert signature.user_id == user_id and signature.collection == "kb"
+
+
+def test_lsh_bands_cover_signature():
+    for threshold in (0.5, 0.7, 0.85, 0.95):
+        bands, rows = near_duplicates.lsh_bands(threshold, 128)
+        assert bands * rows == 128
+        assert (1 / bands) ** (1 / rows) <= threshold
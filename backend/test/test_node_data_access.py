@@ -0,0 +1,318 @@
+"""
+Node Data Access Tests
+======================
+
+Nodes reach the database only through the execution's NodeDataAccess: its
+queries run on the event loop, node code runs off it, and the repository is
+closed when the execution ends. Each unit of work holds the session lock and
+ends its transaction (rolled back on error or timeout), credentials are
+decrypted once per execution, and memories are scoped to their user.
+Synchronous sessions opened on the event loop thread are refused in "raise"
+mode, and no node module imports the synchronous session helpers any more.
+
+The repository runs against an async SQLite database with the memories and
+user_credentials tables.
+"""
+
+import asyncio
+import base64
+import re
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+from langchain_core.messages import AIMessage
+from sqlalchemy import Column, MetaData, Table, Text, create_engine, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.core import database
+from app.core.database import BlockingDatabaseCallError, on_event_loop_thread
+from app.core.encryption import encrypt_data
+from app.core.graph_builder import GraphBuilder
+from app.core.node_data_access import NodeDataAccess
+from app.models.memory import Memory
+from app.models.user_credential import UserCredential
+from app.nodes.base import NodeInput, NodeOutput, NodeType, ProcessorNode
+from app.nodes.memory.buffer_memory import BufferMemoryNode
+
+from benchmarks.flows import NODE_REGISTRY, linear_chain
+
+pytest.importorskip("aiosqlite")
+
+NODES_DIR = Path(__file__).resolve().parents[1] / "app" / "nodes"
+USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+class RecallNode(ProcessorNode):
+    """Reads and extends conversation history through a BufferMemoryNode."""
+
+    seen = []
+
+    def __init__(self):
+        super().__init__()
+        self._metadata = {
+            "name": "RecallNode",
+            "display_name": "Recall",
+            "description": "Uses conversation memory",
+            "node_type": NodeType.PROCESSOR,
+            "inputs": [NodeInput(name="input", type="any", description="Upstream output",
+                                 is_connection=True, required=False)],
+            "outputs": [NodeOutput(name="output", type="any", description="History size")],
+        }
+
+    def execute(self, inputs: Dict[str, Any], connected_nodes: Dict[str, Any]) -> Dict[str, Any]:
+        memory = BufferMemoryNode()
+        memory.data_access, memory.user_id = self.data_access, self.user_id
+        history = memory.load_messages("chat-1")
+        memory.save_messages("chat-1", [AIMessage(content="pong")])
+        RecallNode.seen.append((on_event_loop_thread(), len(history), len(self.credentials)))
+        return {"output": f"{len(history)} messages"}
+
+
+def _create_tables(connection):
+    """
+    memories and user_credentials as SQLite can hold them: UUIDs as CHAR(32)
+    (a "UUID" column would get numeric affinity), the tsvector as plain text,
+    and no users table.
+    """
+    metadata = MetaData()
+    for table in (Memory.__table__, UserCredential.__table__):
+        Table(table.name, metadata, *(
+            Column(column.name, Text if column.computed is not None else column.type.as_generic(),
+                   primary_key=column.primary_key)
+            for column in table.columns
+        ))
+    metadata.create_all(connection)
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch):
+    """Async SQLite session factory, installed as the application's AsyncSessionLocal."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", poolclass=NullPool)
+    statements = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *_: statements.append((statement, on_event_loop_thread())),
+    )
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(_create_tables)
+
+    asyncio.run(setup())
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(database, "AsyncSessionLocal", factory)
+    yield SimpleNamespace(engine=engine, factory=factory, statements=statements)
+    asyncio.run(engine.dispose())
+
+
+def _add(app_db, *rows):
+    async def insert():
+        async with app_db.factory() as db:
+            db.add_all(rows)
+            await db.commit()
+
+    asyncio.run(insert())
+
+
+def _credential(user_id, name, secret):
+    encrypted = base64.b64encode(encrypt_data(secret)).decode("utf-8")
+    return UserCredential(user_id=user_id, name=name, service_type="openai", encrypted_secret=encrypted)
+
+
+@pytest.fixture
+def guarded_sync_engine(monkeypatch):
+    """A synchronous engine that refuses checkouts on the event loop and counts all of them."""
+    engine = create_engine("sqlite://", poolclass=QueuePool)
+    database.install_event_loop_guard(engine)
+    checkouts = []
+    event.listen(engine, "checkout", lambda *_: checkouts.append(on_event_loop_thread()))
+    monkeypatch.setattr(database, "event_loop_guard_mode", "raise")
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    return SimpleNamespace(engine=engine, checkouts=checkouts)
+
+
+def test_nodes_use_the_execution_repository_off_the_loop(app_db, guarded_sync_engine, monkeypatch):
+    _add(app_db,
+         Memory(user_id=USER_ID, session_id="chat-1", content="ping", context="human", source_type="chat"),
+         _credential(USER_ID, "openai", {"api_key": "sk-test"}))
+    opened = []
+    monkeypatch.setattr(NodeDataAccess, "aclose", _recording_aclose(NodeDataAccess.aclose, opened))
+    RecallNode.seen.clear()
+    app_db.statements.clear()
+
+    flow = linear_chain(3)
+    flow["nodes"][2]["type"] = "RecallNode"  # stub_0 → recall → stub_2
+    builder = GraphBuilder({**NODE_REGISTRY, "RecallNode": RecallNode})
+    builder.build_from_flow(flow)
+    result = asyncio.run(builder.execute({"input": "go"}, user_id=str(USER_ID)))
+
+    assert result["success"], result.get("error")
+    assert RecallNode.seen == [(False, 1, 1)]
+    assert app_db.statements and all(on_loop for _, on_loop in app_db.statements)
+    (data_access,) = opened
+    assert data_access.stats()["closed"] and data_access.stats()["sessions_opened"] == 1
+    assert _memory_contents(app_db, USER_ID) == ["pong", "ping"]
+    assert guarded_sync_engine.checkouts == []  # no synchronous session at all
+
+
+def _recording_aclose(aclose, opened):
+    async def recording_aclose(self):
+        opened.append(self)
+        await aclose(self)
+
+    return recording_aclose
+
+
+def _memory_contents(app_db, user_id):
+    async def load():
+        data_access = await NodeDataAccess.open(app_db.factory)
+        try:
+            return [memory.content for memory in await data_access.load_memories("chat-1", user_id)]
+        finally:
+            await data_access.aclose()
+
+    return asyncio.run(load())
+
+
+def test_units_of_work_are_serialized_and_end_their_transaction(app_db):
+    async def scenario():
+        data_access = await NodeDataAccess.open(app_db.factory)
+        inside, overlaps = [], []
+
+        async def unit(name):
+            async with data_access.session() as db:
+                overlaps.append(bool(inside))
+                inside.append(name)
+                await db.execute(text("SELECT 1"))
+                await asyncio.sleep(0.01)
+                inside.remove(name)
+
+        await asyncio.gather(unit("a"), unit("b"), unit("c"))
+        assert overlaps == [False, False, False]
+        assert not data_access._session.in_transaction()  # not left idle in transaction
+
+        with pytest.raises(RuntimeError, match="node failed"):
+            async with data_access.session() as db:
+                db.add(Memory(session_id="chat-1", content="lost", context="human", source_type="chat"))
+                await db.flush()
+                raise RuntimeError("node failed")
+        assert not data_access._session.in_transaction()
+        async with data_access.session() as db:
+            assert await db.scalar(select(func.count()).select_from(Memory)) == 0  # rolled back
+
+        await data_access.aclose()
+        with pytest.raises(RuntimeError, match="closed"):
+            async with data_access.session():
+                pass
+
+    asyncio.run(scenario())
+
+
+def test_credentials_are_decrypted_once_per_execution(app_db):
+    _add(app_db,
+         _credential(USER_ID, "openai", {"api_key": "sk-test"}),
+         UserCredential(user_id=USER_ID, name="broken", service_type="openai", encrypted_secret="bm90LWVuY3J5cHRlZA=="),
+         _credential(uuid.uuid4(), "someone-else", {"api_key": "sk-other"}))
+
+    async def scenario():
+        data_access = await NodeDataAccess.open(app_db.factory)
+        try:
+            credentials = await data_access.get_credentials(str(USER_ID))
+            assert not data_access._session.in_transaction()
+            queries = len(app_db.statements)
+            assert await data_access.get_credentials(USER_ID) is credentials
+            assert len(app_db.statements) == queries  # cached for the rest of the execution
+            return credentials, data_access.stats()
+        finally:
+            await data_access.aclose()
+
+    credentials, stats = asyncio.run(scenario())
+    secrets = {credential["name"]: credential["secret"] for credential in credentials}
+    assert secrets == {"openai": {"api_key": "sk-test"}, "broken": {}}  # undecryptable secrets come back empty
+    assert stats["cached_credential_users"] == 1
+
+
+def test_memories_are_saved_and_loaded_per_user(app_db):
+    other_user = uuid.uuid4()
+
+    async def scenario():
+        data_access = await NodeDataAccess.open(app_db.factory)
+        try:
+            assert await data_access.save_memories(USER_ID, "chat-1", []) == 0
+            for content in ("first", "second", "third"):
+                await data_access.save_memories(USER_ID, "chat-1", [(content, "human", {"turn": content})])
+            await data_access.save_memories(other_user, "chat-1", [("theirs", "human", {})])
+            await data_access.save_memories(None, "chat-1", [("anonymous", "ai", {})], source_type="webhook")
+            assert not data_access._session.in_transaction()
+
+            recent = await data_access.load_memories("chat-1", str(USER_ID), limit=2)
+            assert not data_access._session.in_transaction()
+            anonymous = await data_access.load_memories("chat-1", None)
+            return recent, anonymous
+        finally:
+            await data_access.aclose()
+
+    recent, anonymous = asyncio.run(scenario())
+    assert [(m.content, m.memory_metadata) for m in recent] == [("third", {"turn": "third"}), ("second", {"turn": "second"})]
+    assert [(m.content, m.source_type) for m in anonymous] == [("anonymous", "webhook")]
+
+
+def test_call_times_out_and_releases_the_session(app_db):
+    async def scenario():
+        data_access = NodeDataAccess(session_factory=app_db.factory, loop=asyncio.get_running_loop(), timeout=0.05)
+
+        async def slow_query():
+            async with data_access.session() as db:
+                await db.execute(text("SELECT 1"))
+                await asyncio.sleep(5)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.to_thread(data_access.call, slow_query())
+        await asyncio.sleep(0.05)  # let the cancellation reach the unit of work
+        assert not data_access._lock.locked()
+        assert not data_access._session.in_transaction()
+
+        assert await asyncio.to_thread(data_access.call, data_access.load_memories("chat-1", None)) == []
+        await data_access.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_blocking_calls_on_the_event_loop_are_refused(app_db, guarded_sync_engine):
+    async def blocking_node_code():
+        with database.SessionLocal() as db:
+            db.execute(text("SELECT 1"))
+
+    with pytest.raises(BlockingDatabaseCallError):
+        asyncio.run(blocking_node_code())
+    assert guarded_sync_engine.engine.pool.checkedout() == 0
+
+    # The same session off the loop is fine
+    with database.SessionLocal() as db:
+        assert db.execute(text("SELECT 1")).scalar() == 1
+
+    async def call_on_loop():
+        data_access = await NodeDataAccess.open(app_db.factory)
+        try:
+            with pytest.raises(BlockingDatabaseCallError):
+                data_access.call(data_access.load_memories("chat-1", None))
+            assert await data_access.run(data_access.load_memories("chat-1", None)) == []
+        finally:
+            await data_access.aclose()
+
+    asyncio.run(call_on_loop())
+
+
+def test_node_modules_do_not_open_synchronous_sessions():
+    pattern = re.compile(r"\bget_db\b|\bSessionLocal\b|get_credentials?_sync|psycopg2\.connect")
+    offenders = [
+        str(path.relative_to(NODES_DIR))
+        for path in NODES_DIR.rglob("*.py")
+        if pattern.search(path.read_text(encoding="utf-8"))
+    ]
+    assert offenders == []
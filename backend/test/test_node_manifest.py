@@ -0,0 +1,81 @@
+"""
+Node Registry Manifest Tests
+============================
+
+Checks that the committed manifest is current and reproducible (per-instance
+defaults are normalized), that manifest-registered nodes are imported only on
+first use, and that cold start is faster than import-based discovery.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.core.node_manifest import DYNAMIC_VALUE, build_manifest, load_manifest
+from app.core.node_registry import NodeRegistry
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+COLD_START_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from app.core.node_registry import node_registry
+node_registry.discover_nodes(use_manifest={use_manifest})
+elapsed = time.perf_counter() - start
+print(f"RESULT {{elapsed}} {{len(node_registry.nodes)}} {{'langchain_openai' in sys.modules}}")
+"""
+
+
+def _cold_start(use_manifest: bool):
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT.format(use_manifest=use_manifest)],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "BACKEND_PORT": os.environ.get("BACKEND_PORT", "8000")},
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    line = next(line for line in result.stdout.splitlines() if line.startswith("RESULT "))
+    _, elapsed, count, heavy_imported = line.split()
+    return float(elapsed), int(count), heavy_imported == "True"
+
+
+def test_manifest_is_current():
+    assert load_manifest() is not None, "run 'python -m app.core.node_manifest build'"
+
+
+def test_rebuilding_the_manifest_is_deterministic():
+    manifest = load_manifest()
+    assert build_manifest() == manifest
+
+    webhook = next(entry for entry in manifest["nodes"] if entry["name"] == "WebhookTrigger")
+    assert webhook["dynamic"] and webhook["metadata"]["description"] == DYNAMIC_VALUE
+
+    registry = NodeRegistry()
+    assert registry.load_manifest()
+    listed = next(config for config in registry.get_all_nodes() if config.name == "WebhookTrigger")
+    assert "/webhook/wh_" in listed.description
+
+
+def test_manifest_nodes_are_imported_on_first_use():
+    registry = NodeRegistry()
+    assert registry.load_manifest()
+
+    assert "OpenAIChat" in registry.nodes
+    assert not registry.nodes.is_loaded("OpenAIChat")
+    assert registry.node_configs["OpenAIChat"].display_name
+
+    node_class = registry.get_node("OpenAIChat")
+    assert registry.nodes.is_loaded("OpenAIChat")
+    assert node_class().metadata == registry.node_configs["OpenAIChat"]
+
+
+def test_manifest_cold_start_is_faster_than_import_discovery():
+    manifest_time, manifest_count, manifest_heavy = _cold_start(use_manifest=True)
+    import_time, import_count, import_heavy = _cold_start(use_manifest=False)
+
+    assert manifest_count == import_count
+    assert not manifest_heavy and import_heavy
+    assert manifest_time < import_time
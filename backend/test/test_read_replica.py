@@ -0,0 +1,117 @@
+"""
+Read Replica Routing Tests
+==========================
+
+Plain SELECTs go to the replica while its lag is within bounds; a write (or
+locking read) pins the rest of the session to the primary; excessive lag, a
+failed lag check or a stale measurement sends reads back to the primary. The
+lag is measured by a background task, never on the request path.
+"""
+
+import asyncio
+import inspect
+import time
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+
+from app.core.database import ReplicaLagMonitor, RoutingSession
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("origin", String))
+
+
+def _engine(origin):
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(items.insert().values(origin=origin))
+    return engine
+
+
+def _monitor(lag):
+    monitor = ReplicaLagMonitor(max_lag=5, interval=60)
+    monitor.lag_seconds, monitor.checked_at = lag, time.monotonic()
+    return monitor
+
+
+def _origins(session, statement=None):
+    return session.execute(statement if statement is not None else select(items.c.origin)).scalars().all()
+
+
+def test_reads_use_replica_until_the_session_writes():
+    primary, replica = _engine("primary"), _engine("replica")
+
+    with RoutingSession(primary=primary, replica=replica, lag_monitor=_monitor(0.5)) as session:
+        assert _origins(session) == ["replica"]
+        assert _origins(session, select(items.c.origin).with_for_update()) == ["primary"]
+        assert _origins(session) == ["primary"]
+
+    with RoutingSession(primary=primary, replica=replica, lag_monitor=_monitor(0.5)) as session:
+        session.execute(items.insert().values(origin="written"))
+        assert _origins(session) == ["primary", "written"]
+        session.rollback()
+
+    with RoutingSession(primary=primary, replica=replica, lag_monitor=_monitor(30)) as session:
+        assert _origins(session) == ["primary"]
+        assert not session.info.get("primary_only")
+
+
+class _Monitor(ReplicaLagMonitor):
+    result = 0.0
+    measurements = 0
+
+    async def _measure(self, replica):
+        self.measurements += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_lag_monitor_marks_replica_unusable_on_lag_error_or_staleness():
+    monitor = _Monitor(max_lag=5, interval=60)
+    assert not monitor.usable
+
+    asyncio.run(monitor.refresh(None))
+    assert monitor.usable
+
+    monitor.result = 12.0
+    asyncio.run(monitor.refresh(None))
+    assert not monitor.usable and monitor.stats()["lag_seconds"] == 12.0
+
+    monitor.result = ConnectionRefusedError("replica down")
+    asyncio.run(monitor.refresh(None))
+    assert not monitor.usable and monitor.error == "replica down"
+
+    monitor.result = 0.0
+    asyncio.run(monitor.refresh(None))
+    monitor.checked_at -= 3 * 60 + 1  # the refresh task stopped renewing it
+    assert not monitor.usable
+
+
+def test_lag_is_refreshed_in_the_background():
+    async def scenario():
+        monitor = _Monitor(max_lag=5, interval=0.01)
+        await monitor.start(object())
+        await asyncio.sleep(0.05)
+        assert monitor.usable and monitor.measurements >= 2 and monitor.stats()["refreshing"]
+        await monitor.stop()
+        assert not monitor.stats()["refreshing"]
+
+        idle = _Monitor(max_lag=5, interval=0.01)
+        await idle.start(None)  # no replica configured
+        assert idle.measurements == 0 and not idle.stats()["refreshing"]
+
+    asyncio.run(scenario())
+
+
+def test_read_after_write_endpoints_use_the_primary():
+    from app.api import chat, node_configurations
+    from app.core.database import get_db_session
+
+    endpoints = [
+        chat.get_chat_messages, chat.get_workflow_chats,
+        node_configurations.get_node_configuration, node_configurations.get_node_configuration_by_node_id,
+        node_configurations.get_workflow_node_configurations, node_configurations.get_node_configurations_by_type,
+    ]
+    for endpoint in endpoints:
+        assert inspect.signature(endpoint).parameters["db"].default.dependency is get_db_session, endpoint.__name__
@@ -0,0 +1,92 @@
+"""
+Search Result Cache Tests
+=========================
+
+TTL caching and single-flight coalescing with a stubbed search client, and the
+Tavily node's connection test always reaching the provider.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.search_cache import SearchResultCache, get_search_cache
+from app.nodes.tools.tavily_search import TavilySearchNode
+
+
+class StubSearch:
+    def __init__(self, delay: threading.Event = None):
+        self.calls = 0
+        self.release = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, query):
+        with self._lock:
+            self.calls += 1
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        return [{"title": query, "url": "https://example.com", "content": "stub"}]
+
+
+def test_normalized_query_hits_and_expires():
+    now = [0.0]
+    cache = SearchResultCache(ttl_seconds=60, clock=lambda: now[0])
+    search = StubSearch()
+    options = {"max_results": 5, "search_depth": "basic"}
+
+    cache.get_or_fetch("tavily", "Latest  Python release", options, lambda: search("q"))
+    cache.get_or_fetch("tavily", "latest python release ", dict(reversed(options.items())), lambda: search("q"))
+    cache.get_or_fetch("tavily", "latest python release", {**options, "search_depth": "advanced"}, lambda: search("q"))
+    assert search.calls == 2
+
+    now[0] = 61.0
+    cache.get_or_fetch("tavily", "latest python release", options, lambda: search("q"))
+    assert search.calls == 3
+    assert cache.stats()["hits"] == 1
+
+
+def test_concurrent_duplicates_trigger_one_upstream_call():
+    release = threading.Event()
+    search = StubSearch(delay=release)
+    cache = SearchResultCache(ttl_seconds=60)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.get_or_fetch, "tavily", "same question", {}, lambda: search("q")) for _ in range(8)]
+        while cache.stats()["misses"] + cache.stats()["coalesced"] < 8:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [f.result(timeout=5) for f in futures]
+
+    assert search.calls == 1
+    assert all(r is results[0] for r in results)
+    assert cache.stats()["coalesced"] == 7
+
+
+def test_failures_propagate_and_are_not_cached():
+    cache = SearchResultCache(ttl_seconds=60)
+
+    def failing():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("tavily", "q", {}, failing)
+    assert cache.get_or_fetch("tavily", "q", {}, lambda: "ok") == "ok"
+    assert cache.stats()["errors"] == 1
+
+
+def test_tavily_connection_test_bypasses_the_cache(monkeypatch):
+    search = StubSearch()
+    monkeypatch.setattr(TavilySearchNode, "_create_tavily_search", lambda self, key, config: type(
+        "Tavily", (), {"run": staticmethod(search)})())
+    monkeypatch.setattr(TavilySearchNode, "get_credential", lambda self, _: {"secret": {"api_key": "tvly-test"}})
+    before = get_search_cache().stats()
+
+    for _ in range(2):
+        node = TavilySearchNode()
+        node.user_data = {"credential_id": "cred-1"}
+        node.execute()
+
+    assert search.calls == 2
+    after = get_search_cache().stats()
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
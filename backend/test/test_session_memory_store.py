@@ -0,0 +1,124 @@
+"""
+Session Memory Store Tests
+==========================
+
+Conversation sessions are capped and evicted by LRU and idle TTL, and an
+evicted session is rebuilt by its loader on the next access. Conversation
+memory writes each turn with explicit roles and rehydrates only the user's
+own rows with a recognised role.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlalchemy.dialects import postgresql
+
+from app.core import session_memory_store
+from app.core.node_data_access import _session_memories_query, use_node_data_access
+from app.core.session_memory_store import SessionMemoryStore
+from app.nodes.memory.conversation_memory import ConversationMemoryNode
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_store_is_bounded_by_lru_and_idle_ttl():
+    clock = _Clock()
+    store = SessionMemoryStore(max_sessions=100, idle_ttl_seconds=60, clock=clock)
+
+    for n in range(10_000):
+        store.get_or_load(f"session-{n}", lambda: object())
+    assert len(store) == 100
+    assert store.stats()["lru_evictions"] == 9_900
+
+    clock.now = 30
+    store.get("session-9999")
+    clock.now = 61
+    assert store.evict_idle() == 99
+    assert store.get("session-9999") is not None
+    assert store.stats()["idle_evictions"] == 99
+
+
+def test_evicted_session_is_rehydrated_on_next_access():
+    store = SessionMemoryStore(max_sessions=1, idle_ttl_seconds=0)
+    loads = []
+
+    def loader(session_id):
+        loads.append(session_id)
+        return {"session": session_id}
+
+    first = store.get_or_load("a", lambda: loader("a"))
+    assert store.get_or_load("a", lambda: loader("a")) is first
+    store.get_or_load("b", lambda: loader("b"))
+    assert store.get_or_load("a", lambda: loader("a")) == {"session": "a"}
+    assert loads == ["a", "b", "a"]
+    assert store.stats()["hits"] == 1 and store.stats()["misses"] == 3
+
+
+def test_conversation_memory_node_shares_sessions_across_instances(monkeypatch):
+    store = SessionMemoryStore(max_sessions=10)
+    monkeypatch.setattr(session_memory_store, "_store", store)
+
+    memory = ConversationMemoryNode().execute(session_id="chat-1", k=3)
+    memory.save_context({"input": "hi"}, {"output": "hello"})
+    again = ConversationMemoryNode().execute(session_id="chat-1", k=4)
+
+    assert again is memory and again.k == 4
+    assert len(again.chat_memory.messages) == 2
+    assert store.stats()["resident_sessions"] == 1
+
+
+class _MemoryRows:
+    """Data access over an in-memory ``memories`` table."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.loads = []
+
+    def call(self, coroutine):
+        return asyncio.run(coroutine)
+
+    async def load_memories(self, session_id, user_id, limit=10):
+        self.loads.append((session_id, user_id))
+        return [row for row in reversed(self.rows)
+                if row.session_id == session_id and row.user_id == user_id][:limit]
+
+    async def save_memories(self, user_id, session_id, entries, source_type="chat"):
+        self.rows += [SimpleNamespace(user_id=user_id, session_id=session_id, content=content, context=context)
+                      for content, context, _ in entries]
+        return len(entries)
+
+
+def test_conversation_turns_are_persisted_and_rehydrated_per_user(monkeypatch):
+    store = SessionMemoryStore(max_sessions=10)
+    monkeypatch.setattr(session_memory_store, "_store", store)
+    rows = _MemoryRows([
+        SimpleNamespace(user_id="user-2", session_id="chat-1", content="someone else", context="human"),
+        SimpleNamespace(user_id="user-1", session_id="chat-1", content="a note", context="buffer_note"),
+    ])
+
+    def memory_of(user_id):
+        node = ConversationMemoryNode()
+        node.data_access, node.user_id = rows, user_id
+        return node.execute(session_id="chat-1", k=3)
+
+    with use_node_data_access(rows):
+        memory_of("user-1").save_context({"input": "hi"}, {"output": "hello"})
+    assert [(row.user_id, row.context, row.content) for row in rows.rows[2:]] == [
+        ("user-1", "human", "hi"), ("user-1", "ai", "hello"),
+    ]
+
+    store.clear()  # evicted
+    rehydrated = memory_of("user-1")
+    assert rehydrated.chat_memory.messages == [HumanMessage(content="hi"), AIMessage(content="hello")]
+    assert memory_of("user-2").chat_memory.messages == [HumanMessage(content="someone else")]
+    assert rows.loads == [("chat-1", "user-1"), ("chat-1", "user-1"), ("chat-1", "user-2")]
+
+    sql = str(_session_memories_query("chat-1", None, 6).compile(dialect=postgresql.dialect()))
+    assert "memories.session_id = %(session_id_1)s AND memories.user_id IS NULL" in sql
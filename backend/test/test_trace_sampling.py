@@ -0,0 +1,110 @@
+"""
+Trace Sampling and Export Tests
+===============================
+
+Every trace is kept unless a head sampling strategy is configured, tail
+sampling keeps failing and slow ones of those dropped, and kept spans are
+exported in batches by a background thread so per-node tracing overhead does
+not depend on sink latency. The log sink honours ENABLE_WORKFLOW_TRACING.
+"""
+
+import logging
+import threading
+import time
+
+from app.core import trace_export, tracing
+from app.core.trace_export import BatchSpanExporter, FileSpanSink, log_span_sink
+from app.core.tracing import DistributedTracer, SamplingStrategy, WorkflowTracer
+
+
+def _run_workflow(tracer: DistributedTracer, nodes: int = 3, fail: bool = False) -> WorkflowTracer:
+    workflow = WorkflowTracer(session_id=None, distributed_tracer=tracer)
+    workflow.start_workflow(workflow_id="wf", flow_data={"nodes": [{}] * nodes, "edges": []})
+    for n in range(nodes):
+        workflow.start_node_execution(f"node-{n}", "Test", {"input": "x"})
+        failed = fail and n == nodes - 1
+        workflow.end_node_execution(f"node-{n}", "Test", {"output": "y"}, success=not failed,
+                                    error_message="boom" if failed else None)
+    workflow.end_workflow(success=not fail, error="boom" if fail else None)
+    return workflow
+
+
+def test_every_trace_is_sampled_unless_configured(monkeypatch):
+    monkeypatch.setattr(tracing, "_distributed_tracer", None)
+    tracer = tracing.get_distributed_tracer()
+    assert tracer.sampling_decision.strategy is SamplingStrategy.ALWAYS
+    assert all(tracer.start_trace("op").sampling_decision for _ in range(50))
+
+    monkeypatch.setattr(tracing, "_distributed_tracer", None)
+    monkeypatch.setattr(tracing, "TRACE_SAMPLING_STRATEGY", "probabilistic")
+    assert tracing.get_distributed_tracer().sampling_decision.strategy is SamplingStrategy.PROBABILISTIC
+
+
+def test_log_sink_respects_workflow_tracing_switch(monkeypatch, caplog):
+    spans = DistributedTracer(sampling_strategy=SamplingStrategy.ALWAYS).start_trace("op").get_all_spans()
+    caplog.set_level(logging.INFO, logger=trace_export.logger.name)
+
+    monkeypatch.setattr(trace_export, "ENABLE_WORKFLOW_TRACING", False)
+    log_span_sink(spans)
+    assert caplog.records == []
+
+    monkeypatch.setattr(trace_export, "ENABLE_WORKFLOW_TRACING", True)
+    log_span_sink(spans)
+    assert "Exporting 1 spans" in caplog.text
+
+
+def test_tail_sampling_keeps_errors_and_slow_traces():
+    batches = []
+    exporter = BatchSpanExporter(sinks=[batches.append], batch_size=10_000, flush_interval=60)
+    tracer = DistributedTracer(
+        sampling_strategy=SamplingStrategy.PROBABILISTIC, probability=0.0,
+        exporter=exporter, tail_sampling=True, tail_latency_ms=50,
+    )
+
+    for _ in range(20):
+        _run_workflow(tracer)
+    _run_workflow(tracer, fail=True)
+    slow = tracer.start_trace("slow")
+    time.sleep(0.06)
+    tracer.finish_trace(slow)
+    exporter.flush()
+
+    spans = [span for batch in batches for span in batch]
+    roots = [span for span in spans if span.tags.get("is_root")]
+    assert sorted(root.tags["sampling.reason"] for root in roots) == ["error", "latency"]
+    assert tracer.sampling_decision.stats()["dropped_traces"] == 20
+    assert len(spans) == 5  # failing workflow (root + 3 nodes) + slow root
+
+
+def test_rate_limited_head_sampling_uses_token_bucket():
+    tracer = DistributedTracer(sampling_strategy=SamplingStrategy.RATE_LIMITED, rate_limit=5)
+    decisions = [tracer.start_trace("op").sampling_decision for _ in range(50)]
+    assert sum(decisions) == 5
+    assert tracer.start_trace("other-op").sampling_decision
+
+
+def test_node_overhead_is_independent_of_sink_latency(tmp_path):
+    release = threading.Event()
+
+    def stalled_sink(spans):
+        release.wait(5)
+
+    file_sink = FileSpanSink(str(tmp_path / "traces.jsonl"))
+    exporter = BatchSpanExporter(sinks=[stalled_sink, file_sink], max_queue_size=200, batch_size=50, flush_interval=0.01)
+    tracer = DistributedTracer(sampling_strategy=SamplingStrategy.ALWAYS, exporter=exporter)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        _run_workflow(tracer, nodes=5)
+    elapsed = time.perf_counter() - started
+
+    overhead = tracer.get_metrics()["node_overhead_us"]
+    assert overhead["count"] == 500
+    assert elapsed < 2.0  # a blocking sink would stall each trace
+    stats = exporter.stats()
+    assert stats["queued_spans"] <= 200 and stats["dropped_spans"] > 0
+
+    release.set()
+    exporter.shutdown()
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    assert len(lines) == exporter.stats()["exported_spans"] > 0
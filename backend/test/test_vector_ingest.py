@@ -0,0 +1,102 @@
+"""
+Vector Bulk Ingest Tests
+========================
+
+Covers NDJSON framing and record validation for the COPY-based vector loader.
+"""
+
+import asyncio
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.core.constants import VECTOR_INDEXED_DIMENSIONS
+from app.models.vector_document import VectorDocument
+from app.services.vector_ingest_service import (
+    IngestLineTooLargeError,
+    build_copy_record,
+    iter_ndjson_lines,
+)
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def _collect(chunks, **kwargs):
+    async def run():
+        return [item async for item in iter_ndjson_lines(chunks, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_lines_split_across_chunks_are_reassembled():
+    lines = _collect(_chunks(b'{"a": 1}\n{"b"', b': 2}\n\n{"c": 3}'))
+
+    assert lines == [(1, b'{"a": 1}'), (2, b'{"b": 2}'), (4, b'{"c": 3}')]
+
+
+def test_long_lines_fed_byte_by_byte_are_reassembled():
+    long_line = b'{"content": "' + b"x" * 5000 + b'"}'
+    payload = long_line + b'\n{"d": 4}\n'
+    lines = _collect(_chunks(*(payload[i:i + 1] for i in range(len(payload)))))
+
+    assert lines == [(1, long_line), (2, b'{"d": 4}')]
+
+
+def test_oversized_line_is_rejected():
+    with pytest.raises(IngestLineTooLargeError):
+        _collect(_chunks(b"x" * 64, b"y" * 64), max_line_bytes=100)
+
+
+def test_list_and_base64_embeddings_produce_same_record():
+    collection_id = uuid.uuid4()
+    created_at = datetime.now(timezone.utc)
+    vector = np.array([0.5, -1.0, 2.25], dtype="<f4")
+
+    from_list = build_copy_record(
+        {"content": "hello", "embedding": vector.tolist(), "chunk_index": 2}, collection_id, 3, created_at
+    )
+    from_b64 = build_copy_record(
+        {"content": "hello", "embedding_b64": base64.b64encode(vector.tobytes()).decode()},
+        collection_id, 3, created_at,
+    )
+
+    assert np.array_equal(from_list[4], from_b64[4])
+    assert from_list[1] == collection_id
+    assert json.loads(from_list[3]) == {}
+    assert from_list[7] == 2
+
+
+def test_dimension_mismatch_is_rejected():
+    with pytest.raises(ValueError, match="dimension"):
+        build_copy_record({"content": "x", "embedding": [1.0, 2.0]}, uuid.uuid4(), 3, datetime.now(timezone.utc))
+
+
+def test_non_string_source_fields_are_rejected_per_line():
+    record = {"content": "x", "embedding": [1.0, 2.0, 3.0]}
+    for field, value in (("source_url", 123), ("source_type", ["web"])):
+        with pytest.raises(ValueError, match=f"{field} must be a string"):
+            build_copy_record({**record, field: value}, uuid.uuid4(), 3, datetime.now(timezone.utc))
+
+
+def test_embedding_column_accepts_any_width_and_is_indexed_per_width():
+    table = VectorDocument.__table__
+    assert table.c.embedding_vector.type.dim is None  # collections keep their own embedding_dimension
+
+    indexes = {index.name: index for index in table.indexes}
+    for dimension in VECTOR_INDEXED_DIMENSIONS:
+        ddl = str(CreateIndex(indexes[f"idx_vector_documents_embedding_hnsw_{dimension}"]).compile(
+            dialect=postgresql.dialect()
+        ))
+        assert f"USING hnsw (CAST(embedding_vector AS VECTOR({dimension})) vector_cosine_ops)" in ddl
+        assert ddl.endswith(f"WHERE vector_dims(embedding_vector) = {dimension}")
+    assert "idx_vector_documents_embedding_hnsw" not in indexes
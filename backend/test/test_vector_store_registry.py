@@ -0,0 +1,43 @@
+"""
+Vector Store Engine Registry Tests
+==================================
+
+Checks engine reuse, LRU eviction and collection cache invalidation.
+"""
+
+import uuid
+
+from app.core.vector_store_registry import VectorStoreEngineRegistry
+
+
+def _dsn(tmp_path, name):
+    return f"sqlite:///{tmp_path / name}.db"
+
+
+def test_same_dsn_reuses_engine(tmp_path):
+    registry = VectorStoreEngineRegistry(pool_size=2, max_overflow=0)
+    dsn = _dsn(tmp_path, "a")
+
+    assert registry.get_engine(dsn) is registry.get_engine(dsn)
+    assert registry.stats()["engines"] == 1
+
+
+def test_lru_eviction_drops_engine_and_cached_collections(tmp_path):
+    registry = VectorStoreEngineRegistry(pool_size=2, max_overflow=0, max_engines=1)
+    first, second = _dsn(tmp_path, "a"), _dsn(tmp_path, "b")
+    key = (first, "docs", "model")
+
+    first_engine = registry.get_engine(first)
+    registry.cache_collection(key, uuid.uuid4(), {})
+    registry.get_engine(second)
+
+    assert registry.get_cached_collection(key) is None
+    assert registry.get_engine(first) is not first_engine
+
+
+def test_idle_engines_are_evicted(tmp_path):
+    registry = VectorStoreEngineRegistry(pool_size=2, max_overflow=0, idle_ttl=-1)
+    registry.get_engine(_dsn(tmp_path, "a"))
+
+    assert registry.evict_idle() == 1
+    assert registry.stats()["engines"] == 0
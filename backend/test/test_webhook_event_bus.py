@@ -0,0 +1,135 @@
+"""
+Webhook Event Bus Tests
+=======================
+
+Ring buffers stay bounded, reconnecting subscribers replay from their last
+event ID, and events published on one replica reach subscribers on another
+through the NOTIFY relay, which runs off the request path, skips transient
+events nobody else streams, and always fits the NOTIFY size limit.
+"""
+
+import asyncio
+import json
+
+from app.core.webhook_event_bus import NOTIFY_MAX_BYTES, WebhookEventBus, _encode_notification
+
+
+class _LoopbackConnection:
+    """Stands in for the LISTEN connection: every pg_notify reaches all attached buses."""
+
+    def __init__(self):
+        self.listeners = []
+        self.notifications = []
+
+    def is_closed(self):
+        return False
+
+    async def close(self):
+        pass
+
+    async def executemany(self, query, args):
+        for channel, payload in args:
+            self.notifications.append(json.loads(payload))
+            for callback in self.listeners:
+                callback(self, 0, channel, payload)
+
+
+def _attach(bus, connection):
+    bus._conn = connection
+    bus._start_relay()
+    connection.listeners.append(bus._on_notification)
+
+
+async def _drain(*buses):
+    for _ in range(3):  # announcements can trigger replies
+        for bus in buses:
+            await bus.drain()
+
+
+def test_ring_buffer_is_bounded_and_replays_after_last_event_id():
+    async def scenario():
+        bus = WebhookEventBus(buffer_size=5, max_webhooks=2)
+        published = [await bus.publish("wh_a", {"data": {"n": n}}) for n in range(8)]
+
+        assert [e["data"]["n"] for e in bus.history("wh_a")] == [3, 4, 5, 6, 7]
+        assert [e["data"]["n"] for e in bus.replay("wh_a", published[5]["event_id"])] == [6, 7]
+        # Evicted IDs fall back to the whole buffer
+        assert len(bus.replay("wh_a", published[0]["event_id"])) == 5
+
+        subscription = bus.subscribe("wh_a", last_event_id=published[6]["event_id"])
+        assert [e["data"]["n"] for e in subscription.backlog] == [7]
+
+        # Webhooks with subscribers survive LRU eviction
+        await bus.publish("wh_b", {"data": {}})
+        await bus.publish("wh_c", {"data": {}})
+        assert set(bus.webhook_ids()) == {"wh_a", "wh_c"}
+
+    asyncio.run(scenario())
+
+
+def test_events_fan_out_across_replicas():
+    async def scenario():
+        connection = _LoopbackConnection()
+        pod_a, pod_b = WebhookEventBus(), WebhookEventBus()
+        _attach(pod_a, connection)
+        _attach(pod_b, connection)
+
+        subscriber_a = pod_a.subscribe("wh_x").queue
+        subscriber_b = pod_b.subscribe("wh_x").queue
+        await _drain(pod_a, pod_b)
+        event = await pod_a.publish("wh_x", {"data": {"hello": "world"}})
+        await pod_b.publish("wh_x", {"type": "webhook_execution_event"}, store=False)
+        await _drain(pod_a, pod_b)
+
+        received_a = [subscriber_a.get_nowait() for _ in range(subscriber_a.qsize())]
+        received_b = [subscriber_b.get_nowait() for _ in range(subscriber_b.qsize())]
+        assert sorted(e["event_id"] for e in received_a) == sorted(e["event_id"] for e in received_b)
+        assert len(received_a) == 2
+        # The receiving replica buffers relayed events under the original ID
+        assert pod_b.latest("wh_x")["event_id"] == event["event_id"]
+        assert pod_a.stats()["relayed_in"] == 1 and pod_b.stats()["relayed_in"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_relay_is_queued_and_skips_transient_events_nobody_streams():
+    async def scenario():
+        connection = _LoopbackConnection()
+        pod_a, pod_b = WebhookEventBus(), WebhookEventBus()
+        _attach(pod_a, connection)
+        _attach(pod_b, connection)
+
+        await pod_a.publish("wh_x", {"data": {}})
+        assert connection.notifications == []  # publish never waits for pg_notify
+
+        for _ in range(5):
+            await pod_a.publish("wh_x", {"type": "progress"}, store=False)
+        await _drain(pod_a, pod_b)
+        assert [n["e"]["event_id"] for n in connection.notifications if "e" in n] == [
+            pod_a.latest("wh_x")["event_id"]
+        ]
+        assert pod_a.stats()["relay_skipped"] == 5
+
+        subscription = pod_b.subscribe("wh_x")
+        await _drain(pod_a, pod_b)
+        await pod_a.publish("wh_x", {"type": "progress"}, store=False)
+        await _drain(pod_a, pod_b)
+        assert subscription.queue.get_nowait()["type"] == "progress"
+
+        await pod_a.stop()
+        await pod_b.stop()
+
+    asyncio.run(scenario())
+
+
+def test_oversized_notifications_are_truncated():
+    event = {"event_id": "a-1", "data": {"blob": "x" * 20000}, "headers": {}, "received_at": "now"}
+    message = json.loads(_encode_notification("a", "wh_x", event, True))
+
+    assert message["e"]["truncated"] is True
+    assert "data" not in message["e"] and message["e"]["event_id"] == "a-1"
+
+    event = {"event_id": "a-2", "url": "https://example.com/?q=" + "x" * 20000, "received_at": "now"}
+    payload = _encode_notification("a", "wh_x", event, True)
+    assert len(payload.encode("utf-8")) <= NOTIFY_MAX_BYTES
+    assert json.loads(payload)["e"] == {"event_id": "a-2", "received_at": "now", "truncated": True}
@@ -0,0 +1,98 @@
+"""
+Webhook Load Test Harness Tests
+===============================
+
+The database-free parts of benchmarks.webhook_load: per-stage percentiles and
+error rates, timing wrappers for sync/async functions and drained streams, the
+closed-loop driver and SLO checks.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.webhook_load import (
+    StageRecorder,
+    _timed,
+    _timed_execution,
+    check_slos,
+    drive,
+    parse_slo,
+    percentile,
+)
+
+
+def test_stage_timings_and_wrappers():
+    assert percentile(list(range(1, 101)), 50) == 50
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile([7.0], 95) == 7.0
+
+    recorder = StageRecorder()
+    for ms in range(1, 101):
+        recorder.record("route_lookup", ms / 1000, ok=ms % 10 != 0)
+    row = recorder.summary()["route_lookup"]
+    assert (row["count"], row["p50_ms"], row["p95_ms"], row["max_ms"]) == (100, 50.0, 95.0, 100.0)
+    assert row["error_rate"] == 0.1
+
+    async def lookup(found):
+        return object() if found else None
+
+    async def execute():
+        async def stream():
+            yield {"type": "node_end"}
+            yield {"type": "error"}
+        return stream()
+
+    recorder.reset()
+    timed_lookup = _timed(recorder, "route_lookup", lookup, lambda result: result is not None)
+    timed_build = _timed(recorder, "graph_build", lambda: 1 / 0)
+
+    async def scenario():
+        await timed_lookup(True)
+        await timed_lookup(False)
+        with pytest.raises(ZeroDivisionError):
+            timed_build()
+        events = [event async for event in await _timed_execution(recorder, execute)()]
+        assert len(events) == 2
+
+    asyncio.run(scenario())
+    summary = recorder.summary()
+    assert list(summary) == ["route_lookup", "graph_build", "execution"]
+    assert summary["route_lookup"]["error_rate"] == 0.5
+    assert summary["graph_build"]["error_rate"] == 1.0
+    assert summary["execution"]["error_rate"] == 1.0
+
+
+def test_drive_reports_statuses_and_slo_violations():
+    responses = iter([200, 429, 503, None] * 25)
+    in_flight = peak = 0
+
+    async def send():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        status_code = next(responses)
+        if status_code is None:
+            raise ConnectionError("reset by peer")
+        return SimpleNamespace(status_code=status_code)
+
+    recorder = StageRecorder()
+    level = asyncio.run(drive(send, total=100, concurrency=8, recorder=recorder))
+
+    assert peak == 8
+    assert level["statuses"] == {"200": 25, "429": 25, "503": 25, "ConnectionError": 25}
+    assert level["rate_limited"] == 0.25
+    row = recorder.summary()["request"]
+    assert row["count"] == 100 and row["error_rate"] == 0.5
+
+    results = {"levels": [{"route": "node", "concurrency": 8, "stages": {"request": row}}]}
+    assert parse_slo("request.p99=250") == ("request", "p99_ms", 250.0)
+    assert check_slos(results, [parse_slo("request.errors=0.01")]) == [
+        "node@8 request error_rate: 0.5 > 0.01"
+    ]
+    assert check_slos(results, [parse_slo("request.p99=60000"), parse_slo("graph_build.p99=1")]) == []
+    with pytest.raises(ValueError):
+        parse_slo("request-p99")
@@ -0,0 +1,132 @@
+"""
+Webhook Rate Limiter and Stats Writer Tests
+===========================================
+
+Token buckets admit bursts and refill over time; the buffered stats writer
+turns thousands of webhook hits into a handful of batched statements, weights
+the endpoint's average response time by request counts, and a row the
+database rejects costs only that row.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.rate_limiter import TokenBucketRateLimiter
+from app.services.webhook_service import WebhookService
+from app.services.webhook_stats_writer import EndpointCounters, WebhookStatsWriter
+
+REQUESTS = 5000
+WEBHOOK_IDS = ["wh_loadtest01", "wh_loadtest02", "wh_loadtest03"]
+
+
+class _CountingSession:
+    """Async session stand-in that records statements instead of running them."""
+
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.log.append((statement, params))
+
+    async def commit(self):
+        self.log.append(("commit", None))
+
+
+def test_token_bucket_allows_burst_then_refills():
+    now = [0.0]
+    limiter = TokenBucketRateLimiter(max_buckets=2, clock=lambda: now[0])
+
+    assert all(limiter.try_acquire("wh_a", rate_per_minute=60, burst=3) for _ in range(3))
+    assert not limiter.try_acquire("wh_a", rate_per_minute=60, burst=3)
+    assert limiter.is_limited("wh_a", rate_per_minute=60, burst=3)
+
+    now[0] = 1.0  # 60/min refills one token per second
+    assert limiter.try_acquire("wh_a", rate_per_minute=60, burst=3)
+
+    limiter.try_acquire("wh_b", rate_per_minute=60)
+    limiter.try_acquire("wh_c", rate_per_minute=60)
+    assert limiter.stats()["buckets"] == 2
+
+
+def test_buffered_writer_batches_webhook_load(monkeypatch):
+    log = []
+    writer = WebhookStatsWriter(max_pending_events=REQUESTS - 1000, session_factory=lambda: _CountingSession(log))
+    service = WebhookService()
+    limiter_endpoints = {
+        wid: SimpleNamespace(webhook_id=wid, config={"rate_limit_per_minute": 10000}) for wid in WEBHOOK_IDS
+    }
+
+    monkeypatch.setattr("app.services.webhook_service.get_webhook_stats_writer", lambda: writer)
+
+    async def run_load():
+        start = time.perf_counter()
+        limited = 0
+        for i in range(REQUESTS):
+            wid = WEBHOOK_IDS[i % len(WEBHOOK_IDS)]
+            if await service.check_rate_limit(None, wid, endpoint=limiter_endpoints[wid]):
+                limited += 1
+                continue
+            service.record_event(webhook_id=wid, payload={"i": i}, response_status=200, execution_time_ms=5)
+        elapsed = time.perf_counter() - start
+        written = await writer.flush()
+        return elapsed, limited, written
+
+    elapsed, limited, written = asyncio.run(run_load())
+
+    accepted = REQUESTS - limited
+    statements = [entry for entry in log if entry[0] != "commit"]
+
+    assert written == min(accepted, REQUESTS - 1000)
+    assert writer.stats()["dropped_events"] == accepted - written
+    assert len(statements) == 1 + len(WEBHOOK_IDS)
+    assert len(statements[0][1]) == written
+    assert log.count(("commit", None)) == 1
+
+
+class _RejectingSession(_CountingSession):
+    """Fails any INSERT that contains an event whose payload is marked bad."""
+
+    def begin_nested(self):
+        return self
+
+    async def execute(self, statement, params=None):
+        if params and any(row.get("payload") == "bad" for row in params):
+            raise ValueError("invalid input syntax")
+        await super().execute(statement, params)
+
+
+def test_a_bad_event_row_is_dropped_alone():
+    log = []
+    writer = WebhookStatsWriter(session_factory=lambda: _RejectingSession(log))
+    for payload in ({"i": 1}, "bad", {"i": 3}):
+        writer.record_event({"webhook_id": "wh_a", "payload": payload, "response_status": 200})
+
+    assert asyncio.run(writer.flush()) == 2
+    inserted = [params[0]["payload"] for _, params in log if isinstance(params, list)]
+    assert inserted == [{"i": 1}, {"i": 3}]
+    stats = writer.stats()
+    assert stats["rejected_events"] == 1 and stats["failed_flushes"] == 0
+
+
+def test_average_response_time_is_weighted_by_request_counts():
+    log = []
+    writer = WebhookStatsWriter()
+    counters = {"wh_a": EndpointCounters(count=4, errors=0, total_time_ms=100)}
+    asyncio.run(writer._update_endpoints(_CountingSession(log), counters))
+
+    ((update, _),) = log
+    sql = str(update.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    average = "coalesce(webhook_endpoints.avg_response_time_ms, 0)"
+    count = "coalesce(webhook_endpoints.trigger_count, 0)"
+    # A 4-request window counts four times, not as much as the whole history
+    assert f"avg_response_time_ms=(({average} * {count} + 100) / CAST(({count} + 4) AS NUMERIC))" in sql
+
@@ -0,0 +1,96 @@
+"""
+Workflow Listing Tests
+======================
+
+List queries select summary columns only (never flow_data), continue from an
+opaque (last activity, id) keyset cursor instead of OFFSET, and search with
+escaped ILIKE patterns served by the trigram indexes. Rows whose updated_at is
+NULL page by created_at instead of crashing the cursor or dropping out.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.workflow import Workflow
+from app.services.workflow_service import (
+    InvalidWorkflowCursorError,
+    WorkflowService,
+    decode_workflow_cursor,
+    encode_workflow_cursor,
+)
+
+
+class _RecordingSession:
+    """Captures the statement and returns canned rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statement = None
+
+    async def execute(self, statement):
+        self.statement = statement
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: self.rows))
+
+    def sql(self) -> str:
+        return str(self.statement.compile(dialect=postgresql.dialect()))
+
+
+def _rows(count):
+    at = datetime(2025, 7, 1, tzinfo=timezone.utc)
+    return [SimpleNamespace(id=uuid.uuid4(), created_at=at, updated_at=at) for _ in range(count)]
+
+
+def test_listing_is_keyset_paginated_and_skips_flow_data():
+    service = WorkflowService()
+    user_id = uuid.uuid4()
+
+    first_page = _RecordingSession(_rows(2))
+    workflows, next_cursor = asyncio.run(service.get_user_workflows(first_page, user_id, limit=2))
+    sql = first_page.sql()
+    assert "flow_data" not in sql.split("FROM")[0]
+    assert "ORDER BY coalesce(workflows.updated_at, workflows.created_at) DESC, workflows.id DESC" in sql
+    assert decode_workflow_cursor(next_cursor) == (workflows[-1].updated_at, workflows[-1].id)
+
+    deep_page = _RecordingSession(_rows(1))
+    _, last_cursor = asyncio.run(
+        service.get_user_workflows(deep_page, user_id, skip=10_000, limit=2, cursor=next_cursor)
+    )
+    sql = deep_page.sql()
+    assert "(coalesce(workflows.updated_at, workflows.created_at), workflows.id) < (" in sql
+    assert "OFFSET" not in sql
+    assert last_cursor is None
+
+    with pytest.raises(InvalidWorkflowCursorError):
+        asyncio.run(service.get_user_workflows(_RecordingSession([]), user_id, cursor="not-a-cursor"))
+
+
+def test_never_updated_rows_page_by_created_at():
+    rows = _rows(2)
+    rows[-1].updated_at = None
+    workflows, next_cursor = asyncio.run(
+        WorkflowService().get_user_workflows(_RecordingSession(rows), uuid.uuid4(), limit=2)
+    )
+    assert decode_workflow_cursor(next_cursor) == (workflows[-1].created_at, workflows[-1].id)
+
+
+def test_public_search_uses_escaped_ilike():
+    session = _RecordingSession([])
+    asyncio.run(WorkflowService().get_public_workflows(session, search="50%_off"))
+
+    statement = session.statement.compile(dialect=postgresql.dialect())
+    assert "workflows.name ILIKE" in str(statement) and "ESCAPE" in str(statement)
+    assert "%50\\%\\_off%" in statement.params.values()
+    assert "flow_data" not in str(statement).split("FROM")[0]
+
+    at = datetime(2025, 7, 1, 12, 30, tzinfo=timezone.utc)
+    workflow_id = uuid.uuid4()
+    assert decode_workflow_cursor(encode_workflow_cursor(at, workflow_id)) == (at, workflow_id)
+    assert {index.name for index in Workflow.__table__.indexes} >= {
+        "idx_workflows_user_activity_id", "idx_workflows_public_activity_id", "idx_workflows_name_trgm",
+    }
+